@@ -11,13 +11,27 @@
 # *même si certains fichiers ne sont pas disponibles, en utilisant des images de substitution
 # *ou des objets factices. Il gère également la résolution des chemins pour les ressources,
 # *que le jeu soit exécuté depuis les sources ou comme un exécutable figé.*
+#
+# It also holds the derived copies of the sprites, rendered once instead of every frame:
+# - the RotationAtlas, the rotated copies of the spinning and aimed sprites (bullets, garlic
+#   shots), one per quantized angle;
+# - the SpriteVariantCache, the flipped, tinted and scaled copies (the player facing left,
+#   the death flashes, the smaller items), bounded in memory.
+#
+# *Il contient aussi les copies dérivées des sprites, rendues une fois au lieu de chaque frame :*
+# *- le RotationAtlas, les copies tournées des sprites qui tournent ou sont orientés (projectiles,*
+# *  tirs d'ail), une par angle quantifié ;*
+# *- le SpriteVariantCache, les copies retournées, teintées et mises à l'échelle (le joueur tourné*
+# *  vers la gauche, les flashs de mort, les objets réduits), bornées en mémoire.*
 
 import pygame
 import os
 import sys
 import logging
+from collections import OrderedDict
 from utilities import get_asset_path # Import the centralized function
 from config import PLACEHOLDER_TEXT_COLOR, PLACEHOLDER_BG_COLOR, IMAGE_ASSET_CONFIG, SOUND_ASSET_CONFIG, DEFAULT_PLACEHOLDER_SIZE, PLACEHOLDER_FONT_SIZE # Import new configs
+from config import ROTATION_ATLAS_STEP, ROTATION_ATLAS_IMAGES, SPRITE_VARIANT_CACHE_BYTES
 
 # It's good practice to initialize pygame.font if you're going to use it.
 # This should ideally be done once at the start of the game (e.g., in main.py after pygame.init()).
@@ -74,6 +88,157 @@ class DummySound:
     # *Ajoutez toute autre méthode qui pourrait être appelée sur un objet Sound pour éviter les AttributeError.*
     # *Pour l'instant, play() est la plus critique.*
 
+class RotationAtlas:
+    """
+    Rotated copies of images, one every `step` degrees, rendered once per image (at startup with
+    prewarm(), or on first use). Each frame comes with the offset from the unrotated image's
+    top-left corner to the rotated one's, so the sprite turns around its center.
+
+    *Copies tournées d'images, une tous les `step` degrés, rendues une fois par image (au démarrage*
+    *avec prewarm(), ou à la première utilisation). Chaque image est fournie avec le décalage du coin*
+    *supérieur gauche de l'image non tournée à celui de l'image tournée, pour que le sprite tourne*
+    *autour de son centre.*
+    """
+    def __init__(self, step=ROTATION_ATLAS_STEP):
+        """
+        Args:
+            step (int): Degrees between two rendered angles. / *Degrés entre deux angles rendus.*
+        """
+        self.step = max(1, step)
+        self._frames = {}  # image -> [(surface, (dx, dy)), ...] by angle / *image -> [(surface, (dx, dy)), ...] par angle*
+
+    def frames(self, image):
+        """
+        Returns every (surface, offset) frame of an image, the one at index i being rotated by i * step degrees.
+        *Retourne toutes les images (surface, décalage) d'une image, celle d'indice i étant tournée de i * step degrés.*
+        """
+        frames = self._frames.get(image)
+        if frames is None:
+            center = image.get_rect().center
+            frames = []
+            for angle in range(0, 360, self.step):
+                rotated = pygame.transform.rotate(image, angle)
+                frames.append((rotated, rotated.get_rect(center=center).topleft))
+            self._frames[image] = frames
+        return frames
+
+    def frame(self, image, angle):
+        """
+        Returns the (surface, offset) frame closest to an angle, in degrees counterclockwise (as pygame.transform.rotate).
+        *Retourne l'image (surface, décalage) la plus proche d'un angle, en degrés dans le sens antihoraire (comme pygame.transform.rotate).*
+        """
+        frames = self.frames(image)
+        return frames[int(round(angle / self.step)) % len(frames)]
+
+    def prewarm(self, images):
+        """Renders the frames of several images now. / *Rend maintenant les images de plusieurs images.*"""
+        for image in images:
+            try:
+                self.frames(image)
+            except (pygame.error, TypeError) as e: # Not a real surface / *Pas une vraie surface*
+                logging.warning(f"Could not pre-render the rotations of {image}: {e} / Impossible de pré-rendre les rotations de {image} : {e}")
+
+    def clear(self):
+        self._frames.clear()
+
+    def stats(self):
+        """
+        Returns the number of images and frames held, and their pixel memory in bytes.
+        *Retourne le nombre d'images et de copies gardées, et leur mémoire en pixels en octets.*
+        """
+        surfaces = [surface for frames in self._frames.values() for surface, _ in frames]
+        return {
+            'images': len(self._frames),
+            'frames': len(surfaces),
+            'bytes': sum(_surface_bytes(surface) for surface in surfaces),
+        }
+
+
+class SpriteVariantCache:
+    """
+    Flipped, tinted and scaled copies of images, keyed by source image, flip, tint and scale.
+    Each copy is made on first use. When their pixel memory exceeds the budget, the least
+    recently used copies are evicted.
+
+    *Copies retournées, teintées et mises à l'échelle d'images, indexées par image source,*
+    *retournement, teinte et échelle. Chaque copie est faite à la première utilisation. Quand leur*
+    *mémoire en pixels dépasse le budget, les copies les moins récemment utilisées sont évincées.*
+    """
+    def __init__(self, max_bytes=SPRITE_VARIANT_CACHE_BYTES):
+        """
+        Args:
+            max_bytes (int): Pixel memory budget of the copies, 0 for no limit. / *Budget de mémoire en pixels des copies, 0 pour aucune limite.*
+        """
+        self.max_bytes = max_bytes
+        self._variants = OrderedDict()  # key -> (surface, bytes), least recently used first / *clé -> (surface, octets), moins récemment utilisée en premier*
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, image, flip_x=False, flip_y=False, tint=None, scale=1.0):
+        """
+        Returns a copy of an image, scaled, then flipped, then tinted (multiplied by an RGBA color).
+        The image itself is returned when nothing changes.
+        Args:
+            image (pygame.Surface): The source image. / *L'image source.*
+            flip_x, flip_y (bool): Mirror horizontally / vertically. / *Retourner horizontalement / verticalement.*
+            tint (tuple, optional): RGBA color multiplied into the pixels. / *Couleur RGBA multipliée dans les pixels.*
+            scale (float): Size factor. / *Facteur de taille.*
+        Returns:
+            pygame.Surface: The shared copy; do not draw on it. / *La copie partagée ; ne pas dessiner dessus.*
+        """
+        if not flip_x and not flip_y and tint is None and scale == 1.0:
+            return image
+        key = (image, flip_x, flip_y, None if tint is None else tuple(tint), scale)
+        entry = self._variants.get(key)
+        if entry is not None:
+            self._variants.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+        self.misses += 1
+        variant = image
+        if scale != 1.0:
+            variant = pygame.transform.scale(variant, (int(image.get_width() * scale), int(image.get_height() * scale)))
+        if flip_x or flip_y:
+            variant = pygame.transform.flip(variant, flip_x, flip_y)
+        if tint is not None:
+            if variant is image:
+                variant = image.copy()
+            variant.fill(tint, special_flags=pygame.BLEND_RGBA_MULT)
+        size = _surface_bytes(variant)
+        self._variants[key] = (variant, size)
+        self.bytes += size
+        if self.max_bytes:
+            while self.bytes > self.max_bytes and len(self._variants) > 1:
+                _, (_, evicted_size) = self._variants.popitem(last=False)
+                self.bytes -= evicted_size
+                self.evictions += 1
+        return variant
+
+    def clear(self):
+        self._variants.clear()
+        self.bytes = 0
+
+    def stats(self):
+        """
+        Returns the number of copies held, their pixel memory in bytes, and the hit, miss and eviction counters.
+        *Retourne le nombre de copies gardées, leur mémoire en pixels en octets, et les compteurs de succès, d'échecs et d'évictions.*
+        """
+        return {'variants': len(self._variants), 'bytes': self.bytes, 'hits': self.hits,
+                'misses': self.misses, 'evictions': self.evictions}
+
+
+def _surface_bytes(surface):
+    return int(surface.get_width()) * int(surface.get_height()) * int(surface.get_bytesize())
+
+
+# Shared by every AssetManager and entity, like the images themselves
+# *Partagé par chaque AssetManager et entité, comme les images elles-mêmes*
+rotation_atlas = RotationAtlas()
+sprite_variants = SpriteVariantCache()
+
+
 class AssetManager:
     """
     Manages loading and storage of game assets like images and sounds.
@@ -95,6 +260,8 @@ class AssetManager:
         self.cli_mode = cli_mode
         self.images = {}
         self.sounds = {}
+        self.rotations = rotation_atlas
+        self.variants = sprite_variants
         self.placeholder_font = None
 
         if not self.cli_mode: # Only attempt font initialization if not in CLI mode / *Tenter l'initialisation de la police uniquement si pas en mode CLI*
@@ -163,7 +330,11 @@ class AssetManager:
                         logging.warning(f"Placeholder font not available for asset '{key}'. Placeholder will be a plain blue rectangle. / Police de substitution non disponible pour la ressource '{key}'. Le substitut sera un simple rectangle bleu.")
 
                     self.images[key] = placeholder_surface.convert_alpha()
-            
+
+        if not self.cli_mode: # Render the rotations of the aimed and spinning sprites up front / *Rendre d'avance les rotations des sprites orientés et tournants*
+            self.rotations.prewarm(self.images[key] for key in ROTATION_ATLAS_IMAGES if key in self.images)
+            logging.debug(f"Rotation atlas / Atlas de rotation : {self.rotations.stats()}")
+
         # Sound loading using SOUND_ASSET_CONFIG / *Chargement des sons en utilisant SOUND_ASSET_CONFIG*
         for key, path in SOUND_ASSET_CONFIG.items():
             logging.debug(f"Attempting to load sound asset '{key}' from path '{path}'. / Tentative de chargement de la ressource sonore '{key}' depuis le chemin '{path}'.")
@@ -0,0 +1,84 @@
+# background.py
+# This file defines the TiledBackground, the grass under the game world. Instead of tiling the
+# grass image over one world-sized surface at startup (64 MB for a 4000x4000 world), it keeps
+# the single tile image and, each frame, blits only the copies of it that are visible on
+# screen, in one Surface.blits() call. Memory no longer grows with the world size and startup
+# does no pre-tiling. The tile is converted to an opaque surface once, since grass needs no
+# alpha and opaque blits are the fastest. Parts of the screen outside the world stay untouched,
+# as with the old world-sized surface.
+#
+# *Ce fichier définit le TiledBackground, l'herbe sous le monde du jeu. Au lieu de répéter l'image*
+# *d'herbe sur une surface de la taille du monde au démarrage (64 Mo pour un monde de 4000x4000), il*
+# *garde la seule image de tuile et, à chaque frame, ne copie que les exemplaires visibles à l'écran,*
+# *en un seul appel à Surface.blits(). La mémoire ne grandit plus avec la taille du monde et le*
+# *démarrage ne fait plus de pré-tuilage. La tuile est convertie une fois en surface opaque, car*
+# *l'herbe n'a pas besoin d'alpha et les copies opaques sont les plus rapides. Les parties de l'écran*
+# *hors du monde restent intactes, comme avec l'ancienne surface de la taille du monde.*
+
+import logging
+
+import pygame
+
+import config
+
+
+class TiledBackground:
+    """
+    A tile image repeated over the world, drawn one visible tile at a time.
+    *Une image de tuile répétée sur le monde, dessinée une tuile visible à la fois.*
+    """
+    def __init__(self, tile_image, world_size=config.WORLD_SIZE, fill_color=(0, 100, 0)):
+        """
+        Args:
+            tile_image (pygame.Surface): The image repeated from the world's top-left corner.
+                                         *L'image répétée depuis le coin supérieur gauche du monde.*
+            world_size (tuple[int, int]): The (width, height) of the game world. / *La (largeur, hauteur) du monde du jeu.*
+            fill_color (tuple): Plain color used if the tile has no size. / *Couleur unie utilisée si la tuile n'a pas de taille.*
+        """
+        self.world_size = world_size
+        self.fill_color = fill_color
+        self.tile_size = tile_image.get_size()
+        if self.tile_size[0] <= 0 or self.tile_size[1] <= 0:
+            logging.warning("Grass asset has invalid dimensions, cannot tile background. / "
+                            "La ressource d'herbe a des dimensions invalides, impossible de répéter le fond.")
+            self.tile = None
+        else:
+            try:
+                self.tile = tile_image.convert() # Opaque copy in the display format / *Copie opaque au format de l'affichage*
+            except pygame.error: # No display mode set yet / *Pas encore de mode d'affichage*
+                self.tile = tile_image
+        self.last_tiles = 0  # Tiles blitted by the last draw / *Tuiles copiées par le dernier dessin*
+
+    def draw(self, screen, scroll):
+        """
+        Draws the part of the world under the screen.
+        Args:
+            screen (pygame.Surface): The screen to draw on. / *L'écran sur lequel dessiner.*
+            scroll (list[int, int]): The camera's scroll offset. / *Le décalage de défilement de la caméra.*
+        Returns:
+            int: The number of tiles blitted. / *Le nombre de tuiles copiées.*
+        """
+        scroll_x, scroll_y = int(scroll[0]), int(scroll[1])
+        # The world on screen, cut to the screen / *Le monde à l'écran, coupé à l'écran*
+        world_on_screen = pygame.Rect(-scroll_x, -scroll_y, *self.world_size).clip(screen.get_rect())
+        if not world_on_screen.width or not world_on_screen.height:
+            self.last_tiles = 0
+            return 0
+        if self.tile is None:
+            screen.fill(self.fill_color, world_on_screen)
+            self.last_tiles = 0
+            return 0
+        tile_w, tile_h = self.tile_size
+        # World coordinates of the first visible tile / *Coordonnées dans le monde de la première tuile visible*
+        first_x = (world_on_screen.left + scroll_x) // tile_w * tile_w
+        first_y = (world_on_screen.top + scroll_y) // tile_h * tile_h
+        tile = self.tile
+        sequence = [(tile, (x - scroll_x, y - scroll_y))
+                    for y in range(first_y, world_on_screen.bottom + scroll_y, tile_h)
+                    for x in range(first_x, world_on_screen.right + scroll_x, tile_w)]
+        previous_clip = screen.get_clip()
+        screen.set_clip(world_on_screen.clip(previous_clip))
+        screen.blits(sequence, doreturn=False)
+        screen.set_clip(previous_clip)
+        self.last_tiles = len(sequence)
+        return self.last_tiles
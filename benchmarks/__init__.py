@@ -0,0 +1,2 @@
+# Micro-benchmarks, run with `python -m benchmarks.<name>` from the repository root.
+# *Micro-bancs d'essai, à lancer avec `python -m benchmarks.<nom>` depuis la racine du dépôt.*
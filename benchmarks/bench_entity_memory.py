@@ -0,0 +1,59 @@
+# bench_entity_memory.py
+# Reports the memory used per entity for each GameObject subclass, measured with tracemalloc
+# while building 100,000 instances. Entities are built in CLI mode (size metadata instead of
+# surfaces) so only the entity layout itself is measured, not image data.
+# Run with: python -m benchmarks.bench_entity_memory [count]
+#
+# *Rapporte la mémoire utilisée par entité pour chaque sous-classe de GameObject, mesurée avec*
+# *tracemalloc pendant la construction de 100 000 instances. Les entités sont construites en mode CLI*
+# *(métadonnées de taille au lieu de surfaces) pour ne mesurer que la disposition des entités, pas les images.*
+# *Lancer avec : python -m benchmarks.bench_entity_memory [nombre]*
+
+import gc
+import sys
+import tracemalloc
+
+from game_clock import GameClock, VIRTUAL
+from game_entities import Bullet, Carrot, Collectible, Explosion, Player, Vampire
+
+DEFAULT_COUNT = 100_000
+
+
+def _factories():
+    clock = GameClock(VIRTUAL)
+    meta = {'size_hint': (32, 32)}
+    return {
+        'Player': lambda i: Player(i, i, meta, None, cli_mode=True, clock=clock),
+        'Carrot': lambda i: Carrot(i, i, meta, cli_mode=True),
+        'Bullet': lambda i: Bullet(i, i, i + 10, i, meta, cli_mode=True),
+        'Collectible': lambda i: Collectible(i, i, meta, 'hp', cli_mode=True),
+        'Vampire': lambda i: Vampire(i, i, meta, cli_mode=True),
+        'Explosion': lambda i: Explosion(i, i, meta, clock=clock),
+    }
+
+
+def measure(factory, count):
+    """Returns the bytes allocated per instance while building `count` instances. / *Retourne les octets alloués par instance pendant la construction de `count` instances.*"""
+    gc.collect()
+    tracemalloc.start()
+    entities = [factory(i) for i in range(count)]
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # The list holding them costs one pointer per entity / *La liste qui les contient coûte un pointeur par entité*
+    per_entity = (allocated - sys.getsizeof(entities)) / count
+    has_dict = hasattr(entities[0], '__dict__')
+    del entities
+    return per_entity, has_dict
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT
+    print(f"{count} instances per type / {count} instances par type")
+    print(f"{'entity':>12} {'bytes/entity':>13} {'__dict__':>9}")
+    for name, factory in _factories().items():
+        per_entity, has_dict = measure(factory, count)
+        print(f"{name:>12} {per_entity:>13.0f} {str(has_dict):>9}")
+
+
+if __name__ == '__main__':
+    main()
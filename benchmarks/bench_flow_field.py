@@ -0,0 +1,84 @@
+# bench_flow_field.py
+# Measures FlowField rebuilds around obstacles (config.FLOW_FIELD_OBSTACLES, or one wall if it is
+# empty), as the player walks across the world: the whole rebuild (unbounded budget) and the
+# median and worst single ticks with the configured per-tick budget, next to a full Dijkstra over
+# every cell, the way the field was first rebuilt.
+# Run with: python -m benchmarks.bench_flow_field
+#
+# *Mesure les reconstructions du FlowField autour des obstacles (config.FLOW_FIELD_OBSTACLES, ou un mur*
+# *s'il est vide), pendant que le joueur traverse le monde : la reconstruction entière (budget illimité)*
+# *et les ticks médian et pire avec le budget par tick configuré, à côté d'un Dijkstra complet sur toutes*
+# *les cellules, comme le champ était reconstruit au départ.*
+# *Lancer avec : python -m benchmarks.bench_flow_field*
+
+import heapq
+import math
+import time
+
+import pygame
+
+import config
+from flow_field import FlowField
+
+WORLD = config.WORLD_SIZE
+OBSTACLES = [pygame.Rect(area) for area in config.FLOW_FIELD_OBSTACLES] or [pygame.Rect(1000, 1000, 500, 2000)]
+# Player positions, one per cell crossed along a zigzag walk / *Positions du joueur, une par cellule traversée le long d'une marche en zigzag*
+TARGETS = [(x, y) for y in range(100, 3900, 600) for x in range(100, 3900, config.FLOW_FIELD_CELL_SIZE)]
+
+
+def _full_dijkstra(field, cell):
+    # Reference: Dijkstra from the target over every cell / *Référence : Dijkstra depuis la cible sur toutes les cellules*
+    cost = [math.inf] * (field.rows * field.cols)
+    target = cell[1] * field.cols + cell[0]
+    cost[target] = 0.0
+    heap = [(0.0, target)]
+    while heap:
+        current, index = heapq.heappop(heap)
+        if current > cost[index]:
+            continue
+        for neighbour, step in field._adjacency[index]:
+            if current + step < cost[neighbour]:
+                cost[neighbour] = current + step
+                heapq.heappush(heap, (current + step, neighbour))
+
+
+def bench_full():
+    field = FlowField(WORLD, obstacles=OBSTACLES, rebuild_budget=0)
+    field.set_target(*TARGETS[0]) # Builds the adjacency / *Construit les voisinages*
+    start = time.perf_counter()
+    for x, y in TARGETS:
+        _full_dijkstra(field, field.cell_of(x, y))
+    return (time.perf_counter() - start) / len(TARGETS)
+
+
+def bench_rebuild(budget):
+    # Returns (mean seconds per rebuild, sorted seconds of each tick, mean ticks per rebuild)
+    # *Retourne (secondes moyennes par reconstruction, secondes triées de chaque tick, ticks moyens par reconstruction)*
+    field = FlowField(WORLD, obstacles=OBSTACLES, rebuild_budget=budget)
+    field.set_target(*TARGETS[0])
+    while field.building:
+        field.set_target(*TARGETS[0])
+    ticks = []
+    for x, y in TARGETS:
+        field.set_target(x + config.FLOW_FIELD_CELL_SIZE // 2, y) # Enters a new cell / *Entre dans une nouvelle cellule*
+        while True:
+            start = time.perf_counter()
+            field.set_target(x, y)
+            ticks.append(time.perf_counter() - start)
+            if not field.building:
+                break
+    return sum(ticks) / len(TARGETS), sorted(ticks), len(ticks) / len(TARGETS)
+
+
+def main():
+    print(f"{len(TARGETS)} target cells, obstacles {OBSTACLES}")
+    print(f"{'full Dijkstra':>24}: {bench_full() * 1e3:6.2f} ms/rebuild")
+    for budget in (0, config.FLOW_FIELD_REBUILD_BUDGET):
+        mean, ticks, per_rebuild = bench_rebuild(budget)
+        label = f"budget {budget or 'unbounded'}"
+        print(f"{label:>24}: {mean * 1e3:6.2f} ms/rebuild, tick median {ticks[len(ticks) // 2] * 1e3:5.2f} ms,"
+              f" worst {ticks[-1] * 1e3:5.2f} ms, {per_rebuild:.1f} ticks/rebuild")
+
+
+if __name__ == '__main__':
+    main()
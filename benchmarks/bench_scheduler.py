@@ -0,0 +1,76 @@
+# bench_scheduler.py
+# Compares the per-tick cost of the Scheduler with the previous approach of every entity
+# polling its own timer each tick, for growing numbers of idle timers. The same number of timers
+# fire during every run; only the timers due after it grow.
+# Run with: python -m benchmarks.bench_scheduler
+#
+# *Compare le coût par tick du Scheduler avec l'ancienne approche où chaque entité interroge*
+# *son propre minuteur à chaque tick, pour un nombre croissant de minuteurs inactifs. Le même nombre*
+# *de minuteurs se déclenche à chaque mesure ; seuls les minuteurs dus après elle augmentent.*
+# *Lancer avec : python -m benchmarks.bench_scheduler*
+
+import random
+import time
+
+from scheduler import Scheduler
+
+TICK = 1.0 / 50
+TICKS = 500
+TIMER_COUNTS = (1_000, 10_000, 100_000)
+DUE_IN_RUN = 500  # Timers firing during the measured ticks, whatever the count / *Minuteurs déclenchés pendant les ticks mesurés, quel que soit le nombre*
+
+
+class _PolledTimer:
+    __slots__ = ('due', 'done')
+
+    def __init__(self, due):
+        self.due = due
+        self.done = False
+
+
+def _noop():
+    pass
+
+
+def _due_times(count, rng):
+    # DUE_IN_RUN timers within the measured ticks, the others spread over the ten minutes after them
+    # *DUE_IN_RUN minuteurs pendant les ticks mesurés, les autres répartis sur les dix minutes suivantes*
+    run = TICKS * TICK
+    return ([rng.uniform(0.0, run) for _ in range(DUE_IN_RUN)]
+            + [rng.uniform(run + TICK, run + 600.0) for _ in range(count - DUE_IN_RUN)])
+
+
+def bench_scheduler(count, rng):
+    scheduler = Scheduler()
+    for due in _due_times(count, rng):
+        scheduler.schedule(due, _noop)
+    now = 0.0
+    start = time.perf_counter()
+    for _ in range(TICKS):
+        now += TICK
+        scheduler.advance(now)
+    return (time.perf_counter() - start) / TICKS
+
+
+def bench_polling(count, rng):
+    timers = [_PolledTimer(due) for due in _due_times(count, rng)]
+    now = 0.0
+    start = time.perf_counter()
+    for _ in range(TICKS):
+        now += TICK
+        for timer in timers:
+            if not timer.done and now >= timer.due:
+                timer.done = True
+    return (time.perf_counter() - start) / TICKS
+
+
+def main():
+    print(f"{'timers':>8} {'scheduler us/tick':>18} {'polling us/tick':>16}")
+    for count in TIMER_COUNTS:
+        scheduled = bench_scheduler(count, random.Random(1))
+        polled = bench_polling(count, random.Random(1))
+        print(f"{count:>8} {scheduled * 1e6:>18.1f} {polled * 1e6:>16.1f}")
+
+
+if __name__ == '__main__':
+    main()
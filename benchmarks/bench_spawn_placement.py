@@ -0,0 +1,41 @@
+# bench_spawn_placement.py
+# Measures the time to place carrot waves of growing size with the SpawnPlacer, away from a
+# player in the middle of the world, with and without a minimum spacing between the carrots.
+# Run with: python -m benchmarks.bench_spawn_placement
+#
+# *Mesure le temps de placement de vagues de carottes de taille croissante avec le SpawnPlacer, loin*
+# *d'un joueur au milieu du monde, avec et sans distance minimale entre les carottes.*
+# *Lancer avec : python -m benchmarks.bench_spawn_placement*
+
+import math
+import time
+
+import numpy as np
+
+import config
+from spawn_placement import SpawnPlacer
+
+ITEM = (32, 32)
+CENTER = (config.WORLD_SIZE[0] // 2, config.WORLD_SIZE[1] // 2)
+WAVES = (500, 5_000, 50_000)
+SPACING = 10
+
+
+def bench_wave(count, min_spacing):
+    # Returns the seconds spent placing one wave / *Retourne les secondes passées à placer une vague*
+    placer = SpawnPlacer(config.WORLD_SIZE, min(config.WORLD_SIZE) / config.CARROT_SPAWN_SAFE_RATIO,
+                         bulk_rng=np.random.default_rng(3))
+    placer.region(ITEM, CENTER) # Built once per player cell in the game / *Construite une fois par cellule du joueur en jeu*
+    start = time.perf_counter()
+    placer.place(ITEM, CENTER, count, min_spacing)
+    return time.perf_counter() - start
+
+
+def main():
+    print(f"{'carrots':>8} {'ms/wave':>10} {f'ms/wave, spacing {SPACING}':>24}")
+    for count in WAVES:
+        print(f"{count:>8} {bench_wave(count, 0) * 1e3:>10.2f} {bench_wave(count, SPACING) * 1e3:>24.2f}")
+
+
+if __name__ == '__main__':
+    main()
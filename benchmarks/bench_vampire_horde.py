@@ -0,0 +1,77 @@
+# bench_vampire_horde.py
+# Compares the per-tick cost of moving a horde of vampires with VampireHorde.step(), in one
+# batched pass, against calling Vampire.update() on each one, for growing horde sizes. The
+# vampires follow a flow field around one obstacle and stay in sync with a collision layer.
+# Run with: python -m benchmarks.bench_vampire_horde
+#
+# *Compare le coût par tick du déplacement d'une horde de vampires avec VampireHorde.step(), en une*
+# *passe groupée, à l'appel de Vampire.update() sur chacun, pour des hordes de taille croissante. Les*
+# *vampires suivent un champ de flux autour d'un obstacle et restent synchronisés avec une couche de collision.*
+# *Lancer avec : python -m benchmarks.bench_vampire_horde*
+
+import time
+
+import pygame
+
+import config
+from collision import CollisionWorld
+from flow_field import FlowField
+from game_entities import Vampire
+from vampire_horde import VampireHorde
+
+TICKS = 100
+HORDE_SIZES = (50, 500, 5_000)
+META = {'size_hint': (32, 32)}
+
+
+def _horde(count):
+    world = CollisionWorld()
+    horde = VampireHorde(world.layer('vampires'))
+    for i in range(count):
+        vampire = Vampire((i * 397) % 3900, (i * 211) % 3900, META, cli_mode=True)
+        vampire.active = True
+        horde.add(vampire)
+    return horde
+
+
+def _field(player):
+    field = FlowField(config.WORLD_SIZE, obstacles=[pygame.Rect(1000, 1000, 256, 256)], rebuild_budget=0)
+    field.set_target(*player.rect.center)
+    return field
+
+
+class _Player:
+    # Only the rect is read by the vampires / *Seul le rect est lu par les vampires*
+    def __init__(self):
+        self.rect = pygame.Rect(2000, 2000, 32, 32)
+
+
+def bench_step(count):
+    player, horde = _Player(), _horde(count)
+    field = _field(player)
+    start = time.perf_counter()
+    for _ in range(TICKS):
+        horde.step(player.rect, config.WORLD_SIZE, field)
+    return (time.perf_counter() - start) / TICKS
+
+
+def bench_update(count):
+    player, horde = _Player(), _horde(count)
+    field = _field(player)
+    layer = horde.collision_layer
+    start = time.perf_counter()
+    for tick in range(TICKS):
+        for vampire in horde:
+            vampire.update(player, config.WORLD_SIZE, tick, field)
+            layer.update(vampire)
+    return (time.perf_counter() - start) / TICKS
+
+
+def main():
+    print(f"{'vampires':>8} {'step() ms/tick':>15} {'update() ms/tick':>17}")
+    for count in HORDE_SIZES:
+        print(f"{count:>8} {bench_step(count) * 1e3:>15.3f} {bench_update(count) * 1e3:>17.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,253 @@
+# bullet_store.py
+# This file defines the BulletStore class, an array-backed container for the player's bullets.
+# Positions and velocities are kept as float NumPy arrays (so sub-pixel movement is not lost
+# to integer pygame.Rect coordinates), the whole store is integrated and culled in batched
+# passes, and removals swap the last bullet into the freed slot so they cost O(1).
+# Each slot also keeps its start position and expiry time, so spent bullets (too old or too
+# far from where they were fired) are culled in the same batched way.
+# Bullet objects stay as facades over their slot, for rendering and tests.
+#
+# *Ce fichier définit la classe BulletStore, un conteneur en tableaux pour les projectiles du joueur.*
+# *Positions et vélocités sont stockées dans des tableaux NumPy flottants (le mouvement sub-pixel n'est*
+# *donc pas perdu dans les coordonnées entières de pygame.Rect), tout le stockage est intégré et filtré*
+# *par passes groupées, et les suppressions déplacent le dernier projectile dans la case libérée afin*
+# *de coûter O(1). Chaque case garde aussi sa position de départ et son temps d'expiration, de sorte que*
+# *les projectiles épuisés (trop vieux ou trop loin de leur point de tir) sont filtrés de la même façon groupée.*
+# *Les objets Bullet restent des façades sur leur case, pour l'affichage et les tests.*
+
+import numpy as np
+import pygame
+
+INITIAL_CAPACITY = 64  # Slots allocated up front, doubled when full / *Cases allouées au départ, doublées quand c'est plein*
+
+
+class BulletStore:
+    """
+    Struct-of-arrays storage for bullets with swap-remove and batched integration.
+    Slot order is not stable: removing a bullet moves the last one into its slot.
+
+    *Stockage en structure de tableaux pour les projectiles, avec suppression par échange et intégration groupée.*
+    *L'ordre des cases n'est pas stable : supprimer un projectile déplace le dernier dans sa case.*
+    """
+    def __init__(self, capacity=INITIAL_CAPACITY, pool=None):
+        """
+        Initializes an empty store.
+        Args:
+            capacity (int): Number of slots allocated up front. / *Nombre de cases allouées au départ.*
+            pool (EntityPool, optional): Removed bullets are released to this pool.
+                                         *Les projectiles retirés sont rendus à cette réserve.*
+        """
+        self.pool = pool
+        self.count = 0
+        self.bullets = []  # Facades, in slot order / *Façades, dans l'ordre des cases*
+        self._allocate(max(1, capacity))
+
+    def _allocate(self, capacity):
+        old_count = self.count
+        arrays = {}
+        for name, dtype in (('x', np.float64), ('y', np.float64), ('vx', np.float64), ('vy', np.float64),
+                            ('width', np.int64), ('height', np.int64),
+                            ('x0', np.float64), ('y0', np.float64), ('expires', np.float64)):
+            array = np.zeros(capacity, dtype=dtype)
+            if hasattr(self, name):
+                array[:old_count] = getattr(self, name)[:old_count]
+            arrays[name] = array
+        self.x, self.y = arrays['x'], arrays['y']
+        self.vx, self.vy = arrays['vx'], arrays['vy']
+        self.width, self.height = arrays['width'], arrays['height']
+        self.x0, self.y0 = arrays['x0'], arrays['y0'] # Where each bullet was fired / *Où chaque projectile a été tiré*
+        self.expires = arrays['expires'] # Game time of expiry / *Temps de jeu d'expiration*
+
+    @property
+    def capacity(self):
+        return self.x.shape[0]
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        return iter(self.bullets)
+
+    def add(self, bullet, expires=np.inf):
+        """
+        Moves a bullet's position and velocity into the arrays and binds it as a facade.
+        Args:
+            bullet (Bullet): The bullet. / *Le projectile.*
+            expires (float): Game time at which cull_spent() removes it; never by default.
+                             *Temps de jeu auquel cull_spent() le retire ; jamais par défaut.*
+
+        *Transfère la position et la vélocité d'un projectile dans les tableaux et le lie comme façade.*
+        """
+        if self.count == self.capacity:
+            self._allocate(self.capacity * 2)
+        slot = self.count
+        rect = bullet.rect
+        self.x[slot], self.y[slot] = bullet.position
+        self.x0[slot], self.y0[slot] = bullet.position
+        self.expires[slot] = expires
+        self.vx[slot], self.vy[slot] = bullet.velocity
+        self.width[slot] = rect.width
+        self.height[slot] = rect.height
+        bullet._store = self
+        bullet._slot = slot
+        self.bullets.append(bullet)
+        self.count += 1
+        return bullet
+
+    def remove(self, bullet):
+        """Removes a bound bullet in O(1). / *Retire un projectile lié en O(1).*"""
+        if bullet._store is self:
+            self._swap_remove(bullet._slot)
+
+    def remove_slots(self, slots):
+        """
+        Removes several slots at once. Slots are processed from the highest down, so the
+        bullets moved into freed slots are never ones still waiting to be removed.
+
+        *Retire plusieurs cases d'un coup. Les cases sont traitées de la plus haute à la plus basse,*
+        *pour que les projectiles déplacés dans les cases libérées ne soient jamais des projectiles à retirer.*
+        """
+        for slot in sorted(slots, reverse=True):
+            self._swap_remove(slot)
+
+    def _swap_remove(self, slot):
+        last = self.count - 1
+        removed = self.bullets[slot]
+        removed._unbind(float(self.x[slot]), float(self.y[slot]))
+        if slot != last:
+            for array in (self.x, self.y, self.vx, self.vy, self.width, self.height, self.x0, self.y0, self.expires):
+                array[slot] = array[last]
+            moved = self.bullets[last]
+            moved._slot = slot
+            self.bullets[slot] = moved
+        self.bullets.pop()
+        self.count = last
+        if self.pool is not None:
+            self.pool.release(removed)
+
+    def clear(self, keep=()):
+        """
+        Removes every bullet.
+        Args:
+            keep (iterable[Bullet]): Bullets about to be added again, not released to the pool.
+                                     *Projectiles sur le point d'être rajoutés, non rendus à la réserve.*
+
+        *Retire tous les projectiles.*
+        """
+        kept = {id(bullet) for bullet in keep}
+        for slot in range(self.count):
+            bullet = self.bullets[slot]
+            bullet._unbind(float(self.x[slot]), float(self.y[slot]))
+            if self.pool is not None and id(bullet) not in kept:
+                self.pool.release(bullet)
+        self.bullets = []
+        self.count = 0
+
+    def rect_of(self, slot, rect_type=pygame.Rect):
+        """Returns the integer rectangle of a slot, truncated like pygame.Rect. / *Retourne le rectangle entier d'une case, tronqué comme pygame.Rect.*"""
+        return rect_type(int(self.x[slot]), int(self.y[slot]), int(self.width[slot]), int(self.height[slot]))
+
+    def positions(self):
+        """
+        Returns read-only views of the live x and y float positions, in slot order, for the renderer.
+        *Retourne des vues en lecture seule des positions x et y flottantes actives, dans l'ordre des cases, pour l'affichage.*
+        """
+        x = self.x[:self.count]
+        y = self.y[:self.count]
+        x.flags.writeable = False
+        y.flags.writeable = False
+        return x, y
+
+    def integrate(self):
+        """Moves every bullet by its velocity. / *Déplace chaque projectile selon sa vélocité.*"""
+        count = self.count
+        self.x[:count] += self.vx[:count]
+        self.y[:count] += self.vy[:count]
+
+    def cull_outside(self, world_size):
+        """
+        Removes the bullets whose rectangle left the world entirely.
+        Args:
+            world_size (tuple[int, int]): The (width, height) of the game world. / *La (largeur, hauteur) du monde du jeu.*
+        Returns:
+            int: Number of bullets removed. / *Nombre de projectiles retirés.*
+        """
+        count = self.count
+        if count == 0:
+            return 0
+        left = np.trunc(self.x[:count])
+        top = np.trunc(self.y[:count])
+        outside = (left + self.width[:count] < 0) | (left > world_size[0]) | \
+                  (top + self.height[:count] < 0) | (top > world_size[1])
+        slots = np.flatnonzero(outside)
+        if slots.size:
+            self.remove_slots(slots.tolist())
+        return int(slots.size)
+
+    def cull_spent(self, current_time, max_range=0):
+        """
+        Removes the bullets that expired or flew farther than `max_range` from where they were fired.
+        Args:
+            current_time (float): The current game time. / *Le temps de jeu actuel.*
+            max_range (float): Longest flight distance, in pixels, 0 for no limit.
+                               *Plus longue distance de vol, en pixels, 0 pour aucune limite.*
+        Returns:
+            int: Number of bullets removed. / *Nombre de projectiles retirés.*
+        """
+        count = self.count
+        if count == 0:
+            return 0
+        spent = self.expires[:count] <= current_time
+        if max_range:
+            dx = self.x[:count] - self.x0[:count]
+            dy = self.y[:count] - self.y0[:count]
+            spent |= dx * dx + dy * dy > max_range * max_range
+        slots = np.flatnonzero(spent)
+        if slots.size:
+            self.remove_slots(slots.tolist())
+        return int(slots.size)
+
+    def farthest_slot(self, x, y):
+        """
+        Returns the slot of the bullet farthest from (x, y), or None when the store is empty.
+        *Retourne la case du projectile le plus éloigné de (x, y), ou None quand le stockage est vide.*
+        """
+        count = self.count
+        if count == 0:
+            return None
+        dx = self.x[:count] - x
+        dy = self.y[:count] - y
+        return int(np.argmax(dx * dx + dy * dy))
+
+    def slots_near(self, spatial_hash):
+        """
+        Returns the slots of the bullets overlapping an occupied cell of a SpatialHash layer,
+        so only those go through the per-bullet narrowphase.
+        Args:
+            spatial_hash (SpatialHash): The layer to test against (e.g. the carrots).
+                                        *La couche à tester (par ex. les carottes).*
+
+        *Retourne les cases des projectiles chevauchant une cellule occupée d'une couche SpatialHash,*
+        *pour que seuls ceux-ci passent par la phase étroite projectile par projectile.*
+        """
+        count = self.count
+        if count == 0 or len(spatial_hash) == 0:
+            return []
+        cols, rows, size = spatial_hash.cols, spatial_hash.rows, spatial_hash.cell_size
+        width = self.width[:count]
+        height = self.height[:count]
+        if width.max() > size or height.max() > size:
+            # Bullets bigger than a cell could cover a middle cell; skip the filter
+            # *Des projectiles plus grands qu'une cellule pourraient couvrir une cellule centrale ; ne pas filtrer*
+            return list(range(count))
+        occupied = np.zeros(cols * rows, dtype=bool)
+        occupied[np.fromiter(spatial_hash.occupied_cells(), dtype=np.int64)] = True
+        # Same clamped cell range as SpatialHash._cell_range / *Même plage de cellules limitée que SpatialHash._cell_range*
+        left = np.trunc(self.x[:count]).astype(np.int64)
+        top = np.trunc(self.y[:count]).astype(np.int64)
+        x0 = np.clip(left // size, 0, cols - 1)
+        y0 = np.clip(top // size, 0, rows - 1)
+        x1 = np.clip((left + np.maximum(width - 1, 0)) // size, 0, cols - 1)
+        y1 = np.clip((top + np.maximum(height - 1, 0)) // size, 0, rows - 1)
+        near = occupied[y0 * cols + x0] | occupied[y0 * cols + x1] | occupied[y1 * cols + x0] | occupied[y1 * cols + x1]
+        return np.flatnonzero(near).tolist()
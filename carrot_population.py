@@ -0,0 +1,262 @@
+# carrot_population.py
+# This file defines the CarrotPopulation class, an array-backed store for all the carrots
+# of a game. Positions, directions, active flags and respawn times are held in NumPy arrays
+# so that flee/chase/wander steering and world-bounds clamping run as one batched pass per
+# tick instead of a Python loop allocating vectors for every carrot. Carrot objects stay
+# as thin facades over their slot in the arrays, for rendering, collisions and tests.
+#
+# *Ce fichier définit la classe CarrotPopulation, un stockage en tableaux de toutes les carottes*
+# *d'une partie. Positions, directions, états actifs et temps de réapparition sont stockés dans des*
+# *tableaux NumPy afin que le pilotage (fuite/poursuite/errance) et le respect des limites du monde*
+# *s'exécutent en une seule passe groupée par tick, au lieu d'une boucle Python allouant des vecteurs*
+# *pour chaque carotte. Les objets Carrot restent de simples façades sur leur case dans les tableaux,*
+# *pour l'affichage, les collisions et les tests.*
+
+import time
+
+import numpy as np
+
+import config
+
+
+class CarrotPopulation:
+    """
+    Struct-of-arrays storage and batched steering for a list of Carrot facades.
+
+    *Stockage en structure de tableaux et pilotage groupé pour une liste de façades Carrot.*
+    """
+    def __init__(self, collision_layer=None, rng=None, lod=None):
+        """
+        Initializes an empty population.
+        Args:
+            collision_layer (SpatialHash, optional): Broadphase layer kept in sync with active carrots.
+                                                     *Couche de phase large maintenue à jour avec les carottes actives.*
+            rng (numpy.random.Generator, optional): Source of the wandering jitter.
+                                                    *Source de l'aléa d'errance.*
+            lod (SimulationLod, optional): Distance tiers updating far carrots less often (see simulation_lod.py).
+                                           Every active carrot is updated every tick when omitted.
+                                           *Paliers de distance mettant à jour moins souvent les carottes lointaines*
+                                           *(voir simulation_lod.py). Toutes les carottes actives sont mises à jour*
+                                           *à chaque tick s'il est omis.*
+        """
+        self.collision_layer = collision_layer
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.lod = lod
+        self.carrots = []
+        self._source = None # The list the population was bound from / *La liste à partir de laquelle la population a été liée*
+        self._rects = []
+        self._allocate(0)
+
+    def _allocate(self, size):
+        self.x = np.zeros(size, dtype=np.float64)
+        self.y = np.zeros(size, dtype=np.float64)
+        self.width = np.zeros(size, dtype=np.int64)
+        self.height = np.zeros(size, dtype=np.int64)
+        self.dir_x = np.zeros(size, dtype=np.float64)
+        self.dir_y = np.zeros(size, dtype=np.float64)
+        self.speed = np.zeros(size, dtype=np.float64)
+        self.active = np.zeros(size, dtype=bool)
+        self.respawn_time = np.zeros(size, dtype=np.float64)
+        # Last grid cells seen, to re-bucket only carrots that crossed a cell edge
+        # *Dernières cellules vues, pour ne re-classer que les carottes ayant franchi un bord de cellule*
+        self._cells = np.full((4, size), -1, dtype=np.int64)
+
+    def __len__(self):
+        return len(self.carrots)
+
+    def __contains__(self, carrot):
+        return getattr(carrot, '_population', None) is self
+
+    def bind(self, carrots):
+        """
+        Moves the state of the given carrots into the arrays and makes them facades over it.
+        Carrots previously bound get their state back as plain attributes.
+
+        *Transfère l'état des carottes données dans les tableaux et en fait des façades sur celui-ci.*
+        *Les carottes liées précédemment récupèrent leur état sous forme d'attributs simples.*
+        """
+        for carrot in self.carrots:
+            self._unbind(carrot)
+        self._allocate(len(carrots))
+        self.carrots = list(carrots)
+        self._source = carrots
+        self._rects = [carrot.rect for carrot in self.carrots]
+        for slot, carrot in enumerate(self.carrots):
+            direction = carrot.direction
+            self.x[slot] = carrot.rect.x
+            self.y[slot] = carrot.rect.y
+            self.width[slot] = carrot.rect.width
+            self.height[slot] = carrot.rect.height
+            self.dir_x[slot] = direction[0]
+            self.dir_y[slot] = direction[1]
+            self.speed[slot] = carrot.speed
+            self.active[slot] = carrot.active
+            self.respawn_time[slot] = carrot.respawn_timer
+            carrot._population = self
+            carrot._slot = slot
+            if self.collision_layer is not None:
+                if carrot.active:
+                    self.collision_layer.update(carrot)
+                else:
+                    self.collision_layer.remove(carrot)
+        self._cells = self._cell_keys(np.arange(len(self.carrots)))
+
+    def _unbind(self, carrot):
+        if carrot._population is not self:
+            return
+        slot = carrot._slot
+        direction = carrot.direction
+        active = bool(self.active[slot])
+        respawn_timer = float(self.respawn_time[slot])
+        carrot._population = None
+        carrot._slot = -1
+        carrot.direction = direction
+        carrot.active = active
+        carrot.respawn_timer = respawn_timer
+
+    def sync(self, carrots):
+        """
+        Rebinds the population if the carrot list was replaced or resized since the last bind.
+        *Relie la population si la liste des carottes a été remplacée ou redimensionnée depuis la dernière liaison.*
+        """
+        if carrots is not self._source or len(carrots) != len(self.carrots):
+            self.bind(carrots)
+
+    def set_active(self, slot, value):
+        """Sets a carrot's active flag and keeps the collision layer in sync. / *Définit l'état actif d'une carotte et met à jour la couche de collision.*"""
+        self.active[slot] = value
+        if self.collision_layer is not None:
+            if value:
+                self._rebucket(slot)
+            else:
+                self.collision_layer.remove(self.carrots[slot])
+
+    def store_position(self, slot):
+        """Copies a facade's rect position into the arrays after it was moved directly. / *Copie la position du rect d'une façade dans les tableaux après un déplacement direct.*"""
+        rect = self._rects[slot]
+        self.x[slot] = rect.x
+        self.y[slot] = rect.y
+        if self.active[slot] and self.collision_layer is not None:
+            self._rebucket(slot)
+
+    def _rebucket(self, slot):
+        self._cells[:, slot] = self._cell_keys(np.array([slot]))[:, 0]
+        self.collision_layer.update(self.carrots[slot])
+
+    def _cell_keys(self, slots):
+        size = self.collision_layer.cell_size if self.collision_layer is not None else config.COLLISION_CELL_SIZE
+        x = self.x[slots].astype(np.int64)
+        y = self.y[slots].astype(np.int64)
+        return np.stack((
+            x // size,
+            y // size,
+            (x + np.maximum(self.width[slots] - 1, 0)) // size,
+            (y + np.maximum(self.height[slots] - 1, 0)) // size,
+        ))
+
+    def step(self, player_rect, world_bounds):
+        """
+        Steers and moves every active carrot in one batched pass, with the same rules as
+        Carrot.update(): flee when the player is inside CARROT_CHASE_RADIUS, chase inside
+        CARROT_DETECTION_RADIUS (faster when closer), wander otherwise, then clamp to the world.
+        With a SimulationLod, only the carrots whose tier is due this tick are steered, and they
+        move by as many ticks as their tier's interval.
+        Args:
+            player_rect (pygame.Rect): The player's current rectangle. / *Rectangle actuel du joueur.*
+            world_bounds (tuple[int, int]): Boundaries of the game world. / *Limites du monde du jeu.*
+
+        *Pilote et déplace toutes les carottes actives en une seule passe groupée, avec les mêmes règles*
+        *que Carrot.update() : fuite quand le joueur est dans CARROT_CHASE_RADIUS, poursuite dans*
+        *CARROT_DETECTION_RADIUS (plus rapide de près), errance sinon, puis limitation au monde.*
+        *Avec un SimulationLod, seules les carottes dont le palier est dû à ce tick sont pilotées, et elles*
+        *avancent d'autant de ticks que l'intervalle de leur palier.*
+        """
+        slots = np.flatnonzero(self.active)
+        if slots.size == 0:
+            return
+        lod = self.lod
+        if lod is None or slots.size < lod.min_population:
+            self._steer(slots, player_rect, world_bounds, 1)
+            return
+        to_player_x = player_rect.centerx - (self.x[slots] + self.width[slots] // 2)
+        to_player_y = player_rect.centery - (self.y[slots] + self.height[slots] // 2)
+        due, ticks = lod.schedule(slots, to_player_x * to_player_x + to_player_y * to_player_y)
+        if due.size:
+            start = time.perf_counter()
+            self._steer(due, player_rect, world_bounds, ticks)
+            lod.charge(time.perf_counter() - start)
+
+    def _steer(self, slots, player_rect, world_bounds, ticks):
+        # Steering kernel for the given slots, moving them by `ticks` ticks' worth of distance (a number or one per slot)
+        # *Noyau de pilotage pour les cases données, les déplaçant de la distance de `ticks` ticks (un nombre ou un par case)*
+        x = self.x[slots]
+        y = self.y[slots]
+        width = self.width[slots]
+        height = self.height[slots]
+        dir_x = self.dir_x[slots]
+        dir_y = self.dir_y[slots]
+        speed = self.speed[slots]
+
+        # Same integer centers as pygame.Rect.center / *Mêmes centres entiers que pygame.Rect.center*
+        to_player_x = player_rect.centerx - (x + width // 2)
+        to_player_y = player_rect.centery - (y + height // 2)
+        dist_sq = to_player_x * to_player_x + to_player_y * to_player_y
+        dist = np.sqrt(dist_sq)
+
+        detected = dist_sq < config.CARROT_DETECTION_RADIUS_SQUARED
+        speed_factor = (config.CARROT_DETECTION_RADIUS - dist) / config.CARROT_DETECTION_RADIUS
+        boosted = speed * (1 + speed_factor * (config.MAX_SPEED_MULTIPLIER - 1))
+        boosted = np.minimum(np.maximum(speed, boosted), speed * config.MAX_SPEED_MULTIPLIER)
+        current_speed = np.where(detected, boosted, speed)
+        if not np.isscalar(ticks) or ticks != 1:
+            current_speed = current_speed * ticks
+
+        # Flee or chase along the normalized vector to the player / *Fuir ou poursuivre selon le vecteur normalisé vers le joueur*
+        safe_dist = np.where(dist_sq > 0, dist, 1.0)
+        fleeing = detected & (dist < config.CARROT_CHASE_RADIUS) & (dist_sq > 0)
+        chasing = detected & (dist >= config.CARROT_CHASE_RADIUS)
+        dir_x = np.where(fleeing, -(to_player_x / safe_dist), np.where(chasing, to_player_x / safe_dist, dir_x))
+        dir_y = np.where(fleeing, -(to_player_y / safe_dist), np.where(chasing, to_player_y / safe_dist, dir_y))
+
+        # Wander: jitter the current direction and re-normalize / *Errance : perturber la direction actuelle et renormaliser*
+        wandering = ~detected
+        wander_count = int(np.count_nonzero(wandering))
+        if wander_count:
+            jitter = self.rng.uniform(-0.2, 0.2, size=(wander_count, 2))
+            wander_x = dir_x[wandering] + jitter[:, 0]
+            wander_y = dir_y[wandering] + jitter[:, 1]
+            length = np.sqrt(wander_x * wander_x + wander_y * wander_y)
+            degenerate = length == 0 # Highly unlikely; fall back to (1, 0) / *Très improbable ; repli sur (1, 0)*
+            wander_x = np.where(degenerate, 1.0, wander_x)
+            length = np.where(degenerate, 1.0, length)
+            dir_x[wandering] = wander_x / length
+            dir_y[wandering] = wander_y / length
+
+        # Integer positions, truncated like pygame.Rect assignments, then clamped to the world
+        # *Positions entières, tronquées comme les affectations de pygame.Rect, puis limitées au monde*
+        new_x = np.clip(np.trunc(x + dir_x * current_speed), 0, world_bounds[0] - width)
+        new_y = np.clip(np.trunc(y + dir_y * current_speed), 0, world_bounds[1] - height)
+
+        self.dir_x[slots] = dir_x
+        self.dir_y[slots] = dir_y
+        self.x[slots] = new_x
+        self.y[slots] = new_y
+
+        # Write positions back to the facades' rects for the ones that moved
+        # *Recopier les positions dans les rects des façades pour celles qui ont bougé*
+        moved = np.flatnonzero((new_x != x) | (new_y != y))
+        if moved.size:
+            rects = self._rects
+            for slot, rect_x, rect_y in zip(slots[moved].tolist(), new_x[moved].tolist(), new_y[moved].tolist()):
+                rects[slot].topleft = (rect_x, rect_y)
+
+            if self.collision_layer is not None:
+                moved_slots = slots[moved]
+                cells = self._cell_keys(moved_slots)
+                changed = np.any(cells != self._cells[:, moved_slots], axis=0)
+                if changed.any():
+                    changed_slots = moved_slots[changed]
+                    self._cells[:, changed_slots] = cells[:, changed]
+                    carrots = self.carrots
+                    for slot in changed_slots.tolist():
+                        self.collision_layer.update(carrots[slot])
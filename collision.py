@@ -0,0 +1,212 @@
+# collision.py
+# This file defines the broadphase collision structures used by GameState.
+# A SpatialHash buckets entities into a uniform grid of cells covering the game world,
+# so that "who overlaps this rectangle?" only tests the entities sharing a cell with it
+# instead of every entity in the game. A CollisionWorld groups several named layers
+# (carrots, items, vampires...) and counts the narrowphase pair tests made each frame.
+#
+# *Ce fichier définit les structures de détection de collisions (phase large) utilisées par GameState.*
+# *Un SpatialHash range les entités dans une grille uniforme de cellules couvrant le monde du jeu,*
+# *de sorte que la question "qui chevauche ce rectangle ?" ne teste que les entités partageant une*
+# *cellule avec lui, au lieu de toutes les entités du jeu. Un CollisionWorld regroupe plusieurs couches*
+# *nommées (carottes, objets, vampires...) et compte les tests de paires effectués à chaque frame.*
+
+import config
+
+
+class SpatialHash:
+    """
+    Uniform grid of cells over the game world. Each entity (any object with a `rect`)
+    is registered in every cell its rectangle overlaps. Moving an entity only touches
+    the buckets when the range of cells it covers changes.
+
+    *Grille uniforme de cellules sur le monde du jeu. Chaque entité (tout objet avec un `rect`)*
+    *est enregistrée dans chaque cellule que son rectangle chevauche. Déplacer une entité ne*
+    *modifie les cases que lorsque la plage de cellules couverte change.*
+    """
+    def __init__(self, world_size, cell_size):
+        """
+        Initializes the spatial hash.
+        Args:
+            world_size (tuple[int, int]): The (width, height) of the game world.
+                                          *La (largeur, hauteur) du monde du jeu.*
+            cell_size (int): The side of a square cell, in pixels.
+                             *Le côté d'une cellule carrée, en pixels.*
+        """
+        self.cell_size = cell_size
+        self.cols = max(1, -(-world_size[0] // cell_size))  # Ceiling division / *Division arrondie au supérieur*
+        self.rows = max(1, -(-world_size[1] // cell_size))
+        # Cell key -> insertion-ordered dict used as an ordered set, so query results are deterministic
+        # *Clé de cellule -> dict ordonné utilisé comme ensemble ordonné, pour des résultats de requête déterministes*
+        self._cells = {}
+        self._entity_ranges = {}  # Entity -> (x0, y0, x1, y1) cell range / *Entité -> plage de cellules*
+
+    def _cell_range(self, rect):
+        """Returns the (x0, y0, x1, y1) range of cells covered by a rectangle, clamped to the grid."""
+        # *Retourne la plage (x0, y0, x1, y1) des cellules couvertes par un rectangle, limitée à la grille.*
+        size = self.cell_size
+        last_col = self.cols - 1
+        last_row = self.rows - 1
+        x0 = min(last_col, max(0, int(rect.x) // size))
+        y0 = min(last_row, max(0, int(rect.y) // size))
+        x1 = min(last_col, max(0, (int(rect.x) + max(0, int(rect.width) - 1)) // size))
+        y1 = min(last_row, max(0, (int(rect.y) + max(0, int(rect.height) - 1)) // size))
+        return (x0, y0, x1, y1)
+
+    def _add_to_cells(self, entity, cell_range):
+        x0, y0, x1, y1 = cell_range
+        cells = self._cells
+        for cy in range(y0, y1 + 1):
+            row_offset = cy * self.cols
+            for cx in range(x0, x1 + 1):
+                bucket = cells.get(row_offset + cx)
+                if bucket is None:
+                    bucket = cells[row_offset + cx] = {}
+                bucket[entity] = None
+
+    def _remove_from_cells(self, entity, cell_range):
+        x0, y0, x1, y1 = cell_range
+        cells = self._cells
+        for cy in range(y0, y1 + 1):
+            row_offset = cy * self.cols
+            for cx in range(x0, x1 + 1):
+                bucket = cells.get(row_offset + cx)
+                if bucket is not None:
+                    bucket.pop(entity, None)
+                    if not bucket:
+                        del cells[row_offset + cx]
+
+    def update(self, entity):
+        """
+        Inserts the entity, or re-buckets it if its rectangle now covers different cells.
+        *Insère l'entité, ou la re-classe si son rectangle couvre maintenant d'autres cellules.*
+        """
+        new_range = self._cell_range(entity.rect)
+        old_range = self._entity_ranges.get(entity)
+        if old_range == new_range:
+            return
+        if old_range is not None:
+            self._remove_from_cells(entity, old_range)
+        self._add_to_cells(entity, new_range)
+        self._entity_ranges[entity] = new_range
+
+    def remove(self, entity):
+        """
+        Removes the entity from the hash. Does nothing if it is not registered.
+        *Retire l'entité du hash. Ne fait rien si elle n'est pas enregistrée.*
+        """
+        old_range = self._entity_ranges.pop(entity, None)
+        if old_range is not None:
+            self._remove_from_cells(entity, old_range)
+
+    def clear(self):
+        """Removes every entity. / *Retire toutes les entités.*"""
+        self._cells.clear()
+        self._entity_ranges.clear()
+
+    def candidates(self, rect):
+        """
+        Returns the entities sharing at least one cell with the rectangle (broadphase only),
+        without duplicates and in a deterministic order.
+
+        *Retourne les entités partageant au moins une cellule avec le rectangle (phase large uniquement),*
+        *sans doublons et dans un ordre déterministe.*
+        """
+        x0, y0, x1, y1 = self._cell_range(rect)
+        cells = self._cells
+        if x0 == x1 and y0 == y1: # Common case: the rectangle fits in one cell / *Cas courant : le rectangle tient dans une cellule*
+            bucket = cells.get(y0 * self.cols + x0)
+            return list(bucket) if bucket else []
+        found = {}
+        for cy in range(y0, y1 + 1):
+            row_offset = cy * self.cols
+            for cx in range(x0, x1 + 1):
+                bucket = cells.get(row_offset + cx)
+                if bucket:
+                    found.update(bucket)
+        return list(found)
+
+    def occupied_cells(self):
+        """Returns the keys (row * cols + col) of the non-empty cells. / *Retourne les clés des cellules non vides.*"""
+        return self._cells.keys()
+
+    def __contains__(self, entity):
+        return entity in self._entity_ranges
+
+    def __len__(self):
+        return len(self._entity_ranges)
+
+
+class CollisionWorld:
+    """
+    A set of named SpatialHash layers sharing the same grid, plus a counter of the
+    narrowphase rectangle tests performed, so we can check collision cost per frame.
+
+    *Un ensemble de couches SpatialHash nommées partageant la même grille, plus un compteur*
+    *des tests de rectangles effectués (phase étroite), pour vérifier le coût des collisions par frame.*
+    """
+    def __init__(self, world_size=config.WORLD_SIZE, cell_size=config.COLLISION_CELL_SIZE):
+        """
+        Initializes the collision world.
+        Args:
+            world_size (tuple[int, int]): The (width, height) of the game world.
+                                          *La (largeur, hauteur) du monde du jeu.*
+            cell_size (int): Side of a grid cell in pixels. / *Côté d'une cellule de la grille en pixels.*
+        """
+        self.world_size = world_size
+        self.cell_size = cell_size
+        self.layers = {}
+        self.pair_tests = 0  # Pair tests made since begin_frame() / *Tests de paires depuis begin_frame()*
+        self.last_frame_pair_tests = 0  # Pair tests made during the previous frame / *Tests de paires de la frame précédente*
+
+    def layer(self, name):
+        """Returns the layer with this name, creating it if needed. / *Retourne la couche de ce nom, en la créant si besoin.*"""
+        spatial_hash = self.layers.get(name)
+        if spatial_hash is None:
+            spatial_hash = self.layers[name] = SpatialHash(self.world_size, self.cell_size)
+        return spatial_hash
+
+    def begin_frame(self):
+        """Starts a new frame of pair test counting. / *Commence une nouvelle frame de comptage des tests de paires.*"""
+        self.last_frame_pair_tests = self.pair_tests
+        self.pair_tests = 0
+
+    def move(self, name, entity):
+        """Inserts or re-buckets an entity in a layer. / *Insère ou re-classe une entité dans une couche.*"""
+        self.layer(name).update(entity)
+
+    def remove(self, name, entity):
+        """Removes an entity from a layer. / *Retire une entité d'une couche.*"""
+        self.layer(name).remove(entity)
+
+    def clear(self):
+        """Empties every layer. / *Vide toutes les couches.*"""
+        for spatial_hash in self.layers.values():
+            spatial_hash.clear()
+
+    def query(self, name, rect):
+        """
+        Returns the entities of a layer whose rect collides with the given rectangle.
+        Args:
+            name (str): The layer to query. / *La couche à interroger.*
+            rect (pygame.Rect): The rectangle to test. / *Le rectangle à tester.*
+        Returns:
+            list: Colliding entities, in a deterministic order. / *Entités en collision, dans un ordre déterministe.*
+        """
+        candidates = self.layer(name).candidates(rect)
+        self.pair_tests += len(candidates)
+        return [entity for entity in candidates if rect.colliderect(entity.rect)]
+
+    def first_hit(self, name, rect):
+        """
+        Returns the first entity of a layer colliding with the rectangle, or None.
+        Stops testing as soon as a hit is found.
+
+        *Retourne la première entité d'une couche en collision avec le rectangle, ou None.*
+        *Arrête les tests dès qu'une collision est trouvée.*
+        """
+        for entity in self.layer(name).candidates(rect):
+            self.pair_tests += 1
+            if rect.colliderect(entity.rect):
+                return entity
+        return None
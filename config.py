@@ -11,6 +11,8 @@
 # *Monde et Caméra*
 WORLD_SIZE = (4000, 4000)  # Total size of the game world in pixels / *Taille totale du monde du jeu en pixels*
 SCROLL_TRIGGER = 0.2  # Percentage of screen edge to trigger scrolling / *Pourcentage du bord de l'écran pour déclencher le défilement*
+COLLISION_CELL_SIZE = 128  # Side of a collision grid cell, in pixels / *Côté d'une cellule de la grille de collision, en pixels*
+VIEWPORT_CULL_MARGIN = 32  # Pixels kept around the screen when culling draws, for sprites drawn past their rect / *Pixels gardés autour de l'écran lors de l'écartement des dessins, pour les sprites dessinés au-delà de leur rect*
 
 # Player & Entities
 # *Joueur et Entités*
@@ -25,6 +27,9 @@ MAX_CARROT_JUICE = 999  # Practical cap for carrot juice collected / *Limite pra
 # *Mécanismes de Jeu*
 ## Combat
 BULLET_SPEED = 4  # Speed of player's bullets / *Vitesse des projectiles du joueur*
+BULLET_TTL = 6  # Seconds a bullet flies before it is removed, 0 for no limit / *Secondes de vol d'un projectile avant sa suppression, 0 pour aucune limite*
+BULLET_MAX_RANGE = 1200  # Distance a bullet flies before it is removed, in pixels, 0 for no limit / *Distance de vol d'un projectile avant sa suppression, en pixels, 0 pour aucune limite*
+WEAPON_FIRE_INTERVALS = {'bullet': 0.08, 'garlic': 0.25}  # Shortest time between two player shots, in seconds, by weapon / *Temps minimal entre deux tirs du joueur, en secondes, par arme*
 GARLIC_SHOT_SPEED = 5  # Speed of the garlic special attack / *Vitesse de l'attaque spéciale à l'ail*
 GARLIC_SHOT_DURATION = 3  # Duration the garlic shot stays active, in seconds / *Durée pendant laquelle le tir d'ail reste actif, en secondes*
 GARLIC_SHOT_MAX_TRAVEL = 250  # Maximum distance the garlic shot can travel, in pixels / *Distance maximale que le tir d'ail peut parcourir, en pixels*
@@ -36,6 +41,7 @@ CARROT_COUNT = 5  # Number of carrot enemies in the game / *Nombre de carottes e
 CARROT_SPEED = 3  # Base speed of carrot enemies / *Vitesse de base des carottes ennemies*
 CARROT_RESPAWN_DELAY = 3  # Delay before a carrot respawns after being defeated, in seconds / *Délai avant la réapparition d'une carotte après avoir été vaincue, en secondes*
 CARROT_DETECTION_RADIUS = 200  # Radius within which carrots detect the player / *Rayon dans lequel les carottes détectent le joueur*
+CARROT_DETECTION_RADIUS_SQUARED = CARROT_DETECTION_RADIUS ** 2 # Squared detection radius, computed once / *Rayon de détection au carré, calculé une seule fois*
 CARROT_CHASE_RADIUS = 100  # Radius within which carrots will actively chase the player / *Rayon dans lequel les carottes poursuivront activement le joueur*
 CARROT_CHASE_RADIUS_SQUARED = CARROT_CHASE_RADIUS ** 2 # Squared chase radius for performance (avoid sqrt) / *Rayon de poursuite au carré pour la performance (éviter sqrt)*
 MAX_SPEED_MULTIPLIER = 3  # Maximum speed multiplier for carrots when close to player / *Multiplicateur de vitesse maximal pour les carottes proches du joueur*
@@ -43,6 +49,7 @@ MAX_SPEED_MULTIPLIER = 3  # Maximum speed multiplier for carrots when close to p
 ## Vampire
 # *Vampire (Ennemi Spécial)*
 VAMPIRE_SPEED = 4  # Speed of the vampire enemy / *Vitesse de l'ennemi vampire*
+VAMPIRE_COUNT = 1  # Vampires at the start of a game / *Vampires au début d'une partie*
 
 # UI & Visuals
 # *Interface Utilisateur et Visuels*
@@ -63,10 +70,15 @@ UI_GARLIC_SPACING = 5
 UI_JUICE_COUNTER_DIGIT_SPACING = 2
 UI_JUICE_COUNTER_DIGIT_SCALE = 0.5
 VAMPIRE_DEATH_TINT_COLOR = (0, 255, 0, 128)
+PLAYER_DEATH_TINT_COLOR = (255, 0, 0, 128)
 
 # Timing & Animation
 # *Temporisation et Animation*
-FRAME_DELAY = 0.02  # Delay per frame, aiming for 50 FPS (1/50 = 0.02) / *Délai par frame, visant 50 FPS (1/50 = 0.02)*
+FRAME_DELAY = 0.02  # Delay per frame when FIXED_TIMESTEP is off, aiming for 50 FPS (1/50 = 0.02) / *Délai par frame quand FIXED_TIMESTEP est désactivé, visant 50 FPS (1/50 = 0.02)*
+FIXED_TIMESTEP = True  # Run the simulation at a fixed tick rate, decoupled from rendering / *Exécuter la simulation à fréquence fixe, découplée de l'affichage*
+SIMULATION_TICK_RATE = 50  # Simulation ticks per second; speeds are tuned per tick / *Ticks de simulation par seconde ; les vitesses sont réglées par tick*
+MAX_CATCH_UP_TICKS = 5  # Most ticks run for one rendered frame after a stall / *Nombre maximal de ticks exécutés pour une frame après un blocage*
+RENDER_FPS_LIMIT = 120  # Render frame cap with FIXED_TIMESTEP, 0 for uncapped / *Limite d'images affichées avec FIXED_TIMESTEP, 0 pour aucune limite*
 EXPLOSION_FLASH_INTERVAL = 0.1  # Interval between explosion flashes, in seconds / *Intervalle entre les flashs d'explosion, en secondes*
 EXPLOSION_MAX_FLASHES = 3  # Number of flashes for an explosion effect / *Nombre de flashs pour un effet d'explosion*
 VAMPIRE_DEATH_DURATION = 2  # Duration of the vampire death effect, in seconds / *Durée de l'effet de mort du vampire, en secondes*
@@ -78,8 +90,53 @@ PLAYER_INVINCIBILITY_FLASH_FREQUENCY = 15 # Frequency of player flashing when in
 # Gameplay
 # *Jouabilité (Autres)*
 ITEM_DROP_GARLIC_CHANCE = 0.5  # Chance for a defeated enemy to drop a garlic item (0.0 to 1.0) / *Chance qu'un ennemi vaincu laisse tomber un ail (0.0 à 1.0)*
+ITEM_LIFETIME = 30  # Seconds an uncollected item stays on the ground, 0 for ever / *Secondes qu'un objet non ramassé reste au sol, 0 pour toujours*
+ITEM_MERGE_RADIUS = 48  # A drop this close to an item of the same type merges into it, 0 to never merge / *Un objet déposé aussi près d'un objet du même type fusionne avec lui, 0 pour ne jamais fusionner*
 GARLIC_SHOT_ROTATION_SPEED = 5 # Visual rotation speed of the garlic item when shot / *Vitesse de rotation visuelle de l'ail lorsqu'il est tiré*
 CARROT_SPAWN_SAFE_RATIO = 3  # Minimum distance from player for carrot spawn (world_size / ratio) / *Distance minimale par rapport au joueur pour l'apparition des carottes (taille_monde / ratio)*
+CARROT_SPAWN_MIN_SPACING = 0  # Minimum distance between carrots of one wave, 0 for none / *Distance minimale entre les carottes d'une vague, 0 pour aucune*
+SPAWN_MAX_ATTEMPTS = 32  # Random draws per position before sampling the precomputed spawn region / *Tirages aléatoires par position avant d'échantillonner la région d'apparition précalculée*
+SPAWN_BULK_THRESHOLD = 64  # Smallest wave placed with batched NumPy draws / *Plus petite vague placée par tirages NumPy groupés*
+SPAWN_CELL_SIZE = 128  # Side of the spawn region grid cells, in pixels / *Côté des cellules de la grille de la région d'apparition, en pixels*
+SPAWN_MAX_ROUNDS = 8  # Batches drawn before a placement falls back / *Lots tirés avant qu'un placement se rabatte*
+SPAWN_SPACING_CANDIDATES = 8  # Candidates drawn per missing position when spacing is on / *Candidats tirés par position manquante quand l'espacement est actif*
+
+# Entity Budgets (most live entities per type; past it the least useful ones are culled first)
+# *Budgets d'Entités (nombre maximal d'entités vivantes par type ; au-delà les moins utiles sont retirées en premier)*
+BULLET_BUDGET = 512  # Farthest bullets from the player go first / *Les projectiles les plus loin du joueur partent en premier*
+ITEM_BUDGET = 256  # Oldest items go first / *Les objets les plus anciens partent en premier*
+EXPLOSION_BUDGET = 64  # Oldest explosions go first, without their drop / *Les explosions les plus anciennes partent en premier, sans leur butin*
+
+# Object Pools (instances created up front and recycled instead of reallocated)
+# *Réserves d'Objets (instances créées au départ et recyclées au lieu d'être réallouées)*
+BULLET_POOL_SIZE = 128  # Bullets pre-allocated at startup / *Projectiles pré-alloués au démarrage*
+EXPLOSION_POOL_SIZE = 16  # Explosions pre-allocated at startup / *Explosions pré-allouées au démarrage*
+COLLECTIBLE_POOL_SIZE = 32  # Collectible items pre-allocated at startup / *Objets collectables pré-alloués au démarrage*
+GARLIC_SHOT_POOL_SIZE = 8  # Garlic shots pre-allocated at startup / *Tirs d'ail pré-alloués au démarrage*
+
+# Simulation Level of Detail (enemies far from the player update less often, see simulation_lod.py)
+# *Niveau de Détail de Simulation (les ennemis loin du joueur sont mis à jour moins souvent, voir simulation_lod.py)*
+LOD_NEAR_RADIUS = 1200  # Updated every tick within this distance; covers the screen and detection radii / *Mis à jour à chaque tick dans cette distance ; couvre l'écran et les rayons de détection*
+LOD_MID_RADIUS = 2000  # Outer distance of the mid tier / *Distance extérieure du palier moyen*
+LOD_MID_INTERVAL = 3  # Ticks between updates in the mid tier / *Ticks entre mises à jour dans le palier moyen*
+LOD_FAR_INTERVAL = 10  # Ticks between updates beyond LOD_MID_RADIUS / *Ticks entre mises à jour au-delà de LOD_MID_RADIUS*
+LOD_MIN_POPULATION = 64  # Below this many active enemies every one updates each tick (tiering costs more than it saves) / *En dessous de ce nombre d'ennemis actifs, tous sont mis à jour à chaque tick (le classement coûte plus qu'il ne rapporte)*
+
+# Flow Field (shared navigation towards the player, see flow_field.py)
+# *Champ de Flux (navigation partagée vers le joueur, voir flow_field.py)*
+FLOW_FIELD_CELL_SIZE = 64  # Side of a flow field cell, in pixels / *Côté d'une cellule du champ de flux, en pixels*
+FLOW_FIELD_REBUILD_BUDGET = 400  # Cells settled per tick by a rebuild around obstacles, 0 for no limit; the old field is used until it ends / *Cellules réglées par tick par une reconstruction autour des obstacles, 0 pour aucune limite ; l'ancien champ sert jusqu'à la fin*
+FLOW_FIELD_OBSTACLES = []  # World rectangles (x, y, width, height) chasers walk around / *Rectangles du monde (x, y, largeur, hauteur) contournés par les poursuivants*
+
+# Stress Profile (main.py --stress, see stress.py); each value can be overridden on the command line
+# *Profil de Stress (main.py --stress, voir stress.py) ; chaque valeur peut être remplacée en ligne de commande*
+STRESS_CARROTS = 5000  # Carrots at the start of a stress run / *Carottes au début d'une exécution de stress*
+STRESS_VAMPIRES = 12  # Vampires at the start of a stress run / *Vampires au début d'une exécution de stress*
+STRESS_FIRE_RATE = 20  # Bullets auto-fired per second / *Projectiles tirés automatiquement par seconde*
+STRESS_EXPLOSION_RATE = 12  # Explosions spawned per second around the player / *Explosions créées par seconde autour du joueur*
+STRESS_WAVE_SIZE = 0  # Carrots added by each spawn wave, 0 for none / *Carottes ajoutées par chaque vague, 0 pour aucune*
+STRESS_WAVE_INTERVAL = 5  # Seconds between spawn waves / *Secondes entre les vagues d'apparition*
+STRESS_DURATION = 60  # Game seconds simulated by a headless run, 0 to run until interrupted / *Secondes de jeu simulées par une exécution sans affichage, 0 pour tourner jusqu'à interruption*
 
 # Music Configuration
 # *Configuration de la Musique*
@@ -101,6 +158,16 @@ PLACEHOLDER_BG_COLOR = (0, 0, 255)     # Blue background color for placeholder i
 DEFAULT_PLACEHOLDER_SIZE = (100, 50)   # Default size for placeholder images if original size is unknown / *Taille par défaut pour les images de remplacement si la taille originale est inconnue*
 PLACEHOLDER_FONT_SIZE = 20 # Font size for text on placeholders / *Taille de police de remplacement*
 
+# Rotation Atlas and Sprite Variants (derived copies of sprites rendered once, see asset_manager.py)
+# *Atlas de Rotation et Variantes de Sprites (copies dérivées des sprites rendues une seule fois, voir asset_manager.py)*
+ROTATION_ATLAS_STEP = 5  # Degrees between two pre-rendered angles / *Degrés entre deux angles pré-rendus*
+ROTATION_ATLAS_IMAGES = ('bullet', 'garlic')  # Images rendered at startup; others are rendered on first use / *Images rendues au démarrage ; les autres le sont à la première utilisation*
+SPRITE_VARIANT_CACHE_BYTES = 16 * 1024 * 1024  # Pixel memory of the flipped, tinted and scaled copies; least recently used go first / *Mémoire en pixels des copies retournées, teintées et mises à l'échelle ; les moins récemment utilisées partent en premier*
+
+# Render Queue (world-space sprites are queued by layer, then submitted with Surface.blits, see render_queue.py)
+# *File de Rendu (les sprites de l'espace du monde sont mis en file par couche, puis envoyés avec Surface.blits, voir render_queue.py)*
+RENDER_LAYERS = ('carrots', 'player', 'bullets', 'garlic_shots', 'explosions', 'vampires', 'items')  # Bottom to top; the HUD is drawn over them / *Du bas vers le haut ; le HUD est dessiné par-dessus*
+
 # Asset Configuration: 'path' is mandatory, 'size' (width, height) is optional for placeholders.
 # Keys should match what AssetManager and main.py expect for loading.
 #
@@ -0,0 +1,205 @@
+# ecs.py
+# This file defines a small entity-component-system (ECS) core.
+# An entity is an integer id. Its components are named values (a rect, a velocity, an
+# item type...). Entities with exactly the same set of component names share an Archetype,
+# which stores each component in its own column (a list), so a system walks only the
+# archetypes holding the components it needs instead of testing every entity.
+# Queries are cached by World: a query keeps the list of matching archetypes and is
+# extended when a new archetype appears, so running it costs nothing per unrelated entity.
+#
+# *Ce fichier définit un petit noyau entité-composant-système (ECS).*
+# *Une entité est un identifiant entier. Ses composants sont des valeurs nommées (un rect, une*
+# *vélocité, un type d'objet...). Les entités ayant exactement le même ensemble de noms de composants*
+# *partagent un Archetype, qui stocke chaque composant dans sa propre colonne (une liste), de sorte*
+# *qu'un système ne parcourt que les archétypes possédant les composants dont il a besoin au lieu de*
+# *tester chaque entité. Les requêtes sont mises en cache par World : une requête garde la liste des*
+# *archétypes correspondants et est complétée quand un nouvel archétype apparaît, donc l'exécuter ne*
+# *coûte rien par entité non concernée.*
+
+import itertools
+
+
+class Archetype:
+    """
+    Column storage for all the entities sharing one set of component names.
+    Removal swaps the last row into the freed one, so row order is not stable.
+
+    *Stockage en colonnes de toutes les entités partageant un même ensemble de noms de composants.*
+    *La suppression déplace la dernière ligne dans celle libérée, l'ordre des lignes n'est donc pas stable.*
+    """
+    def __init__(self, signature):
+        self.signature = signature  # frozenset of component names / *frozenset des noms de composants*
+        self.entities = []  # Entity id of each row / *Identifiant d'entité de chaque ligne*
+        self.columns = {name: [] for name in signature}
+
+    def __len__(self):
+        return len(self.entities)
+
+    def append(self, entity, components):
+        """Adds a row and returns its index. / *Ajoute une ligne et retourne son indice.*"""
+        self.entities.append(entity)
+        for name, column in self.columns.items():
+            column.append(components[name])
+        return len(self.entities) - 1
+
+    def pop(self, row):
+        """
+        Removes a row and returns (components, moved entity id or None).
+        *Retire une ligne et retourne (composants, identifiant de l'entité déplacée ou None).*
+        """
+        last = len(self.entities) - 1
+        components = {}
+        for name, column in self.columns.items():
+            components[name] = column[row]
+            column[row] = column[last]
+            column.pop()
+        moved = self.entities[last]
+        self.entities[row] = moved
+        self.entities.pop()
+        return components, (moved if row != last else None)
+
+
+class Query:
+    """
+    Cached view over every archetype holding a set of components.
+    Iterating yields (entity, component values...) rows in the requested order. Rows are
+    copied per archetype first, so systems may spawn and despawn entities while iterating.
+
+    *Vue mise en cache sur tous les archétypes possédant un ensemble de composants.*
+    *L'itération produit des lignes (entité, valeurs des composants...) dans l'ordre demandé. Les lignes*
+    *sont d'abord copiées par archétype, pour que les systèmes puissent créer et supprimer des entités pendant l'itération.*
+    """
+    def __init__(self, names):
+        self.names = names
+        self.required = frozenset(names)
+        self.archetypes = []
+
+    def _consider(self, archetype):
+        if self.required <= archetype.signature:
+            self.archetypes.append(archetype)
+
+    def __iter__(self):
+        names = self.names
+        for archetype in self.archetypes:
+            if archetype.entities:
+                columns = [archetype.columns[name] for name in names]
+                yield from list(zip(archetype.entities, *columns))
+
+    def __len__(self):
+        return sum(len(archetype) for archetype in self.archetypes)
+
+
+class World:
+    """
+    Entity registry: creates entities, moves them between archetypes when components are
+    added or removed, and serves cached queries.
+
+    *Registre des entités : crée les entités, les déplace entre archétypes quand des composants sont*
+    *ajoutés ou retirés, et fournit des requêtes mises en cache.*
+    """
+    def __init__(self):
+        self._ids = itertools.count(1)
+        self._archetypes = {}  # signature -> Archetype
+        self._locations = {}  # entity -> (Archetype, row) / *entité -> (Archetype, ligne)*
+        self._queries = {}  # tuple of names -> Query / *tuple de noms -> Query*
+        self.despawn_hooks = []  # Called with (entity, components) on despawn / *Appelés avec (entité, composants) à la suppression*
+
+    def __len__(self):
+        return len(self._locations)
+
+    def __contains__(self, entity):
+        return entity in self._locations
+
+    def _archetype(self, signature):
+        archetype = self._archetypes.get(signature)
+        if archetype is None:
+            archetype = self._archetypes[signature] = Archetype(signature)
+            for query in self._queries.values():
+                query._consider(archetype)
+        return archetype
+
+    def _insert(self, entity, components):
+        archetype = self._archetype(frozenset(components))
+        self._locations[entity] = (archetype, archetype.append(entity, components))
+
+    def _extract(self, entity):
+        archetype, row = self._locations.pop(entity)
+        components, moved = archetype.pop(row)
+        if moved is not None:
+            self._locations[moved] = (archetype, row)
+        return components
+
+    def spawn(self, **components):
+        """
+        Creates an entity with the given components.
+        Returns:
+            int: The new entity id. / *L'identifiant de la nouvelle entité.*
+        """
+        entity = next(self._ids)
+        self._insert(entity, components)
+        return entity
+
+    def despawn(self, entity):
+        """
+        Removes an entity and runs the despawn hooks. Unknown entities are ignored.
+        *Supprime une entité et exécute les crochets de suppression. Les entités inconnues sont ignorées.*
+        """
+        if entity not in self._locations:
+            return
+        components = self._extract(entity)
+        for hook in self.despawn_hooks:
+            hook(entity, components)
+
+    def get(self, entity, name, default=None):
+        """Returns one component of an entity. / *Retourne un composant d'une entité.*"""
+        archetype, row = self._locations[entity]
+        column = archetype.columns.get(name)
+        return column[row] if column is not None else default
+
+    def set(self, entity, name, value):
+        """Replaces the value of an existing component. / *Remplace la valeur d'un composant existant.*"""
+        archetype, row = self._locations[entity]
+        archetype.columns[name][row] = value
+
+    def has(self, entity, name):
+        location = self._locations.get(entity)
+        return location is not None and name in location[0].signature
+
+    def components(self, entity):
+        """Returns a copy of all the components of an entity. / *Retourne une copie de tous les composants d'une entité.*"""
+        archetype, row = self._locations[entity]
+        return {name: column[row] for name, column in archetype.columns.items()}
+
+    def add_component(self, entity, name, value):
+        """Adds (or replaces) a component, moving the entity to its new archetype. / *Ajoute (ou remplace) un composant, en déplaçant l'entité vers son nouvel archétype.*"""
+        if self.has(entity, name):
+            self.set(entity, name, value)
+            return
+        components = self._extract(entity)
+        components[name] = value
+        self._insert(entity, components)
+
+    def remove_component(self, entity, name):
+        """Removes a component if present, moving the entity to its new archetype. / *Retire un composant s'il est présent, en déplaçant l'entité vers son nouvel archétype.*"""
+        if not self.has(entity, name):
+            return
+        components = self._extract(entity)
+        del components[name]
+        self._insert(entity, components)
+
+    def query(self, *names):
+        """
+        Returns the cached Query for these component names, creating it on first use.
+        *Retourne la Query mise en cache pour ces noms de composants, en la créant à la première utilisation.*
+        """
+        query = self._queries.get(names)
+        if query is None:
+            query = self._queries[names] = Query(names)
+            for archetype in self._archetypes.values():
+                query._consider(archetype)
+        return query
+
+    def clear(self):
+        """Despawns every entity (running the hooks). Archetypes and queries are kept. / *Supprime toutes les entités (en exécutant les crochets). Archétypes et requêtes sont conservés.*"""
+        for entity in list(self._locations):
+            self.despawn(entity)
@@ -0,0 +1,80 @@
+# entity_pool.py
+# This file defines the EntityPool class, a free list of reusable game entities.
+# Short-lived entities (bullets, explosions, dropped items) are taken from a pool and given
+# back when they leave the game, instead of being allocated and garbage collected one by one.
+# A recycled entity is re-initialized through its `reset(...)` method, which takes the same
+# arguments as its constructor.
+#
+# *Ce fichier définit la classe EntityPool, une liste libre d'entités de jeu réutilisables.*
+# *Les entités à courte durée de vie (projectiles, explosions, objets déposés) sont prises dans une*
+# *réserve et rendues quand elles quittent le jeu, au lieu d'être allouées et libérées une à une par*
+# *le ramasse-miettes. Une entité recyclée est réinitialisée par sa méthode `reset(...)`, qui prend*
+# *les mêmes arguments que son constructeur.*
+
+
+class EntityPool:
+    """
+    Free list of entities of one class, with hit/miss statistics.
+    *Liste libre d'entités d'une classe, avec des statistiques de réussites/échecs.*
+    """
+    def __init__(self, factory):
+        """
+        Args:
+            factory (callable): Builds a new entity from the acquire() arguments, usually the class itself.
+                                *Construit une nouvelle entité à partir des arguments d'acquire(), en général la classe elle-même.*
+        """
+        self.factory = factory
+        self._free = []
+        self._free_ids = set()  # Guards against releasing the same entity twice / *Empêche de rendre deux fois la même entité*
+        self.hits = 0  # Acquisitions served by a recycled entity / *Acquisitions servies par une entité recyclée*
+        self.misses = 0  # Acquisitions that had to build a new entity / *Acquisitions ayant dû construire une nouvelle entité*
+        self.releases = 0
+
+    def prewarm(self, count, *args, **kwargs):
+        """
+        Builds entities up front so the first `count` acquisitions are hits.
+        *Construit des entités à l'avance pour que les `count` premières acquisitions soient des réussites.*
+        """
+        for _ in range(count - len(self._free)):
+            self.release(self.factory(*args, **kwargs))
+        self.releases = 0
+
+    def acquire(self, *args, **kwargs):
+        """
+        Returns an entity initialized with the given constructor arguments.
+        *Retourne une entité initialisée avec les arguments de constructeur donnés.*
+        """
+        if self._free:
+            entity = self._free.pop()
+            self._free_ids.discard(id(entity))
+            entity.reset(*args, **kwargs)
+            self.hits += 1
+            return entity
+        self.misses += 1
+        return self.factory(*args, **kwargs)
+
+    def release(self, entity):
+        """
+        Gives an entity back to the pool. Releasing an entity already in the pool is ignored.
+        *Rend une entité à la réserve. Rendre une entité déjà dans la réserve est ignoré.*
+        """
+        if id(entity) in self._free_ids:
+            return
+        entity.active = False
+        self._free.append(entity)
+        self._free_ids.add(id(entity))
+        self.releases += 1
+
+    @property
+    def free_count(self):
+        return len(self._free)
+
+    @property
+    def hit_rate(self):
+        """Fraction of acquisitions served from the pool. / *Fraction des acquisitions servies par la réserve.*"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 1.0
+
+    def stats(self):
+        """Returns the counters as a dict, for logging. / *Retourne les compteurs sous forme de dict, pour la journalisation.*"""
+        return {'hits': self.hits, 'misses': self.misses, 'releases': self.releases, 'free': len(self._free)}
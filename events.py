@@ -0,0 +1,252 @@
+# events.py
+# This file defines the game events and the EventBus that carries them.
+# During a simulation tick, GameState and the entities only append small event objects
+# (a kill, a pickup, damage taken, a shot) to the bus. At the end of the tick the bus groups
+# them by type and hands each batch to the listeners subscribed to that type: audio, HUD,
+# telemetry and logging. The simulation loops themselves never play sounds or write logs,
+# and a tick without events, or with events nobody listens to, costs no listener call.
+#
+# *Ce fichier définit les événements du jeu et l'EventBus qui les transporte.*
+# *Pendant un tick de simulation, GameState et les entités ne font qu'ajouter de petits objets*
+# *événements (une victime, un ramassage, des dégâts subis, un tir) au bus. À la fin du tick, le bus*
+# *les regroupe par type et transmet chaque lot aux écouteurs abonnés à ce type : audio, HUD,*
+# *télémétrie et journalisation. Les boucles de simulation elles-mêmes ne jouent jamais de sons et*
+# *n'écrivent jamais de journaux, et un tick sans événement, ou avec des événements que personne*
+# *n'écoute, ne coûte aucun appel d'écouteur.*
+
+import logging
+
+
+class GameEvent:
+    """Base class of the events carried by the EventBus. / *Classe de base des événements transportés par l'EventBus.*"""
+    __slots__ = ()
+
+
+class KillEvent(GameEvent):
+    """
+    An enemy was killed. `count` is the running total for that kind of enemy, when tracked.
+    *Un ennemi a été tué. `count` est le total cumulé pour ce type d'ennemi, s'il est suivi.*
+    """
+    __slots__ = ('kind', 'x', 'y', 'count')
+
+    def __init__(self, kind, x, y, count=None):
+        self.kind = kind  # 'carrot' or 'vampire' / *'carrot' ou 'vampire'*
+        self.x = x
+        self.y = y
+        self.count = count
+
+
+class PickupEvent(GameEvent):
+    """
+    The player collected an item. `amount` is the player's stock of it afterwards.
+    *Le joueur a ramassé un objet. `amount` est son stock de cet objet après coup.*
+    """
+    __slots__ = ('item_type', 'amount')
+
+    def __init__(self, item_type, amount):
+        self.item_type = item_type
+        self.amount = amount
+
+
+class DamageEvent(GameEvent):
+    """The player took damage. / *Le joueur a subi des dégâts.*"""
+    __slots__ = ('amount', 'health')
+
+    def __init__(self, amount, health):
+        self.amount = amount
+        self.health = health  # Health left / *Santé restante*
+
+
+class ShotEvent(GameEvent):
+    """The player fired a weapon. / *Le joueur a utilisé une arme.*"""
+    __slots__ = ('weapon', 'x', 'y')
+
+    def __init__(self, weapon, x, y):
+        self.weapon = weapon  # 'bullet' or 'garlic' / *'bullet' ou 'garlic'*
+        self.x = x
+        self.y = y
+
+
+class EventBus:
+    """
+    Queue of events emitted during a tick, dispatched in batches by type.
+    *File des événements émis pendant un tick, distribués par lots selon leur type.*
+    """
+    def __init__(self):
+        self._queue = []
+        self._handlers = {}  # Event class -> handlers taking a list of events / *Classe d'événement -> fonctions prenant une liste d'événements*
+        self.emitted_count = 0
+        self.dispatched_count = 0  # Events delivered to at least one handler / *Événements remis à au moins une fonction*
+
+    def subscribe(self, event_type, handler):
+        """
+        Registers `handler(events)` for batches of `event_type`.
+        *Enregistre `handler(events)` pour les lots de `event_type`.*
+        """
+        self._handlers.setdefault(event_type, []).append(handler)
+
+    def unsubscribe(self, event_type, handler):
+        handlers = self._handlers.get(event_type)
+        if handlers and handler in handlers:
+            handlers.remove(handler)
+
+    def emit(self, event):
+        """Queues an event until the next dispatch(). / *Met un événement en file jusqu'au prochain dispatch().*"""
+        self._queue.append(event)
+
+    def dispatch(self):
+        """
+        Delivers the queued events, grouped by type in emission order, then empties the queue.
+        Events emitted by handlers wait for the next dispatch.
+        Returns:
+            int: Number of events taken from the queue. / *Nombre d'événements retirés de la file.*
+
+        *Remet les événements en file, regroupés par type dans l'ordre d'émission, puis vide la file.*
+        *Les événements émis par les fonctions abonnées attendent le prochain dispatch.*
+        """
+        queue = self._queue
+        if not queue:
+            return 0
+        self._queue = []
+        self.emitted_count += len(queue)
+        batches = {}
+        for event in queue:
+            batch = batches.get(type(event))
+            if batch is None:
+                batches[type(event)] = [event]
+            else:
+                batch.append(event)
+        handlers = self._handlers
+        for event_type, events in batches.items():
+            subscribed = handlers.get(event_type)
+            if subscribed:
+                self.dispatched_count += len(events)
+                for handler in subscribed:
+                    handler(events)
+        return len(queue)
+
+    def clear(self):
+        """Drops the queued events without delivering them. / *Abandonne les événements en file sans les remettre.*"""
+        self._queue = []
+
+    def __len__(self):
+        return len(self._queue)
+
+
+class AudioListener:
+    """
+    Plays the sound effects of a batch, each distinct sound once per tick.
+    *Joue les effets sonores d'un lot, chaque son distinct une fois par tick.*
+    """
+    KILL_SOUNDS = {'carrot': 'explosion', 'vampire': 'vampire_death'}
+    PICKUP_SOUNDS = {'hp': 'get_hp', 'garlic': 'get_garlic', 'carrot_juice': 'get_hp'}  # Juice reuses the HP sound / *Le jus réutilise le son des PV*
+
+    def __init__(self, sounds):
+        self.sounds = sounds
+
+    def attach(self, bus):
+        bus.subscribe(KillEvent, self.on_kills)
+        bus.subscribe(PickupEvent, self.on_pickups)
+        bus.subscribe(DamageEvent, self.on_damage)
+        return self
+
+    def _play(self, keys):
+        for key in dict.fromkeys(keys): # Unique, in order / *Uniques, dans l'ordre*
+            sound = self.sounds.get(key)
+            if sound is not None:
+                sound.play()
+
+    def on_kills(self, events):
+        self._play(self.KILL_SOUNDS.get(event.kind) for event in events)
+
+    def on_pickups(self, events):
+        self._play(self.PICKUP_SOUNDS.get(event.item_type) for event in events)
+
+    def on_damage(self, events):
+        if any(event.health > 0 for event in events): # A fatal hit has no hurt sound / *Un coup fatal n'a pas de son de blessure*
+            self._play(('hurt',))
+
+
+class HudListener:
+    """
+    Flags the HUD as needing a refresh when the player's health or stocks change.
+    *Signale que le HUD doit être rafraîchi quand la santé ou les stocks du joueur changent.*
+    """
+    def __init__(self):
+        self.dirty = True  # Draw once at start / *Dessiner une fois au départ*
+
+    def attach(self, bus):
+        bus.subscribe(PickupEvent, self.on_change)
+        bus.subscribe(DamageEvent, self.on_change)
+        bus.subscribe(ShotEvent, self.on_shots)
+        return self
+
+    def on_change(self, events):
+        self.dirty = True
+
+    def on_shots(self, events):
+        if any(event.weapon == 'garlic' for event in events): # Garlic stock went down / *Le stock d'ail a baissé*
+            self.dirty = True
+
+    def consume(self):
+        """Returns True once after each change. / *Retourne True une fois après chaque changement.*"""
+        dirty = self.dirty
+        self.dirty = False
+        return dirty
+
+
+class TelemetryListener:
+    """
+    Counts the events of a game by type and kind, e.g. counts['kill:carrot'].
+    *Compte les événements d'une partie par type et sorte, par ex. counts['kill:carrot'].*
+    """
+    def __init__(self):
+        self.counts = {}
+
+    def attach(self, bus):
+        bus.subscribe(KillEvent, lambda events: self._count('kill', events, 'kind'))
+        bus.subscribe(PickupEvent, lambda events: self._count('pickup', events, 'item_type'))
+        bus.subscribe(DamageEvent, lambda events: self._add('damage', sum(event.amount for event in events)))
+        bus.subscribe(ShotEvent, lambda events: self._count('shot', events, 'weapon'))
+        return self
+
+    def _add(self, key, amount):
+        self.counts[key] = self.counts.get(key, 0) + amount
+
+    def _count(self, prefix, events, field):
+        for event in events:
+            self._add(f"{prefix}:{getattr(event, field)}", 1)
+
+    def reset(self):
+        self.counts.clear()
+
+
+class LogListener:
+    """
+    Writes the game log lines for kills, pickups and damage, once per batch.
+    *Écrit les lignes de journal du jeu pour les victimes, ramassages et dégâts, une fois par lot.*
+    """
+    PICKUP_NAMES = {'hp': ('HP', 'PV'), 'garlic': ('Garlic', 'Ail'), 'carrot_juice': ('Carrot Juice', 'Jus de Carotte')}
+
+    def attach(self, bus):
+        bus.subscribe(KillEvent, self.on_kills)
+        bus.subscribe(PickupEvent, self.on_pickups)
+        bus.subscribe(DamageEvent, self.on_damage)
+        return self
+
+    def on_kills(self, events):
+        for event in events:
+            if event.kind == 'vampire':
+                logging.info(f"Vampire killed by garlic! Total kills: {event.count} / Vampire tué par l'ail ! Total victimes : {event.count}")
+        carrots = sum(1 for event in events if event.kind == 'carrot')
+        if carrots:
+            logging.debug(f"Carrots killed this tick: {carrots} / Carottes tuées ce tick : {carrots}")
+
+    def on_pickups(self, events):
+        for event in events:
+            name, nom = self.PICKUP_NAMES.get(event.item_type, (event.item_type, event.item_type))
+            logging.info(f"Player collected {name}. Current {name}: {event.amount} / Joueur a ramassé {nom}. {nom} actuel : {event.amount}")
+
+    def on_damage(self, events):
+        health = events[-1].health
+        logging.debug(f"Player took damage. HP left: {health} / Le joueur a subi des dégâts. PV restants : {health}")
@@ -0,0 +1,267 @@
+# flow_field.py
+# This file defines the FlowField used by chasing enemies to reach the player.
+# The game world is divided into a grid of cells. Each time the player enters a new cell,
+# the field computes, once for all enemies, the walking cost from every cell to the player's
+# cell, going around the optional obstacle cells. It then stores which way to go from each
+# cell. An enemy then only reads the entry of the cell it stands in: O(1) per enemy, whatever
+# the number of enemies.
+# Cells with a clear straight line to the player's cell (no obstacle in the rectangle they span)
+# are marked "direct": enemies there steer straight at the player, exactly as before, and the
+# field only bends their path where an obstacle is in the way. Without obstacles every cell is
+# direct and a rebuild costs nothing.
+# A rebuild is incremental in two ways. The cost of a direct cell is known exactly (its octile
+# distance), so it is set for all of them in one NumPy pass, and Dijkstra only runs over the
+# cells in an obstacle's shadow. That search is also spread over several ticks: each call to
+# set_target() settles at most FLOW_FIELD_REBUILD_BUDGET cells, and the previous field stays in
+# use until the new one is complete.
+#
+# *Ce fichier définit le FlowField utilisé par les ennemis poursuivants pour rejoindre le joueur.*
+# *Le monde du jeu est découpé en une grille de cellules. Chaque fois que le joueur entre dans une*
+# *nouvelle cellule, le champ calcule, une fois pour tous les ennemis, le coût de marche de chaque*
+# *cellule jusqu'à celle du joueur en contournant les cellules obstacles optionnelles, puis la direction*
+# *à suivre depuis chaque cellule. Un ennemi ne lit alors que l'entrée de sa cellule : O(1) par ennemi,*
+# *quel que soit le nombre d'ennemis.*
+# *Les cellules ayant une ligne droite dégagée jusqu'à celle du joueur (aucun obstacle dans le rectangle*
+# *qu'elles couvrent) sont marquées "directes" : les ennemis qui s'y trouvent foncent droit sur le joueur,*
+# *exactement comme avant, et le champ ne courbe leur trajet que là où un obstacle gêne. Sans obstacle,*
+# *toutes les cellules sont directes et une reconstruction ne coûte rien.*
+# *Une reconstruction est incrémentale de deux façons. Le coût d'une cellule directe est connu exactement*
+# *(sa distance octile), il est donc fixé pour toutes en une passe NumPy, et Dijkstra ne parcourt que les*
+# *cellules dans l'ombre d'un obstacle. Cette recherche est aussi étalée sur plusieurs ticks : chaque appel*
+# *à set_target() règle au plus FLOW_FIELD_REBUILD_BUDGET cellules, et l'ancien champ reste utilisé*
+# *jusqu'à ce que le nouveau soit complet.*
+
+import heapq
+import math
+
+import numpy as np
+
+import config
+
+_SQRT2 = math.sqrt(2)
+# Neighbour offsets (dx, dy) and step costs / *Décalages des voisins (dx, dy) et coûts de pas*
+_OFFSETS = ((1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1))
+
+
+def _shifted(grid, dx, dy, fill):
+    """
+    Returns a copy of `grid` where each cell holds the value of its neighbour at (dx, dy).
+    *Retourne une copie de `grid` où chaque cellule contient la valeur de son voisin en (dx, dy).*
+    """
+    out = np.full_like(grid, fill)
+    rows, cols = grid.shape
+    out[max(0, -dy):rows - max(0, dy), max(0, -dx):cols - max(0, dx)] = \
+        grid[max(0, dy):rows - max(0, -dy), max(0, dx):cols - max(0, -dx)]
+    return out
+
+
+class FlowField:
+    """
+    Grid of walking costs and directions towards one target cell, shared by every chaser.
+    *Grille de coûts de marche et de directions vers une cellule cible, partagée par tous les poursuivants.*
+    """
+    def __init__(self, world_size, cell_size=config.FLOW_FIELD_CELL_SIZE, obstacles=(),
+                 rebuild_budget=config.FLOW_FIELD_REBUILD_BUDGET):
+        """
+        Initializes an empty field.
+        Args:
+            world_size (tuple[int, int]): The (width, height) of the game world. / *La (largeur, hauteur) du monde du jeu.*
+            cell_size (int): The side of a square cell, in pixels. / *Le côté d'une cellule carrée, en pixels.*
+            obstacles (iterable[pygame.Rect], optional): World areas enemies must walk around.
+                                                         *Zones du monde que les ennemis doivent contourner.*
+            rebuild_budget (int): Cells settled per set_target() call while rebuilding, 0 for no limit.
+                                  *Cellules réglées par appel à set_target() pendant une reconstruction, 0 pour aucune limite.*
+        """
+        self.cell_size = cell_size
+        self.cols = max(1, -(-world_size[0] // cell_size))  # Ceiling division / *Division arrondie au supérieur*
+        self.rows = max(1, -(-world_size[1] // cell_size))
+        self.blocked = np.zeros((self.rows, self.cols), dtype=bool)
+        self.cost = np.zeros((self.rows, self.cols), dtype=np.float64)
+        self.dir_x = np.zeros((self.rows, self.cols), dtype=np.float64)
+        self.dir_y = np.zeros((self.rows, self.cols), dtype=np.float64)
+        self.direct = np.ones((self.rows, self.cols), dtype=bool)
+        self.target_cell = None
+        self.rebuild_count = 0
+        self.shadow_cells = 0  # Cells left to Dijkstra by the last rebuild / *Cellules laissées à Dijkstra par la dernière reconstruction*
+        self.rebuild_budget = rebuild_budget
+        self._build = None  # Rebuild in progress, resumed by set_target() / *Reconstruction en cours, reprise par set_target()*
+        self._adjacency = None  # Cached walkable neighbours / *Voisins praticables mis en cache*
+        for rect in obstacles:
+            self.add_obstacle(rect)
+
+    def cell_of(self, x, y):
+        """Returns the (col, row) cell holding a world position, clamped to the grid. / *Retourne la cellule (col, ligne) contenant une position du monde, limitée à la grille.*"""
+        size = self.cell_size
+        return (min(self.cols - 1, max(0, int(x) // size)), min(self.rows - 1, max(0, int(y) // size)))
+
+    def add_obstacle(self, rect):
+        """
+        Marks the cells overlapped by a world rectangle as blocked. The field is rebuilt on the next set_target().
+        *Marque comme bloquées les cellules chevauchées par un rectangle du monde. Le champ est reconstruit au prochain set_target().*
+        """
+        x0, y0 = self.cell_of(rect.left, rect.top)
+        x1, y1 = self.cell_of(rect.right - 1, rect.bottom - 1)
+        self.blocked[y0:y1 + 1, x0:x1 + 1] = True
+        self._adjacency = None
+        self.target_cell = None
+        self._build = None
+
+    def clear_obstacles(self):
+        self.blocked[:] = False
+        self._adjacency = None
+        self.target_cell = None
+        self._build = None
+
+    @property
+    def building(self):
+        """True while a rebuild is spread over set_target() calls. / *True tant qu'une reconstruction est étalée sur des appels à set_target().*"""
+        return self._build is not None
+
+    def set_target(self, x, y):
+        """
+        Points the field at a world position, starting a rebuild only if the position is in a new cell,
+        and carries on the rebuild in progress. Call once per tick.
+        Returns:
+            bool: True if a rebuild was started. / *True si une reconstruction a été commencée.*
+
+        *Oriente le champ vers une position du monde, en ne commençant une reconstruction que si la position*
+        *est dans une nouvelle cellule, et poursuit la reconstruction en cours. À appeler une fois par tick.*
+        """
+        cell = self.cell_of(x, y)
+        started = cell != self.target_cell
+        if started:
+            self.target_cell = cell
+            self.rebuild_count += 1
+            if self.blocked.any():
+                self._build = self._rebuild(cell) # Replaces a rebuild towards an older cell / *Remplace une reconstruction vers une cellule plus ancienne*
+            else: # Every straight line is clear / *Toutes les lignes droites sont dégagées*
+                self._build = None
+                self.direct[:] = True
+        if self._build is not None:
+            try:
+                next(self._build)
+            except StopIteration:
+                self._build = None
+        return started
+
+    def _build_adjacency(self):
+        # Walkable neighbours of each cell, as (index, step cost) lists; diagonal steps may not
+        # cut the corner of a blocked cell. Rebuilt only when the obstacles change.
+        # *Voisins praticables de chaque cellule, en listes (indice, coût du pas) ; les pas diagonaux*
+        # *ne peuvent pas couper le coin d'une cellule bloquée. Reconstruit seulement quand les obstacles changent.*
+        passable = ~self.blocked
+        cols = self.cols
+        adjacency = [[] for _ in range(self.rows * cols)]
+        for dx, dy in _OFFSETS:
+            allowed = passable & _shifted(passable, dx, dy, False)
+            if dx and dy:
+                allowed &= _shifted(passable, dx, 0, False) & _shifted(passable, 0, dy, False)
+            step = _SQRT2 if dx and dy else 1.0
+            delta = dy * cols + dx
+            for index in np.flatnonzero(allowed).tolist():
+                adjacency[index].append((index + delta, step))
+        self._adjacency = adjacency
+
+    def _rebuild(self, cell):
+        # Generator: runs until rebuild_budget cells are settled, then yields to the next set_target() call;
+        # the new field replaces the old one only once complete
+        # *Générateur : s'exécute jusqu'à avoir réglé rebuild_budget cellules, puis rend la main au prochain appel*
+        # *à set_target() ; le nouveau champ ne remplace l'ancien qu'une fois complet*
+        if self._adjacency is None:
+            self._build_adjacency()
+        adjacency = self._adjacency
+        rows, cols = self.rows, self.cols
+        target_x, target_y = cell
+        row_index, col_index = np.indices((rows, cols))
+
+        # Clear cells: no obstacle in the rectangle spanned by the cell and the target cell,
+        # counted in O(1) per cell with a summed-area table
+        # *Cellules dégagées : aucun obstacle dans le rectangle couvert par la cellule et la cellule*
+        # *cible, compté en O(1) par cellule grâce à une table de sommes cumulées*
+        summed = np.zeros((rows + 1, cols + 1), dtype=np.int64)
+        summed[1:, 1:] = self.blocked.cumsum(axis=0).cumsum(axis=1)
+        y0, y1 = np.minimum(row_index, target_y), np.maximum(row_index, target_y) + 1
+        x0, x1 = np.minimum(col_index, target_x), np.maximum(col_index, target_x) + 1
+        clear = (summed[y1, x1] - summed[y0, x1] - summed[y1, x0] + summed[y0, x0]) == 0
+
+        # A clear cell's walking cost is exactly its octile distance to the target, along a path that
+        # stays in the clear rectangle, so it is set in one vectorized pass, stepping straight at the target
+        # *Le coût de marche d'une cellule dégagée est exactement sa distance octile jusqu'à la cible, par un*
+        # *chemin qui reste dans le rectangle dégagé ; il est donc fixé en une passe vectorisée, en allant droit vers la cible*
+        span_x, span_y = np.abs(col_index - target_x), np.abs(row_index - target_y)
+        cost = np.where(clear, np.maximum(span_x, span_y) + (_SQRT2 - 1) * np.minimum(span_x, span_y), math.inf)
+        parent = np.where(clear, (row_index + np.sign(target_y - row_index)) * cols + col_index + np.sign(target_x - col_index),
+                          row_index * cols + col_index)
+
+        # Only the cells in an obstacle's shadow are left to Dijkstra, seeded from the clear cells around them;
+        # each shadow cell remembers the neighbour it is reached from. Clear costs are exact, so never relaxed.
+        # *Seules les cellules dans l'ombre d'un obstacle sont laissées à Dijkstra, à partir des cellules dégagées*
+        # *qui les entourent ; chaque cellule d'ombre retient le voisin par lequel elle est atteinte. Les coûts*
+        # *dégagés sont exacts, donc jamais relâchés.*
+        shadow = ~clear & ~self.blocked
+        shadow_cells = int(np.count_nonzero(shadow))
+        if shadow_cells:
+            near_shadow = np.zeros_like(shadow)
+            for dx, dy in _OFFSETS:
+                near_shadow |= _shifted(shadow, dx, dy, False)
+            cost_list = cost.ravel().tolist()
+            parent_list = parent.ravel().tolist()
+            heap = [(cost_list[index], index) for index in np.flatnonzero(clear & near_shadow).tolist()]
+            heapq.heapify(heap)
+            pop, push = heapq.heappop, heapq.heappush
+            budget = self.rebuild_budget
+            if budget and shadow_cells > budget:
+                yield # A large shadow starts next call; the vectorized pass above is this call's share / *Une grande ombre commence au prochain appel ; la passe vectorisée ci-dessus est la part de cet appel*
+            settled = 0
+            while heap:
+                current, index = pop(heap)
+                if current > cost_list[index]:
+                    continue # Stale entry / *Entrée périmée*
+                settled += 1
+                if budget and settled % budget == 0:
+                    yield
+                for neighbour, step in adjacency[index]:
+                    candidate = current + step
+                    if candidate < cost_list[neighbour]:
+                        cost_list[neighbour] = candidate
+                        parent_list[neighbour] = index
+                        push(heap, (candidate, neighbour))
+            cost = np.array(cost_list).reshape(rows, cols)
+            parent = np.array(parent_list).reshape(rows, cols)
+        self.cost = cost
+        self.shadow_cells = shadow_cells
+
+        # Direction of each cell: towards the neighbour it is reached from
+        # *Direction de chaque cellule : vers le voisin par lequel elle est atteinte*
+        step_x = parent % cols - col_index
+        step_y = parent // cols - row_index
+        length = np.hypot(step_x, step_y)
+        length[length == 0] = 1.0 # The target and unreachable cells stay still / *La cible et les cellules inaccessibles restent immobiles*
+        self.dir_x = step_x / length
+        self.dir_y = step_y / length
+        # Enemies steer straight where the line is clear, or where the target cannot be reached
+        # *Les ennemis vont droit là où la ligne est dégagée, ou là où la cible est inaccessible*
+        self.direct = clear | ~np.isfinite(cost)
+
+    def direction_at(self, x, y):
+        """
+        Returns the unit (dx, dy) to follow from a world position, or None where the straight line to
+        the target is clear (or the target cannot be reached), in which case the caller steers directly.
+        *Retourne le (dx, dy) unitaire à suivre depuis une position du monde, ou None là où la ligne droite*
+        *vers la cible est dégagée (ou la cible inaccessible), auquel cas l'appelant se dirige directement.*
+        """
+        col, row = self.cell_of(x, y)
+        if self.direct[row, col]:
+            return None
+        return (self.dir_x[row, col], self.dir_y[row, col])
+
+    def directions_at(self, xs, ys):
+        """
+        Vectorized direction_at() for many positions.
+        Returns:
+            tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: dx, dy and the `direct` mask for each position.
+                                                                *dx, dy et le masque `direct` de chaque position.*
+        """
+        cols = np.clip(np.asarray(xs, dtype=np.int64) // self.cell_size, 0, self.cols - 1)
+        rows = np.clip(np.asarray(ys, dtype=np.int64) // self.cell_size, 0, self.rows - 1)
+        return self.dir_x[rows, cols], self.dir_y[rows, cols], self.direct[rows, cols]
@@ -0,0 +1,133 @@
+# game_clock.py
+# This file defines the GameClock class, the single source of game time.
+# GameState owns one clock and hands it to the entities that need the time (player
+# invincibility, explosions...), so every timer in the game reads the same value.
+# The clock runs in one of four modes:
+#   - 'real':    wall-clock time (time.time()), minus any time spent paused;
+#   - 'scaled':  wall-clock time multiplied by a scale factor (slow motion, fast-forward);
+#   - 'paused':  frozen at the time it was paused;
+#   - 'virtual': only moves when advance() is called, independently of the wall clock,
+#                for deterministic and faster-than-real-time headless runs.
+#
+# *Ce fichier définit la classe GameClock, la source unique du temps de jeu.*
+# *GameState possède une horloge et la transmet aux entités qui ont besoin du temps (invincibilité*
+# *du joueur, explosions...), afin que tous les minuteurs du jeu lisent la même valeur.*
+# *L'horloge fonctionne dans l'un de quatre modes :*
+#   *- 'real' : temps réel (time.time()), moins le temps passé en pause ;*
+#   *- 'scaled' : temps réel multiplié par un facteur (ralenti, avance rapide) ;*
+#   *- 'paused' : figée au moment de la mise en pause ;*
+#   *- 'virtual' : n'avance que lorsque advance() est appelée, indépendamment du temps réel,*
+#                 *pour des exécutions sans affichage déterministes et plus rapides que le temps réel.*
+
+import time
+
+REAL = 'real'
+SCALED = 'scaled'
+PAUSED = 'paused'
+VIRTUAL = 'virtual'
+MODES = (REAL, SCALED, PAUSED, VIRTUAL)
+
+
+class GameClock:
+    """
+    Game time source with real-time, scaled, paused and virtual (step-driven) modes.
+    Switching modes never makes the game time jump.
+
+    *Source du temps de jeu avec des modes temps réel, accéléré/ralenti, en pause et virtuel (piloté par pas).*
+    *Changer de mode ne fait jamais sauter le temps de jeu.*
+    """
+    def __init__(self, mode=REAL, scale=1.0, start_time=0.0):
+        """
+        Initializes the clock.
+        Args:
+            mode (str): One of 'real', 'scaled', 'paused' or 'virtual'. / *'real', 'scaled', 'paused' ou 'virtual'.*
+            scale (float): Game seconds per wall-clock second in 'scaled' mode.
+                           *Secondes de jeu par seconde réelle en mode 'scaled'.*
+            start_time (float): Initial game time for the 'virtual' and 'paused' modes.
+                                *Temps de jeu initial pour les modes 'virtual' et 'paused'.*
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown clock mode: {mode} / Mode d'horloge inconnu : {mode}")
+        if scale < 0:
+            raise ValueError("Clock scale must be positive. / L'échelle de l'horloge doit être positive.")
+        self.scale = scale
+        self._offset = 0.0  # Game time minus wall time in 'real' mode / *Temps de jeu moins temps réel en mode 'real'*
+        self._anchor_game = start_time  # Game time at the last anchor / *Temps de jeu au dernier ancrage*
+        self._anchor_wall = time.time()
+        self._frozen = start_time  # Game time in 'paused' and 'virtual' modes / *Temps de jeu en modes 'paused' et 'virtual'*
+        self._resume_mode = REAL
+        self.mode = mode
+        if mode == SCALED:
+            self._anchor_game = self._anchor_wall
+
+    def now(self):
+        """Returns the current game time, in seconds. / *Retourne le temps de jeu actuel, en secondes.*"""
+        mode = self.mode
+        if mode == REAL:
+            # time.time() is looked up at call time, so tests patching it keep working
+            # *time.time() est résolu à l'appel, pour que les tests qui le remplacent continuent de fonctionner*
+            return time.time() + self._offset
+        if mode == SCALED:
+            return self._anchor_game + (time.time() - self._anchor_wall) * self.scale
+        return self._frozen
+
+    def set_mode(self, mode):
+        """
+        Switches mode, keeping the game time continuous.
+        *Change de mode, en gardant le temps de jeu continu.*
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown clock mode: {mode} / Mode d'horloge inconnu : {mode}")
+        current = self.now()
+        wall = time.time()
+        if mode == REAL:
+            self._offset = current - wall
+        elif mode == SCALED:
+            self._anchor_game = current
+            self._anchor_wall = wall
+        else:
+            self._frozen = current
+        self.mode = mode
+
+    def set_scale(self, scale):
+        """
+        Changes the time scale and switches to 'scaled' mode.
+        *Change l'échelle de temps et passe en mode 'scaled'.*
+        """
+        if scale < 0:
+            raise ValueError("Clock scale must be positive. / L'échelle de l'horloge doit être positive.")
+        current = self.now()
+        self.scale = scale
+        self._anchor_game = current
+        self._anchor_wall = time.time()
+        self.mode = SCALED
+
+    def pause(self):
+        """Freezes game time. / *Fige le temps de jeu.*"""
+        if self.mode in (REAL, SCALED):
+            self._resume_mode = self.mode
+            self.set_mode(PAUSED)
+
+    def resume(self):
+        """Restarts game time in the mode used before pause(). / *Relance le temps de jeu dans le mode utilisé avant pause().*"""
+        if self.mode == PAUSED:
+            self.set_mode(self._resume_mode)
+
+    @property
+    def paused(self):
+        return self.mode == PAUSED
+
+    def advance(self, seconds):
+        """
+        Moves a 'virtual' clock forward.
+        Args:
+            seconds (float): Game time to add. / *Temps de jeu à ajouter.*
+        Returns:
+            float: The new game time. / *Le nouveau temps de jeu.*
+        """
+        if self.mode != VIRTUAL:
+            raise RuntimeError("Only a virtual clock can be advanced. / Seule une horloge virtuelle peut être avancée.")
+        if seconds < 0:
+            raise ValueError("A clock cannot go backwards. / Une horloge ne peut pas reculer.")
+        self._frozen += seconds
+        return self._frozen
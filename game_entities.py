@@ -12,13 +12,18 @@
 
 import math
 import random
-import time
 
 import pygame
 
 import config
+from asset_manager import rotation_atlas, sprite_variants
+from events import DamageEvent
+from game_clock import GameClock
+from hud import DigitStrip
 from utilities import calculate_movement_towards, get_direction_vector
 
+_UNSET = object()  # Marks a lazily computed slot not computed yet / *Marque un attribut calculé à la demande pas encore calculé*
+
 class GameObject:
     """
     Base class for all game entities.
@@ -26,7 +31,13 @@ class GameObject:
 
     *Classe de base pour toutes les entités du jeu.*
     *Fournit des attributs communs comme la position, l'image et un état actif.*
+
+    Every class in the hierarchy declares its attributes in `__slots__`, so instances carry
+    no per-instance `__dict__` and new attributes cannot be added on the fly.
+    *Chaque classe de la hiérarchie déclare ses attributs dans `__slots__`, pour que les instances*
+    *n'aient pas de `__dict__` propre et qu'aucun attribut ne puisse être ajouté à la volée.*
     """
+    __slots__ = ('cli_mode', 'original_image', 'image', 'rect', 'active', 'entity')
     def __init__(self, x, y, image, cli_mode=False):
         """
         Initializes a GameObject.
@@ -43,19 +54,22 @@ class GameObject:
         self.cli_mode = cli_mode
         self.original_image = image # In CLI, this could be metadata dict / *En CLI, cela pourrait être un dict de métadonnées*
         self.image = image         # In CLI, this could be metadata dict / *En CLI, cela pourrait être un dict de métadonnées*
+        self.rect = self._make_rect(x, y, image)
+        self.active = True # Whether the object is currently active in the game / *Si l'objet est actuellement actif dans le jeu*
+        self.entity = None # ECS entity id when registered in a World (see ecs.py) / *Identifiant d'entité ECS si enregistré dans un World (voir ecs.py)*
 
+    def _make_rect(self, x, y, image):
+        """Builds the object's rectangle at top-left (x, y) from its image or CLI metadata. / *Construit le rectangle de l'objet en haut-gauche (x, y) à partir de son image ou des métadonnées CLI.*"""
         if not self.cli_mode and hasattr(image, 'get_rect'):
-            self.rect = image.get_rect(topleft=(x, y))
-        else:
-            # For CLI, or if image is not a surface (e.g. placeholder failed even more)
-            # *Pour CLI, ou si l'image n'est pas une surface (par ex. le substitut a encore plus échoué)*
-            width, height = 0, 0 # Default size / *Taille par défaut*
-            if isinstance(image, dict): # Check if it's metadata from AssetManager CLI mode / *Vérifier si ce sont des métadonnées du mode CLI d'AssetManager*
-                size_info = image.get('size_hint') or image.get('size') # Prefer 'size_hint' if available from config / *Préférer 'size_hint' si disponible depuis config*
-                if size_info:
-                    width, height = size_info
-            self.rect = pygame.Rect(x, y, width, height)
-        self.active = True # Whether the object is currently active in the game / *Si l'objet est actuellement actif dans le jeu*
+            return image.get_rect(topleft=(x, y))
+        # For CLI, or if image is not a surface (e.g. placeholder failed even more)
+        # *Pour CLI, ou si l'image n'est pas une surface (par ex. le substitut a encore plus échoué)*
+        width, height = 0, 0 # Default size / *Taille par défaut*
+        if isinstance(image, dict): # Check if it's metadata from AssetManager CLI mode / *Vérifier si ce sont des métadonnées du mode CLI d'AssetManager*
+            size_info = image.get('size_hint') or image.get('size') # Prefer 'size_hint' if available from config / *Préférer 'size_hint' si disponible depuis config*
+            if size_info:
+                width, height = size_info
+        return pygame.Rect(x, y, width, height)
         
     def update(self, *args):
         """
@@ -84,7 +98,11 @@ class Player(GameObject):
     *Représente le personnage du joueur (le lapin).*
     *Gère le mouvement, la santé, les objets et autre logique spécifique au joueur.*
     """
-    def __init__(self, x, y, image, asset_manager, cli_mode=False):
+    __slots__ = ('clock', 'scheduler', 'events', 'initial_x', 'initial_y', 'flipped', 'last_direction', 'health', 'max_health',
+                 'garlic_count', 'carrot_juice_count', 'invincible', 'last_hit_time', 'speed', 'death_effect_active',
+                 'death_effect_start_time', 'asset_manager', 'last_fired')
+
+    def __init__(self, x, y, image, asset_manager, cli_mode=False, clock=None, scheduler=None, events=None):
         """
         Initializes the Player.
         Args:
@@ -94,8 +112,21 @@ class Player(GameObject):
             asset_manager (AssetManager): For accessing sound assets.
                                           *Pour accéder aux ressources sonores.*
             cli_mode (bool): CLI mode flag. / *Indicateur du mode CLI.*
+            clock (GameClock, optional): Game time source, normally the GameState's. A real-time clock by default.
+                                         *Source du temps de jeu, normalement celle de GameState. Horloge temps réel par défaut.*
+            scheduler (Scheduler, optional): When given, invincibility ends through a scheduled timer
+                                             instead of update_invincibility() polling.
+                                             *Si fourni, l'invincibilité se termine par un minuteur planifié*
+                                             *au lieu de l'interrogation par update_invincibility().*
+            events (EventBus, optional): When given, damage is reported as a DamageEvent and the hurt sound
+                                         is left to the bus listeners instead of being played here.
+                                         *Si fourni, les dégâts sont signalés par un DamageEvent et le son de*
+                                         *blessure est laissé aux écouteurs du bus au lieu d'être joué ici.*
         """
         super().__init__(x, y, image, cli_mode=cli_mode)
+        self.clock = clock if clock is not None else GameClock()
+        self.scheduler = scheduler
+        self.events = events
         self.initial_x = x
         self.initial_y = y
         self.flipped = False  # True if the player image is flipped horizontally / *True si l'image du joueur est retournée horizontalement*
@@ -110,9 +141,27 @@ class Player(GameObject):
         self.death_effect_active = False # True if death animation is playing / *True si l'animation de mort est en cours*
         self.death_effect_start_time = 0
         self.asset_manager = asset_manager
-        self.health_changed = False # Flag for UI update / *Indicateur pour mise à jour UI*
-        self.garlic_changed = False # Flag for UI update / *Indicateur pour mise à jour UI*
-        self.juice_changed = False  # Flag for UI update / *Indicateur pour mise à jour UI*
+        self.last_fired = {} # Game time of the last shot, by weapon / *Temps de jeu du dernier tir, par arme*
+
+    def ready_to_fire(self, weapon, current_time):
+        """
+        Fire-rate governor: tells if `weapon` may fire at `current_time`, and if so records the shot.
+        Args:
+            weapon (str): A key of config.WEAPON_FIRE_INTERVALS ('bullet', 'garlic'). Other weapons are not limited.
+                          *Une clé de config.WEAPON_FIRE_INTERVALS ('bullet', 'garlic'). Les autres armes ne sont pas limitées.*
+            current_time (float): Game time of the attempted shot. / *Temps de jeu du tir tenté.*
+        Returns:
+            bool: True if the shot may go, False while the weapon is cooling down.
+                  *True si le tir peut partir, False tant que l'arme refroidit.*
+
+        *Limiteur de cadence : indique si `weapon` peut tirer à `current_time`, et si oui enregistre le tir.*
+        """
+        last = self.last_fired.get(weapon)
+        # A clock that went backwards (new game, virtual clock) never blocks / *Une horloge revenue en arrière (nouvelle partie, horloge virtuelle) ne bloque jamais*
+        if last is not None and 0 <= current_time - last < config.WEAPON_FIRE_INTERVALS.get(weapon, 0):
+            return False
+        self.last_fired[weapon] = current_time
+        return True
 
     def move(self, dx, dy, world_bounds):
         """
@@ -131,7 +180,7 @@ class Player(GameObject):
         
         if not self.cli_mode and self.original_image: # Image operations only in GUI mode
             if dx < 0 and not self.flipped:
-                self.image = pygame.transform.flip(self.original_image, True, False)
+                self.image = sprite_variants.get(self.original_image, flip_x=True) # Flipped once, then shared / *Retournée une fois, puis partagée*
                 self.flipped = True
             elif dx > 0 and self.flipped:
                 self.image = self.original_image
@@ -147,16 +196,25 @@ class Player(GameObject):
         """
         if not self.invincible and not self.death_effect_active:
             self.health = max(0, self.health - amount)
-            self.health_changed = True
+            if self.events is not None:
+                self.events.emit(DamageEvent(amount, self.health))
             if self.health > 0:
-                if not self.cli_mode: self.asset_manager.sounds['hurt'].play()
+                if self.events is None and not self.cli_mode: self.asset_manager.sounds['hurt'].play()
                 self.invincible = True
-                self.last_hit_time = time.time()
+                self.last_hit_time = self.clock.now()
+                if self.scheduler is not None:
+                    self.scheduler.schedule(self.last_hit_time + config.PLAYER_INVINCIBILITY_DURATION,
+                                            self._end_invincibility, self.last_hit_time)
         
     def update_invincibility(self):
-        """Checks and updates the player's invincibility status based on duration."""
-        # *Vérifie et met à jour l'état d'invincibilité du joueur en fonction de la durée.*
-        if self.invincible and (time.time() - self.last_hit_time >= config.PLAYER_INVINCIBILITY_DURATION):
+        """Checks and updates the player's invincibility status based on duration (polling path, without a scheduler)."""
+        # *Vérifie et met à jour l'état d'invincibilité du joueur en fonction de la durée (chemin par interrogation, sans planificateur).*
+        if self.invincible and (self.clock.now() - self.last_hit_time >= config.PLAYER_INVINCIBILITY_DURATION):
+            self.invincible = False
+
+    def _end_invincibility(self, hit_time):
+        """Scheduler callback; ignored if the player was hit again since. / *Rappel du planificateur ; ignoré si le joueur a été touché à nouveau depuis.*"""
+        if self.last_hit_time == hit_time:
             self.invincible = False
 
     def reset(self):
@@ -172,9 +230,7 @@ class Player(GameObject):
         if not self.cli_mode and self.original_image:
             self.image = self.original_image # Reset image if flipped / *Réinitialiser l'image si retournée*
         self.flipped = False
-        self.health_changed = True # Ensure UI updates on reset / *Assurer la mise à jour de l'UI à la réinitialisation*
-        self.garlic_changed = True
-        self.juice_changed = True
+        self.last_fired.clear()
         
     def draw(self, screen, scroll):
         """
@@ -185,15 +241,20 @@ class Player(GameObject):
         # *Surcharge GameObject.draw si une logique de dessin spécifique au joueur est nécessaire (par ex. flash d'invincibilité géré dans la boucle principale)*
         super().draw(screen, scroll) # Standard drawing / *Dessin standard*
         
-    def draw_ui(self, screen, hp_image, garlic_image, max_garlic):
+    def draw_ui(self, screen, hp_image, garlic_image, max_garlic, digits=None):
         """
         Draws player-related UI elements like health and garlic count.
+        In game, they are drawn into the cached HUD layer (see hud.HudLayer) rather than on the screen.
         Args:
-            screen (pygame.Surface): The screen to draw on. / *L'écran sur lequel dessiner.*
+            screen (pygame.Surface): The screen (or screen-sized layer) to draw on. / *L'écran (ou la couche de la taille de l'écran) sur lequel dessiner.*
             hp_image (pygame.Surface): Image for health points. / *Image pour les points de vie.*
             garlic_image (pygame.Surface): Image for garlic count. / *Image pour le compteur d'ail.*
             max_garlic (int): Max garlic player can hold (for UI layout, if needed).
                               *Ail max que le joueur peut tenir (pour la disposition de l'UI, si besoin).*
+            digits (DigitStrip, optional): Pre-scaled juice counter digits, built from the assets if not given.
+                                           *Chiffres pré-mis à l'échelle du compteur de jus, construits à partir des ressources si non fournis.*
+
+        *En jeu, ils sont dessinés dans la couche de HUD mise en cache (voir hud.HudLayer) plutôt qu'à l'écran.*
         """
         if self.cli_mode: return # No UI drawing in CLI mode / *Pas de dessin d'UI en mode CLI*
 
@@ -215,24 +276,14 @@ class Player(GameObject):
         # *Compteur de jus de carotte en bas à droite (toujours visible si compte > 0)*
         if self.carrot_juice_count > 0:
             juice_image = self.asset_manager.images.get('carrot_juice')
-            digit_0_img = self.asset_manager.images.get('digit_0')
+            if digits is None:
+                digits = DigitStrip.from_images(self.asset_manager.images)
 
-            if juice_image and hasattr(juice_image, 'get_width') and digit_0_img and hasattr(digit_0_img, 'get_width'):
+            if juice_image and hasattr(juice_image, 'get_width') and digits is not None:
                 digits_str = str(self.carrot_juice_count)
                 spacing = config.UI_JUICE_COUNTER_DIGIT_SPACING # Reduced spacing for digits / *Espacement réduit pour les chiffres*
-
-                # Use the actual loaded digit images for scaling, assuming they are all same size
-                # *Utiliser les images de chiffres réellement chargées pour la mise à l'échelle, en supposant qu'elles ont toutes la même taille*
-                # Scale factor can be adjusted here if needed / *Le facteur d'échelle peut être ajusté ici si nécessaire*
-                # For simplicity, let's assume digit images are already appropriately sized or use a fixed scale.
-                # *Par simplicité, supposons que les images des chiffres sont déjà de taille appropriée ou utilisons une échelle fixe.*
-                # Example: scale digits to be half the height of the juice icon
-                # *Exemple : mettre à l'échelle les chiffres pour qu'ils fassent la moitié de la hauteur de l'icône de jus*
-                digit_scale_factor = config.UI_JUICE_COUNTER_DIGIT_SCALE
-                scaled_digit_height = int(digit_0_img.get_height() * digit_scale_factor)
-                scaled_digit_width = int(digit_0_img.get_width() * digit_scale_factor)
-
-                total_digits_width = len(digits_str) * scaled_digit_width + (len(digits_str) - 1) * spacing
+                scaled_digit_height = digits.glyph_size[1] # Scaled by UI_JUICE_COUNTER_DIGIT_SCALE / *Mis à l'échelle par UI_JUICE_COUNTER_DIGIT_SCALE*
+                total_digits_width = digits.width(digits_str, spacing)
 
                 # Position juice image first
                 juice_x = screen.get_width() - 10 - juice_image.get_width()
@@ -242,23 +293,53 @@ class Player(GameObject):
                 # Position digits to the left of the juice image
                 digit_start_x = juice_x - spacing - total_digits_width
                 digit_y_align = juice_y + (juice_image.get_height() - scaled_digit_height) // 2 # Vertically center digits with juice image
+                digits.draw(screen, digits_str, digit_start_x, digit_y_align, spacing)
+
+class _StoredBulletRect(pygame.Rect):
+    """
+    Rectangle of a bullet held by a BulletStore; changes made to it are written back into the store's arrays.
+    Copies made from it (move(), copy(), ...) are plain detached rectangles.
+    *Rectangle d'un projectile tenu par un BulletStore ; ses modifications sont réécrites dans les tableaux du stockage.*
+    *Les copies faites à partir de lui (move(), copy(), ...) sont des rectangles détachés ordinaires.*
+    """
+    __slots__ = ('_bullet',)
 
-                current_x = digit_start_x
-                for digit_char in digits_str:
-                    digit_img_asset = self.asset_manager.images.get(f'digit_{digit_char}')
-                    if digit_img_asset and hasattr(digit_img_asset, 'get_width'):
-                        scaled_digit_surface = pygame.transform.scale(digit_img_asset, (scaled_digit_width, scaled_digit_height))
-                        screen.blit(scaled_digit_surface, (current_x, digit_y_align))
-                        current_x += scaled_digit_width + spacing
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name != '_bullet':
+            self._write_back()
+
+    def _write_back(self):
+        bullet = getattr(self, '_bullet', None)
+        if bullet is not None and bullet._store is not None:
+            bullet.rect = self
+
+def _writing_back(method):
+    # Wraps an in-place Rect method so its result reaches the store / *Enveloppe une méthode en place de Rect pour que son résultat atteigne le stockage*
+    def in_place(self, *args, **kwargs):
+        method(self, *args, **kwargs)
+        self._write_back()
+    in_place.__name__ = method.__name__
+    return in_place
+
+for _name in ('clamp_ip', 'inflate_ip', 'move_ip', 'normalize', 'scale_by_ip', 'union_ip', 'unionall_ip', 'update'):
+    if hasattr(pygame.Rect, _name):
+        setattr(_StoredBulletRect, _name, _writing_back(getattr(pygame.Rect, _name)))
 
 class Bullet(GameObject):
     """
     Represents a bullet projectile fired by the player.
-    Moves in a straight line towards a target.
+    Moves in a straight line towards a target, with a float sub-pixel position.
+    When added to a BulletStore (see bullet_store.py), its position and velocity live in the
+    store's arrays and `rect` returns a rectangle built from them, whose changes are written back.
 
     *Représente un projectile (balle) tiré par le joueur.*
-    *Se déplace en ligne droite vers une cible.*
+    *Se déplace en ligne droite vers une cible, avec une position flottante sub-pixel.*
+    *Lorsqu'il est ajouté à un BulletStore (voir bullet_store.py), sa position et sa vélocité sont stockées*
+    *dans les tableaux du stockage et `rect` retourne un rectangle construit à partir de celles-ci, dont les modifications sont réécrites.*
     """
+    __slots__ = ('_store', '_slot', '_rect', '_frame', 'position', 'velocity', 'angle')
+
     def __init__(self, x, y, target_x, target_y, image, cli_mode=False):
         """
         Initializes a Bullet.
@@ -271,41 +352,118 @@ class Bullet(GameObject):
                                            *Visuel de la balle ou métadonnées CLI.*
             cli_mode (bool): CLI mode flag. / *Indicateur du mode CLI.*
         """
+        self._store = None # Set by BulletStore.add() / *Défini par BulletStore.add()*
+        self._slot = -1
         super().__init__(x, y, image, cli_mode=cli_mode)
+        self._aim(x, y, target_x, target_y)
+
+    def reset(self, x, y, target_x, target_y, image, cli_mode=False):
+        """
+        Re-initializes a pooled bullet with the constructor's arguments (see EntityPool).
+        *Réinitialise un projectile recyclé avec les arguments du constructeur (voir EntityPool).*
+        """
+        self.cli_mode = cli_mode
+        if image is not self.original_image:
+            self.original_image = self.image = image
+            self._rect = self._make_rect(x, y, image)
+        else:
+            self._rect.topleft = (x, y)
+        self.active = True
+        self._aim(x, y, target_x, target_y)
+
+    def _aim(self, x, y, target_x, target_y):
+        self.position = (float(x), float(y)) # Sub-pixel top-left position / *Position haut-gauche sub-pixel*
         # Calculate direction from the initial (x,y) passed, which is typically player's center or weapon muzzle.
         # *Calculer la direction à partir des (x,y) initiaux passés, qui sont typiquement le centre du joueur ou la bouche de l'arme.*
         dir_x, dir_y = get_direction_vector(x, y, target_x, target_y)
         self.velocity = (dir_x * config.BULLET_SPEED, dir_y * config.BULLET_SPEED)
         self.angle = math.degrees(math.atan2(-dir_y, dir_x)) # Angle for rotation / *Angle pour la rotation*
-        
+        self._frame = _UNSET # Looked up on the first draw / *Cherchée au premier dessin*
+
+    @property
+    def rect(self):
+        if self._store is not None:
+            rect = self._store.rect_of(self._slot, _StoredBulletRect)
+            rect._bullet = self
+            return rect
+        return self._rect
+
+    @rect.setter
+    def rect(self, value):
+        if self._store is not None:
+            slot = self._slot
+            self._store.x[slot] = value.x
+            self._store.y[slot] = value.y
+            self._store.width[slot] = value.width
+            self._store.height[slot] = value.height
+        else:
+            self._rect = value
+            self.position = (float(value.x), float(value.y))
+
+    def _unbind(self, x, y):
+        """Takes the position back from the store when the bullet leaves it. / *Reprend la position du stockage quand le projectile le quitte.*"""
+        self._store = None
+        self._slot = -1
+        self.position = (x, y)
+        self._rect.topleft = (x, y)
+
     def update(self):
-        """Updates the bullet's position based on its velocity."""
-        # *Met à jour la position de la balle en fonction de sa vélocité.*
-        self.rect.x += self.velocity[0]
-        self.rect.y += self.velocity[1]
-        
+        """Updates the bullet's position based on its velocity (per-object path; BulletStore.integrate() moves stored bullets)."""
+        # *Met à jour la position de la balle en fonction de sa vélocité (chemin par objet ; BulletStore.integrate() déplace les projectiles stockés).*
+        if self._store is not None:
+            slot = self._slot
+            self._store.x[slot] += self.velocity[0]
+            self._store.y[slot] += self.velocity[1]
+            return
+        self.position = (self.position[0] + self.velocity[0], self.position[1] + self.velocity[1])
+        self._rect.topleft = self.position
+
     @property
-    def rotated_image(self):
+    def rotated_frame(self):
         """
-        Returns the bullet image rotated to match its direction of movement.
-        Only relevant in GUI mode.
+        Returns the (surface, offset) frame of the rotation atlas matching the direction of movement,
+        or None in CLI mode. Blit the surface at the bullet's top-left plus the offset.
+        The direction never changes in flight, so the frame is looked up once per shot, when the
+        bullet is first drawn; bullets that never show on screen never look it up.
 
-        *Retourne l'image de la balle tournée pour correspondre à sa direction de mouvement.*
-        *Pertinent uniquement en mode GUI.*
+        *Retourne l'image (surface, décalage) de l'atlas de rotation correspondant à la direction de*
+        *mouvement, ou None en mode CLI. Copier la surface au coin supérieur gauche du projectile plus le décalage.*
+        *La direction ne change jamais en vol, l'image est donc cherchée une fois par tir, au premier dessin*
+        *du projectile ; les projectiles qui n'apparaissent jamais à l'écran ne la cherchent jamais.*
         """
-        if self.cli_mode or not self.original_image or not hasattr(self.original_image, 'get_rect'):
-            return None # Or some default CLI representation if needed / *Ou une représentation CLI par défaut si besoin*
-        return pygame.transform.rotate(self.original_image, self.angle)
+        frame = self._frame
+        if frame is _UNSET:
+            if self.cli_mode or not self.original_image or not hasattr(self.original_image, 'get_rect'):
+                frame = None
+            else:
+                frame = rotation_atlas.frame(self.original_image, self.angle)
+            self._frame = frame
+        return frame
+
+    @property
+    def rotated_image(self):
+        """
+        Returns the bullet image rotated to match its direction of movement (see rotated_frame).
+        *Retourne l'image de la balle tournée pour correspondre à sa direction de mouvement (voir rotated_frame).*
+        """
+        frame = self.rotated_frame
+        return frame[0] if frame is not None else None
 
 class Carrot(GameObject):
     """
     Represents a carrot enemy.
     Moves towards the player and respawns after being defeated.
+    When bound to a CarrotPopulation (see carrot_population.py), its direction, active flag
+    and respawn timer live in the population's arrays and it is stepped in batch.
 
     *Représente une carotte ennemie.*
     *Se déplace vers le joueur et réapparaît après avoir été vaincue.*
+    *Lorsqu'elle est liée à une CarrotPopulation (voir carrot_population.py), sa direction, son état*
+    *actif et son minuteur de réapparition sont stockés dans les tableaux de la population, qui la met à jour par lots.*
     """
-    def __init__(self, x, y, image, cli_mode=False):
+    __slots__ = ('_population', '_slot', '_active', '_respawn_timer', '_direction', 'speed', 'spawn_position')
+
+    def __init__(self, x, y, image, cli_mode=False, rng=random):
         """
         Initializes a Carrot enemy.
         Args:
@@ -313,21 +471,68 @@ class Carrot(GameObject):
             image (pygame.Surface or dict): Carrot's visual or CLI metadata.
                                            *Visuel de la carotte ou métadonnées CLI.*
             cli_mode (bool): CLI mode flag. / *Indicateur du mode CLI.*
+            rng (random.Random, optional): Source of the initial direction; the global `random` module by default.
+                                           *Source de la direction initiale ; le module global `random` par défaut.*
         """
+        self._population = None # Set by CarrotPopulation.bind() / *Défini par CarrotPopulation.bind()*
+        self._slot = -1
         super().__init__(x, y, image, cli_mode=cli_mode)
         self.speed = config.CARROT_SPEED
         self.active = True
         self.respawn_timer = 0 # Timer for respawning / *Minuteur pour la réapparition*
-        self.direction = pygame.math.Vector2(random.uniform(-1, 1), 
-                                           random.uniform(-1, 1))
-        if self.direction.length_squared() > 0: # Avoid normalizing zero vector / *Éviter de normaliser un vecteur nul*
-            self.direction.normalize_ip()
+        direction = pygame.math.Vector2(rng.uniform(-1, 1),
+                                        rng.uniform(-1, 1))
+        if direction.length_squared() > 0: # Avoid normalizing zero vector / *Éviter de normaliser un vecteur nul*
+            direction.normalize_ip()
         else: # Default direction if random resulted in (0,0) / *Direction par défaut si l'aléatoire a donné (0,0)*
-            self.direction = pygame.math.Vector2(1,0)
+            direction = pygame.math.Vector2(1,0)
+        self.direction = direction
 
         self.spawn_position = (x, y)  # Store initial spawn position / *Stocker la position d'apparition initiale*
 
-    def respawn(self, world_size, player_rect):
+    # Array-backed attributes: read from the population when bound, from the instance otherwise
+    # *Attributs stockés en tableaux : lus depuis la population si liée, depuis l'instance sinon*
+    @property
+    def active(self):
+        if self._population is not None:
+            return bool(self._population.active[self._slot])
+        return self._active
+
+    @active.setter
+    def active(self, value):
+        if self._population is not None:
+            self._population.set_active(self._slot, value)
+        else:
+            self._active = value
+
+    @property
+    def respawn_timer(self):
+        if self._population is not None:
+            return float(self._population.respawn_time[self._slot])
+        return self._respawn_timer
+
+    @respawn_timer.setter
+    def respawn_timer(self, value):
+        if self._population is not None:
+            self._population.respawn_time[self._slot] = value
+        else:
+            self._respawn_timer = value
+
+    @property
+    def direction(self):
+        if self._population is not None:
+            return pygame.math.Vector2(float(self._population.dir_x[self._slot]), float(self._population.dir_y[self._slot]))
+        return self._direction
+
+    @direction.setter
+    def direction(self, value):
+        if self._population is not None:
+            self._population.dir_x[self._slot] = value[0]
+            self._population.dir_y[self._slot] = value[1]
+        else:
+            self._direction = value
+
+    def respawn(self, world_size, player_rect, rng=random):
         """
         Resets the carrot to its initial spawn position and reactivates it.
         Args:
@@ -335,49 +540,48 @@ class Carrot(GameObject):
                                 *Non utilisé directement ici mais souvent partie de la logique de réapparition pour le placement.*
             player_rect (pygame.Rect): Player's rectangle, for potential safe spawning logic (not used here).
                                      *Rectangle du joueur, pour une logique potentielle d'apparition sûre (non utilisée ici).*
+            rng (random.Random, optional): Source of the new direction. / *Source de la nouvelle direction.*
         """
         # *Réinitialise la carotte à sa position d'apparition initiale et la réactive.*
         self.rect.topleft = self.spawn_position
+        if self._population is not None:
+            self._population.store_position(self._slot)
         self.active = True
         # Ensure new direction is valid (non-zero vector) before normalizing
         # *S'assurer que la nouvelle direction est valide (vecteur non nul) avant de normaliser*
-        new_dir_x = random.uniform(-1, 1)
-        new_dir_y = random.uniform(-1, 1)
+        new_dir_x = rng.uniform(-1, 1)
+        new_dir_y = rng.uniform(-1, 1)
         # If both are zero (unlikely but possible), default to a direction
         # *Si les deux sont nuls (peu probable mais possible), utiliser une direction par défaut*
         if new_dir_x == 0 and new_dir_y == 0:
             new_dir_x = 1.0 # Or any non-zero component / *Ou toute composante non nulle*
         self.direction = pygame.math.Vector2(new_dir_x, new_dir_y).normalize()
 
-    def update(self, player_rect, world_bounds):
+    def update(self, player_rect, world_bounds, rng=random):
         """
-        Updates the carrot's position and behavior.
+        Updates the carrot's position and behavior (per-object path).
         Moves towards the player if within detection radius, otherwise wanders.
+        CarrotPopulation.step() applies the same rules to a whole population at once.
         Args:
             player_rect (pygame.Rect): The player's current rectangle for targeting.
                                       *Rectangle actuel du joueur pour le ciblage.*
             world_bounds (tuple[int,int]): Boundaries of the game world.
                                           *Limites du monde du jeu.*
+            rng (random.Random, optional): Source of the wandering jitter. / *Source de l'aléa d'errance.*
         """
         if self.active:
-            player_center = pygame.math.Vector2(player_rect.center)
-            carrot_center = pygame.math.Vector2(self.rect.center)
-            
+            direction = self.direction
             # Vector pointing from carrot to player / *Vecteur pointant de la carotte vers le joueur*
-            # Corrected: vector from player to carrot is carrot_center - player_center.
-            # We want to move towards player, so target_direction = player_center - carrot_center.
-            player_center = pygame.math.Vector2(player_rect.center)
-            carrot_center = pygame.math.Vector2(self.rect.center)
-            
-            vector_to_player = player_center - carrot_center
+            vector_to_player = pygame.math.Vector2(player_rect.centerx - self.rect.centerx,
+                                                   player_rect.centery - self.rect.centery)
             dist_sq = vector_to_player.length_squared()
 
             current_speed = self.speed
 
             # Apply speed multiplier and determine direction if player is in detection radius
             # *Appliquer le multiplicateur de vitesse et déterminer la direction si le joueur est dans le rayon de détection*
-            if dist_sq < config.CARROT_DETECTION_RADIUS**2: # Player is in detection radius (dist_sq can be 0 here)
-                                                    # *Le joueur est dans le rayon de détection (dist_sq peut être 0 ici)*
+            if dist_sq < config.CARROT_DETECTION_RADIUS_SQUARED: # Player is in detection radius (dist_sq can be 0 here)
+                                                               # *Le joueur est dans le rayon de détection (dist_sq peut être 0 ici)*
                 dist = math.sqrt(dist_sq)
 
                 # Speed multiplier logic (closer = faster, up to MAX_SPEED_MULTIPLIER)
@@ -393,58 +597,105 @@ class Carrot(GameObject):
                     # Player is very close, carrot should move AWAY from the player
                     # *Le joueur est très proche, la carotte doit s'éloigner du joueur*
                     if dist_sq > 0: # Avoid normalizing zero vector if somehow player and carrot are at exact same spot
-                        self.direction = -vector_to_player.normalize() # Move directly away
+                        direction = -vector_to_player.normalize() # Move directly away
                 else:
                     # Player is in detection range but not too close, carrot moves TOWARDS player
                     # *Le joueur est à portée de détection mais pas trop près, la carotte se déplace VERS le joueur*
                     if dist_sq > 0:
-                         self.direction = vector_to_player.normalize() # Move directly towards
+                         direction = vector_to_player.normalize() # Move directly towards
             else:
                 # Player is far, carrot wanders randomly
                 # *Le joueur est loin, la carotte erre aléatoirement*
                 # Add small random vector to current direction and re-normalize
                 # *Ajouter un petit vecteur aléatoire à la direction actuelle et renormaliser*
-                self.direction += pygame.math.Vector2(random.uniform(-0.2, 0.2), random.uniform(-0.2, 0.2))
-                if self.direction.length_squared() == 0: # Handle potential zero vector after random addition
-                    self.direction = pygame.math.Vector2(random.uniform(-1,1), random.uniform(-1,1)) # New random direction
+                direction = direction + pygame.math.Vector2(rng.uniform(-0.2, 0.2), rng.uniform(-0.2, 0.2))
+                if direction.length_squared() == 0: # Handle potential zero vector after random addition
+                    direction = pygame.math.Vector2(rng.uniform(-1,1), rng.uniform(-1,1)) # New random direction
 
-                if self.direction.length_squared() > 0: # Ensure it's not zero before normalizing
-                    self.direction.normalize_ip()
+                if direction.length_squared() > 0: # Ensure it's not zero before normalizing
+                    direction.normalize_ip()
                 else: # Fallback if still zero (highly unlikely)
-                    self.direction = pygame.math.Vector2(1,0)
-            
-            movement = self.direction * current_speed
-            self.rect.x += movement.x
-            self.rect.y += movement.y
-            
+                    direction = pygame.math.Vector2(1,0)
+            self.direction = direction
+
+            self.rect.x += direction.x * current_speed
+            self.rect.y += direction.y * current_speed
+
             # Keep within world bounds / *Rester dans les limites du monde*
             self.rect.x = max(0, min(world_bounds[0] - self.rect.width, self.rect.x))
             self.rect.y = max(0, min(world_bounds[1] - self.rect.height, self.rect.y))
+            if self._population is not None:
+                self._population.store_position(self._slot)
 
-class GarlicShot(GameObject): # This class seems unused in favor of the dictionary in GameState.
-                              # *Cette classe semble inutilisée au profit du dictionnaire dans GameState.*
-                              # If it were to be used, it would need proper integration.
-                              # *Si elle devait être utilisée, elle nécessiterait une intégration correcte.*
+class GarlicShot(GameObject):
     """
     Represents a garlic shot projectile, a special attack.
-    (Currently, game logic in GameState handles garlic shot as a dictionary, not this class)
+    Flies in a straight line, spinning, until it hits a vampire or reaches its maximum travel.
+    In game, shots are pooled ECS entities: the MovementSystem moves them, the LifetimeSystem
+    ends them after GARLIC_SHOT_DURATION, and GameState counts their travel and resolves hits.
+    Every shot of one image shares the same rotation frames, from the rotation atlas.
 
     *Représente un projectile de tir d'ail, une attaque spéciale.*
-    *(Actuellement, la logique du jeu dans GameState gère le tir d'ail comme un dictionnaire, pas cette classe)*
+    *Vole en ligne droite, en tournant, jusqu'à toucher un vampire ou atteindre sa distance maximale.*
+    *En jeu, les tirs sont des entités ECS recyclées : le MovementSystem les déplace, le LifetimeSystem*
+    *les termine après GARLIC_SHOT_DURATION, et GameState compte leur distance et résout les touches.*
+    *Tous les tirs d'une même image partagent les mêmes images de rotation, tirées de l'atlas de rotation.*
     """
+    __slots__ = ('direction', 'rotation_angle', 'speed', 'max_travel', 'traveled')
+
     def __init__(self, start_x, start_y, target_x, target_y, image, cli_mode=False):
         super().__init__(start_x, start_y, image, cli_mode=cli_mode)
+        self.direction = pygame.math.Vector2()
+        self._aim(start_x, start_y, target_x, target_y)
+
+    def reset(self, start_x, start_y, target_x, target_y, image, cli_mode=False):
+        """
+        Re-initializes a pooled garlic shot with the constructor's arguments (see EntityPool).
+        *Réinitialise un tir d'ail recyclé avec les arguments du constructeur (voir EntityPool).*
+        """
+        self.cli_mode = cli_mode
+        if image is not self.original_image:
+            self.original_image = self.image = image
+            self.rect = self._make_rect(start_x, start_y, image)
+        else:
+            self.rect.topleft = (start_x, start_y)
+        self.active = True
+        self._aim(start_x, start_y, target_x, target_y)
+
+    def _aim(self, start_x, start_y, target_x, target_y):
         dir_x, dir_y = get_direction_vector(start_x, start_y, target_x, target_y)
-        self.direction = pygame.math.Vector2(dir_x, dir_y)
+        self.direction.update(dir_x, dir_y)
         self.rotation_angle = 0 # For visual rotation / *Pour la rotation visuelle*
         self.speed = config.GARLIC_SHOT_SPEED
         self.max_travel = config.GARLIC_SHOT_MAX_TRAVEL # Max distance it can travel / *Distance max qu'il peut parcourir*
         self.traveled = 0 # Distance traveled so far / *Distance parcourue jusqu'à présent*
-        self.active = True
+
+    @property
+    def velocity(self):
+        """Pixels moved per tick, as (dx, dy). / *Pixels parcourus par tick, en (dx, dy).*"""
+        return (self.direction.x * self.speed, self.direction.y * self.speed)
+
+    def advance(self):
+        """
+        Counts one tick of travel and spin (the position itself is moved by the MovementSystem).
+        As in the game loop before the ECS, the tick that reaches the maximum travel still counts as
+        in flight, so the shot is tested for hits at its final position; it expires on the next tick.
+        Returns:
+            bool: False once the maximum travel was already reached before this tick.
+                  *False une fois la distance maximale déjà atteinte avant ce tick.*
+
+        *Compte un tick de distance et de rotation (la position elle-même est déplacée par le MovementSystem).*
+        *Comme dans la boucle de jeu d'avant l'ECS, le tick qui atteint la distance maximale compte encore comme*
+        *en vol, le tir est donc testé contre les cibles à sa position finale ; il expire au tick suivant.*
+        """
+        in_flight = self.traveled < self.max_travel
+        self.traveled += self.speed
+        self.rotation_angle = (self.rotation_angle + config.GARLIC_ROTATION_SPEED) % 360
+        return in_flight
 
     def update(self):
-        """Updates garlic shot's position, rotation, and checks travel limit."""
-        # *Met à jour la position, la rotation du tir d'ail et vérifie la limite de déplacement.*
+        """Updates garlic shot's position, rotation, and checks travel limit (per-object path, outside the ECS)."""
+        # *Met à jour la position, la rotation du tir d'ail et vérifie la limite de déplacement (chemin par objet, hors ECS).*
         if self.active:
             self.rect.x += self.direction.x * self.speed
             self.rect.y += self.direction.y * self.speed
@@ -454,8 +705,29 @@ class GarlicShot(GameObject): # This class seems unused in favor of the dictiona
             if self.traveled >= self.max_travel:
                 self.active = False
 
-class Explosion(GameObject): # Explosion is not a GameObject in current code, but has similar attributes
-                             # *Explosion n'est pas un GameObject dans le code actuel, mais a des attributs similaires*
+    @property
+    def rotated_frame(self):
+        """
+        Returns the shared (surface, offset) atlas frame closest to the current rotation angle, or None in CLI mode.
+        *Retourne l'image (surface, décalage) partagée de l'atlas la plus proche de l'angle de rotation actuel, ou None en mode CLI.*
+        """
+        if self.cli_mode or not self.original_image or not hasattr(self.original_image, 'get_rect'):
+            return None
+        return rotation_atlas.frame(self.original_image, self.rotation_angle)
+
+    @property
+    def rotated_image(self):
+        """Returns the surface of rotated_frame, or None in CLI mode. / *Retourne la surface de rotated_frame, ou None en mode CLI.*"""
+        frame = self.rotated_frame
+        return frame[0] if frame is not None else None
+
+    def draw(self, screen, scroll):
+        frame = self.rotated_frame
+        if frame is not None:
+            rotated, (offset_x, offset_y) = frame
+            screen.blit(rotated, (self.rect.x + offset_x - scroll[0], self.rect.y + offset_y - scroll[1]))
+
+class Explosion(GameObject):
     """
     Represents an explosion effect.
     Lasts for a short duration with a flashing animation.
@@ -463,8 +735,10 @@ class Explosion(GameObject): # Explosion is not a GameObject in current code, bu
     *Représente un effet d'explosion.*
     *Dure peu de temps avec une animation clignotante.*
     """
-    def __init__(self, x, y, image): # Does not take cli_mode, assumes GUI if created
-                                     # *Ne prend pas cli_mode, suppose GUI si créé*
+    __slots__ = ('start_time', 'flash_count', 'max_flashes', 'flash_interval')
+
+    def __init__(self, x, y, image, clock=None): # Does not take cli_mode, assumes GUI if created
+                                                 # *Ne prend pas cli_mode, suppose GUI si créé*
         """
         Initializes an Explosion effect.
         Args:
@@ -472,19 +746,27 @@ class Explosion(GameObject): # Explosion is not a GameObject in current code, bu
                         *Coordonnées centrales de l'explosion.*
             image (pygame.Surface): Image for the explosion.
                                     *Image pour l'explosion.*
+            clock (GameClock, optional): Game time source. A real-time clock by default.
+                                         *Source du temps de jeu. Horloge temps réel par défaut.*
         """
-        # GameObject.__init__(self, x, y, image) # If it were a GameObject
-        # self.rect.center = (x,y)
-        self.image = image
-        if image and hasattr(image, 'get_rect'): # Check if image is a valid surface
-            self.rect = image.get_rect(center=(x, y))
-        else: # Fallback if image is None or not a surface (e.g. asset loading failed)
-            self.rect = pygame.Rect(x,y,0,0) # Placeholder rect
-
-        self.start_time = time.time() # Time of creation / *Moment de création*
-        self.flash_count = 0 # Number of flashes so far / *Nombre de flashs jusqu'à présent*
+        super().__init__(x, y, image)
         self.max_flashes = config.EXPLOSION_MAX_FLASHES
         self.flash_interval = config.EXPLOSION_FLASH_INTERVAL
+        self.reset(x, y, image, clock)
+
+    def reset(self, x, y, image, clock=None):
+        """
+        (Re-)initializes the explosion's position and timing; also used to recycle a pooled explosion.
+        *(Ré)initialise la position et la temporisation de l'explosion ; sert aussi à recycler une explosion de la réserve.*
+        """
+        self.original_image = self.image = image
+        # A placeholder rect of size 0 if image is None or not a surface (e.g. asset loading failed)
+        # *Un rectangle de remplacement de taille 0 si l'image est None ou n'est pas une surface (par ex. échec du chargement)*
+        self.rect = self._make_rect(x, y, image)
+        self.rect.center = (x, y)
+
+        self.start_time = (clock if clock is not None else GameClock()).now() # Time of creation / *Moment de création*
+        self.flash_count = 0 # Number of flashes so far / *Nombre de flashs jusqu'à présent*
         self.active = True
 
     def update(self, current_time):
@@ -501,13 +783,29 @@ class Explosion(GameObject): # Explosion is not a GameObject in current code, bu
         if self.active:
             elapsed = current_time - self.start_time
             if elapsed > self.flash_interval:
-                self.flash_count += 1
-                self.start_time = current_time # Reset timer for next flash / *Réinitialiser le minuteur pour le prochain flash*
+                return self.flash(current_time)
             if self.flash_count >= self.max_flashes:
                 self.active = False
                 return True # Signal that explosion is done / *Signaler que l'explosion est terminée*
         return False
 
+    def flash(self, current_time):
+        """
+        Advances the animation by one flash. GameState calls this from a scheduled timer every
+        `flash_interval` seconds instead of polling update().
+        Returns:
+            bool: True if this was the last flash. / *True si c'était le dernier flash.*
+
+        *Avance l'animation d'un flash. GameState l'appelle depuis un minuteur planifié toutes les*
+        *`flash_interval` secondes au lieu d'interroger update().*
+        """
+        self.flash_count += 1
+        self.start_time = current_time # Reset timer for next flash / *Réinitialiser le minuteur pour le prochain flash*
+        if self.flash_count >= self.max_flashes:
+            self.active = False
+            return True # Signal that explosion is done / *Signaler que l'explosion est terminée*
+        return False
+
     def draw(self, screen, scroll):
         """
         Draws the explosion if it's active and in a "flash on" state.
@@ -527,6 +825,8 @@ class Collectible(GameObject):
     *Représente un objet à collectionner (par ex. PV, Ail, Jus de Carotte).*
     *Peut être ramassé par le joueur.*
     """
+    __slots__ = ('item_type', '_source', 'quantity')
+
     def __init__(self, x, y, image, item_type, scale=0.5, cli_mode=False):
         """
         Initializes a Collectible item.
@@ -541,17 +841,7 @@ class Collectible(GameObject):
                            *Facteur d'échelle pour l'image de l'objet.*
             cli_mode (bool): CLI mode flag. / *Indicateur du mode CLI.*
         """
-        # In CLI mode, 'image' is metadata, so scaling is not applicable.
-        # This logic applies scaling only in GUI mode when a valid surface is provided.
-        # *En mode CLI, 'image' correspond à des métadonnées, donc la mise à l'échelle n'est pas applicable.*
-        # *Cette logique applique la mise à l'échelle uniquement en mode GUI lorsqu'une surface valide est fournie.*
-        final_image = image
-        if not cli_mode and image and hasattr(image, 'get_width'): # Check if it's a surface before scaling
-                                                                    # *Vérifier si c'est une surface avant de mettre à l'échelle*
-            final_image = pygame.transform.scale(
-                image,
-                (int(image.get_width() * scale), int(image.get_height() * scale))
-            )
+        final_image = self._scaled(image, scale, cli_mode)
 
         # Initialize GameObject. x, y are treated as topleft for GameObject's constructor.
         # The GameObject.__init__ handles using size_hint from metadata if final_image is a dict (CLI mode).
@@ -571,6 +861,38 @@ class Collectible(GameObject):
 
         self.active = True
         self.item_type = item_type # Type of collectible (e.g., 'hp', 'garlic') / *Type d'objet à collectionner (par ex. 'hp', 'ail')*
+        self.quantity = 1 # Units held, more than one once nearby drops merged / *Unités contenues, plus d'une une fois des objets proches fusionnés*
+        self._source = (image, scale) # Unscaled image and scale, to skip rescaling on reuse / *Image non mise à l'échelle et facteur, pour éviter de refaire la mise à l'échelle au recyclage*
+
+    @staticmethod
+    def _scaled(image, scale, cli_mode):
+        # In CLI mode, 'image' is metadata, so scaling is not applicable.
+        # This logic applies scaling only in GUI mode when a valid surface is provided.
+        # *En mode CLI, 'image' correspond à des métadonnées, donc la mise à l'échelle n'est pas applicable.*
+        # *Cette logique applique la mise à l'échelle uniquement en mode GUI lorsqu'une surface valide est fournie.*
+        if not cli_mode and image and hasattr(image, 'get_width'): # Check if it's a surface before scaling
+                                                                    # *Vérifier si c'est une surface avant de mettre à l'échelle*
+            return sprite_variants.get(image, scale=scale) # Scaled once per source image / *Mise à l'échelle une fois par image source*
+        return image
+
+    def reset(self, x, y, image, item_type, scale=0.5, cli_mode=False):
+        """
+        Re-initializes a pooled item with the constructor's arguments (see EntityPool).
+        The scaled image is kept when the source image and scale are unchanged.
+
+        *Réinitialise un objet recyclé avec les arguments du constructeur (voir EntityPool).*
+        *L'image mise à l'échelle est conservée quand l'image source et le facteur sont inchangés.*
+        """
+        source = self._source
+        if source[0] is not image or source[1] != scale or cli_mode != self.cli_mode:
+            self.cli_mode = cli_mode
+            self.original_image = self.image = self._scaled(image, scale, cli_mode)
+            self.rect = self._make_rect(x, y, self.image)
+            self._source = (image, scale)
+        self.rect.center = (x, y)
+        self.active = True
+        self.item_type = item_type
+        self.quantity = 1
 
 class Vampire(GameObject):
     """
@@ -580,6 +902,9 @@ class Vampire(GameObject):
     *Représente l'ennemi Vampire.*
     *Poursuit le joueur et possède un mécanisme spécial de mort/réapparition.*
     """
+    __slots__ = ('respawn_timer', 'death_effect_active', 'death_effect_start_time', 'death_effect_duration', 'speed',
+                 'death_position')
+
     def __init__(self, x, y, image, cli_mode=False):
         """
         Initializes the Vampire enemy.
@@ -597,8 +922,9 @@ class Vampire(GameObject):
         self.death_effect_start_time = 0
         self.death_effect_duration = config.VAMPIRE_DEATH_DURATION
         self.speed = config.VAMPIRE_SPEED
+        self.death_position = (0, 0)  # Where it last died, for the carrot juice drop / *Où il est mort en dernier, pour la chute de jus de carotte*
 
-    def update(self, player, world_bounds, current_time):
+    def update(self, player, world_bounds, current_time, flow_field=None, rng=random):
         """
         Updates the Vampire's state, including movement, death effect, and respawning.
         Args:
@@ -608,10 +934,19 @@ class Vampire(GameObject):
                                           *Limites du monde du jeu.*
             current_time (float): The current game time.
                                   *Le temps de jeu actuel.*
+            flow_field (FlowField, optional): Field pointed at the player, followed around obstacles.
+                                              The vampire heads straight for the player without it.
+                                              *Champ orienté vers le joueur, suivi autour des obstacles.*
+                                              *Le vampire fonce droit sur le joueur sans lui.*
+            rng (random.Random, optional): Source of the respawn position. / *Source de la position de réapparition.*
         """
         if self.active:
             # Movement logic / *Logique de mouvement*
-            move_x, move_y = calculate_movement_towards(self.rect, player.rect, self.speed, world_bounds)
+            direction = flow_field.direction_at(self.rect.centerx, self.rect.centery) if flow_field is not None else None
+            if direction is None: # Clear straight line / *Ligne droite dégagée*
+                move_x, move_y = calculate_movement_towards(self.rect, player.rect, self.speed, world_bounds)
+            else:
+                move_x, move_y = direction[0] * self.speed, direction[1] * self.speed
             self.rect.x += move_x
             self.rect.y += move_y
 
@@ -633,8 +968,8 @@ class Vampire(GameObject):
                  # Respawn only if not in the middle of a death effect
                  # *Réapparaître uniquement si pas au milieu d'un effet de mort*
                 self.respawn(
-                    random.randint(0, world_bounds[0] - self.rect.width),
-                    random.randint(0, world_bounds[1] - self.rect.height)
+                    rng.randint(0, world_bounds[0] - self.rect.width),
+                    rng.randint(0, world_bounds[1] - self.rect.height)
                 )
 
     def respawn(self, x, y):
@@ -669,8 +1004,7 @@ class Vampire(GameObject):
                     # Tinted image for death effect (e.g., green)
                     # *Image teintée pour l'effet de mort (par ex. vert)*
                     if self.original_image and hasattr(self.original_image, 'copy'):
-                        tinted_image = self.original_image.copy()
-                        tinted_image.fill(config.VAMPIRE_DEATH_TINT_COLOR, special_flags=pygame.BLEND_RGBA_MULT) # Green tint
+                        tinted_image = sprite_variants.get(self.original_image, tint=config.VAMPIRE_DEATH_TINT_COLOR) # Green tint, made once / *Teinte verte, faite une fois*
                         screen.blit(tinted_image, (self.rect.x - scroll[0], self.rect.y - scroll[1]))
             # else: death effect duration passed, it will be set to inactive by update or GameState
             # *sinon : la durée de l'effet de mort est passée, il sera défini comme inactif par update ou GameState*
@@ -684,6 +1018,8 @@ class Button(GameObject): # Button is also a GameObject
     UI Button class. Can be clicked to trigger a callback function.
     *Classe pour les boutons d'interface utilisateur. Peut être cliqué pour déclencher une fonction de rappel.*
     """
+    __slots__ = ('callback',)
+
     def __init__(self, x, y, image, callback, cli_mode=False):
         """
         Initializes a Button.
@@ -11,11 +11,24 @@
 
 import logging
 import math
-import random
 
 import pygame
 
 import config
+from bullet_store import BulletStore
+from carrot_population import CarrotPopulation
+from collision import CollisionWorld
+from ecs import World
+from game_clock import GameClock, VIRTUAL
+from scheduler import Scheduler
+from rng import RngRegistry
+from simulation_lod import SimulationLod
+from spawn_placement import SpawnPlacer
+from vampire_horde import VampireHorde
+from systems import CollisionSystem, LifetimeSystem, MovementSystem, PickupSystem
+from entity_pool import EntityPool
+from flow_field import FlowField
+from events import EventBus, KillEvent, PickupEvent, ShotEvent, AudioListener, HudListener, TelemetryListener, LogListener
 from game_entities import Carrot, Vampire, Player, Bullet, GarlicShot, Explosion, Collectible
 
 class GameState:
@@ -26,7 +39,7 @@ class GameState:
     *Gère l'état global du jeu, y compris toutes les entités,*
     *les conditions de jeu et les mises à jour.*
     """
-    def __init__(self, asset_manager, cli_mode=False):
+    def __init__(self, asset_manager, cli_mode=False, clock=None, seed=None):
         """
         Initializes the game state.
         Args:
@@ -34,52 +47,87 @@ class GameState:
                                           *L'instance de AssetManager pour accéder aux ressources du jeu.*
             cli_mode (bool): True if the game is running in Command Line Interface mode.
                              *True si le jeu fonctionne en mode Interface en Ligne de Commande.*
+            clock (GameClock, optional): The game time source shared with the entities. A real-time clock by default.
+                                         *La source du temps de jeu partagée avec les entités. Horloge temps réel par défaut.*
+            seed (int, optional): Session seed making every random draw reproducible (see rng.py).
+                                  *Graine de session rendant chaque tirage aléatoire reproductible (voir rng.py).*
         """
         self.cli_mode = cli_mode
+        self.clock = clock if clock is not None else GameClock()  # Single source of game time / *Source unique du temps de jeu*
+        # Separate random streams for spawns, AI and loot / *Flux aléatoires séparés pour apparitions, IA et butin*
+        self.rng = RngRegistry(seed)
         self.scroll = [0, 0]  # Camera scroll position / *Position de défilement de la caméra*
         self.scroll_trigger = config.SCROLL_TRIGGER  # Screen edge percentage to trigger scroll / *Pourcentage du bord de l'écran pour déclencher le défilement*
         self.world_size = config.WORLD_SIZE  # Total dimensions of the game world / *Dimensions totales du monde du jeu*
         self.carrot_spawn_safe_radius_sq = (min(self.world_size) / config.CARROT_SPAWN_SAFE_RATIO)**2
+        # Bounded carrot placement away from the player, one at a time or in waves
+        # *Placement borné des carottes loin du joueur, une à la fois ou par vagues*
+        self.spawn_placer = SpawnPlacer(self.world_size, math.sqrt(self.carrot_spawn_safe_radius_sq),
+                                        rng=self.rng.stream('spawn'), bulk_rng=self.rng.bulk('spawn'))
         self.game_over = False  # True if the game has ended / *True si le jeu est terminé*
         self.started = False  # True if the game has started (past the initial screen) / *True si le jeu a commencé (après l'écran initial)*
         self.paused = False  # True if the game is currently paused / *True si le jeu est actuellement en pause*
         self.asset_manager = asset_manager
-
-        self.player = Player(200, 200, asset_manager.images['rabbit'], asset_manager, cli_mode=self.cli_mode)
-
-        self.garlic_shot = None  # Stores active garlic shot details / *Stocke les détails du tir d'ail actif*
-        self.garlic_shot_start_time = 0
-        self.garlic_shot_travel = 0
-
-        self.vampire = Vampire(
-            random.randint(0, config.WORLD_SIZE[0]),
-            random.randint(0, config.WORLD_SIZE[1]),
-            asset_manager.images['vampire'],
-            cli_mode=self.cli_mode
-        )
-        self.vampire.active = True # This might need to be conditional if Vampire init changes based on cli_mode
-                                   # *Ceci pourrait devoir être conditionnel si l'initialisation de Vampire change en fonction du cli_mode*
-        self.bullets = []  # List of active player bullets / *Liste des projectiles actifs du joueur*
+        # Broadphase grid for carrots, items and vampires / *Grille de phase large pour carottes, objets et vampires*
+        self.collision_world = CollisionWorld(self.world_size, config.COLLISION_CELL_SIZE)
+        # Entity-component storage and the systems run by the update pipeline
+        # *Stockage entité-composant et systèmes exécutés par le pipeline de mise à jour*
+        self.world = World()
+        self.movement_system = MovementSystem(self.world)
+        self.lifetime_system = LifetimeSystem(self.world)
+        self.collision_system = CollisionSystem(self.world, self.collision_world)
+        self.pickup_system = PickupSystem(self.world, self.collision_world, 'items', self._apply_pickup)
+        self.world.despawn_hooks.append(self._on_despawn)
+        # Array-backed carrot state, stepped in one batched pass / *État des carottes en tableaux, mis à jour en une passe groupée*
+        self.carrot_population = CarrotPopulation(self.collision_world.layer('carrots'), rng=self.rng.bulk('ai'),
+                                             lod=SimulationLod.from_config())
+        # Navigation towards the player shared by all chasers, rebuilt when the player changes cell
+        # *Navigation vers le joueur partagée par tous les poursuivants, reconstruite quand le joueur change de cellule*
+        self.flow_field = FlowField(self.world_size, obstacles=[pygame.Rect(area) for area in config.FLOW_FIELD_OBSTACLES])
+        # Timed events (respawns, effect expiry, item drops) / *Événements temporisés (réapparitions, fin d'effets, chutes d'objets)*
+        self.scheduler = Scheduler()
+        # Kill, pickup, damage and shot events queued during a tick and dispatched at its end
+        # *Événements de victime, ramassage, dégâts et tir mis en file pendant un tick et distribués à sa fin*
+        self.events = EventBus()
+        if not self.cli_mode:
+            AudioListener(asset_manager.sounds).attach(self.events)
+        self.hud = HudListener().attach(self.events)  # Tells the UI when to refresh / *Indique à l'UI quand se rafraîchir*
+        self.telemetry = TelemetryListener().attach(self.events)
+        LogListener().attach(self.events)
+
+        self.player = Player(200, 200, asset_manager.images['rabbit'], asset_manager, cli_mode=self.cli_mode,
+                             clock=self.clock, scheduler=self.scheduler, events=self.events)
+
+        # All the vampires, moved in one batched pass and tracked in the 'vampires' collision layer
+        # *Tous les vampires, déplacés en une passe groupée et suivis dans la couche de collision 'vampires'*
+        self.vampires = VampireHorde(self.collision_world.layer('vampires'))
+        spawn_rng = self.rng.stream('spawn')
+        for _ in range(config.VAMPIRE_COUNT):
+            self.add_vampire(spawn_rng.randint(0, config.WORLD_SIZE[0]), spawn_rng.randint(0, config.WORLD_SIZE[1]))
+        # Pools recycling short-lived entities, pre-warmed so combat does not allocate
+        # *Réserves recyclant les entités à courte durée de vie, pré-remplies pour que le combat n'alloue pas*
+        self.bullet_pool = EntityPool(Bullet)
+        self.explosion_pool = EntityPool(Explosion)
+        self.collectible_pool = EntityPool(Collectible)
+        self.garlic_shot_pool = EntityPool(GarlicShot)
+        self._prewarm_pools()
+        self.bullet_store = BulletStore(pool=self.bullet_pool)  # Array-backed player bullets / *Projectiles du joueur stockés en tableaux*
         self.carrots = []  # List of active carrot enemies / *Liste des carottes ennemies actives*
         self.explosions = []  # List of active explosions / *Liste des explosions actives*
-        self.garlic_shots = [] # List of active garlic shots (though current logic uses a single self.garlic_shot)
-                               # *Liste des tirs d'ail actifs (bien que la logique actuelle utilise un seul self.garlic_shot)*
+        self.garlic_shots = [] # List of active garlic shots, all ECS entities / *Liste des tirs d'ail actifs, tous entités ECS*
         self.items = []  # List of active collectible items / *Liste des objets collectables actifs*
-
-        # Redundant garlic_shot attributes, already defined above. Consider removing if not distinct.
-        # *Attributs garlic_shot redondants, déjà définis ci-dessus. Envisager de supprimer s'ils ne sont pas distincts.*
-        # self.garlic_shot = None
-        # self.garlic_shot_travel = 0
-        # self.garlic_shot_start_time = 0
-        self.garlic_shot_speed = config.GARLIC_SHOT_SPEED
-        self.garlic_shot_duration = config.GARLIC_SHOT_DURATION
-        
-        self.vampire_killed_count = 0  # Track vampires killed / *Compteur de vampires tués*
-        self.last_vampire_death_pos = (0, 0)  # Position tracking for item drops from vampire / *Suivi de la position pour les chutes d'objets du vampire*
+        self.bullets_spent = 0  # Bullets removed for age or range / *Projectiles retirés pour âge ou portée*
+        self.items_merged = 0  # Drops merged into a nearby item / *Objets déposés fusionnés avec un objet proche*
+        # Shots refused by the fire-rate governor and entities culled by a budget, e.g. drop_counts['budget:bullets']
+        # *Tirs refusés par le limiteur de cadence et entités retirées par un budget, par ex. drop_counts['budget:bullets']*
+        self.drop_counts = {}
+        self._explosion_timers = {}  # Pending flash timer of each explosion / *Minuteur de flash en attente de chaque explosion*
 
         # Initialize carrots / *Initialiser les carottes*
-        for _ in range(config.CARROT_COUNT):
-            self.create_carrot(asset_manager)
+        self.spawn_carrots(config.CARROT_COUNT, asset_manager)
+        self.carrot_population.bind(self.carrots)
+
+        self.pipeline = self._build_pipeline()
 
     def reset(self):
         """
@@ -94,30 +142,38 @@ class GameState:
         self.game_over = False
         self.started = False
         self.paused = False # Reset pause state / *Réinitialiser l'état de pause*
+        self.clock.resume()
         
-        # Completely reset all entity containers / *Réinitialiser complètement tous les conteneurs d'entités*
-        self.bullets = []
-        self.explosions = []
-        self.garlic_shots = [] # If multiple garlic shots were intended / *Si plusieurs tirs d'ail étaient prévus*
-        self.items = []
+        # Empty all entity containers, giving pooled entities back to their pools
+        # *Vider tous les conteneurs d'entités, en rendant les entités recyclables à leurs réserves*
+        self.bullet_store.clear()
+        for explosion in self.explosions:
+            self.explosion_pool.release(explosion)
+        self.explosions.clear()
+        self._explosion_timers.clear()
+        self.world.clear() # Despawn hooks return the items and garlic shots to their pools / *Les crochets de suppression rendent les objets et tirs d'ail à leurs réserves*
+        self.garlic_shots.clear()
+        for item in self.items: # Items never registered as entities / *Objets jamais enregistrés comme entités*
+            self.collectible_pool.release(item)
+        self.items.clear()
         self.carrots = []
         
-        # Reset single garlic shot state / *Réinitialiser l'état du tir d'ail unique*
-        self.garlic_shot = None
-        self.garlic_shot_travel = 0
-        self.garlic_shot_start_time = 0
-        
+        self.collision_world.clear()
+        self.scheduler.clear() # Pending respawns and effects belong to the old game / *Les réapparitions et effets en attente appartiennent à l'ancienne partie*
+        self.events.clear()
+        self.telemetry.reset()
+        self.hud.dirty = True
+
         # Reset entities / *Réinitialiser les entités*
         if self.player:
             self.player.reset()
-            # Clear any bullet rotation state (if applicable) / *Effacer tout état de rotation de projectile (si applicable)*
-            if hasattr(self.player, 'bullet_rotation'):
-                del self.player.bullet_rotation
         
-        # Hard reset vampire / *Réinitialisation matérielle du vampire*
-        if self.vampire:
-            vampire_width = self.vampire.rect.width
-            vampire_height = self.vampire.rect.height
+        # Hard reset vampires, back to the starting horde / *Réinitialisation matérielle des vampires, ramenés à la horde de départ*
+        self.vampires.trim(config.VAMPIRE_COUNT)
+        spawn_rng = self.rng.stream('spawn')
+        for vampire in self.vampires:
+            vampire_width = vampire.rect.width
+            vampire_height = vampire.rect.height
             if vampire_width == 0 and isinstance(self.asset_manager.images.get('vampire'), dict): # CLI mode with size hint
                 size_hint = self.asset_manager.images['vampire'].get('size_hint') or self.asset_manager.images['vampire'].get('size')
                 if size_hint:
@@ -125,269 +181,612 @@ class GameState:
                 else: # Fallback if no size info in CLI metadata
                     vampire_width, vampire_height = config.IMAGE_ASSET_CONFIG['vampire']['size']
 
-            self.vampire.active = False
-            self.vampire.death_effect_active = False
-            self.vampire.respawn_timer = 0
+            vampire.active = False
+            vampire.death_effect_active = False
+            vampire.respawn_timer = 0
             # Respawn the vampire at a new random valid position
             # *Faire réapparaître le vampire à une nouvelle position aléatoire valide*
-            self.vampire.respawn(
-                random.randint(0, self.world_size[0] - vampire_width if self.world_size[0] > vampire_width else 0),
-                random.randint(0, self.world_size[1] - vampire_height if self.world_size[1] > vampire_height else 0)
+            vampire.respawn(
+                spawn_rng.randint(0, self.world_size[0] - vampire_width if self.world_size[0] > vampire_width else 0),
+                spawn_rng.randint(0, self.world_size[1] - vampire_height if self.world_size[1] > vampire_height else 0)
             )
-            # self.vampire.active = True # This is redundant as Vampire.respawn() sets self.active = True
+        self.vampires.sync()
 
-        self.vampire_killed_count = 0 # Reset kill count / *Réinitialiser le compteur de victimes*
+        self.vampires.killed_count = 0 # Reset kill count / *Réinitialiser le compteur de victimes*
+        self.vampires.last_death_pos = (0, 0)
             
         # Recreate carrots with fresh instances / *Recréer les carottes avec de nouvelles instances*
         self.carrots = []
-        for _ in range(config.CARROT_COUNT):
-            self.create_carrot(self.asset_manager)
+        self.spawn_carrots(config.CARROT_COUNT)
+        self.carrot_population.bind(self.carrots)
+
+    def add_bullet(self, start_x, start_y, target_x, target_y, image, current_time=None):
+        """
+        Creates and adds a new bullet to the game. It is removed after BULLET_TTL seconds or
+        BULLET_MAX_RANGE pixels, whichever comes first.
+        Args:
+            current_time (float, optional): Game time of the shot; the clock's time by default.
+                                            *Temps de jeu du tir ; le temps de l'horloge par défaut.*
+
+        *Crée et ajoute un nouveau projectile au jeu. Il est retiré après BULLET_TTL secondes ou*
+        *BULLET_MAX_RANGE pixels, selon ce qui arrive en premier.*
+        """
+        if current_time is None:
+            current_time = self.clock.now()
+        bullet_store = self.bullet_store
+        if config.BULLET_BUDGET and len(bullet_store) >= config.BULLET_BUDGET:
+            # The bullet farthest from the player matters least / *Le projectile le plus loin du joueur compte le moins*
+            bullet_store.remove_slots([bullet_store.farthest_slot(*self.player.rect.center)])
+            self._count_drop('budget:bullets')
+        expires = current_time + config.BULLET_TTL if config.BULLET_TTL else math.inf
+        bullet = bullet_store.add(self.bullet_pool.acquire(start_x, start_y, target_x, target_y, image, cli_mode=self.cli_mode),
+                                  expires)
+        self.events.emit(ShotEvent('bullet', start_x, start_y))
+        return bullet
+
+    def fire_bullet(self, target_x, target_y, image, current_time=None):
+        """
+        Fires a player bullet from the player's center towards a world position, within the
+        'bullet' fire rate (see Player.ready_to_fire()).
+        Returns:
+            Bullet or None: The new bullet, or None if the weapon is cooling down.
+                            *Le nouveau projectile, ou None si l'arme refroidit.*
+
+        *Tire un projectile du joueur depuis son centre vers une position du monde, dans la limite*
+        *de la cadence de 'bullet' (voir Player.ready_to_fire()).*
+        """
+        if current_time is None:
+            current_time = self.clock.now()
+        if not self.player.ready_to_fire('bullet', current_time):
+            self._count_drop('governor:bullet')
+            return None
+        return self.add_bullet(self.player.rect.centerx, self.player.rect.centery, target_x, target_y, image, current_time)
+
+    def _count_drop(self, key):
+        self.drop_counts[key] = self.drop_counts.get(key, 0) + 1
+
+    def drop_stats(self):
+        """
+        Returns the shots refused by the fire-rate governor ('governor:<weapon>') and the entities
+        culled by a budget ('budget:<type>') since the game was created, to tune the limits.
+        *Retourne les tirs refusés par le limiteur de cadence ('governor:<arme>') et les entités*
+        *retirées par un budget ('budget:<type>') depuis la création du jeu, pour régler les limites.*
+        """
+        return dict(self.drop_counts)
+
+    def _prewarm_pools(self):
+        # Placeholder instances without an image; acquire() gives them their real image and position
+        # *Instances de remplacement sans image ; acquire() leur donne leur vraie image et position*
+        self.bullet_pool.prewarm(config.BULLET_POOL_SIZE, 0, 0, 1, 0, None, cli_mode=self.cli_mode)
+        self.explosion_pool.prewarm(config.EXPLOSION_POOL_SIZE, 0, 0, None, clock=self.clock)
+        self.collectible_pool.prewarm(config.COLLECTIBLE_POOL_SIZE, 0, 0, None, None, config.ITEM_SCALE, cli_mode=self.cli_mode)
+        self.garlic_shot_pool.prewarm(config.GARLIC_SHOT_POOL_SIZE, 0, 0, 1, 0, None, cli_mode=self.cli_mode)
 
-    def add_bullet(self, start_x, start_y, target_x, target_y, image):
+    def pool_stats(self):
+        """
+        Returns the hit/miss counters of the entity pools, by pool name.
+        *Retourne les compteurs de réussites/échecs des réserves d'entités, par nom de réserve.*
+        """
+        return {
+            'bullets': self.bullet_pool.stats(),
+            'explosions': self.explosion_pool.stats(),
+            'collectibles': self.collectible_pool.stats(),
+            'garlic_shots': self.garlic_shot_pool.stats(),
+        }
+
+    def gauges(self):
+        """
+        Returns the live entity counts, and the counters of entities removed before their natural end,
+        to check that memory stays flat over long sessions.
+        *Retourne le nombre d'entités vivantes, et les compteurs d'entités retirées avant leur fin naturelle,*
+        *pour vérifier que la mémoire reste stable sur de longues sessions.*
+        """
+        return {
+            'carrots': sum(1 for carrot in self.carrots if carrot.active),
+            'vampires': sum(1 for vampire in self.vampires if vampire.active),
+            'bullets': len(self.bullet_store),
+            'garlic_shots': len(self.garlic_shots),
+            'explosions': len(self.explosions),
+            'items': len(self.items),
+            'entities': len(self.world),
+            'timers': len(self.scheduler),
+            'bullets_spent': self.bullets_spent,
+            'expired': self.lifetime_system.expired_count, # Items and garlic shots / *Objets et tirs d'ail*
+            'items_merged': self.items_merged,
+        }
+
+    def lod_stats(self):
+        """
+        Returns the carrot LOD tier populations and update costs since the last call, by tier name.
+        *Retourne les populations et coûts de mise à jour des paliers LOD des carottes depuis le dernier appel, par nom de palier.*
+        """
+        lod = self.carrot_population.lod
+        if lod is None:
+            return {}
+        stats = lod.stats()
+        lod.reset_stats()
+        return stats
+
+    @property
+    def bullets(self):
         """
-        Creates and adds a new bullet to the game.
-        *Crée et ajoute un nouveau projectile au jeu.*
+        A copy of the active player bullets, as facades in store slot order (the order changes on removal).
+        Add bullets with add_bullet() or by assigning a new list, not by changing the copy.
+        *Une copie des projectiles actifs du joueur, sous forme de façades dans l'ordre des cases du stockage (l'ordre change lors des suppressions).*
+        *Ajouter des projectiles avec add_bullet() ou en affectant une nouvelle liste, pas en modifiant la copie.*
         """
-        self.bullets.append(Bullet(start_x, start_y, target_x, target_y, image, cli_mode=self.cli_mode))
+        return list(self.bullet_store.bullets)
 
-    # add_garlic_shot is not used if self.garlic_shot is a single dictionary.
-    # *add_garlic_shot n'est pas utilisé si self.garlic_shot est un dictionnaire unique.*
-    def add_garlic_shot(self, start_x, start_y, target_x, target_y, image):
+    @bullets.setter
+    def bullets(self, bullets):
+        bullets = list(bullets) # May be the store's own list, emptied by clear() / *Peut être la liste du stockage, vidée par clear()*
+        self.bullet_store.clear(keep=bullets)
+        for bullet in bullets:
+            self.bullet_store.add(bullet)
+
+    def add_garlic_shot(self, start_x, start_y, target_x, target_y, image, current_time=None):
         """
-        Creates and adds a new garlic shot to the game's list of garlic shots.
-        Note: Current game logic uses a single `self.garlic_shot` dictionary, not this list.
-        This method is kept for potential future use or test compatibility.
+        Takes a garlic shot with top-left (start_x, start_y) from the pool and spawns it as an entity
+        that moves towards the target and expires after GARLIC_SHOT_DURATION.
+        Args:
+            current_time (float, optional): Game time of the throw; the clock's time by default.
+                                            *Temps de jeu du lancer ; le temps de l'horloge par défaut.*
+        Returns:
+            GarlicShot: The new shot. / *Le nouveau tir.*
 
-        *Crée et ajoute un nouveau tir d'ail à la liste des tirs d'ail du jeu.*
-        *Note : La logique de jeu actuelle utilise un unique dictionnaire `self.garlic_shot`, et non cette liste.*
-        *Cette méthode est conservée pour une utilisation future potentielle ou la compatibilité des tests.*
+        *Prend dans la réserve un tir d'ail de coin haut-gauche (start_x, start_y) et le crée comme entité*
+        *qui se déplace vers la cible et expire après GARLIC_SHOT_DURATION.*
+        """
+        if current_time is None:
+            current_time = self.clock.now()
+        shot = self.garlic_shot_pool.acquire(start_x, start_y, target_x, target_y, image, cli_mode=self.cli_mode)
+        shot.entity = self.world.spawn(
+            facade=shot, body=shot.rect, position=[float(start_x), float(start_y)], velocity=shot.velocity,
+            expires=current_time + config.GARLIC_SHOT_DURATION, collider='garlic_shots')
+        self.garlic_shots.append(shot)
+        return shot
+
+    def throw_garlic(self, target_x, target_y, image, current_time=None):
         """
-        self.garlic_shots.append(GarlicShot(start_x, start_y, target_x, target_y, image, cli_mode=self.cli_mode))
+        Throws one of the player's garlic from the player's center towards a world position.
+        Several shots can be in flight at once, within the 'garlic' fire rate.
+        Returns:
+            GarlicShot or None: The new shot, or None if the player has no garlic or is cooling down.
+                                *Le nouveau tir, ou None si le joueur n'a pas d'ail ou refroidit.*
+
+        *Lance un des aulx du joueur depuis le centre du joueur vers une position du monde.*
+        *Plusieurs tirs peuvent être en vol en même temps, dans la limite de la cadence de 'garlic'.*
+        """
+        if self.player.garlic_count <= 0:
+            return None
+        if current_time is None:
+            current_time = self.clock.now()
+        if not self.player.ready_to_fire('garlic', current_time):
+            self._count_drop('governor:garlic')
+            return None
+        self.player.garlic_count -= 1
+        start_x, start_y = self.player.rect.center
+        shot = self.add_garlic_shot(start_x, start_y, target_x, target_y, image, current_time)
+        shot.rect.center = (start_x, start_y) # Centered on the player / *Centré sur le joueur*
+        self.world.set(shot.entity, 'position', [float(shot.rect.x), float(shot.rect.y)])
+        shot.rotation_angle = math.degrees(math.atan2(-shot.direction.y, shot.direction.x)) % 360 # Starts along its path / *Part dans l'axe de sa trajectoire*
+        self.events.emit(ShotEvent('garlic', start_x, start_y))
+        return shot
 
     def add_explosion(self, x, y, image):
         """
-        Creates and adds a new explosion effect to the game.
-        *Crée et ajoute un nouvel effet d'explosion au jeu.*
+        Creates and adds a new explosion effect to the game, and schedules its first flash.
+        *Crée et ajoute un nouvel effet d'explosion au jeu, et planifie son premier flash.*
         """
-        self.explosions.append(Explosion(x, y, image))
-
-    # add_collectible seems unused, Collectibles are created directly in update()
-    # *add_collectible semble inutilisé, les Collectibles sont créés directement dans update()*
-    # def add_collectible(self, x, y, image, item_type='hp'): # item_type added for clarity
-    #     """Create and add a new collectible item"""
-    #     self.items.append(Collectible(x, y, image, item_type, config.ITEM_SCALE, cli_mode=self.cli_mode))
+        if config.EXPLOSION_BUDGET and len(self.explosions) >= config.EXPLOSION_BUDGET:
+            # The oldest goes, without its drop / *La plus ancienne part, sans son butin*
+            oldest = self.explosions.pop(0)
+            self.scheduler.cancel(self._explosion_timers.pop(oldest, None))
+            self.explosion_pool.release(oldest)
+            self._count_drop('budget:explosions')
+        explosion = self.explosion_pool.acquire(x, y, image, clock=self.clock)
+        self.explosions.append(explosion)
+        flash_time = explosion.start_time + explosion.flash_interval
+        self._explosion_timers[explosion] = self.scheduler.schedule(flash_time, self._flash_explosion, explosion, flash_time)
+        return explosion
+
+    def add_collectible(self, x, y, image, item_type='hp', current_time=None): # item_type added for clarity
+        """
+        Takes a collectible item centered on (x, y) from the pool and adds it to the game.
+        A drop within ITEM_MERGE_RADIUS of an item of the same type is merged into it instead,
+        and items left uncollected expire after ITEM_LIFETIME seconds.
+        Args:
+            current_time (float, optional): Game time of the drop; the clock's time by default.
+                                            *Temps de jeu du dépôt ; le temps de l'horloge par défaut.*
+        Returns:
+            Collectible: The new item, or the item it was merged into. / *Le nouvel objet, ou celui avec lequel il a fusionné.*
+
+        *Prend un objet collectable centré sur (x, y) dans la réserve et l'ajoute au jeu.*
+        *Un objet déposé à moins de ITEM_MERGE_RADIUS d'un objet du même type fusionne plutôt avec lui,*
+        *et les objets non ramassés expirent après ITEM_LIFETIME secondes.*
+        """
+        if current_time is None:
+            current_time = self.clock.now()
+        target = self._merge_target(x, y, item_type)
+        if target is not None:
+            target.quantity += 1
+            self.items_merged += 1
+            if config.ITEM_LIFETIME: # The stack lasts as long as its newest drop / *La pile dure autant que son dernier objet déposé*
+                self.world.set(target.entity, 'expires', current_time + config.ITEM_LIFETIME)
+            return target
+        if config.ITEM_BUDGET and len(self.items) >= config.ITEM_BUDGET:
+            self._cull_item(self.items[0]) # The oldest goes / *Le plus ancien part*
+            self._count_drop('budget:items')
+        item = self.collectible_pool.acquire(x, y, image, item_type, config.ITEM_SCALE, cli_mode=self.cli_mode)
+        self.items.append(item)
+        self._spawn_item(item, current_time)
+        return item
+
+    def _cull_item(self, item):
+        if item.entity is not None:
+            self.world.despawn(item.entity) # The despawn hook releases it / *Le crochet de suppression le libère*
+        else: # Never registered as an entity / *Jamais enregistré comme entité*
+            self.items.remove(item)
+            self.collectible_pool.release(item)
+
+    def _merge_target(self, x, y, item_type):
+        # Nearest registered item of the same type within the merge radius, found through the broadphase
+        # *Objet enregistré du même type le plus proche dans le rayon de fusion, trouvé par la phase large*
+        radius = config.ITEM_MERGE_RADIUS
+        if not radius:
+            return None
+        best, best_dist_sq = None, radius * radius
+        for item in self.collision_world.query('items', pygame.Rect(x - radius, y - radius, 2 * radius, 2 * radius)):
+            if not item.active or item.item_type != item_type or item.entity is None:
+                continue
+            dist_sq = (item.rect.centerx - x) ** 2 + (item.rect.centery - y) ** 2
+            if dist_sq <= best_dist_sq:
+                best, best_dist_sq = item, dist_sq
+        return best
 
     def create_carrot(self, asset_manager):
         """
         Creates a new carrot enemy at a random position, ensuring it's not too close to the player.
         *Crée une nouvelle carotte ennemie à une position aléatoire, en s'assurant qu'elle n'est pas trop proche du joueur.*
         """
-        while True:
-            carrot_image_data = asset_manager.images['carrot']
-            carrot_width, carrot_height = 0, 0
-            if isinstance(carrot_image_data, dict): # CLI mode, use size_hint
-                size_hint = carrot_image_data.get('size_hint') or carrot_image_data.get('size')
-                if size_hint:
-                    carrot_width, carrot_height = size_hint
-                else: # Fallback if no size info in CLI metadata
-                    carrot_width, carrot_height = config.IMAGE_ASSET_CONFIG['carrot']['size'] # Default size from config
-            elif hasattr(carrot_image_data, 'get_width'): # GUI mode, actual surface
-                carrot_width = carrot_image_data.get_width()
-                carrot_height = carrot_image_data.get_height()
-            else: # Should not happen if asset loading is robust
-                carrot_width, carrot_height = 48, 48
-
-
-            x = random.randint(0, self.world_size[0] - carrot_width)
-            y = random.randint(0, self.world_size[1] - carrot_height)
-            # Ensure player exists and check distance, or spawn if player doesn't exist (e.g. initial setup)
-            # *S'assurer que le joueur existe et vérifier la distance, ou apparaître si le joueur n'existe pas (par ex. configuration initiale)*
-            # Ensure player rect is valid before accessing centerx/centery
-            # *S'assurer que le rect du joueur est valide avant d'accéder à centerx/centery*
-            player_center_x = self.player.rect.centerx if self.player and hasattr(self.player.rect, 'centerx') else self.world_size[0] / 2
-            player_center_y = self.player.rect.centery if self.player and hasattr(self.player.rect, 'centery') else self.world_size[1] / 2
-
-            if not self.player or \
-               ((x - player_center_x)**2 +
-                (y - player_center_y)**2 > self.carrot_spawn_safe_radius_sq):
-                self.carrots.append(Carrot(x, y, carrot_image_data, cli_mode=self.cli_mode))
-                break
+        return self.spawn_carrots(1, asset_manager)[0]
 
-    def update(self, current_time):
+    def spawn_carrots(self, count, asset_manager=None, min_spacing=config.CARROT_SPAWN_MIN_SPACING):
         """
-        Updates the state of all game entities and handles interactions for the current frame.
+        Creates a wave of carrots away from the player. Placement always terminates (see spawn_placement.py).
         Args:
-            current_time (float): The current game time, used for time-based logic.
-                                  *Le temps de jeu actuel, utilisé pour la logique basée sur le temps.*
-        """
-        # Update player's invincibility state / *Mettre à jour l'état d'invincibilité du joueur*
-        self.player.update_invincibility()
-
-        # Update carrot logic / *Mettre à jour la logique des carottes*
-        for carrot in self.carrots:
-            if carrot.active:
-                carrot.update(self.player.rect, self.world_size) # Delegate update to Carrot method
-                                                                 # *Déléguer la mise à jour à la méthode Carrot*
-
-        # Update bullets and handle collisions / *Mettre à jour les projectiles et gérer les collisions*
-        for bullet in self.bullets[:]:
-            bullet.update()
-
-            # Remove off-screen bullets / *Supprimer les projectiles hors écran*
-            if (bullet.rect.right < 0 or bullet.rect.left > self.world_size[0] or
-                bullet.rect.bottom < 0 or bullet.rect.top > self.world_size[1]):
-                self.bullets.remove(bullet)
-                continue
+            count (int): Number of carrots. / *Nombre de carottes.*
+            asset_manager (AssetManager, optional): Source of the carrot image; the game's own by default.
+                                                    *Source de l'image de carotte ; celui du jeu par défaut.*
+            min_spacing (float): Minimum distance between the new carrots, 0 for none.
+                                 *Distance minimale entre les nouvelles carottes, 0 pour aucune.*
+        Returns:
+            list[Carrot]: The new carrots, also appended to self.carrots. / *Les nouvelles carottes, aussi ajoutées à self.carrots.*
+
+        *Crée une vague de carottes loin du joueur. Le placement se termine toujours (voir spawn_placement.py).*
+        """
+        carrot_image_data = (asset_manager or self.asset_manager).images['carrot']
+        size = self._carrot_size(carrot_image_data)
+        # No safe zone before the player exists (e.g. initial setup) / *Pas de zone de sécurité avant que le joueur existe (par ex. configuration initiale)*
+        center = self.player.rect.center if self.player and hasattr(self.player.rect, 'center') else None
+        ai_rng = self.rng.stream('ai')
+        carrots = [Carrot(x, y, carrot_image_data, cli_mode=self.cli_mode, rng=ai_rng)
+                   for x, y in self.spawn_placer.place(size, center, count, min_spacing)]
+        self.carrots.extend(carrots)
+        return carrots
+
+    @staticmethod
+    def _carrot_size(carrot_image_data):
+        if isinstance(carrot_image_data, dict): # CLI mode, use size_hint
+            size_hint = carrot_image_data.get('size_hint') or carrot_image_data.get('size')
+            if size_hint:
+                return tuple(size_hint)
+            return tuple(config.IMAGE_ASSET_CONFIG['carrot']['size']) # Default size from config / *Taille par défaut depuis config*
+        if hasattr(carrot_image_data, 'get_width'): # GUI mode, actual surface
+            return (carrot_image_data.get_width(), carrot_image_data.get_height())
+        return (48, 48) # Should not happen if asset loading is robust / *Ne devrait pas arriver si le chargement des ressources est robuste*
+
+    def update(self, current_time=None):
+        """
+        Updates the state of all game entities and handles interactions for the current frame,
+        by running each stage of the update pipeline in order, then dispatching the tick's events.
+        Args:
+            current_time (float, optional): The current game time, used for time-based logic.
+                                            Read from the game clock when omitted.
+                                            *Le temps de jeu actuel, utilisé pour la logique basée sur le temps.*
+                                            *Lu depuis l'horloge du jeu s'il est omis.*
 
-            # Check collisions with carrots / *Vérifier les collisions avec les carottes*
-            for carrot in self.carrots:
-                if carrot.active and bullet.rect.colliderect(carrot.rect):
-                    self.explosions.append(Explosion(
-                        carrot.rect.centerx,
-                        carrot.rect.centery,
-                        self.asset_manager.images['explosion']
-                    ))
-                    carrot.active = False # Carrot becomes inactive
-                                          # *La carotte devient inactive*
-                    carrot.respawn_timer = current_time # Set respawn timer
-                                                        # *Définir le minuteur de réapparition*
-                    if not self.cli_mode: self.asset_manager.sounds['explosion'].play()
-                    try:
-                        self.bullets.remove(bullet)
-                    except ValueError: # Bullet might have been removed by another collision in same frame
-                                       # *Le projectile a peut-être été supprimé par une autre collision dans la même frame*
-                        logging.debug("Bullet already removed, skipping. / Projectile déjà supprimé, on ignore.")
-                    break # Bullet is consumed, no need to check other carrots
-                          # *Le projectile est consommé, pas besoin de vérifier les autres carottes*
-
-        # Respawn carrots after delay / *Faire réapparaître les carottes après un délai*
-        for carrot in self.carrots:
-            if not carrot.active and (current_time - carrot.respawn_timer > config.CARROT_RESPAWN_DELAY):
-                carrot.respawn_timer = 0  # Reset timer / *Réinitialiser le minuteur*
-                carrot.respawn(self.world_size, self.player.rect) # Call carrot's own respawn logic
-                                                                  # *Appeler la logique de réapparition propre à la carotte*
-
-        # Garlic shot logic / *Logique du tir d'ail*
-        if self.garlic_shot and self.garlic_shot["active"]:
-            if self.garlic_shot_travel < config.GARLIC_SHOT_MAX_TRAVEL and \
-               (current_time - self.garlic_shot_start_time <= self.garlic_shot_duration): # Check duration as well
-                                                                                           # *Vérifier également la durée*
-                # Update rotation angle each frame / *Mettre à jour l'angle de rotation à chaque frame*
-                self.garlic_shot["rotation_angle"] = (self.garlic_shot["rotation_angle"] + config.GARLIC_ROTATION_SPEED) % 360
-                # Move in the pre-calculated direction / *Se déplacer dans la direction pré-calculée*
-                self.garlic_shot["x"] += self.garlic_shot["dx"] * self.garlic_shot_speed
-                self.garlic_shot["y"] += self.garlic_shot["dy"] * self.garlic_shot_speed
-                self.garlic_shot_travel += self.garlic_shot_speed
-            else: # Max travel reached or duration expired / *Voyage maximal atteint ou durée expirée*
-                self.garlic_shot["active"] = False
-                self.garlic_shot = None # Clear the shot / *Effacer le tir*
-                self.garlic_shot_travel = 0 # Reset travel for next shot / *Réinitialiser le voyage pour le prochain tir*
-
-
-            # Check for collision with vampire (only if garlic shot still exists and is active)
-            # *Vérifier la collision avec le vampire (seulement si le tir d'ail existe encore et est actif)*
-            if self.garlic_shot and self.garlic_shot["active"] and self.vampire.active:
-                self.garlic_shot["rect"].center = (self.garlic_shot["x"], self.garlic_shot["y"])
-                if self.garlic_shot["rect"].colliderect(self.vampire.rect):
-                    self.vampire.death_effect_active = True
-                    self.vampire.death_effect_start_time = current_time
-                    self.vampire.active = False
-                    self.vampire.respawn_timer = current_time # Set respawn timer for vampire
-                                                              # *Définir le minuteur de réapparition pour le vampire*
-                    if not self.cli_mode: self.asset_manager.sounds['vampire_death'].play()
-                    self.garlic_shot = None # Garlic shot is consumed / *Le tir d'ail est consommé*
-                    self.garlic_shot_travel = 0
-                    self.vampire_killed_count += 1
-                    self.last_vampire_death_pos = self.vampire.rect.center  # Store death position / *Stocker la position de la mort*
-                    logging.info(f"Vampire killed by garlic! Total kills: {self.vampire_killed_count} / Vampire tué par l'ail ! Total victimes : {self.vampire_killed_count}")
-
-
-        # Update vampire / *Mettre à jour le vampire*
-        self.vampire.update(self.player, self.world_size, current_time) # Delegate to Vampire's update
-                                                                        # *Déléguer à la mise à jour de Vampire*
-
-        # Handle finished vampire death animations and item drop
-        # *Gérer les animations de mort de vampire terminées et la chute d'objets*
-        if self.vampire.death_effect_active and \
-           not self.vampire.active and \
-           (current_time - self.vampire.death_effect_start_time >= config.VAMPIRE_DEATH_DURATION):
-
-            self.vampire.death_effect_active = False # Clear flag / *Effacer l'indicateur*
-
-            # Drop carrot juice at the vampire's last known position
-            # *Laisser tomber du jus de carotte à la dernière position connue du vampire*
-            self.items.append(
-                Collectible(
-                    self.last_vampire_death_pos[0],
-                    self.last_vampire_death_pos[1],
-                    self.asset_manager.images['carrot_juice'],
-                    'carrot_juice', # item_type
-                    config.ITEM_SCALE,
-                    cli_mode=self.cli_mode
-                )
-            )
-            logging.debug(f"Carrot juice dropped at {self.last_vampire_death_pos} / Jus de carotte déposé à {self.last_vampire_death_pos}")
+        *Met à jour l'état de toutes les entités du jeu et gère les interactions pour la frame actuelle,*
+        *en exécutant dans l'ordre chaque étape du pipeline de mise à jour, puis en distribuant les événements du tick.*
+        """
+        if current_time is None:
+            current_time = self.clock.now()
+        self.collision_world.begin_frame()
+        for stage in self.pipeline:
+            stage(current_time)
+        self.events.dispatch()
+
+    def _build_pipeline(self):
+        """
+        Returns the fixed sequence of update stages. Every stage takes the current game time.
+        *Retourne la séquence fixe des étapes de mise à jour. Chaque étape prend le temps de jeu actuel.*
+        """
+        return (
+            self.scheduler.advance,         # Timed events (respawns, invincibility expiry, explosion flashes, item drops)
+                                            # *Événements temporisés (réapparitions, fin d'invincibilité, flashs d'explosion, chutes d'objets)*
+            self._step_carrots,
+            self._register_items,
+            self.movement_system.run,
+            self.lifetime_system.run,
+            self._sync_colliders,
+            self._step_bullets,
+            self._step_garlic_shots,
+            self._update_flow_field,
+            self._step_vampire,
+            self._check_vampire_contact,
+            self._collect_pickups,
+        )
 
-        # Check collision between player and active vampire / *Vérifier la collision entre le joueur et le vampire actif*
-        if self.vampire.active and self.player.rect.colliderect(self.vampire.rect):
+    def _step_carrots(self, current_time):
+        # Update carrot logic in one batched pass; the population rebinds if the list was replaced
+        # and keeps the 'carrots' collision layer in sync
+        # *Mettre à jour les carottes en une passe groupée ; la population se relie si la liste a été remplacée*
+        # *et maintient la couche de collision 'carrots' à jour*
+        self.carrot_population.sync(self.carrots)
+        self.carrot_population.step(self.player.rect, self.world_size)
+
+    def _register_items(self, current_time):
+        # Items added to the list directly (rather than through add_collectible) become entities here
+        # *Les objets ajoutés directement à la liste (plutôt que par add_collectible) deviennent des entités ici*
+        for item in self.items:
+            if item.entity is None:
+                self._spawn_item(item, current_time)
+
+    def _sync_colliders(self, current_time):
+        self.collision_system.run(current_time)
+        self._sync_vampire_collision()
+
+    def _step_bullets(self, current_time):
+        collision_world = self.collision_world
+        # Move all bullets and remove off-screen ones in batched passes
+        # *Déplacer tous les projectiles et supprimer ceux hors écran par passes groupées*
+        bullet_store = self.bullet_store
+        bullet_store.integrate()
+        bullet_store.cull_outside(self.world_size)
+        self.bullets_spent += bullet_store.cull_spent(current_time, config.BULLET_MAX_RANGE)
+
+        # Only bullets sharing a grid cell with a carrot are tested against carrots
+        # *Seuls les projectiles partageant une cellule avec une carotte sont testés contre les carottes*
+        spent_bullets = []
+        for slot in bullet_store.slots_near(collision_world.layer('carrots')):
+            carrot = collision_world.first_hit('carrots', bullet_store.rect_of(slot))
+            if carrot is not None:
+                self.add_explosion(carrot.rect.centerx, carrot.rect.centery, self.asset_manager.images['explosion'])
+                self.kill_carrot(carrot, current_time)
+                self.events.emit(KillEvent('carrot', carrot.rect.centerx, carrot.rect.centery))
+                spent_bullets.append(slot) # Bullet is consumed / *Le projectile est consommé*
+        bullet_store.remove_slots(spent_bullets)
+
+    def _step_garlic_shots(self, current_time):
+        # Shots were moved by the MovementSystem and expired by the LifetimeSystem; here they spin,
+        # run out of travel, or hit the first vampire they touch
+        # *Les tirs ont été déplacés par le MovementSystem et expirés par le LifetimeSystem ; ici ils tournent,*
+        # *épuisent leur distance, ou touchent le premier vampire rencontré*
+        for shot in list(self.garlic_shots):
+            if not shot.advance(): # Max travel reached on an earlier tick, whose position was hit-tested / *Distance maximale atteinte à un tick précédent, dont la position a été testée*
+                self.world.despawn(shot.entity)
+                continue
+            vampire = self.collision_world.first_hit('vampires', shot.rect)
+            if vampire is not None:
+                self.kill_vampire(current_time, vampire)
+                self.world.despawn(shot.entity) # Garlic shot is consumed / *Le tir d'ail est consommé*
+
+    def _update_flow_field(self, current_time):
+        self.flow_field.set_target(self.player.rect.centerx, self.player.rect.centery)
+
+    def _step_vampire(self, current_time):
+        # Move the active vampires in one batched pass; inactive ones wait for their scheduled respawn
+        # *Déplacer les vampires actifs en une passe groupée ; les inactifs attendent leur réapparition planifiée*
+        self.vampires.step(self.player.rect, self.world_size, self.flow_field)
+
+    def _check_vampire_contact(self, current_time):
+        # Check collision between player and active vampires / *Vérifier la collision entre le joueur et les vampires actifs*
+        for vampire in self.collision_world.query('vampires', self.player.rect):
             self.player.take_damage()
             # Vampire might become inactive or teleport upon hitting player, handle in Vampire class or here
             # *Le vampire pourrait devenir inactif ou se téléporter en touchant le joueur, à gérer dans la classe Vampire ou ici*
             # For now, simple model: vampire also "dies" or becomes inactive and respawns
             # *Pour l'instant, modèle simple : le vampire "meurt" aussi ou devient inactif et réapparaît*
-            self.vampire.active = False
-            self.vampire.respawn_timer = current_time
-            logging.debug("Player collided with Vampire. / Le joueur est entré en collision avec le Vampire.")
-
-
-        # Update explosions and handle item drops from them / *Mettre à jour les explosions et gérer les chutes d'objets associées*
-        for explosion in self.explosions[:]:
-            if explosion.update(current_time): # update returns True when explosion is finished
-                                               # *update retourne True quand l'explosion est terminée*
-                # Create collectible item (HP or Garlic) / *Créer un objet collectable (PV ou Ail)*
-                is_garlic = random.random() < config.ITEM_DROP_GARLIC_CHANCE
-                item_image_key = 'garlic' if is_garlic else 'hp'
-                item_type = 'garlic' if is_garlic else 'hp'
-
-                self.items.append(
-                    Collectible(
-                        explosion.rect.centerx,
-                        explosion.rect.centery,
-                        self.asset_manager.images[item_image_key],
-                        item_type,
-                        config.ITEM_SCALE,
-                        cli_mode=self.cli_mode
-                    )
-                )
-                logging.debug(f"{item_type} dropped from explosion at ({explosion.rect.centerx}, {explosion.rect.centery}) / {item_type} déposé par explosion à ({explosion.rect.centerx}, {explosion.rect.centery})")
-                self.explosions.remove(explosion)
+            vampire.active = False
+            vampire.respawn_timer = current_time
+            self.collision_world.remove('vampires', vampire)
+            self._schedule_vampire_respawn(vampire, current_time)
 
+    def _collect_pickups(self, current_time):
         # Check item collisions with player / *Vérifier les collisions d'objets avec le joueur*
-        for item in self.items[:]:
-            if item.active and self.player.rect.colliderect(item.rect):
-                logging.debug(f"Player collecting item: {item.item_type}. Player HP: {self.player.health}, Garlic: {self.player.garlic_count} / Joueur ramassant l'objet : {item.item_type}. PV Joueur : {self.player.health}, Ail : {self.player.garlic_count}")
-                collected = False
-                if item.item_type == 'hp' and self.player.health < config.MAX_HEALTH:
-                    self.player.health += 1
-                    self.player.health_changed = True # For UI update / *Pour mise à jour UI*
-                    if not self.cli_mode: self.asset_manager.sounds['get_hp'].play()
-                    collected = True
-                    logging.info(f"Player collected HP. Current HP: {self.player.health} / Joueur a ramassé PV. PV actuels : {self.player.health}")
-                elif item.item_type == 'garlic' and self.player.garlic_count < config.MAX_GARLIC:
-                    self.player.garlic_count += 1
-                    self.player.garlic_changed = True # For UI update / *Pour mise à jour UI*
-                    if not self.cli_mode: self.asset_manager.sounds['get_garlic'].play()
-                    collected = True
-                    logging.info(f"Player collected Garlic. Current Garlic: {self.player.garlic_count} / Joueur a ramassé Ail. Ail actuel : {self.player.garlic_count}")
-                elif item.item_type == 'carrot_juice':
-                    self.player.carrot_juice_count = min(self.player.carrot_juice_count + 1, config.MAX_CARROT_JUICE)
-                    self.player.juice_changed = True # For UI update / *Pour mise à jour UI*
-                    if not self.cli_mode: self.asset_manager.sounds['get_hp'].play()  # Reuse existing pickup sound / *Réutiliser son de ramassage existant*
-                    collected = True
-                    logging.info(f"Player collected Carrot Juice. Current Juice: {self.player.carrot_juice_count} / Joueur a ramassé Jus de Carotte. Jus actuel : {self.player.carrot_juice_count}")
-
-                if collected:
-                    self.items.remove(item)
+        self.pickup_system.run(self.player.rect)
+
+    def _apply_pickup(self, item, item_type):
+        """
+        Gives a touched item to the player, one unit at a time for merged items.
+        Returns True if it was taken whole (full stocks leave it, or what remains of it, on the ground).
+        *Donne un objet touché au joueur, une unité à la fois pour les objets fusionnés.*
+        *Retourne True s'il a été pris entièrement (les stocks pleins le laissent, ou ce qu'il en reste, au sol).*
+        """
+        amount = None
+        while item.quantity > 0:
+            given = self._give_unit(item_type)
+            if given is None:
+                break
+            amount = given
+            item.quantity -= 1
+        if amount is None:
+            return False
+        # Sound, HUD refresh and log line are handled by the event listeners
+        # *Son, rafraîchissement du HUD et ligne de journal sont gérés par les écouteurs d'événements*
+        self.events.emit(PickupEvent(item_type, amount))
+        return item.quantity == 0
+
+    def _give_unit(self, item_type):
+        # One unit of an item to the player; returns the new stock, or None if it is full
+        # *Une unité d'un objet au joueur ; retourne le nouveau stock, ou None s'il est plein*
+        player = self.player
+        if item_type == 'hp' and player.health < config.MAX_HEALTH:
+            player.health += 1
+            amount = player.health
+        elif item_type == 'garlic' and player.garlic_count < config.MAX_GARLIC:
+            player.garlic_count += 1
+            amount = player.garlic_count
+        elif item_type == 'carrot_juice':
+            player.carrot_juice_count = min(player.carrot_juice_count + 1, config.MAX_CARROT_JUICE)
+            amount = player.carrot_juice_count
+        else:
+            return None
+        return amount
+
+    def _spawn_item(self, item, current_time):
+        components = dict(facade=item, body=item.rect, collider='items', pickup=item.item_type)
+        if config.ITEM_LIFETIME: # Uncollected items are despawned by the LifetimeSystem / *Les objets non ramassés sont supprimés par le LifetimeSystem*
+            components['expires'] = current_time + config.ITEM_LIFETIME
+        item.entity = self.world.spawn(**components)
+        self.collision_world.move('items', item)
+
+    def _on_despawn(self, entity, components):
+        facade = components.get('facade')
+        if facade is None:
+            return
+        facade.entity = None
+        if 'pickup' in components: # Items leave the list and go back to their pool / *Les objets quittent la liste et retournent à leur réserve*
+            if facade in self.items:
+                self.items.remove(facade)
+            self.collectible_pool.release(facade)
+        elif isinstance(facade, GarlicShot): # Spent or expired garlic shots too / *Les tirs d'ail consommés ou expirés aussi*
+            if facade in self.garlic_shots:
+                self.garlic_shots.remove(facade)
+            self.garlic_shot_pool.release(facade)
+
+    def kill_carrot(self, carrot, current_time):
+        """
+        Deactivates a carrot and schedules its respawn after CARROT_RESPAWN_DELAY.
+        *Désactive une carotte et planifie sa réapparition après CARROT_RESPAWN_DELAY.*
+        """
+        carrot.active = False # Carrot becomes inactive (and leaves the collision layer)
+                              # *La carotte devient inactive (et quitte la couche de collision)*
+        carrot.respawn_timer = current_time # Time of death / *Moment de la mort*
+        self.scheduler.schedule(current_time + config.CARROT_RESPAWN_DELAY, self._respawn_carrot, carrot)
+
+    def _respawn_carrot(self, carrot):
+        # Carrots from a replaced list or already back in play are left alone
+        # *Les carottes d'une liste remplacée ou déjà revenues en jeu sont ignorées*
+        if carrot not in self.carrot_population or carrot.active:
+            return
+        carrot.respawn_timer = 0  # Reset timer / *Réinitialiser le minuteur*
+        carrot.respawn(self.world_size, self.player.rect, self.rng.stream('ai')) # Call carrot's own respawn logic
+                                                          # *Appeler la logique de réapparition propre à la carotte*
+
+    @property
+    def vampire(self):
+        """The first vampire, for code written when there was only one. / *Le premier vampire, pour le code écrit quand il n'y en avait qu'un.*"""
+        return self.vampires[0] if len(self.vampires) else None
+
+    @property
+    def vampire_killed_count(self):
+        return self.vampires.killed_count
+
+    @property
+    def last_vampire_death_pos(self):
+        return self.vampires.last_death_pos
+
+    def add_vampire(self, x, y):
+        """
+        Creates an active vampire and adds it to the horde, e.g. for a wave.
+        *Crée un vampire actif et l'ajoute à la horde, par ex. pour une vague.*
+        """
+        vampire = Vampire(x, y, self.asset_manager.images['vampire'], cli_mode=self.cli_mode)
+        vampire.active = True
+        return self.vampires.add(vampire)
+
+    def kill_vampire(self, current_time, vampire=None):
+        """
+        Kills a vampire (the first one by default): starts its death effect, counts the kill, and
+        schedules its carrot juice drop at the end of the effect and its respawn after VAMPIRE_RESPAWN_TIME.
+
+        *Tue un vampire (le premier par défaut) : démarre son effet de mort, compte la victime, et planifie*
+        *sa chute de jus de carotte à la fin de l'effet et sa réapparition après VAMPIRE_RESPAWN_TIME.*
+        """
+        if vampire is None:
+            vampire = self.vampire
+        vampire.death_effect_active = True
+        vampire.death_effect_start_time = current_time
+        vampire.active = False
+        vampire.respawn_timer = current_time # Time of death / *Moment de la mort*
+        self.collision_world.remove('vampires', vampire)
+        count = self.vampires.record_death(vampire)  # Also stores the death position / *Stocke aussi la position de la mort*
+        self.events.emit(KillEvent('vampire', *vampire.death_position, count=count))
+        self.scheduler.schedule(current_time + config.VAMPIRE_DEATH_DURATION, self._finish_vampire_death, vampire, current_time)
+        self._schedule_vampire_respawn(vampire, current_time)
+
+    def _finish_vampire_death(self, vampire, death_time):
+        # A vampire killed again since then has its own timer / *Un vampire retué depuis a son propre minuteur*
+        if not vampire.death_effect_active or vampire.active or vampire.death_effect_start_time != death_time:
+            return
+        vampire.death_effect_active = False # Clear flag / *Effacer l'indicateur*
+
+        # Drop carrot juice where this vampire died / *Laisser tomber du jus de carotte là où ce vampire est mort*
+        self.add_collectible(
+            vampire.death_position[0],
+            vampire.death_position[1],
+            self.asset_manager.images['carrot_juice'],
+            'carrot_juice', # item_type
+            death_time + config.VAMPIRE_DEATH_DURATION
+        )
+        logging.debug(f"Carrot juice dropped at {vampire.death_position} / Jus de carotte déposé à {vampire.death_position}")
+
+    def _schedule_vampire_respawn(self, vampire, current_time):
+        self.scheduler.schedule(current_time + config.VAMPIRE_RESPAWN_TIME, self._respawn_vampire, vampire)
+
+    def _respawn_vampire(self, vampire):
+        if vampire.active or vampire not in self.vampires.vampires:
+            return
+        if vampire.death_effect_active: # Wait for the end of the death effect / *Attendre la fin de l'effet de mort*
+            self.scheduler.schedule(vampire.death_effect_start_time + vampire.death_effect_duration, self._respawn_vampire, vampire)
+            return
+        spawn_rng = self.rng.stream('spawn')
+        vampire.respawn(
+            spawn_rng.randint(0, self.world_size[0] - vampire.rect.width),
+            spawn_rng.randint(0, self.world_size[1] - vampire.rect.height)
+        )
+        self.vampires.sync(vampire)
+
+    def _flash_explosion(self, explosion, flash_time):
+        if not explosion.flash(flash_time):
+            next_flash = flash_time + explosion.flash_interval
+            self._explosion_timers[explosion] = self.scheduler.schedule(next_flash, self._flash_explosion, explosion, next_flash)
+            return
+        self._explosion_timers.pop(explosion, None)
+        # Last flash: create collectible item (HP or Garlic) / *Dernier flash : créer un objet collectable (PV ou Ail)*
+        is_garlic = self.rng.stream('loot').random() < config.ITEM_DROP_GARLIC_CHANCE
+        item_image_key = 'garlic' if is_garlic else 'hp'
+        item_type = 'garlic' if is_garlic else 'hp'
+
+        self.add_collectible(
+            explosion.rect.centerx,
+            explosion.rect.centery,
+            self.asset_manager.images[item_image_key],
+            item_type,
+            flash_time
+        )
+        logging.debug(f"{item_type} dropped from explosion at ({explosion.rect.centerx}, {explosion.rect.centery}) / {item_type} déposé par explosion à ({explosion.rect.centerx}, {explosion.rect.centery})")
+        if explosion in self.explosions:
+            self.explosions.remove(explosion)
+            self.explosion_pool.release(explosion)
+
+    def _sync_vampire_collision(self):
+        """
+        Keeps the vampires' entries in the collision world in line with their positions and active states.
+        *Maintient les entrées des vampires dans le monde de collision en accord avec leurs positions et états actifs.*
+        """
+        self.vampires.sync()
 
     def pause_game(self):
         """
@@ -396,6 +795,7 @@ class GameState:
         """
         if not self.paused:
             self.paused = True
+            self.clock.pause() # Timers do not run while paused / *Les minuteurs ne tournent pas pendant la pause*
             logging.info("Game paused. / Jeu mis en pause.")
 
     def resume_game(self):
@@ -405,4 +805,26 @@ class GameState:
         """
         if self.paused:
             self.paused = False
+            self.clock.resume()
             logging.info("Game resumed. / Jeu repris.")
+
+    def simulate(self, duration, tick_rate=config.SIMULATION_TICK_RATE):
+        """
+        Runs the simulation for `duration` seconds of game time as fast as possible, by
+        advancing a virtual clock one fixed tick at a time. Used for headless runs.
+        Args:
+            duration (float): Game time to simulate, in seconds. / *Temps de jeu à simuler, en secondes.*
+            tick_rate (int): Simulation ticks per second. / *Ticks de simulation par seconde.*
+        Returns:
+            int: Number of ticks run. / *Nombre de ticks exécutés.*
+
+        *Exécute la simulation pendant `duration` secondes de temps de jeu aussi vite que possible,*
+        *en avançant une horloge virtuelle d'un tick fixe à la fois. Utilisé pour les exécutions sans affichage.*
+        """
+        if self.clock.mode != VIRTUAL:
+            self.clock.set_mode(VIRTUAL)
+        dt = 1.0 / tick_rate
+        ticks = int(round(duration * tick_rate))
+        for _ in range(ticks):
+            self.update(self.clock.advance(dt))
+        return ticks
@@ -0,0 +1,106 @@
+# hud.py
+# This file defines the cached HUD (health, garlic and carrot juice counters) drawn over the game.
+# The HUD only changes when the player's stats do, so it is composed into a screen-sized layer
+# by Player.draw_ui() and that layer is blitted in one call each frame. The layer is composed
+# again only when the game's HudListener (see events.py) reports a pickup, damage or garlic
+# shot, or when the screen size changes. It is RLE-accelerated: most of it is transparent, so
+# the blit skips those pixels almost for free.
+# The juice counter digits come from a DigitStrip, the ten glyphs scaled once and packed side by
+# side in one surface, instead of scaling each glyph on every frame.
+#
+# *Ce fichier définit le HUD mis en cache (compteurs de santé, d'ail et de jus de carotte) dessiné*
+# *par-dessus le jeu. Le HUD ne change que quand les statistiques du joueur changent, il est donc*
+# *composé dans une couche de la taille de l'écran par Player.draw_ui() et cette couche est copiée*
+# *en un seul appel à chaque frame. La couche n'est recomposée que quand le HudListener du jeu (voir*
+# *events.py) signale un ramassage, des dégâts ou un tir d'ail, ou quand la taille de l'écran change.*
+# *Elle est accélérée par RLE : elle est surtout transparente, la copie saute donc ces pixels presque gratuitement.*
+# *Les chiffres du compteur de jus viennent d'une DigitStrip, les dix glyphes mis à l'échelle une fois et*
+# *rangés côte à côte dans une seule surface, au lieu de mettre chaque glyphe à l'échelle à chaque frame.*
+
+import pygame
+
+import config
+
+
+class DigitStrip:
+    """
+    The ten digit glyphs, scaled once to the size of the '0' glyph and packed in one surface.
+    *Les dix glyphes de chiffres, mis à l'échelle une fois à la taille du glyphe '0' et rangés dans une surface.*
+    """
+    def __init__(self, digit_images, scale):
+        """
+        Args:
+            digit_images (list[pygame.Surface]): The glyphs of 0 to 9. / *Les glyphes de 0 à 9.*
+            scale (float): Scale factor applied to the glyphs. / *Facteur d'échelle appliqué aux glyphes.*
+        """
+        width = int(digit_images[0].get_width() * scale)
+        height = int(digit_images[0].get_height() * scale)
+        self.glyph_size = (width, height)
+        self.surface = pygame.Surface((width * len(digit_images), height), pygame.SRCALPHA)
+        self._areas = []
+        for digit, image in enumerate(digit_images):
+            self.surface.blit(pygame.transform.scale(image, (width, height)), (digit * width, 0))
+            self._areas.append(pygame.Rect(digit * width, 0, width, height))
+
+    @classmethod
+    def from_images(cls, images, scale=config.UI_JUICE_COUNTER_DIGIT_SCALE):
+        """
+        Builds the strip from the 'digit_0' to 'digit_9' images, or returns None if one is missing.
+        *Construit la bande à partir des images 'digit_0' à 'digit_9', ou retourne None s'il en manque une.*
+        """
+        digit_images = [images.get(f'digit_{digit}') for digit in range(10)]
+        if not all(image is not None and hasattr(image, 'get_width') for image in digit_images):
+            return None
+        return cls(digit_images, scale)
+
+    def width(self, text, spacing):
+        """Width of a number drawn with draw(). / *Largeur d'un nombre dessiné avec draw().*"""
+        return len(text) * self.glyph_size[0] + (len(text) - 1) * spacing
+
+    def draw(self, surface, text, x, y, spacing):
+        """
+        Draws a string of digits from its top-left corner, in one Surface.blits() call.
+        *Dessine une chaîne de chiffres depuis son coin supérieur gauche, en un seul appel à Surface.blits().*
+        """
+        step = self.glyph_size[0] + spacing
+        surface.blits([(self.surface, (x + i * step, y), self._areas[int(char)]) for i, char in enumerate(text)],
+                      doreturn=False)
+
+
+class HudLayer:
+    """
+    Screen-sized cache of the HUD, composed again only when the HUD listener is dirty or the screen size changes.
+    *Cache du HUD de la taille de l'écran, recomposé seulement quand l'écouteur du HUD est marqué ou que la taille de l'écran change.*
+    """
+    def __init__(self):
+        self.surface = None
+        self.digits = None
+        self.renders = 0  # Times the layer was composed / *Nombre de fois où la couche a été composée*
+
+    def draw(self, screen, hud, player, hp_image, garlic_image, max_garlic):
+        """
+        Blits the HUD on the screen, composing it first if needed (see Player.draw_ui() for the other arguments).
+        Args:
+            hud (HudListener): Tells when the player's stats changed; consumed here. / *Indique quand les statistiques du joueur ont changé ; consommé ici.*
+        Returns:
+            bool: True if the layer was composed again. / *True si la couche a été recomposée.*
+
+        *Copie le HUD à l'écran, en le composant d'abord si besoin (voir Player.draw_ui() pour les autres arguments).*
+        """
+        size = screen.get_size()
+        stale = self.surface is None or self.surface.get_size() != size
+        if stale:
+            self.surface = pygame.Surface(size, pygame.SRCALPHA)
+        dirty = hud.consume()
+        if stale or dirty:
+            if self.digits is None:
+                self.digits = DigitStrip.from_images(player.asset_manager.images)
+            self.surface.fill((0, 0, 0, 0))
+            player.draw_ui(self.surface, hp_image, garlic_image, max_garlic, digits=self.digits)
+            self.surface.set_alpha(255, pygame.RLEACCEL) # Transparent runs are skipped when blitting / *Les plages transparentes sont sautées à la copie*
+            self.renders += 1
+            composed = True
+        else:
+            composed = False
+        screen.blit(self.surface, (0, 0))
+        return composed
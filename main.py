@@ -13,7 +13,6 @@
 
 import argparse
 import logging
-import math
 import os
 import random
 import sys
@@ -23,9 +22,16 @@ import pygame
 
 import config
 from asset_manager import AssetManager, DummySound
+from background import TiledBackground
+from game_clock import GameClock, VIRTUAL
 from game_entities import Button
 from game_state import GameState
+from hud import HudLayer
+from render_queue import RenderQueue
+from stress import StressDriver, StressMonitor, StressProfile
+from timestep import FixedTimestep, RateMeter
 from utilities import get_asset_path
+from viewport import Viewport
 
 # Global variables initialized with default/None values
 # These will be properly initialized in main_entry_point after args parsing
@@ -48,6 +54,30 @@ current_time = 0.0
 running = True
 can_toggle_pause = True
 
+# Fixed-timestep loop state, created in main_entry_point (GUI mode)
+# *État de la boucle à pas de temps fixe, créé dans main_entry_point (mode GUI)*
+frame_timestep = None
+tick_rate_meter = None
+frame_rate_meter = None
+render_clock = None
+
+# World area on screen, used to cull world-space draws (GUI mode)
+# *Zone du monde à l'écran, utilisée pour écarter les dessins dans l'espace du monde (mode GUI)*
+viewport = None
+
+# Cached HUD layer, composed again only when the player's stats change (GUI mode)
+# *Couche de HUD mise en cache, recomposée seulement quand les statistiques du joueur changent (mode GUI)*
+hud_layer = None
+
+# World-space sprites of a frame, batched by layer into Surface.blits() calls (GUI mode)
+# *Sprites de l'espace du monde d'une frame, regroupés par couche en appels à Surface.blits() (mode GUI)*
+render_queue = None
+
+# Stress profile state (--stress), None in a normal game
+# *État du profil de stress (--stress), None dans une partie normale*
+stress_driver = None
+stress_monitor = None
+
 def handle_player_death():
     """
     Handles the player's death event. Activates death effect, plays sound.
@@ -159,6 +189,16 @@ def parse_arguments():
     parser = argparse.ArgumentParser(description="LapinCarotte - A game about a rabbit fighting vampire carrots. / *Un jeu sur un lapin combattant des carottes vampires.*")
     parser.add_argument("--cli", action="store_true", help="Run the game in Command Line Interface mode (no graphics). / *Exécuter le jeu en mode Interface en Ligne de Commande (sans graphismes).*")
     parser.add_argument("-d", "--debug", action="store_true", help="Enable debug logging output. / *Activer la sortie de journalisation de débogage.*")
+    parser.add_argument("--seed", type=int, default=None, help="Seed every random stream to make the session reproducible. / *Initialiser tous les flux aléatoires pour rendre la session reproductible.*")
+    stress = parser.add_argument_group("stress profile / *profil de stress*")
+    stress.add_argument("--stress", action="store_true", help="Run the game loop without player input under a large entity load, logging a summary every second. / *Exécuter la boucle de jeu sans action du joueur sous une forte charge d'entités, avec un résumé chaque seconde.*")
+    stress.add_argument("--stress-carrots", type=int, default=config.STRESS_CARROTS, help="Carrots at the start. / *Carottes au départ.*")
+    stress.add_argument("--stress-vampires", type=int, default=config.STRESS_VAMPIRES, help="Vampires at the start. / *Vampires au départ.*")
+    stress.add_argument("--stress-fire-rate", type=float, default=config.STRESS_FIRE_RATE, help="Bullets auto-fired per second. / *Projectiles tirés automatiquement par seconde.*")
+    stress.add_argument("--stress-explosion-rate", type=float, default=config.STRESS_EXPLOSION_RATE, help="Explosions per second. / *Explosions par seconde.*")
+    stress.add_argument("--stress-wave-size", type=int, default=config.STRESS_WAVE_SIZE, help="Carrots added by each spawn wave, 0 for none. / *Carottes ajoutées par chaque vague, 0 pour aucune.*")
+    stress.add_argument("--stress-wave-interval", type=float, default=config.STRESS_WAVE_INTERVAL, help="Seconds between spawn waves. / *Secondes entre les vagues d'apparition.*")
+    stress.add_argument("--stress-duration", type=float, default=config.STRESS_DURATION, help="Game seconds to run, 0 for no limit. / *Secondes de jeu à exécuter, 0 pour aucune limite.*")
     return parser.parse_args()
 
 def setup_logging(args):
@@ -178,6 +218,10 @@ def setup_logging(args):
         logging.info("CLI mode enabled. / Mode CLI activé.")
     if args.debug:
         logging.info("Debug logging enabled. / Journalisation de débogage activée.")
+    if args.seed is not None:
+        logging.info(f"Random seed: {args.seed} / Graine aléatoire : {args.seed}")
+    if args.stress:
+        logging.info("Stress profile enabled. / Profil de stress activé.")
 
 def initialize_pygame(args):
     """Initialize Pygame and the display screen."""
@@ -226,16 +270,8 @@ def load_game_assets(args, asset_manager, screen_width, screen_height):
 
         grass_image = asset_manager.images.get('grass')
         if grass_image and hasattr(grass_image, 'get_size'):
-            grass_background = pygame.Surface(config.WORLD_SIZE, pygame.SRCALPHA)
-            _grass_w, _grass_h = grass_image.get_size()
-            if _grass_w > 0 and _grass_h > 0:
-                for x_g in range(0, config.WORLD_SIZE[0], _grass_w):
-                    for y_g in range(0, config.WORLD_SIZE[1], _grass_h):
-                        grass_background.blit(grass_image, (x_g, y_g))
-            else:
-                logging.warning("Grass asset has invalid dimensions, cannot tile background.")
-                grass_background.fill((0,100,0))
-            assets['grass_background'] = grass_background
+            # Only the visible tiles are drawn, nothing is pre-tiled / *Seules les tuiles visibles sont dessinées, rien n'est pré-tuilé*
+            assets['grass_background'] = TiledBackground(grass_image, config.WORLD_SIZE)
 
         if pygame.mixer.get_init():
             try:
@@ -395,8 +431,12 @@ def run_gui_mode():
     global screen_width, screen_height
     global start_screen_buttons, pause_screen_buttons, game_over_buttons
     global start_screen_image, start_screen_pos, game_over_image_ui, grass_background, garlic_image, hp_image_ui
+    global frame_timestep, tick_rate_meter, frame_rate_meter, render_clock, viewport, hud_layer, render_queue
+    global stress_driver, stress_monitor
 
-    current_time = time.time()
+    frame_start = time.perf_counter()
+    current_time = game_state.clock.now() # Game time, frozen while paused / *Temps de jeu, figé pendant la pause*
+    fixed_timestep = config.FIXED_TIMESTEP and frame_timestep is not None
 
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
@@ -429,47 +469,29 @@ def run_gui_mode():
                     mouse_x, mouse_y = pygame.mouse.get_pos()
                     target_world_x = mouse_x + game_state.scroll[0]
                     target_world_y = mouse_y + game_state.scroll[1]
-                    game_state.add_bullet(game_state.player.rect.centerx, game_state.player.rect.centery,
-                                          target_world_x, target_world_y,
-                                          asset_manager.images['bullet'])
+                    # Key repeat and macros are held to the weapon's fire rate / *La répétition des touches et les macros sont limitées à la cadence de l'arme*
+                    game_state.fire_bullet(target_world_x, target_world_y, asset_manager.images['bullet'], current_time)
             if event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1 and not game_state.player.death_effect_active:
                     mouse_pos_screen = pygame.mouse.get_pos()
                     target_world_x = mouse_pos_screen[0] + game_state.scroll[0]
                     target_world_y = mouse_pos_screen[1] + game_state.scroll[1]
-                    game_state.add_bullet(game_state.player.rect.centerx, game_state.player.rect.centery,
-                                          target_world_x, target_world_y,
-                                          asset_manager.images['bullet'])
+                    game_state.fire_bullet(target_world_x, target_world_y, asset_manager.images['bullet'], current_time)
                 if event.button == 3 and not game_state.player.death_effect_active and \
-                   game_state.player.garlic_count > 0 and game_state.garlic_shot is None:
-                    game_state.player.garlic_count -= 1
-                    game_state.player.garlic_changed = True
-
-                    game_state.garlic_shot_start_time = current_time
+                   game_state.player.garlic_count > 0:
                     mouse_x_screen, mouse_y_screen = pygame.mouse.get_pos()
                     world_mouse_x = mouse_x_screen + game_state.scroll[0]
                     world_mouse_y = mouse_y_screen + game_state.scroll[1]
-
-                    start_x, start_y = game_state.player.rect.centerx, game_state.player.rect.centery
-                    dx, dy = world_mouse_x - start_x, world_mouse_y - start_y
-
-                    dist = math.hypot(dx, dy)
-                    dx_norm, dy_norm = (dx/dist, dy/dist) if dist > 0 else (0,1)
-                    angle = math.degrees(math.atan2(-dy_norm, dx_norm))
-
-                    game_state.garlic_shot = {
-                        "x": start_x, "y": start_y,
-                        "dx": dx_norm, "dy": dy_norm,
-                        "angle": angle, "active": True,
-                        "rotation_angle": angle,
-                        "rect": garlic_image.get_rect(center=(start_x, start_y))
-                    }
-                    game_state.garlic_shot_travel = 0
-                    logging.debug(f"Garlic shot initiated towards ({world_mouse_x},{world_mouse_y}) with angle {angle:.2f} / Tir d'ail initié vers ({world_mouse_x},{world_mouse_y}) avec un angle de {angle:.2f}")
+                    shot = game_state.throw_garlic(world_mouse_x, world_mouse_y, garlic_image, current_time)
+                    if shot is not None:
+                        logging.debug(f"Garlic shot initiated towards ({world_mouse_x},{world_mouse_y}) with angle {shot.rotation_angle:.2f} / Tir d'ail initié vers ({world_mouse_x},{world_mouse_y}) avec un angle de {shot.rotation_angle:.2f}")
         else:
             for button in game_over_buttons:
                 button.handle_event(event)
 
+    if fixed_timestep and (not game_state.started or game_state.paused or game_state.game_over):
+        frame_timestep.reset() # Time spent in menus is not simulated / *Le temps passé dans les menus n'est pas simulé*
+
     if not game_state.started:
         if screen and start_screen_image and hasattr(start_screen_image, 'get_width'):
             screen.blit(start_screen_image, start_screen_pos)
@@ -483,82 +505,121 @@ def run_gui_mode():
         for button in pause_screen_buttons:
             if screen: button.draw(screen)
     elif not game_state.game_over:
+        dx, dy = 0,0
         if not game_state.player.death_effect_active:
-            dx, dy = 0,0
             keys = pygame.key.get_pressed()
             if keys[pygame.K_LEFT] or keys[pygame.K_q]: dx -= 1
             if keys[pygame.K_RIGHT] or keys[pygame.K_d]: dx += 1
             if keys[pygame.K_UP] or keys[pygame.K_z]: dy -= 1
             if keys[pygame.K_DOWN] or keys[pygame.K_s]: dy += 1
-            if dx != 0 or dy != 0:
-                game_state.player.move(dx, dy, game_state.world_size)
-
-        scroll_margin_x = screen_width * game_state.scroll_trigger
-        scroll_margin_y = screen_height * game_state.scroll_trigger
-
-        if game_state.player.rect.left < game_state.scroll[0] + scroll_margin_x:
-            game_state.scroll[0] = max(0, game_state.player.rect.left - scroll_margin_x)
-        elif game_state.player.rect.right > game_state.scroll[0] + screen_width - scroll_margin_x:
-            game_state.scroll[0] = min(game_state.world_size[0] - screen_width, game_state.player.rect.right - screen_width + scroll_margin_x)
-
-        if game_state.player.rect.top < game_state.scroll[1] + scroll_margin_y:
-            game_state.scroll[1] = max(0, game_state.player.rect.top - scroll_margin_y)
-        elif game_state.player.rect.bottom > game_state.scroll[1] + screen_height - scroll_margin_y:
-            game_state.scroll[1] = min(game_state.world_size[1] - screen_height, game_state.player.rect.bottom - screen_height + scroll_margin_y)
 
-        game_state.scroll[0] = max(0, min(game_state.scroll[0], game_state.world_size[0] - screen_width))
-        game_state.scroll[1] = max(0, min(game_state.scroll[1], game_state.world_size[1] - screen_height))
+        # With a fixed timestep, run as many ticks as the elapsed time requires (possibly none);
+        # otherwise run one tick per rendered frame. Speeds are per tick, so movement happens in ticks.
+        # *Avec un pas de temps fixe, exécuter autant de ticks que le temps écoulé l'exige (éventuellement aucun) ;*
+        # *sinon un tick par frame affichée. Les vitesses sont par tick, le déplacement se fait donc dans les ticks.*
+        tick_times = frame_timestep.ticks(current_time) if fixed_timestep else [current_time]
+        if fixed_timestep:
+            tick_rate_meter.record(time.perf_counter(), len(tick_times))
 
         try:
-            if not game_state.player.death_effect_active:
-                game_state.update(current_time)
-
-            if screen and grass_background and hasattr(grass_background, 'get_width'):
-                screen.blit(grass_background, (-game_state.scroll[0], -game_state.scroll[1]))
-
-            for carrot_enemy in game_state.carrots:
-                if carrot_enemy.active and screen: carrot_enemy.draw(screen, game_state.scroll)
+            for tick_time in tick_times:
+                if game_state.player.death_effect_active:
+                    break
+                if dx != 0 or dy != 0:
+                    game_state.player.move(dx, dy, game_state.world_size)
+                if stress_driver:
+                    stress_driver.step(tick_time)
+                    tick_start = time.perf_counter()
+                    game_state.update(tick_time)
+                    stress_monitor.record_tick(time.perf_counter() - tick_start)
+                else:
+                    game_state.update(tick_time)
+
+            scroll_margin_x = screen_width * game_state.scroll_trigger
+            scroll_margin_y = screen_height * game_state.scroll_trigger
+
+            if game_state.player.rect.left < game_state.scroll[0] + scroll_margin_x:
+                game_state.scroll[0] = max(0, game_state.player.rect.left - scroll_margin_x)
+            elif game_state.player.rect.right > game_state.scroll[0] + screen_width - scroll_margin_x:
+                game_state.scroll[0] = min(game_state.world_size[0] - screen_width, game_state.player.rect.right - screen_width + scroll_margin_x)
+
+            if game_state.player.rect.top < game_state.scroll[1] + scroll_margin_y:
+                game_state.scroll[1] = max(0, game_state.player.rect.top - scroll_margin_y)
+            elif game_state.player.rect.bottom > game_state.scroll[1] + screen_height - scroll_margin_y:
+                game_state.scroll[1] = min(game_state.world_size[1] - screen_height, game_state.player.rect.bottom - screen_height + scroll_margin_y)
+
+            game_state.scroll[0] = max(0, min(game_state.scroll[0], game_state.world_size[0] - screen_width))
+            game_state.scroll[1] = max(0, min(game_state.scroll[1], game_state.world_size[1] - screen_height))
+
+            if screen and grass_background:
+                grass_background.draw(screen, game_state.scroll)
+
+            # Only what overlaps the screen is drawn; the carrot and item layers only contain active entities
+            # *Seul ce qui chevauche l'écran est dessiné ; les couches des carottes et des objets ne contiennent que les entités actives*
+            # Entities draw into the render queue's layers, submitted in a few Surface.blits() calls below
+            # *Les entités dessinent dans les couches de la file de rendu, envoyées en quelques appels à Surface.blits() plus bas*
+            viewport.update(game_state.scroll, (screen_width, screen_height))
+            carrot_layer = game_state.collision_world.layer('carrots')
+            carrots_queue = render_queue.layer('carrots')
+            for carrot_enemy in viewport.visible_in('carrots', carrot_layer, len(carrot_layer)):
+                carrot_enemy.draw(carrots_queue, game_state.scroll)
 
             player_pos_on_screen = (game_state.player.rect.x - game_state.scroll[0], game_state.player.rect.y - game_state.scroll[1])
             if game_state.player.death_effect_active:
                 if int((current_time - game_state.player.death_effect_start_time) / 0.1) % 2 == 0:
-                    if screen and game_state.player.original_image and hasattr(game_state.player.original_image, 'copy') :
-                        tinted_image = game_state.player.original_image.copy()
-                        tinted_image.fill((255, 0, 0, 128), special_flags=pygame.BLEND_RGBA_MULT)
-                        screen.blit(tinted_image, player_pos_on_screen)
+                    if game_state.player.original_image and hasattr(game_state.player.original_image, 'copy') :
+                        tinted_image = asset_manager.variants.get(game_state.player.original_image, tint=config.PLAYER_DEATH_TINT_COLOR)
+                        render_queue.push(tinted_image, player_pos_on_screen, 'player')
             elif game_state.player.invincible and int(current_time * config.PLAYER_INVINCIBILITY_FLASH_FREQUENCY) % 2 == 1:
                 pass
             else:
-                if screen: game_state.player.draw(screen, game_state.scroll)
-
-            for bullet in game_state.bullets:
-                if screen and bullet.image:
-                    rotated_bullet_img = bullet.rotated_image
-                    if rotated_bullet_img:
-                         screen.blit(rotated_bullet_img, (bullet.rect.x - game_state.scroll[0], bullet.rect.y - game_state.scroll[1]))
-
-            if game_state.garlic_shot and game_state.garlic_shot["active"]:
-                if screen and garlic_image and hasattr(garlic_image, 'get_rect'):
-                    rotated_garlic = pygame.transform.rotate(garlic_image, game_state.garlic_shot["rotation_angle"])
-                    rotated_rect = rotated_garlic.get_rect(center=(game_state.garlic_shot["x"], game_state.garlic_shot["y"]))
-                    screen.blit(rotated_garlic, (rotated_rect.x - game_state.scroll[0], rotated_rect.y - game_state.scroll[1]))
-
-            for explosion in game_state.explosions:
-                if screen: explosion.draw(screen, game_state.scroll)
-
-            if screen: game_state.vampire.draw(screen, game_state.scroll, current_time)
+                game_state.player.draw(render_queue.layer('player'), game_state.scroll)
+
+            # Read bullet positions straight from the store's arrays / *Lire les positions des projectiles directement dans les tableaux du stockage*
+            bullet_xs, bullet_ys = game_state.bullet_store.positions()
+            bullets_queue = render_queue.layer('bullets')
+            for slot in viewport.visible_slots('bullets', game_state.bullet_store):
+                bullet, bullet_x, bullet_y = game_state.bullet_store.bullets[slot], bullet_xs[slot], bullet_ys[slot]
+                # Frame looked up in the rotation atlas when the bullet was fired / *Image cherchée dans l'atlas de rotation au tir du projectile*
+                frame = bullet.rotated_frame
+                if frame:
+                    rotated_bullet_img, (offset_x, offset_y) = frame
+                    bullets_queue.blit(rotated_bullet_img, (int(bullet_x) + offset_x - game_state.scroll[0], int(bullet_y) + offset_y - game_state.scroll[1]))
+
+            garlic_queue = render_queue.layer('garlic_shots')
+            for garlic_shot in viewport.visible('garlic_shots', game_state.garlic_shots): # Shared rotation frames / *Images de rotation partagées*
+                garlic_shot.draw(garlic_queue, game_state.scroll)
+
+            explosions_queue = render_queue.layer('explosions')
+            for explosion in viewport.visible('explosions', game_state.explosions):
+                explosion.draw(explosions_queue, game_state.scroll)
+
+            # Dying vampires leave the collision layer but still draw their death effect, so the list is scanned
+            # *Les vampires mourants quittent la couche de collision mais dessinent encore leur effet de mort, la liste est donc parcourue*
+            vampires_queue = render_queue.layer('vampires')
+            for vampire in viewport.visible('vampires', game_state.vampires):
+                vampire.draw(vampires_queue, game_state.scroll, current_time)
+
+            item_layer = game_state.collision_world.layer('items')
+            items_queue = render_queue.layer('items')
+            for item in viewport.visible_in('items', item_layer, len(item_layer)):
+                if item.active: item.draw(items_queue, game_state.scroll)
+
+            if screen:
+                render_queue.submit(screen)
+            else:
+                render_queue.clear()
 
+            # The HUD goes over the world layers. Its cached layer is composed again when the HUD listener
+            # was flagged by pickup, damage and garlic shot events, instead of polling the player
+            # *Le HUD passe par-dessus les couches du monde. Sa couche en cache est recomposée quand l'écouteur du HUD*
+            # *a été signalé par les événements de ramassage, dégâts et tir d'ail, au lieu d'interroger le joueur*
             if screen and hp_image_ui and garlic_image:
-                game_state.player.draw_ui(screen, hp_image_ui, garlic_image, config.MAX_GARLIC)
-
-            if game_state.player.health_changed or game_state.player.garlic_changed or game_state.player.juice_changed:
+                hud_refreshed = hud_layer.draw(screen, game_state.hud, game_state.player, hp_image_ui, garlic_image, config.MAX_GARLIC)
+            else:
+                hud_refreshed = game_state.hud.consume()
+            if hud_refreshed:
                 logging.debug(f"Player Stats - HP: {game_state.player.health}, Garlic: {game_state.player.garlic_count}, Carrot Juice: {game_state.player.carrot_juice_count}, Vampires Killed: {game_state.vampire_killed_count} / Stats Joueur - PV : {game_state.player.health}, Ail : {game_state.player.garlic_count}, Jus de Carotte : {game_state.player.carrot_juice_count}, Vampires Tués : {game_state.vampire_killed_count}")
-                game_state.player.health_changed = False
-                game_state.player.garlic_changed = False
-                game_state.player.juice_changed = False
-
-            for item in game_state.items:
-                if item.active and screen: item.draw(screen, game_state.scroll)
 
         except Exception as e:
             logging.exception(f"ERROR during game logic/draw: {e} / ERREUR pendant la logique/le dessin du jeu : {e}")
@@ -599,7 +660,28 @@ def run_gui_mode():
             screen.blit(crosshair_img_ref, crosshair_rect_instance)
 
     pygame.display.flip()
-    time.sleep(config.FRAME_DELAY)
+    if stress_driver:
+        stress_monitor.record_frame(time.perf_counter() - frame_start, {**viewport.stats(), **render_queue.stats()})
+        stress_monitor.poll(time.perf_counter(), game_state)
+        if stress_driver.finished(current_time):
+            stress_monitor.poll(time.perf_counter(), game_state, force=True)
+            logging.info("Stress run complete. / Exécution de stress terminée.")
+            running = False
+    if fixed_timestep:
+        render_clock.tick(config.RENDER_FPS_LIMIT) # Render as fast as allowed / *Afficher aussi vite que permis*
+        # Rates are measured in wall-clock time, whatever the game clock does / *Fréquences mesurées en temps réel, quoi que fasse l'horloge du jeu*
+        if frame_rate_meter.record(time.perf_counter()):
+            logging.debug(f"Simulation: {tick_rate_meter.rate:.1f} TPS, render: {frame_rate_meter.rate:.1f} FPS, dropped ticks: {frame_timestep.dropped_ticks} / Simulation : {tick_rate_meter.rate:.1f} TPS, affichage : {frame_rate_meter.rate:.1f} FPS, ticks abandonnés : {frame_timestep.dropped_ticks}")
+            logging.debug(f"Entity pools / Réserves d'entités : {game_state.pool_stats()}")
+            logging.debug(f"Carrot LOD tiers / Paliers LOD des carottes : {game_state.lod_stats()}")
+            logging.debug(f"Entity gauges / Jauges d'entités : {game_state.gauges()}")
+            logging.debug(f"Shots and entities dropped / Tirs et entités abandonnés : {game_state.drop_stats()}")
+            logging.debug(f"Draws culled by the viewport / Dessins écartés par le viewport : {viewport.stats()}")
+            logging.debug(f"Sprite variants / Variantes de sprites : {asset_manager.variants.stats()}")
+            logging.debug(f"HUD layer compositions / Compositions de la couche de HUD : {hud_layer.renders}")
+            logging.debug(f"Render queue / File de rendu : {render_queue.stats()}")
+    else:
+        time.sleep(config.FRAME_DELAY)
     logging.debug("run_gui_mode: Frame processing ended. / run_gui_mode : Traitement de la frame terminé.")
 
 
@@ -711,6 +793,32 @@ def run_cli_mode():
     logging.debug("run_cli_mode: Iteration ended. / run_cli_mode : Itération terminée.")
 
 
+def run_stress_cli_mode():
+    """
+    Runs one tick of a headless stress run, as fast as the machine allows.
+    The virtual game clock moves by one tick, so game time is independent of the tick cost.
+
+    *Exécute un tick d'une exécution de stress sans affichage, aussi vite que la machine le permet.*
+    *L'horloge de jeu virtuelle avance d'un tick, le temps de jeu ne dépend donc pas du coût du tick.*
+    """
+    global running, game_state, stress_driver, stress_monitor
+
+    frame_start = time.perf_counter()
+    game_state.clock.advance(1.0 / config.SIMULATION_TICK_RATE)
+    current_time = game_state.clock.now()
+    stress_driver.step(current_time)
+    tick_start = time.perf_counter()
+    game_state.update(current_time)
+    now = time.perf_counter()
+    stress_monitor.record_tick(now - tick_start)
+    stress_monitor.record_frame(now - frame_start) # Driver work included / *Travail du pilote inclus*
+    stress_monitor.poll(now, game_state)
+    if stress_driver.finished(current_time):
+        stress_monitor.poll(now, game_state, force=True)
+        logging.info("Stress run complete. / Exécution de stress terminée.")
+        running = False
+
+
 def main_loop():
     """
     The main game loop. Alternates between GUI and CLI mode based on arguments.
@@ -724,6 +832,8 @@ def main_loop():
     while running:
         if not args.cli:
             run_gui_mode()
+        elif stress_driver:
+            run_stress_cli_mode()
         else:
             run_cli_mode()
     logging.debug("Main loop ended because 'running' is False. / Boucle principale terminée car 'running' est False.")
@@ -734,6 +844,8 @@ def main_entry_point():
     global grass_background, garlic_image, hp_image_ui, game_over_image_ui
     global start_screen_buttons, game_over_buttons, pause_screen_buttons
     global running, can_toggle_pause
+    global frame_timestep, tick_rate_meter, frame_rate_meter, render_clock, viewport, hud_layer, render_queue
+    global stress_driver, stress_monitor
 
     args = parse_arguments()
     setup_logging(args)
@@ -751,7 +863,10 @@ def main_entry_point():
     hp_image_ui = assets['hp_image_ui']
     game_over_image_ui = assets['game_over_image_ui']
 
-    game_state = GameState(asset_manager, cli_mode=args.cli)
+    # A headless stress run simulates on a virtual clock, ticking as fast as possible
+    # *Une exécution de stress sans affichage simule sur une horloge virtuelle, aussi vite que possible*
+    clock = GameClock(VIRTUAL) if args.stress and args.cli else None
+    game_state = GameState(asset_manager, cli_mode=args.cli, clock=clock, seed=args.seed)
 
     callbacks = {
         'start': start_game,
@@ -766,7 +881,22 @@ def main_entry_point():
     game_over_buttons = buttons['game_over']
     pause_screen_buttons = buttons['pause']
 
-    current_time = time.time()
+    frame_timestep = FixedTimestep(config.SIMULATION_TICK_RATE, config.MAX_CATCH_UP_TICKS)
+    tick_rate_meter = RateMeter()
+    frame_rate_meter = RateMeter()
+    render_clock = pygame.time.Clock()
+    viewport = Viewport((screen_width, screen_height))
+    hud_layer = HudLayer()
+    render_queue = RenderQueue()
+
+    if args.stress:
+        stress_driver = StressDriver(StressProfile.from_args(args), game_state,
+                                     asset_manager.images['bullet'], asset_manager.images['explosion'])
+        stress_driver.populate()
+        stress_monitor = StressMonitor()
+        start_game() # Straight into the game / *Directement dans le jeu*
+
+    current_time = game_state.clock.now()
     running = True
 
     try:
@@ -0,0 +1,124 @@
+# render_queue.py
+# This file defines the RenderQueue, which batches the world-space sprites of a frame. During
+# the draw phase, entities push (surface, position) entries into a layer instead of blitting
+# them one by one. At the end, the queue submits each non-empty layer, bottom to top, with one
+# Surface.blits() call. A frame with thousands of sprites then costs a few calls into pygame
+# instead of one per sprite. The layer order is fixed when the queue is built
+# (config.RENDER_LAYERS), so nothing is sorted per frame. Entries of a layer keep their push order.
+# Entity draw methods need no change: a layer handed to them as their `screen` has a blit()
+# method that only queues. The blit count, the number of blits() calls and the submit time of
+# the last frame are kept, to measure the batching.
+#
+# *Ce fichier définit la RenderQueue, qui regroupe les sprites de l'espace du monde d'une frame.*
+# *Pendant la phase de dessin, les entités ajoutent des entrées (surface, position) dans une couche au*
+# *lieu de les copier une par une. À la fin, la file envoie chaque couche non vide, du bas vers le*
+# *haut, en un seul appel à Surface.blits(). Une frame avec des milliers de sprites ne coûte alors que*
+# *quelques appels à pygame au lieu d'un par sprite. L'ordre des couches est fixé à la création de la*
+# *file (config.RENDER_LAYERS), rien n'est donc trié à chaque frame. Les entrées d'une couche gardent*
+# *leur ordre d'ajout. Les méthodes de dessin des entités ne changent pas : une couche qui leur est*
+# *passée comme `screen` a une méthode blit() qui ne fait que mettre en file. Le nombre de copies, le*
+# *nombre d'appels à blits() et le temps d'envoi de la dernière frame sont gardés, pour mesurer le regroupement.*
+
+import time
+
+import config
+
+
+class RenderLayer:
+    """
+    The entries of one layer, with the blit() signature of a pygame.Surface so entities can draw into it.
+    *Les entrées d'une couche, avec la signature blit() d'une pygame.Surface pour que les entités puissent y dessiner.*
+    """
+    __slots__ = ('name', 'entries')
+
+    def __init__(self, name):
+        self.name = name
+        self.entries = []  # Surface.blits() sequence / *Séquence pour Surface.blits()*
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        """Queues a blit; nothing is drawn until the queue is submitted. / *Met une copie en file ; rien n'est dessiné avant l'envoi de la file.*"""
+        if area is None and not special_flags:
+            self.entries.append((source, dest))
+        else:
+            self.entries.append((source, dest, area, special_flags))
+
+    def __len__(self):
+        return len(self.entries)
+
+
+class RenderQueue:
+    """
+    Per-frame queue of blits, grouped by layer and submitted with one Surface.blits() call per layer.
+    *File de copies par frame, regroupées par couche et envoyées en un appel à Surface.blits() par couche.*
+    """
+    def __init__(self, layers=config.RENDER_LAYERS):
+        """
+        Args:
+            layers (tuple[str]): Layer names, from bottom to top. / *Noms des couches, du bas vers le haut.*
+        """
+        self._layers = [RenderLayer(name) for name in layers]
+        self._by_name = {layer.name: layer for layer in self._layers}
+        self.last_blits = 0  # Entries submitted by the last frame / *Entrées envoyées par la dernière frame*
+        self.last_calls = 0  # Surface.blits() calls of the last frame / *Appels à Surface.blits() de la dernière frame*
+        self.last_submit_time = 0.0  # Seconds spent submitting the last frame / *Secondes passées à envoyer la dernière frame*
+        self.last_counts = {}  # Layer -> entries submitted by the last frame / *Couche -> entrées envoyées par la dernière frame*
+
+    def layer(self, name):
+        """
+        Returns a layer, to be passed as the `screen` of entity draw methods.
+        *Retourne une couche, à passer comme `screen` aux méthodes de dessin des entités.*
+        """
+        return self._by_name[name]
+
+    def push(self, surface, dest, layer):
+        """
+        Queues one blit in a layer.
+        Args:
+            surface (pygame.Surface): The sprite to draw. / *Le sprite à dessiner.*
+            dest (tuple[int, int]): Top-left corner on screen. / *Coin supérieur gauche à l'écran.*
+            layer (str): One of the queue's layer names. / *Un des noms de couche de la file.*
+        """
+        self._by_name[layer].entries.append((surface, dest))
+
+    def __len__(self):
+        return sum(len(layer.entries) for layer in self._layers)
+
+    def clear(self):
+        """Drops the queued entries without drawing them. / *Abandonne les entrées en file sans les dessiner.*"""
+        for layer in self._layers:
+            layer.entries.clear()
+
+    def submit(self, screen):
+        """
+        Draws every queued entry, bottom layer first, then empties the queue.
+        Args:
+            screen (pygame.Surface): The surface to draw on. / *La surface sur laquelle dessiner.*
+        Returns:
+            int: The number of entries drawn. / *Le nombre d'entrées dessinées.*
+        """
+        start = time.perf_counter()
+        blits = calls = 0
+        counts = {}
+        for layer in self._layers:
+            entries = layer.entries
+            if entries:
+                screen.blits(entries, doreturn=False)
+                counts[layer.name] = len(entries)
+                blits += len(entries)
+                calls += 1
+                entries.clear()
+        self.last_submit_time = time.perf_counter() - start
+        self.last_blits, self.last_calls, self.last_counts = blits, calls, counts
+        return blits
+
+    def stats(self):
+        """
+        Returns the blit count, blits() calls and submit time (ms) of the last frame, with the count of each layer.
+        *Retourne le nombre de copies, d'appels à blits() et le temps d'envoi (ms) de la dernière frame, avec le compte de chaque couche.*
+        """
+        return {
+            'blits': self.last_blits,
+            'blit_calls': self.last_calls,
+            'submit_ms': round(self.last_submit_time * 1000, 3),
+            **{f"blits:{name}": count for name, count in self.last_counts.items()},
+        }
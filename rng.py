@@ -0,0 +1,83 @@
+# rng.py
+# This file defines the RngRegistry, the game's random number streams.
+# Each subsystem draws from its own named stream: 'spawn' for enemy placement, 'ai' for the
+# carrots' wandering, 'loot' for item drops. With a session seed, every stream is derived
+# from it, so a whole session replays identically. Because the streams are separate, adding
+# a draw in one subsystem does not shift the numbers seen by the others. Each stream exists in
+# two forms: a `random.Random` for scalar draws, and a NumPy Generator for bulk draws over
+# large populations.
+# Without a seed, the scalar streams are the global `random` module, as before, and the bulk
+# streams are freshly seeded from the operating system.
+#
+# *Ce fichier définit le RngRegistry, les flux de nombres aléatoires du jeu.*
+# *Chaque sous-système tire dans son propre flux nommé : 'spawn' pour le placement des ennemis, 'ai'*
+# *pour l'errance des carottes, 'loot' pour les chutes d'objets. Avec une graine de session, chaque*
+# *flux en est dérivé, de sorte qu'une session entière se rejoue à l'identique. Comme les flux sont*
+# *séparés, ajouter un tirage dans un sous-système ne décale pas les nombres vus par les autres. Chaque*
+# *flux existe sous deux formes : un `random.Random` pour les tirages unitaires, et un Generator NumPy*
+# *pour les tirages groupés sur de grandes populations.*
+# *Sans graine, les flux unitaires sont le module global `random`, comme avant, et les flux groupés*
+# *sont initialisés par le système d'exploitation.*
+
+import random
+import zlib
+
+import numpy as np
+
+
+class RngRegistry:
+    """
+    Named random streams derived from one optional session seed.
+    *Flux aléatoires nommés dérivés d'une graine de session optionnelle.*
+    """
+    def __init__(self, seed=None):
+        """
+        Args:
+            seed (int, optional): Session seed. Unseeded sessions use the global `random` module.
+                                  *Graine de session. Les sessions sans graine utilisent le module global `random`.*
+        """
+        self.seed = seed
+        self._scalar = {}
+        self._bulk = {}
+
+    def _sequence(self, name):
+        # Stable per-name child of the session seed (crc32, unlike hash(), does not change between runs)
+        # *Enfant stable par nom de la graine de session (crc32, contrairement à hash(), ne change pas d'une exécution à l'autre)*
+        # SeedSequence only takes non-negative entries, so the seed is read as an unsigned 64-bit value (-1 -> 2**64 - 1)
+        # *SeedSequence n'accepte que des entrées positives, la graine est donc lue comme une valeur 64 bits non signée (-1 -> 2**64 - 1)*
+        return np.random.SeedSequence([self.seed & 0xFFFFFFFFFFFFFFFF, zlib.crc32(name.encode())])
+
+    def stream(self, name):
+        """
+        Returns the scalar stream of a subsystem, created on first use.
+        Returns:
+            random.Random: The stream (the `random` module itself when unseeded).
+                           *Le flux (le module `random` lui-même sans graine).*
+
+        *Retourne le flux unitaire d'un sous-système, créé à la première utilisation.*
+        """
+        if self.seed is None:
+            return random
+        stream = self._scalar.get(name)
+        if stream is None:
+            stream = self._scalar[name] = random.Random(int(self._sequence(name).generate_state(1, np.uint64)[0]))
+        return stream
+
+    def bulk(self, name):
+        """
+        Returns the NumPy stream of a subsystem, for vectorized draws, created on first use.
+        It is independent of the scalar stream of the same name.
+        Returns:
+            numpy.random.Generator: The stream. / *Le flux.*
+
+        *Retourne le flux NumPy d'un sous-système, pour les tirages vectorisés, créé à la première utilisation.*
+        *Il est indépendant du flux unitaire de même nom.*
+        """
+        generator = self._bulk.get(name)
+        if generator is None:
+            if self.seed is None:
+                generator = np.random.default_rng()
+            else: # A second child, so it does not replay the scalar stream / *Un second enfant, pour ne pas rejouer le flux unitaire*
+                generator = np.random.default_rng(self._sequence(name).spawn(1)[0])
+            self._bulk[name] = generator
+        return generator
@@ -0,0 +1,115 @@
+# scheduler.py
+# This file defines the Scheduler class, which runs timed game events (carrot and vampire
+# respawns, end of the player's invincibility, explosion flashes, item drops...).
+# Instead of every entity comparing its own timer with the current time on every tick,
+# each event registers a callback once with its due time. Timers are kept in a binary heap
+# ordered by due time, so a tick only looks at the timers that are actually due.
+# A heap is used rather than a fixed-resolution timer wheel because game time may jump by
+# arbitrary amounts (virtual clock, catch-up after a stall, tests).
+#
+# *Ce fichier définit la classe Scheduler, qui exécute les événements temporisés du jeu*
+# *(réapparitions des carottes et du vampire, fin de l'invincibilité du joueur, flashs d'explosion,*
+# *chutes d'objets...). Au lieu que chaque entité compare son propre minuteur au temps actuel à*
+# *chaque tick, chaque événement enregistre une seule fois une fonction de rappel avec son échéance.*
+# *Les minuteurs sont gardés dans un tas binaire ordonné par échéance, de sorte qu'un tick ne*
+# *regarde que les minuteurs réellement échus. Un tas est utilisé plutôt qu'une roue temporelle à*
+# *résolution fixe car le temps de jeu peut faire des sauts arbitraires (horloge virtuelle,*
+# *rattrapage après un blocage, tests).*
+
+import heapq
+import itertools
+
+
+class Timer:
+    """
+    Handle to a scheduled callback, used to cancel it.
+    *Référence vers un rappel planifié, utilisée pour l'annuler.*
+    """
+    __slots__ = ('when', 'callback', 'args', 'cancelled')
+
+    def __init__(self, when, callback, args):
+        self.when = when
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+
+class Scheduler:
+    """
+    Runs callbacks at given game times. Timers due at the same time run in the order they were scheduled.
+    *Exécute des fonctions de rappel à des temps de jeu donnés. Les minuteurs de même échéance s'exécutent dans leur ordre de planification.*
+    """
+    def __init__(self):
+        self._heap = []  # (when, sequence, Timer) / *(échéance, séquence, Timer)*
+        self._sequence = itertools.count()
+        self._pending = 0
+        self.fired_count = 0  # Callbacks run since creation / *Rappels exécutés depuis la création*
+        self.last_advance_touched = 0  # Heap entries popped by the last advance() / *Entrées du tas retirées par le dernier advance()*
+
+    def schedule(self, when, callback, *args):
+        """
+        Registers `callback(*args)` to run once game time reaches `when`.
+        Args:
+            when (float): Due game time, in seconds. / *Échéance en temps de jeu, en secondes.*
+            callback (callable): Function to call. / *Fonction à appeler.*
+        Returns:
+            Timer: A handle that can be passed to cancel(). / *Une référence utilisable avec cancel().*
+        """
+        timer = Timer(when, callback, args)
+        heapq.heappush(self._heap, (when, next(self._sequence), timer))
+        self._pending += 1
+        return timer
+
+    def cancel(self, timer):
+        """
+        Cancels a pending timer. It is dropped lazily when it reaches the top of the heap.
+        *Annule un minuteur en attente. Il est retiré paresseusement quand il atteint le haut du tas.*
+        """
+        if timer is not None and not timer.cancelled:
+            timer.cancelled = True
+            self._pending -= 1
+
+    def advance(self, now):
+        """
+        Runs every timer due at or before `now`, earliest first. Callbacks may schedule new
+        timers; those already due run during the same call.
+        Args:
+            now (float): Current game time, in seconds. / *Temps de jeu actuel, en secondes.*
+        Returns:
+            int: Number of callbacks run. / *Nombre de rappels exécutés.*
+
+        *Exécute tous les minuteurs échus à `now` ou avant, du plus ancien au plus récent. Les rappels*
+        *peuvent planifier de nouveaux minuteurs ; ceux déjà échus s'exécutent pendant le même appel.*
+        """
+        heap = self._heap
+        fired = 0
+        touched = 0
+        while heap and heap[0][0] <= now:
+            timer = heapq.heappop(heap)[2]
+            touched += 1
+            if timer.cancelled:
+                continue
+            timer.cancelled = True # A fired timer can no longer be cancelled / *Un minuteur exécuté ne peut plus être annulé*
+            self._pending -= 1
+            fired += 1
+            timer.callback(*timer.args)
+        self.fired_count += fired
+        self.last_advance_touched = touched
+        return fired
+
+    def next_due(self):
+        """Returns the due time of the earliest pending timer, or None. / *Retourne l'échéance du prochain minuteur en attente, ou None.*"""
+        heap = self._heap
+        while heap and heap[0][2].cancelled:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    def clear(self):
+        """Drops every pending timer. / *Abandonne tous les minuteurs en attente.*"""
+        for _, _, timer in self._heap:
+            timer.cancelled = True
+        self._heap.clear()
+        self._pending = 0
+
+    def __len__(self):
+        return self._pending
@@ -0,0 +1,120 @@
+# simulation_lod.py
+# This file defines the simulation level of detail (LOD) used to spread enemy AI over ticks.
+# Enemies are sorted into distance tiers around the player. The near tier, which covers the
+# screen and every detection radius, updates every tick. Farther tiers update every N ticks
+# and move N ticks' worth at once. Each enemy's slot gives it a phase within N, so one tier's
+# updates are spread evenly over the ticks instead of all landing on the same one.
+#
+# *Ce fichier définit le niveau de détail (LOD) de simulation utilisé pour répartir l'IA des ennemis*
+# *sur les ticks. Les ennemis sont classés par paliers de distance autour du joueur. Le palier proche,*
+# *qui couvre l'écran et tous les rayons de détection, est mis à jour à chaque tick. Les paliers plus*
+# *lointains sont mis à jour tous les N ticks et avancent de N ticks d'un coup. La case de chaque ennemi*
+# *lui donne une phase dans N, pour que les mises à jour d'un palier soient réparties uniformément sur*
+# *les ticks au lieu de tomber toutes sur le même.*
+
+import numpy as np
+
+import config
+
+
+class LodTier:
+    """
+    One distance band: enemies closer than `max_distance` (and past the previous tier) update every `interval` ticks.
+    *Une bande de distance : les ennemis plus proches que `max_distance` (et au-delà du palier précédent) sont mis à jour tous les `interval` ticks.*
+    """
+    __slots__ = ('name', 'max_distance', 'interval', 'population', 'updated', 'total_updates', 'total_time')
+
+    def __init__(self, name, max_distance, interval):
+        self.name = name
+        self.max_distance = max_distance
+        self.interval = interval
+        self.population = 0  # Enemies in the tier at the last tick / *Ennemis dans le palier au dernier tick*
+        self.updated = 0  # Enemies updated at the last tick / *Ennemis mis à jour au dernier tick*
+        self.total_updates = 0
+        self.total_time = 0.0  # Seconds spent updating this tier / *Secondes passées à mettre à jour ce palier*
+
+
+class SimulationLod:
+    """
+    Distance tiers and the tick counter deciding which enemies update on a given tick.
+    *Paliers de distance et compteur de ticks décidant quels ennemis sont mis à jour à un tick donné.*
+    """
+    def __init__(self, tiers, min_population=0):
+        """
+        Args:
+            tiers (list[LodTier]): Tiers by increasing distance; the last one should reach infinity.
+                                   *Paliers par distance croissante ; le dernier doit aller jusqu'à l'infini.*
+            min_population (int): Smallest number of active enemies for which tiers are used.
+                                  *Plus petit nombre d'ennemis actifs pour lequel les paliers sont utilisés.*
+        """
+        self.tiers = list(tiers)
+        self.min_population = min_population
+        self._bounds_sq = np.array([tier.max_distance ** 2 for tier in self.tiers[:-1]], dtype=np.float64)
+        self.tick = 0
+        self.ticks = 0  # Ticks stepped since the stats were reset / *Ticks exécutés depuis la remise à zéro des stats*
+
+    @classmethod
+    def from_config(cls):
+        return cls([
+            LodTier('near', config.LOD_NEAR_RADIUS, 1),
+            LodTier('mid', config.LOD_MID_RADIUS, config.LOD_MID_INTERVAL),
+            LodTier('far', float('inf'), config.LOD_FAR_INTERVAL),
+        ], config.LOD_MIN_POPULATION)
+
+    def schedule(self, slots, dist_sq):
+        """
+        Advances the tick counter and picks the slots to update this tick.
+        Args:
+            slots (numpy.ndarray): Slots of the active enemies. / *Cases des ennemis actifs.*
+            dist_sq (numpy.ndarray): Their squared distance to the player. / *Leur distance au joueur, au carré.*
+        Returns:
+            tuple: The due slots and the number of ticks they move by (one number, or an array with one per slot).
+                   *Les cases dues et le nombre de ticks dont elles avancent (un nombre, ou un tableau avec un par case).*
+
+        *Avance le compteur de ticks et choisit les cases à mettre à jour à ce tick.*
+        """
+        self.tick += 1
+        self.ticks += 1
+        tier_of = np.searchsorted(self._bounds_sq, dist_sq, side='right')
+        due_parts = []
+        tick_parts = []
+        for index, tier in enumerate(self.tiers):
+            in_tier = slots[tier_of == index]
+            tier.population = in_tier.size
+            if tier.interval > 1 and in_tier.size:
+                in_tier = in_tier[(in_tier + self.tick) % tier.interval == 0] # Staggered phases / *Phases décalées*
+            tier.updated = in_tier.size
+            tier.total_updates += in_tier.size
+            if in_tier.size:
+                due_parts.append(in_tier)
+                tick_parts.append(tier.interval)
+        if len(due_parts) <= 1: # Usually only the near tier is due / *Le plus souvent seul le palier proche est dû*
+            return (due_parts[0], tick_parts[0]) if due_parts else (slots[:0], 1)
+        ticks = np.repeat(np.array(tick_parts, dtype=np.float64), [part.size for part in due_parts])
+        return np.concatenate(due_parts), ticks
+
+    def charge(self, elapsed):
+        """
+        Splits the duration of one batched update between the tiers, by number of enemies updated.
+        *Répartit la durée d'une mise à jour groupée entre les paliers, selon le nombre d'ennemis mis à jour.*
+        """
+        updated = sum(tier.updated for tier in self.tiers)
+        if updated:
+            for tier in self.tiers:
+                tier.total_time += elapsed * tier.updated / updated
+
+    def stats(self):
+        """
+        Returns, per tier, its last population and update count and its mean cost per tick in microseconds.
+        *Retourne, par palier, sa dernière population, son nombre de mises à jour et son coût moyen par tick en microsecondes.*
+        """
+        ticks = max(self.ticks, 1)
+        return {tier.name: {'population': tier.population, 'updated': tier.updated,
+                            'us_per_tick': round(tier.total_time / ticks * 1e6, 1)}
+                for tier in self.tiers}
+
+    def reset_stats(self):
+        self.ticks = 0
+        for tier in self.tiers:
+            tier.total_updates = 0
+            tier.total_time = 0.0
@@ -0,0 +1,269 @@
+# spawn_placement.py
+# This file defines where new enemies may appear: SpawnRegion and SpawnPlacer.
+# A SpawnRegion is computed once for a given item size and player position. It covers every
+# top-left position that keeps the item inside the world and farther than a safe radius from
+# the player, as a grid of cells: cells wholly outside the safe disk, and cells the disk's edge
+# crosses. Sampling picks cells by area and a point inside, so only points drawn in edge cells
+# can be rejected.
+# The SpawnPlacer draws positions from a region. Small requests use the scalar spawn stream one
+# position at a time, with a bounded number of attempts each. Large waves are drawn in NumPy
+# batches. An optional minimum spacing spreads the positions (Poisson-disk style dart throwing
+# on a grid). Every path stops after a fixed number of rounds, so placement always terminates,
+# even when the safe radius covers the whole world.
+#
+# *Ce fichier définit où de nouveaux ennemis peuvent apparaître : SpawnRegion et SpawnPlacer.*
+# *Une SpawnRegion est calculée une fois pour une taille d'objet et une position du joueur données.*
+# *Elle couvre toutes les positions haut-gauche qui gardent l'objet dans le monde et plus loin qu'un*
+# *rayon de sécurité du joueur, sous forme de grille de cellules : celles entièrement hors du disque*
+# *de sécurité, et celles que le bord du disque traverse. L'échantillonnage choisit les cellules selon*
+# *leur aire puis un point à l'intérieur, donc seuls les points tirés dans les cellules de bord peuvent*
+# *être rejetés.*
+# *Le SpawnPlacer tire des positions dans une région. Les petites demandes utilisent le flux unitaire*
+# *d'apparition une position à la fois, avec un nombre borné de tentatives chacune. Les grandes vagues*
+# *sont tirées par lots NumPy. Un espacement minimal optionnel répartit les positions (lancer de*
+# *fléchettes façon disque de Poisson sur une grille). Chaque chemin s'arrête après un nombre fixe de*
+# *tours, donc le placement se termine toujours, même quand le rayon de sécurité couvre tout le monde.*
+
+import logging
+import math
+import random
+
+import numpy as np
+
+import config
+
+
+def _crowded(taken, x, y, col, row, spacing_sq):
+    # True if a position already taken in the 5x5 cells around (col, row) is too close
+    # *True si une position déjà prise dans les 5x5 cellules autour de (col, row) est trop proche*
+    for dc in range(-2, 3):
+        for dr in range(-2, 3):
+            other = taken.get((col + dc, row + dr))
+            if other is not None and (x - other[0]) ** 2 + (y - other[1]) ** 2 < spacing_sq:
+                return True
+    return False
+
+
+class SpawnRegion:
+    """
+    Precomputed top-left positions where an item may spawn, as weighted grid cells.
+    *Positions haut-gauche précalculées où un objet peut apparaître, sous forme de cellules de grille pondérées.*
+    """
+    def __init__(self, world_size, item_size, center=None, safe_radius=0, cell_size=config.SPAWN_CELL_SIZE):
+        """
+        Args:
+            world_size (tuple[int, int]): The (width, height) of the game world. / *La (largeur, hauteur) du monde du jeu.*
+            item_size (tuple[int, int]): The (width, height) of the item to place. / *La (largeur, hauteur) de l'objet à placer.*
+            center (tuple[int, int], optional): Center of the safe disk, usually the player's; no safe disk when None.
+                                                *Centre du disque de sécurité, en général celui du joueur ; pas de disque si None.*
+            safe_radius (float): Top-left positions must be farther than this from the center.
+                                 *Les positions haut-gauche doivent être plus loin que cela du centre.*
+            cell_size (int): Side of the grid cells, in pixels. / *Côté des cellules de la grille, en pixels.*
+        """
+        self.max_x = max(0, world_size[0] - item_size[0])
+        self.max_y = max(0, world_size[1] - item_size[1])
+        self.center = center
+        self.safe_radius_sq = safe_radius ** 2 if center is not None else -1.0
+
+        # Inclusive pixel bounds of each cell / *Bornes inclusives en pixels de chaque cellule*
+        left = np.arange(0, self.max_x + 1, cell_size)
+        top = np.arange(0, self.max_y + 1, cell_size)
+        x0, y0 = np.meshgrid(left, top)
+        x0, y0 = x0.ravel(), y0.ravel()
+        x1 = np.minimum(x0 + cell_size - 1, self.max_x)
+        y1 = np.minimum(y0 + cell_size - 1, self.max_y)
+        if center is None:
+            usable = np.ones(x0.shape, dtype=bool)
+            full = usable
+        else:
+            cx, cy = center
+            near_sq = (np.clip(cx, x0, x1) - cx) ** 2 + (np.clip(cy, y0, y1) - cy) ** 2
+            far_sq = np.maximum(np.abs(x0 - cx), np.abs(x1 - cx)) ** 2 + np.maximum(np.abs(y0 - cy), np.abs(y1 - cy)) ** 2
+            usable = far_sq > self.safe_radius_sq # Some point of the cell is valid / *Un point de la cellule est valide*
+            full = near_sq > self.safe_radius_sq # Every point of the cell is valid / *Tous les points de la cellule sont valides*
+        self._x0, self._x1, self._y0, self._y1 = x0[usable], x1[usable], y0[usable], y1[usable]
+        self._full = full[usable]
+        area = (self._x1 - self._x0 + 1) * (self._y1 - self._y0 + 1)
+        self._cdf = np.cumsum(area, dtype=np.float64)
+        self._full_cdf = np.cumsum(np.where(self._full, area, 0), dtype=np.float64)
+        if self._cdf.size:
+            self._cdf /= self._cdf[-1]
+        if self._full_cdf.size and self._full_cdf[-1] > 0:
+            self._full_cdf /= self._full_cdf[-1]
+
+        # Last resort when no position is valid: the world corner farthest from the center
+        # *Dernier recours quand aucune position n'est valide : le coin du monde le plus éloigné du centre*
+        corners = ((0, 0), (self.max_x, 0), (0, self.max_y), (self.max_x, self.max_y))
+        if center is None:
+            self.fallback = corners[0]
+        else:
+            self.fallback = max(corners, key=lambda corner: (corner[0] - center[0]) ** 2 + (corner[1] - center[1]) ** 2)
+
+    @property
+    def empty(self):
+        """True if no top-left position is outside the safe disk. / *True si aucune position haut-gauche n'est hors du disque de sécurité.*"""
+        return self._cdf.size == 0
+
+    def contains(self, x, y):
+        """
+        Tells if top-left position(s) are outside the safe disk (scalars or arrays).
+        *Indique si des positions haut-gauche sont hors du disque de sécurité (scalaires ou tableaux).*
+        """
+        if self.center is None:
+            return np.ones(np.shape(x), dtype=bool) if np.ndim(x) else True
+        return (x - self.center[0]) ** 2 + (y - self.center[1]) ** 2 > self.safe_radius_sq
+
+    def _draw(self, rng, count, cdf):
+        cells = np.minimum(np.searchsorted(cdf, rng.random(count), side='right'), cdf.size - 1)
+        x = rng.integers(self._x0[cells], self._x1[cells] + 1)
+        y = rng.integers(self._y0[cells], self._y1[cells] + 1)
+        return x, y, self._full[cells]
+
+    def sample(self, rng, count, max_rounds=config.SPAWN_MAX_ROUNDS):
+        """
+        Draws `count` valid top-left positions in batches.
+        Args:
+            rng (numpy.random.Generator): Source of the draws. / *Source des tirages.*
+            count (int): Number of positions. / *Nombre de positions.*
+            max_rounds (int): Batches drawn before falling back to the cells wholly outside the disk.
+                              *Lots tirés avant de se rabattre sur les cellules entièrement hors du disque.*
+        Returns:
+            tuple[numpy.ndarray, numpy.ndarray]: The x and y coordinates, as integers. / *Les coordonnées x et y, en entiers.*
+        """
+        xs, ys = [], []
+        remaining = count
+        if not self.empty:
+            for _ in range(max_rounds):
+                if remaining <= 0:
+                    break
+                # Slight oversampling covers the points rejected in edge cells
+                # *Un léger suréchantillonnage couvre les points rejetés dans les cellules de bord*
+                x, y, full = self._draw(rng, remaining + remaining // 4 + 4, self._cdf)
+                keep = full | self.contains(x, y)
+                x, y = x[keep][:remaining], y[keep][:remaining]
+                xs.append(x)
+                ys.append(y)
+                remaining -= x.size
+            if remaining > 0 and self._full.any(): # Every draw is valid there / *Tout tirage y est valide*
+                x, y, _ = self._draw(rng, remaining, self._full_cdf)
+                xs.append(x)
+                ys.append(y)
+                remaining = 0
+        if remaining > 0:
+            logging.debug(f"No room left to spawn {remaining} item(s), using {self.fallback} / Plus de place pour faire apparaître {remaining} objet(s), utilisation de {self.fallback}")
+            xs.append(np.full(remaining, self.fallback[0]))
+            ys.append(np.full(remaining, self.fallback[1]))
+        if not xs:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        return np.concatenate(xs).astype(np.int64), np.concatenate(ys).astype(np.int64)
+
+
+class SpawnPlacer:
+    """
+    Places items outside a safe radius around the player, one at a time or in waves, always terminating.
+    *Place des objets hors d'un rayon de sécurité autour du joueur, un à la fois ou par vagues, en se terminant toujours.*
+    """
+    def __init__(self, world_size, safe_radius, rng=random, bulk_rng=None, max_attempts=config.SPAWN_MAX_ATTEMPTS,
+                 bulk_threshold=config.SPAWN_BULK_THRESHOLD, cell_size=config.SPAWN_CELL_SIZE):
+        """
+        Args:
+            world_size (tuple[int, int]): The (width, height) of the game world. / *La (largeur, hauteur) du monde du jeu.*
+            safe_radius (float): Minimum distance between a new item's top-left corner and the player's center.
+                                 *Distance minimale entre le coin haut-gauche d'un nouvel objet et le centre du joueur.*
+            rng (random.Random, optional): Scalar source for small requests. / *Source unitaire pour les petites demandes.*
+            bulk_rng (numpy.random.Generator, optional): Batch source for waves and fallbacks.
+                                                         *Source par lots pour les vagues et les replis.*
+            max_attempts (int): Scalar draws per position before using the region. / *Tirages unitaires par position avant d'utiliser la région.*
+            bulk_threshold (int): Smallest request drawn in batches. / *Plus petite demande tirée par lots.*
+            cell_size (int): Side of the region grid cells. / *Côté des cellules de la grille de région.*
+        """
+        self.world_size = world_size
+        self.safe_radius = safe_radius
+        self.rng = rng
+        self.bulk_rng = bulk_rng if bulk_rng is not None else np.random.default_rng()
+        self.max_attempts = max_attempts
+        self.bulk_threshold = bulk_threshold
+        self.cell_size = cell_size
+        self._region = None
+        self._region_key = None
+        self.region_builds = 0
+
+    def region(self, item_size, center):
+        """
+        Returns the SpawnRegion for an item size and player center, rebuilt only when either changes.
+        *Retourne la SpawnRegion d'une taille d'objet et d'un centre du joueur, reconstruite seulement quand l'un change.*
+        """
+        key = (tuple(item_size), None if center is None else tuple(center))
+        if key != self._region_key:
+            self._region = SpawnRegion(self.world_size, item_size, center, self.safe_radius, self.cell_size)
+            self._region_key = key
+            self.region_builds += 1
+        return self._region
+
+    def place(self, item_size, center, count=1, min_spacing=0):
+        """
+        Returns `count` top-left positions for items of the given size.
+        Args:
+            item_size (tuple[int, int]): The (width, height) of the items. / *La (largeur, hauteur) des objets.*
+            center (tuple[int, int] or None): The player's center; no safe disk when None.
+                                              *Le centre du joueur ; pas de disque de sécurité si None.*
+            count (int): Number of positions. / *Nombre de positions.*
+            min_spacing (float): Minimum distance between the new positions, 0 for none. Positions that
+                                 cannot be spaced within the attempt budget are placed without spacing.
+                                 *Distance minimale entre les nouvelles positions, 0 pour aucune. Les positions*
+                                 *impossibles à espacer dans le budget de tentatives sont placées sans espacement.*
+        Returns:
+            list[tuple[int, int]]: The positions. / *Les positions.*
+        """
+        if count <= 0:
+            return []
+        if min_spacing > 0:
+            return self._place_spaced(item_size, center, count, min_spacing)
+        if count < self.bulk_threshold:
+            return [self._place_one(item_size, center) for _ in range(count)]
+        xs, ys = self.region(item_size, center).sample(self.bulk_rng, count)
+        return list(zip(xs.tolist(), ys.tolist()))
+
+    def _place_one(self, item_size, center):
+        # Plain rejection sampling, as cheap as it gets when most of the world is valid, but bounded
+        # *Échantillonnage par rejet simple, le moins coûteux quand la majeure partie du monde est valide, mais borné*
+        max_x = self.world_size[0] - item_size[0]
+        max_y = self.world_size[1] - item_size[1]
+        radius_sq = self.safe_radius ** 2
+        for _ in range(self.max_attempts):
+            x = self.rng.randint(0, max_x)
+            y = self.rng.randint(0, max_y)
+            if center is None or (x - center[0]) ** 2 + (y - center[1]) ** 2 > radius_sq:
+                return (x, y)
+        xs, ys = self.region(item_size, center).sample(self.bulk_rng, 1)
+        return (int(xs[0]), int(ys[0]))
+
+    def _place_spaced(self, item_size, center, count, min_spacing):
+        # Dart throwing on a grid of cells of side spacing/sqrt(2): one position at most per cell,
+        # so a candidate only has to be checked against the 5x5 cells around it
+        # *Lancer de fléchettes sur une grille de cellules de côté espacement/racine(2) : au plus une position*
+        # *par cellule, un candidat n'est donc comparé qu'aux 5x5 cellules qui l'entourent*
+        region = self.region(item_size, center)
+        cell = min_spacing / math.sqrt(2)
+        spacing_sq = min_spacing ** 2
+        taken = {}
+        positions = []
+        for _ in range(config.SPAWN_MAX_ROUNDS):
+            remaining = count - len(positions)
+            if remaining <= 0:
+                break
+            xs, ys = region.sample(self.bulk_rng, remaining * config.SPAWN_SPACING_CANDIDATES)
+            for x, y in zip(xs.tolist(), ys.tolist()):
+                col, row = int(x // cell), int(y // cell)
+                if _crowded(taken, x, y, col, row, spacing_sq):
+                    continue
+                taken[(col, row)] = (x, y)
+                positions.append((x, y))
+                if len(positions) == count:
+                    break
+        missing = count - len(positions)
+        if missing > 0: # The world is full at this spacing / *Le monde est plein à cet espacement*
+            logging.debug(f"{missing} spawn position(s) placed without spacing / {missing} position(s) d'apparition placée(s) sans espacement")
+            xs, ys = region.sample(self.bulk_rng, missing)
+            positions.extend(zip(xs.tolist(), ys.tolist()))
+        return positions
@@ -0,0 +1,248 @@
+# stress.py
+# This file defines the stress profile behind `main.py --stress`. The profile runs the real
+# game loop with large entity populations and no player input:
+# - StressProfile holds the entity counts, the auto-fire rate and the spawn cadence. They
+#   come from config.py and can be overridden on the command line.
+# - StressDriver fills the game state and then plays each tick: it fires bullets, sets off
+#   explosions, adds carrot waves and keeps the player alive.
+# - StressMonitor times frames and ticks. It logs a summary once per wall-clock second,
+#   with the frame time, the tick time, the live entity counts and, in GUI mode, the draws
+#   kept and culled by the viewport.
+# It works both in GUI mode and headless (with --cli), so scaling cliffs show up before the
+# players find them.
+#
+# *Ce fichier définit le profil de stress derrière `main.py --stress`. Le profil exécute la vraie*
+# *boucle de jeu avec de grandes populations d'entités et sans action du joueur :*
+# *- StressProfile contient le nombre d'entités, la cadence de tir automatique et le rythme*
+# *  d'apparition. Ils viennent de config.py et peuvent être remplacés en ligne de commande.*
+# *- StressDriver remplit l'état du jeu puis joue chaque tick : il tire des projectiles, déclenche*
+# *  des explosions, ajoute des vagues de carottes et garde le joueur en vie.*
+# *- StressMonitor chronomètre les frames et les ticks. Il journalise un résumé une fois par seconde*
+# *  réelle, avec le temps de frame, le temps de tick, le nombre d'entités vivantes et, en mode GUI,*
+# *  les dessins gardés et écartés par le viewport.*
+# *Il fonctionne en mode GUI comme sans affichage (avec --cli), afin que les seuils de montée en*
+# *charge apparaissent avant que les joueurs ne les trouvent.*
+
+import logging
+import math
+
+import config
+
+# Angle between two auto-fired bullets: the golden angle spreads them evenly over the circle
+# *Angle entre deux projectiles tirés automatiquement : l'angle d'or les répartit uniformément sur le cercle*
+_FIRE_STEP = math.pi * (3 - math.sqrt(5))
+_FIRE_DISTANCE = 500 # Distance of the aim point from the player / *Distance du point visé par rapport au joueur*
+_EXPLOSION_SPREAD = 600 # Half-side of the square around the player where explosions go off / *Demi-côté du carré autour du joueur où les explosions se déclenchent*
+
+
+class StressProfile:
+    """
+    Entity counts and cadences of a stress run.
+    *Nombre d'entités et cadences d'une exécution de stress.*
+    """
+    def __init__(self, carrots=config.STRESS_CARROTS, vampires=config.STRESS_VAMPIRES,
+                 fire_rate=config.STRESS_FIRE_RATE, explosion_rate=config.STRESS_EXPLOSION_RATE,
+                 wave_size=config.STRESS_WAVE_SIZE, wave_interval=config.STRESS_WAVE_INTERVAL,
+                 duration=config.STRESS_DURATION):
+        """
+        Args:
+            carrots (int): Carrots at the start. / *Carottes au départ.*
+            vampires (int): Vampires at the start. / *Vampires au départ.*
+            fire_rate (float): Bullets fired per second. / *Projectiles tirés par seconde.*
+            explosion_rate (float): Explosions per second. / *Explosions par seconde.*
+            wave_size (int): Carrots added by each wave, 0 for none. / *Carottes ajoutées par vague, 0 pour aucune.*
+            wave_interval (float): Seconds between waves. / *Secondes entre les vagues.*
+            duration (float): Game seconds to run, 0 for no limit. / *Secondes de jeu à exécuter, 0 pour aucune limite.*
+        """
+        if min(carrots, vampires, fire_rate, explosion_rate, wave_size, duration) < 0 or wave_interval <= 0:
+            raise ValueError("Stress profile values must be positive. / Les valeurs du profil de stress doivent être positives.")
+        self.carrots = carrots
+        self.vampires = vampires
+        self.fire_rate = fire_rate
+        self.explosion_rate = explosion_rate
+        self.wave_size = wave_size
+        self.wave_interval = wave_interval
+        self.duration = duration
+
+    @classmethod
+    def from_args(cls, args):
+        """
+        Builds the profile from the parsed `--stress-*` command-line options.
+        *Construit le profil à partir des options `--stress-*` analysées de la ligne de commande.*
+        """
+        return cls(args.stress_carrots, args.stress_vampires, args.stress_fire_rate, args.stress_explosion_rate,
+                   args.stress_wave_size, args.stress_wave_interval, args.stress_duration)
+
+    def __repr__(self):
+        return (f"StressProfile(carrots={self.carrots}, vampires={self.vampires}, fire_rate={self.fire_rate}, "
+                f"explosion_rate={self.explosion_rate}, wave_size={self.wave_size}, "
+                f"wave_interval={self.wave_interval}, duration={self.duration})")
+
+
+class StressDriver:
+    """
+    Populates a game state and plays the stress profile tick after tick, in place of the player.
+    *Peuple un état de jeu et joue le profil de stress tick après tick, à la place du joueur.*
+    """
+    def __init__(self, profile, game_state, bullet_image, explosion_image):
+        """
+        Args:
+            profile (StressProfile): What to spawn and how often. / *Quoi faire apparaître et à quelle fréquence.*
+            game_state (GameState): The game to drive. / *Le jeu à piloter.*
+            bullet_image: Image of the auto-fired bullets. / *Image des projectiles tirés automatiquement.*
+            explosion_image: Image of the explosions. / *Image des explosions.*
+        """
+        self.profile = profile
+        self.game_state = game_state
+        self.bullet_image = bullet_image
+        self.explosion_image = explosion_image
+        # Its own stream, so a seeded run replays without shifting the game's streams
+        # *Son propre flux, pour qu'une exécution avec graine se rejoue sans décaler les flux du jeu*
+        self.rng = game_state.rng.stream('stress')
+        self._start_time = None
+        self._last_time = None
+        self._fire_due = 0.0
+        self._explosions_due = 0.0
+        self._next_wave = None
+        self._fire_angle = 0.0
+
+    def populate(self):
+        """
+        Brings the carrot and vampire populations up to the profile's counts.
+        *Porte les populations de carottes et de vampires au nombre du profil.*
+        """
+        gs = self.game_state
+        missing = self.profile.carrots - len(gs.carrots)
+        if missing > 0:
+            gs.spawn_carrots(missing)
+        spawn_rng = gs.rng.stream('spawn')
+        for _ in range(self.profile.vampires - len(gs.vampires)):
+            gs.add_vampire(spawn_rng.randint(0, gs.world_size[0]), spawn_rng.randint(0, gs.world_size[1]))
+        self._start_time = None
+        self._last_time = None
+        self._next_wave = None
+        logging.info(f"Stress run / Exécution de stress : {self.profile}")
+
+    def step(self, current_time):
+        """
+        Plays the profile up to `current_time`: fires, explodes and spawns what is due. Call once before each tick.
+        *Joue le profil jusqu'à `current_time` : tire, fait exploser et fait apparaître ce qui est dû. À appeler avant chaque tick.*
+        """
+        gs = self.game_state
+        player = gs.player
+        # The player cannot lose a stress run; damage is still taken, so its code path is exercised
+        # *Le joueur ne peut pas perdre une exécution de stress ; les dégâts sont tout de même subis, leur code est donc exercé*
+        if player.health != player.max_health:
+            player.health = player.max_health
+            gs.hud.dirty = True # Keep the cached HUD in step / *Garder le HUD mis en cache à jour*
+        if self._last_time is None:
+            self._start_time = self._last_time = current_time
+            self._next_wave = current_time + self.profile.wave_interval
+            return
+        elapsed = max(0.0, current_time - self._last_time)
+        self._last_time = current_time
+        center_x, center_y = player.rect.center
+
+        self._fire_due += self.profile.fire_rate * elapsed
+        while self._fire_due >= 1.0:
+            self._fire_due -= 1.0
+            self._fire_angle += _FIRE_STEP
+            gs.add_bullet(center_x, center_y,
+                          center_x + math.cos(self._fire_angle) * _FIRE_DISTANCE,
+                          center_y + math.sin(self._fire_angle) * _FIRE_DISTANCE,
+                          self.bullet_image, current_time)
+
+        self._explosions_due += self.profile.explosion_rate * elapsed
+        while self._explosions_due >= 1.0:
+            self._explosions_due -= 1.0
+            gs.add_explosion(center_x + self.rng.randint(-_EXPLOSION_SPREAD, _EXPLOSION_SPREAD),
+                             center_y + self.rng.randint(-_EXPLOSION_SPREAD, _EXPLOSION_SPREAD),
+                             self.explosion_image)
+
+        if self.profile.wave_size and current_time >= self._next_wave:
+            self._next_wave += self.profile.wave_interval
+            gs.spawn_carrots(self.profile.wave_size)
+
+    def finished(self, current_time):
+        """True once the profile's duration has been played. / *True une fois la durée du profil jouée.*"""
+        return bool(self.profile.duration) and self._start_time is not None and \
+            current_time - self._start_time >= self.profile.duration
+
+
+class StressMonitor:
+    """
+    Times frames and ticks, and summarizes them once per window.
+    *Chronomètre les frames et les ticks, et les résume une fois par fenêtre.*
+    """
+    def __init__(self, window=1.0):
+        """
+        Args:
+            window (float): Wall-clock seconds between two summaries. / *Secondes réelles entre deux résumés.*
+        """
+        self.window = window
+        self.summaries = 0
+        self._window_start = None
+        self._frames = []
+        self._ticks = []
+        self._render = {}
+
+    def record_frame(self, seconds, render=None):
+        """
+        Args:
+            seconds (float): Wall-clock time spent on the frame. / *Temps réel passé sur la frame.*
+            render (dict, optional): Draw counts of the frame (see Viewport.stats() and RenderQueue.stats()); the latest ones are summarized.
+                                     *Nombre de dessins de la frame (voir Viewport.stats() et RenderQueue.stats()) ; les derniers sont résumés.*
+        """
+        self._frames.append(seconds)
+        if render is not None:
+            self._render = render
+
+    def record_tick(self, seconds):
+        self._ticks.append(seconds)
+
+    def poll(self, now, game_state, force=False):
+        """
+        Logs and returns a summary when a window has completed, else returns None.
+        Args:
+            now (float): Wall-clock time, e.g. time.perf_counter(). / *Temps réel, par ex. time.perf_counter().*
+            game_state (GameState): The game whose entities are counted. / *Le jeu dont les entités sont comptées.*
+            force (bool): Summarize the current partial window, e.g. at the end of a run.
+                          *Résumer la fenêtre partielle en cours, par ex. à la fin d'une exécution.*
+        Returns:
+            dict or None: Window length, frame and tick times (in ms), entity gauges, drop counters and
+                          the latest draw counts (see GameState.gauges(), GameState.drop_stats() and Viewport.stats()).
+                          *Durée de la fenêtre, temps de frame et de tick (en ms), jauges d'entités, compteurs*
+                          *d'abandons et derniers nombres de dessins (voir GameState.gauges(), GameState.drop_stats()*
+                          *et Viewport.stats()).*
+        """
+        if self._window_start is None:
+            self._window_start = now
+            return None
+        elapsed = now - self._window_start
+        if elapsed < self.window and not (force and self._ticks and elapsed > 0):
+            return None
+        summary = {
+            'seconds': elapsed,
+            'frames': len(self._frames),
+            'frame_ms': _mean_ms(self._frames),
+            'frame_max_ms': max(self._frames, default=0.0) * 1000,
+            'ticks': len(self._ticks),
+            'tick_ms': _mean_ms(self._ticks),
+            'tick_max_ms': max(self._ticks, default=0.0) * 1000,
+            'entities': game_state.gauges(),
+            'drops': game_state.drop_stats(),
+            'render': dict(self._render),
+        }
+        self._frames.clear()
+        self._ticks.clear()
+        self._window_start = now
+        self.summaries += 1
+        counts = ", ".join(f"{name} {count}" for name, count in {**summary['entities'], **summary['drops'], **summary['render']}.items())
+        logging.info(f"[stress] {summary['frames'] / elapsed:.1f} FPS, frame {summary['frame_ms']:.2f} ms "
+                     f"(max {summary['frame_max_ms']:.2f}), {summary['ticks'] / elapsed:.1f} TPS, "
+                     f"tick {summary['tick_ms']:.2f} ms (max {summary['tick_max_ms']:.2f}) | {counts}")
+        return summary
+
+
+def _mean_ms(samples):
+    return sum(samples) / len(samples) * 1000 if samples else 0.0
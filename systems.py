@@ -0,0 +1,112 @@
+# systems.py
+# This file defines the ECS systems run by GameState's update pipeline (see ecs.py).
+# Each system works on one cached query, so its cost grows with the number of entities that
+# have its components, not with the number of entity types in the game.
+# Component names used across the game:
+#   - 'facade':   the GameObject standing for the entity (rendering, collision layers, tests);
+#   - 'body':     its pygame.Rect, shared with the facade;
+#   - 'position': [x, y] floats, the sub-pixel top-left position;
+#   - 'velocity': (dx, dy) pixels per tick;
+#   - 'expires':  game time at which the entity is despawned;
+#   - 'collider': name of the CollisionWorld layer holding the facade;
+#   - 'pickup':   item type given to the player on contact ('hp', 'garlic'...).
+#
+# *Ce fichier définit les systèmes ECS exécutés par le pipeline de mise à jour de GameState (voir ecs.py).*
+# *Chaque système travaille sur une requête mise en cache, son coût croît donc avec le nombre d'entités*
+# *possédant ses composants, pas avec le nombre de types d'entités du jeu.*
+# *Noms de composants utilisés dans le jeu :*
+#   *- 'facade' : le GameObject représentant l'entité (affichage, couches de collision, tests) ;*
+#   *- 'body' : son pygame.Rect, partagé avec la façade ;*
+#   *- 'position' : [x, y] flottants, la position haut-gauche sub-pixel ;*
+#   *- 'velocity' : (dx, dy) pixels par tick ;*
+#   *- 'expires' : temps de jeu auquel l'entité est supprimée ;*
+#   *- 'collider' : nom de la couche de CollisionWorld contenant la façade ;*
+#   *- 'pickup' : type d'objet donné au joueur au contact ('hp', 'garlic'...).*
+
+
+class MovementSystem:
+    """
+    Moves every entity with a position and a velocity, and writes the result to its body.
+    *Déplace chaque entité ayant une position et une vélocité, et recopie le résultat dans son corps.*
+    """
+    def __init__(self, world):
+        self.query = world.query('position', 'velocity', 'body')
+
+    def run(self, current_time):
+        for _, position, velocity, body in self.query:
+            position[0] += velocity[0]
+            position[1] += velocity[1]
+            body.topleft = (position[0], position[1])
+
+
+class LifetimeSystem:
+    """
+    Despawns the entities whose 'expires' time has been reached.
+    *Supprime les entités dont le temps 'expires' est atteint.*
+    """
+    def __init__(self, world):
+        self.world = world
+        self.query = world.query('expires')
+        self.expired_count = 0  # Entities despawned since creation / *Entités supprimées depuis la création*
+
+    def run(self, current_time):
+        expired = [entity for entity, expires in self.query if expires <= current_time]
+        for entity in expired:
+            self.world.despawn(entity)
+        self.expired_count += len(expired)
+
+
+class CollisionSystem:
+    """
+    Keeps each collider's facade registered in its CollisionWorld layer, and removes it from
+    the layer when the entity is despawned.
+
+    *Maintient la façade de chaque collisionneur enregistrée dans sa couche de CollisionWorld, et l'en*
+    *retire quand l'entité est supprimée.*
+    """
+    def __init__(self, world, collision_world):
+        self.collision_world = collision_world
+        self.query = world.query('facade', 'collider')
+        world.despawn_hooks.append(self._on_despawn)
+
+    def run(self, current_time):
+        collision_world = self.collision_world
+        for _, facade, layer in self.query:
+            if facade.active:
+                collision_world.move(layer, facade)
+            else:
+                collision_world.remove(layer, facade)
+
+    def _on_despawn(self, entity, components):
+        layer = components.get('collider')
+        if layer is not None:
+            self.collision_world.remove(layer, components['facade'])
+
+
+class PickupSystem:
+    """
+    Offers the pickups touching a collector's rectangle to a callback, and despawns the ones it accepts.
+    *Propose à une fonction de rappel les objets touchant le rectangle d'un collecteur, et supprime ceux qu'elle accepte.*
+    """
+    def __init__(self, world, collision_world, layer, on_pickup):
+        """
+        Args:
+            layer (str): Collision layer holding the pickups. / *Couche de collision contenant les objets.*
+            on_pickup (callable): Called with (facade, item type); returns True if the item was taken.
+                                  *Appelée avec (façade, type d'objet) ; retourne True si l'objet a été pris.*
+        """
+        self.world = world
+        self.collision_world = collision_world
+        self.layer = layer
+        self.on_pickup = on_pickup
+        self.collected_count = 0
+
+    def run(self, collector_rect):
+        world = self.world
+        for facade in self.collision_world.query(self.layer, collector_rect):
+            entity = facade.entity
+            if not facade.active or entity is None or not world.has(entity, 'pickup'):
+                continue
+            if self.on_pickup(facade, world.get(entity, 'pickup')):
+                world.despawn(entity)
+                self.collected_count += 1
@@ -1,7 +1,7 @@
 import pytest
 from unittest.mock import patch, MagicMock, DEFAULT as MOCK_DEFAULT # Import DEFAULT
 import pygame # Needed for pygame.Surface, pygame.error, pygame.font, pygame.mixer types
-from asset_manager import AssetManager, DummySound # The class we're testing and DummySound
+from asset_manager import AssetManager, DummySound, RotationAtlas, SpriteVariantCache # The class we're testing and DummySound
 from config import DEFAULT_PLACEHOLDER_SIZE as REAL_DEFAULT_PLACEHOLDER_SIZE # Import for type hint or comparison
 from config import IMAGE_ASSET_CONFIG as REAL_IMAGE_ASSET_CONFIG, SOUND_ASSET_CONFIG as REAL_SOUND_ASSET_CONFIG # To see its structure
 
@@ -271,3 +271,76 @@ class TestAssetManagerFontInitialization:
         assert asset_manager_instance.placeholder_font is None
         expected_warning = "Pygame font module not available. Placeholders will not have text."
         assert expected_warning in caplog.text
+
+
+class TestRotationAtlas:
+    @pytest.fixture
+    def arrow(self):
+        pygame.init()
+        surface = pygame.Surface((20, 10))
+        surface.fill((255, 0, 0))
+        return surface
+
+    def test_frames_are_rendered_once_per_image(self, arrow):
+        atlas = RotationAtlas(step=10)
+        frames = atlas.frames(arrow)
+        assert len(frames) == 36
+        assert atlas.frames(arrow) is frames
+        assert atlas.stats()['images'] == 1 and atlas.stats()['frames'] == 36
+
+    def test_frame_is_the_closest_quantized_angle(self, arrow):
+        atlas = RotationAtlas(step=10)
+        frames = atlas.frames(arrow)
+        assert atlas.frame(arrow, 4) is frames[0]
+        assert atlas.frame(arrow, 86) is frames[9]
+        assert atlas.frame(arrow, -90) is frames[27]
+        assert atlas.frame(arrow, 358) is frames[0]
+
+    def test_offsets_keep_the_rotation_centered(self, arrow):
+        surface, offset = RotationAtlas(step=10).frame(arrow, 90)
+        assert surface.get_size() == (10, 20)
+        assert offset == (5, -5)
+
+    def test_prewarm_skips_images_that_cannot_rotate(self, arrow):
+        atlas = RotationAtlas()
+        atlas.prewarm([arrow, MagicMock()])
+        assert atlas.stats()['images'] == 1
+        assert atlas.stats()['bytes'] > 0
+
+
+class TestSpriteVariantCache:
+    @pytest.fixture
+    def sprite(self):
+        pygame.init()
+        surface = pygame.Surface((20, 10), pygame.SRCALPHA)
+        surface.fill((200, 100, 50, 255))
+        surface.fill((255, 255, 255, 255), pygame.Rect(0, 0, 5, 10)) # White left edge / *Bord gauche blanc*
+        return surface
+
+    def test_variants_are_made_once(self, sprite):
+        cache = SpriteVariantCache()
+        flipped = cache.get(sprite, flip_x=True)
+        assert cache.get(sprite, flip_x=True) is flipped
+        assert cache.get(sprite) is sprite
+        assert cache.stats() == {'variants': 1, 'bytes': 20 * 10 * 4, 'hits': 1, 'misses': 1, 'evictions': 0}
+
+    def test_flip_tint_and_scale(self, sprite):
+        cache = SpriteVariantCache()
+        assert cache.get(sprite, flip_x=True).get_at((19, 0)) == (255, 255, 255, 255)
+        assert cache.get(sprite, tint=(255, 0, 0, 128)).get_at((10, 5)) == (200, 0, 0, 128)
+        assert sprite.get_at((10, 5)) == (200, 100, 50, 255) # The source is untouched / *La source est intacte*
+        assert cache.get(sprite, scale=0.5).get_size() == (10, 5)
+        both = cache.get(sprite, flip_x=True, scale=0.5)
+        assert both.get_size() == (10, 5) and both.get_at((9, 0)) == (255, 255, 255, 255)
+        assert cache.stats()['variants'] == 4
+
+    def test_least_recently_used_variants_are_evicted(self, sprite):
+        cache = SpriteVariantCache(max_bytes=2 * 20 * 10 * 4)
+        flipped = cache.get(sprite, flip_x=True)
+        cache.get(sprite, flip_y=True)
+        cache.get(sprite, flip_x=True) # Used again, so kept / *Réutilisée, donc gardée*
+        cache.get(sprite, tint=(0, 255, 0, 255))
+        assert cache.stats()['evictions'] == 1
+        assert cache.stats()['bytes'] <= cache.max_bytes
+        assert cache.get(sprite, flip_x=True) is flipped
+        assert cache.stats()['misses'] == 3
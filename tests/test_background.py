@@ -0,0 +1,58 @@
+import pygame
+import pytest
+
+from background import TiledBackground
+from .test_utils import mock_pygame_init_and_display, real_surface_factory, initialized_pygame
+
+WORLD = (300, 200)
+
+
+@pytest.fixture
+def tile():
+    # Four colored quadrants, so a misplaced tile shows up / *Quatre quarts colorés, pour qu'une tuile mal placée se voie*
+    surface = pygame.Surface((40, 30))
+    surface.fill((200, 0, 0))
+    surface.fill((0, 200, 0), pygame.Rect(20, 0, 20, 15))
+    surface.fill((0, 0, 200), pygame.Rect(0, 15, 20, 15))
+    surface.fill((200, 200, 0), pygame.Rect(20, 15, 20, 15))
+    return surface
+
+
+def _pre_tiled(tile, scroll, screen_size):
+    # The old renderer: the tile repeated over a world-sized surface / *L'ancien rendu : la tuile répétée sur une surface de la taille du monde*
+    world = pygame.Surface(WORLD)
+    for x in range(0, WORLD[0], tile.get_width()):
+        for y in range(0, WORLD[1], tile.get_height()):
+            world.blit(tile, (x, y))
+    screen = pygame.Surface(screen_size)
+    screen.blit(world, (-scroll[0], -scroll[1]))
+    return screen
+
+
+class TestTiledBackground:
+    @pytest.mark.parametrize("scroll", [(0, 0), (17, 43), (139, 101), (250, 150)])
+    def test_matches_the_pre_tiled_world(self, tile, scroll):
+        screen = pygame.Surface((120, 90))
+        background = TiledBackground(tile, WORLD)
+        background.draw(screen, scroll)
+        expected = _pre_tiled(tile, scroll, (120, 90))
+        assert pygame.image.tobytes(screen, 'RGB') == pygame.image.tobytes(expected, 'RGB')
+
+    def test_only_visible_tiles_are_blitted(self, tile):
+        background = TiledBackground(tile, (4000, 4000))
+        assert background.draw(pygame.Surface((120, 90)), (17, 43)) == 4 * 4
+        assert background.draw(pygame.Surface((120, 90)), (0, 0)) == 3 * 3
+
+    def test_screen_outside_the_world_is_left_alone_and_clip_restored(self, tile):
+        screen = pygame.Surface((400, 250))
+        screen.set_clip(pygame.Rect(0, 0, 390, 250))
+        TiledBackground(tile, WORLD).draw(screen, (0, 0))
+        assert screen.get_at((350, 100))[:3] == (0, 0, 0)
+        assert screen.get_at((299, 199))[:3] != (0, 0, 0)
+        assert screen.get_clip() == pygame.Rect(0, 0, 390, 250)
+
+    def test_empty_tile_fills_the_world(self):
+        screen = pygame.Surface((120, 90))
+        background = TiledBackground(pygame.Surface((0, 0)), WORLD)
+        assert background.draw(screen, (0, 0)) == 0
+        assert screen.get_at((60, 45))[:3] == background.fill_color
@@ -0,0 +1,175 @@
+import pytest
+import pygame
+
+from bullet_store import BulletStore
+from collision import SpatialHash
+from entity_pool import EntityPool
+from game_entities import Bullet
+import config
+from .test_utils import mock_pygame_init_and_display, real_surface_factory, initialized_pygame
+
+
+@pytest.fixture
+def bullet_image(real_surface_factory):
+    return real_surface_factory(10, 10)
+
+
+def _bullet(image, x, y, target_x=None, target_y=None):
+    return Bullet(x, y, x + 100 if target_x is None else target_x, y if target_y is None else target_y, image)
+
+
+class _Box:
+    def __init__(self, x, y, w=20, h=20):
+        self.rect = pygame.Rect(x, y, w, h)
+
+
+class TestBulletStore:
+    def test_add_binds_facade(self, bullet_image):
+        store = BulletStore()
+        bullet = store.add(_bullet(bullet_image, 10, 20))
+        assert len(store) == 1
+        assert bullet.rect == pygame.Rect(10, 20, 10, 10)
+        assert store.vx[0] == pytest.approx(config.BULLET_SPEED)
+
+    def test_grows_past_initial_capacity(self, bullet_image):
+        store = BulletStore(capacity=2)
+        for i in range(5):
+            store.add(_bullet(bullet_image, i, 0))
+        assert store.capacity >= 5
+        assert [bullet.rect.x for bullet in store] == [0, 1, 2, 3, 4]
+
+    def test_swap_remove_moves_last_into_slot(self, bullet_image):
+        store = BulletStore()
+        first, middle, last = (store.add(_bullet(bullet_image, x, 0)) for x in (0, 50, 100))
+        store.remove(first)
+        assert store.bullets == [last, middle]
+        assert last._slot == 0
+        assert last.rect.x == 100
+        assert first._store is None
+        assert first.rect.x == 0
+
+    def test_remove_slots_handles_last_slot(self, bullet_image):
+        store = BulletStore()
+        bullets = [store.add(_bullet(bullet_image, x, 0)) for x in range(6)]
+        store.remove_slots([1, 5, 3])
+        assert sorted(bullet.rect.x for bullet in store) == [0, 2, 4]
+        assert all(store.bullets[slot]._slot == slot for slot in range(len(store)))
+        assert bullets[5]._store is None
+
+    def test_integration_keeps_sub_pixel_precision(self, bullet_image):
+        store = BulletStore()
+        # Mostly-horizontal shot: vy is a small fraction of a pixel per tick
+        # *Tir presque horizontal : vy est une petite fraction de pixel par tick*
+        bullet = store.add(_bullet(bullet_image, 100, 100, 1100, 150))
+        for _ in range(10):
+            store.integrate()
+        assert store.y[0] == pytest.approx(100 + 10 * bullet.velocity[1])
+        assert bullet.rect.y == 100 + int(10 * bullet.velocity[1])
+        assert bullet.rect.y > 100
+
+    def test_per_object_update_keeps_sub_pixel_precision(self, bullet_image):
+        bullet = _bullet(bullet_image, 100, 100, 1100, 150)
+        for _ in range(10):
+            bullet.update()
+        assert bullet.rect.y > 100
+
+    def test_cull_outside(self, bullet_image):
+        store = BulletStore()
+        inside = store.add(_bullet(bullet_image, 500, 500))
+        store.add(_bullet(bullet_image, -11, 500))
+        store.add(_bullet(bullet_image, 500, config.WORLD_SIZE[1] + 1))
+        store.add(_bullet(bullet_image, -10, 500)) # Right edge still at 0 / *Bord droit encore à 0*
+        assert store.cull_outside(config.WORLD_SIZE) == 2
+        assert inside in store.bullets and len(store) == 2
+
+    def test_slots_near_filters_on_occupied_cells(self, bullet_image):
+        store = BulletStore()
+        layer = SpatialHash(config.WORLD_SIZE, 100)
+        layer.update(_Box(250, 250))
+        store.add(_bullet(bullet_image, 10, 10))
+        store.add(_bullet(bullet_image, 295, 270)) # Spans cells (2,2) and (3,2)
+        store.add(_bullet(bullet_image, 195, 210)) # Spans cells (1,2) and (2,2)
+        store.add(_bullet(bullet_image, 3000, 3000))
+        assert store.slots_near(layer) == [1, 2]
+
+    def test_slots_near_empty_layer(self, bullet_image):
+        store = BulletStore()
+        store.add(_bullet(bullet_image, 10, 10))
+        assert store.slots_near(SpatialHash(config.WORLD_SIZE, 100)) == []
+
+    def test_clear_unbinds(self, bullet_image):
+        store = BulletStore()
+        bullet = store.add(_bullet(bullet_image, 10, 10))
+        store.integrate()
+        store.clear()
+        assert len(store) == 0 and store.bullets == []
+        assert bullet._store is None
+        assert bullet.rect.x == 10 + config.BULLET_SPEED
+
+    def test_clear_keeps_bullets_added_again_out_of_the_pool(self, bullet_image):
+        pool = EntityPool(Bullet)
+        store = BulletStore(pool=pool)
+        kept, dropped = store.add(_bullet(bullet_image, 10, 10)), store.add(_bullet(bullet_image, 20, 20))
+        store.clear(keep=[kept])
+        assert pool.free_count == 1
+        assert pool.acquire(0, 0, 1, 0, bullet_image) is dropped
+
+    def test_rect_writes_reach_the_store(self, bullet_image):
+        store = BulletStore()
+        bullet = store.add(_bullet(bullet_image, 10, 20))
+        bullet.rect.right = -1
+        assert bullet.rect.topleft == (-11, 20) and store.x[0] == -11
+        rect = bullet.rect
+        rect.x += 5
+        rect.move_ip(0, 7)
+        assert (store.x[0], store.y[0]) == (-6, 27)
+        moved = bullet.rect.move(100, 0) # A copy, detached from the store / *Une copie, détachée du stockage*
+        moved.x = 500
+        assert bullet.rect.x == -6
+
+    def test_positions_are_read_only_views(self, bullet_image):
+        store = BulletStore()
+        store.add(_bullet(bullet_image, 10, 20))
+        xs, ys = store.positions()
+        assert xs.tolist() == [10.0] and ys.tolist() == [20.0]
+        with pytest.raises(ValueError):
+            xs[0] = 5
+        store.integrate()
+        assert store.positions()[0][0] == 10 + config.BULLET_SPEED
+
+    def test_cull_spent_removes_expired_bullets(self, bullet_image):
+        store = BulletStore()
+        store.add(_bullet(bullet_image, 10, 10), expires=5.0)
+        lasting = store.add(_bullet(bullet_image, 20, 20), expires=9.0)
+        forever = store.add(_bullet(bullet_image, 30, 30))
+        assert store.cull_spent(4.9) == 0
+        assert store.cull_spent(5.0) == 1
+        assert store.bullets == [forever, lasting] # The last slot moved into the freed one / *La dernière case a pris la place libérée*
+
+    def test_cull_spent_removes_bullets_past_their_range(self, bullet_image):
+        store = BulletStore()
+        first = store.add(_bullet(bullet_image, 100, 100))
+        for _ in range(25):
+            store.integrate()
+        late = store.add(_bullet(bullet_image, 500, 500))
+        store.integrate()
+        # first flew 26 ticks, late only one / *first a volé 26 ticks, late un seul*
+        assert store.cull_spent(0.0, max_range=config.BULLET_SPEED * 20) == 1
+        assert store.bullets == [late]
+        assert first._store is None
+
+    def test_swap_remove_keeps_start_and_expiry(self, bullet_image):
+        store = BulletStore()
+        first = store.add(_bullet(bullet_image, 0, 0), expires=1.0)
+        store.add(_bullet(bullet_image, 300, 0), expires=7.0)
+        store.remove(first)
+        assert store.x0[0] == 300 and store.expires[0] == 7.0
+
+    def test_farthest_slot(self, bullet_image):
+        store = BulletStore()
+        assert store.farthest_slot(0, 0) is None
+        store.add(_bullet(bullet_image, 10, 10))
+        store.add(_bullet(bullet_image, -400, 0))
+        store.add(_bullet(bullet_image, 300, 0))
+        assert store.farthest_slot(0, 0) == 1
+        assert store.farthest_slot(-400, 0) == 2
@@ -0,0 +1,122 @@
+import pytest
+from unittest.mock import patch
+import numpy as np
+import pygame
+
+from carrot_population import CarrotPopulation
+from collision import CollisionWorld
+from game_entities import Carrot
+from config import WORLD_SIZE
+from .test_utils import mock_pygame_init_and_display, real_surface_factory, initialized_pygame
+
+
+@pytest.fixture
+def carrot_image(real_surface_factory):
+    return real_surface_factory(20, 20)
+
+
+def _make_carrots(image, positions):
+    carrots = []
+    for i, (x, y) in enumerate(positions):
+        carrot = Carrot(x, y, image)
+        angle = i * 0.7
+        carrot.direction = pygame.math.Vector2(np.cos(angle), np.sin(angle))
+        carrots.append(carrot)
+    return carrots
+
+
+# Far wanderers, carrots in the chase ring, carrots in the flee radius and some against the world edges
+# *Errantes lointaines, carottes dans l'anneau de poursuite, dans le rayon de fuite et contre les bords du monde*
+POSITIONS = [(100 + 37 * i, 300 + 91 * i) for i in range(30)] + \
+            [(2000 + dx, 2000 + dy) for dx, dy in ((150, 0), (-120, 60), (0, -170), (90, 90))] + \
+            [(2000 + dx, 2000 + dy) for dx, dy in ((30, 10), (-40, 0), (0, 0), (10, -60))] + \
+            [(0, 0), (WORLD_SIZE[0] - 20, 500), (700, WORLD_SIZE[1] - 20)]
+
+
+class TestCarrotPopulationBinding:
+    def test_bind_moves_state_into_arrays(self, carrot_image):
+        carrots = _make_carrots(carrot_image, [(10, 20), (30, 40)])
+        carrots[1].active = False
+        carrots[1].respawn_timer = 12.5
+        population = CarrotPopulation()
+        population.bind(carrots)
+        assert population.x.tolist() == [10, 30]
+        assert population.active.tolist() == [True, False]
+        assert carrots[1].respawn_timer == 12.5
+        carrots[0].active = False
+        assert population.active[0] == False
+
+    def test_facade_direction_round_trips(self, carrot_image):
+        carrots = _make_carrots(carrot_image, [(10, 20)])
+        population = CarrotPopulation()
+        population.bind(carrots)
+        carrots[0].direction = pygame.math.Vector2(0, -1)
+        assert (population.dir_x[0], population.dir_y[0]) == (0, -1)
+        assert carrots[0].direction == pygame.math.Vector2(0, -1)
+
+    def test_rebinding_restores_plain_attributes(self, carrot_image):
+        carrots = _make_carrots(carrot_image, [(10, 20)])
+        population = CarrotPopulation()
+        population.bind(carrots)
+        carrots[0].active = False
+        population.bind([])
+        assert carrots[0]._population is None
+        assert carrots[0].active is False
+
+    def test_sync_rebinds_only_on_list_change(self, carrot_image):
+        carrots = _make_carrots(carrot_image, [(10, 20)])
+        population = CarrotPopulation()
+        population.sync(carrots)
+        with patch.object(population, 'bind') as mock_bind:
+            population.sync(carrots)
+            mock_bind.assert_not_called()
+            carrots.append(Carrot(50, 50, carrot_image))
+            population.sync(carrots)
+            mock_bind.assert_called_once_with(carrots)
+
+
+class TestCarrotPopulationStep:
+    def test_matches_per_object_update_on_seeded_run(self, carrot_image):
+        per_object = _make_carrots(carrot_image, POSITIONS)
+        batched = _make_carrots(carrot_image, POSITIONS)
+        population = CarrotPopulation(rng=np.random.default_rng(1234))
+        population.bind(batched)
+
+        # The per-object path draws its wander jitter from an identically seeded generator
+        # *Le chemin par objet tire son aléa d'errance d'un générateur initialisé à l'identique*
+        reference_rng = np.random.default_rng(1234)
+        player_rect = pygame.Rect(2000, 2000, 32, 32)
+        with patch('random.uniform', side_effect=lambda a, b: reference_rng.uniform(a, b)):
+            for tick in range(200):
+                player_rect.x += 3 if (tick // 50) % 2 == 0 else -4
+                for carrot in per_object:
+                    carrot.update(player_rect, WORLD_SIZE)
+                population.step(player_rect, WORLD_SIZE)
+
+        for expected, actual in zip(per_object, batched):
+            assert actual.rect.topleft == expected.rect.topleft
+            assert actual.direction.x == pytest.approx(expected.direction.x, abs=1e-12)
+            assert actual.direction.y == pytest.approx(expected.direction.y, abs=1e-12)
+
+    def test_inactive_carrots_do_not_move(self, carrot_image):
+        carrots = _make_carrots(carrot_image, [(500, 500)])
+        carrots[0].active = False
+        population = CarrotPopulation()
+        population.bind(carrots)
+        population.step(pygame.Rect(0, 0, 32, 32), WORLD_SIZE)
+        assert carrots[0].rect.topleft == (500, 500)
+
+    def test_keeps_collision_layer_in_sync(self, carrot_image):
+        world = CollisionWorld(WORLD_SIZE, 64)
+        layer = world.layer('carrots')
+        carrots = _make_carrots(carrot_image, [(60, 10)])
+        carrots[0].direction = pygame.math.Vector2(1, 0)
+        population = CarrotPopulation(layer, rng=np.random.default_rng(0))
+        population.bind(carrots)
+        assert layer.candidates(pygame.Rect(10, 10, 5, 5)) == [carrots[0]]
+        for _ in range(40):
+            population.step(pygame.Rect(3000, 3000, 32, 32), WORLD_SIZE)
+        assert layer.candidates(carrots[0].rect) == [carrots[0]]
+        assert layer.candidates(pygame.Rect(10, 10, 5, 5)) == []
+        carrots[0].active = False
+        assert carrots[0] not in layer
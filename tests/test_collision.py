@@ -0,0 +1,127 @@
+import pytest
+import pygame
+
+from collision import SpatialHash, CollisionWorld
+from game_state import GameState
+from game_entities import Carrot
+import config
+from .test_utils import mock_asset_manager, mock_pygame_init_and_display
+
+
+class _Box:
+    """Minimal entity: anything with a rect can live in the collision world."""
+    def __init__(self, x, y, w=20, h=20):
+        self.rect = pygame.Rect(x, y, w, h)
+
+
+class TestSpatialHash:
+    def test_grid_covers_world(self):
+        spatial_hash = SpatialHash((1000, 500), 128)
+        assert spatial_hash.cols == 8
+        assert spatial_hash.rows == 4
+
+    def test_candidates_only_from_shared_cells(self):
+        spatial_hash = SpatialHash((1000, 1000), 100)
+        near = _Box(10, 10)
+        far = _Box(900, 900)
+        spatial_hash.update(near)
+        spatial_hash.update(far)
+        assert spatial_hash.candidates(pygame.Rect(0, 0, 30, 30)) == [near]
+
+    def test_entity_spanning_cells_is_found_from_each_and_not_duplicated(self):
+        spatial_hash = SpatialHash((1000, 1000), 100)
+        box = _Box(90, 90, 20, 20) # Spans 4 cells
+        spatial_hash.update(box)
+        assert spatial_hash.candidates(pygame.Rect(105, 105, 2, 2)) == [box]
+        assert spatial_hash.candidates(pygame.Rect(0, 0, 200, 200)) == [box]
+
+    def test_update_rebuckets_moved_entity(self):
+        spatial_hash = SpatialHash((1000, 1000), 100)
+        box = _Box(10, 10)
+        spatial_hash.update(box)
+        box.rect.topleft = (510, 510)
+        spatial_hash.update(box)
+        assert spatial_hash.candidates(pygame.Rect(0, 0, 30, 30)) == []
+        assert spatial_hash.candidates(pygame.Rect(500, 500, 30, 30)) == [box]
+
+    def test_out_of_world_rect_is_clamped_to_edge_cells(self):
+        spatial_hash = SpatialHash((1000, 1000), 100)
+        box = _Box(-50, -50)
+        spatial_hash.update(box)
+        assert spatial_hash.candidates(pygame.Rect(0, 0, 5, 5)) == [box]
+
+    def test_remove_and_clear(self):
+        spatial_hash = SpatialHash((1000, 1000), 100)
+        a, b = _Box(10, 10), _Box(15, 15)
+        spatial_hash.update(a)
+        spatial_hash.update(b)
+        spatial_hash.remove(a)
+        spatial_hash.remove(a) # Removing twice is harmless
+        assert a not in spatial_hash and b in spatial_hash
+        spatial_hash.clear()
+        assert len(spatial_hash) == 0
+        assert list(spatial_hash.occupied_cells()) == []
+
+
+class TestCollisionWorld:
+    def test_query_filters_with_narrowphase_and_counts_pairs(self):
+        world = CollisionWorld((1000, 1000), 100)
+        touching = _Box(10, 10)
+        same_cell_apart = _Box(70, 70, 10, 10)
+        world.move('carrots', touching)
+        world.move('carrots', same_cell_apart)
+        hits = world.query('carrots', pygame.Rect(0, 0, 15, 15))
+        assert hits == [touching]
+        assert world.pair_tests == 2
+
+    def test_first_hit_stops_early(self):
+        world = CollisionWorld((1000, 1000), 100)
+        first, second = _Box(10, 10), _Box(12, 12)
+        world.move('carrots', first)
+        world.move('carrots', second)
+        assert world.first_hit('carrots', pygame.Rect(11, 11, 2, 2)) is first
+        assert world.pair_tests == 1
+
+    def test_begin_frame_resets_counter(self):
+        world = CollisionWorld((1000, 1000), 100)
+        world.move('items', _Box(10, 10))
+        world.query('items', pygame.Rect(0, 0, 50, 50))
+        world.begin_frame()
+        assert world.last_frame_pair_tests == 1
+        assert world.pair_tests == 0
+
+    def test_layers_are_independent(self):
+        world = CollisionWorld((1000, 1000), 100)
+        world.move('items', _Box(10, 10))
+        assert world.query('carrots', pygame.Rect(0, 0, 50, 50)) == []
+
+
+class TestGameStateCollisionScaling:
+    def _populate(self, gs, mock_asset_manager, count):
+        gs.carrots = []
+        gs.vampire.active = False
+        gs.vampire.respawn_timer = 10.0
+        carrot_image = mock_asset_manager.images['carrot']
+        bullet_image = mock_asset_manager.images['bullet']
+        # Spread carrots over the world on a grid, each with a bullet flying away from it in the same cell
+        # *Répartir les carottes sur une grille, chacune avec un projectile s'en éloignant dans la même cellule*
+        side = int(count ** 0.5) + 1
+        step = config.WORLD_SIZE[0] // (side + 1)
+        for i in range(count):
+            x = (i % side + 1) * step
+            y = (i // side + 1) * step
+            gs.carrots.append(Carrot(x, y, carrot_image))
+            gs.add_bullet(x + 40, y, x + 100, y, bullet_image)
+
+    def test_pair_tests_scale_linearly(self, mock_asset_manager):
+        pair_tests = []
+        for count in (100, 400):
+            gs = GameState(mock_asset_manager)
+            self._populate(gs, mock_asset_manager, count)
+            gs.update(10.0)
+            pair_tests.append(gs.collision_world.pair_tests)
+        # A brute-force scan would grow 16x (n^2) for 4x more entities
+        # *Un parcours exhaustif croîtrait de 16x (n^2) pour 4x plus d'entités*
+        assert pair_tests[0] > 0
+        assert pair_tests[1] <= pair_tests[0] * 6
+        assert pair_tests[1] < 400 * 400 // 10
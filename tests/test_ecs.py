@@ -0,0 +1,127 @@
+import pytest
+import pygame
+
+from collision import CollisionWorld
+from ecs import World
+from game_state import GameState
+from systems import CollisionSystem, LifetimeSystem, MovementSystem, PickupSystem
+from .test_utils import mock_asset_manager, mock_pygame_init_and_display, real_surface_factory, initialized_pygame
+
+
+class _Facade:
+    def __init__(self, rect):
+        self.rect = rect
+        self.active = True
+        self.entity = None
+
+
+class TestWorld:
+    def test_entities_are_grouped_by_component_set(self):
+        world = World()
+        a = world.spawn(position=[0, 0], velocity=(1, 0))
+        b = world.spawn(position=[5, 5])
+        c = world.spawn(position=[9, 9], velocity=(0, 1))
+        assert len(world) == 3
+        assert sorted(entity for entity, _ in world.query('position')) == sorted([a, b, c])
+        assert sorted(entity for entity, _, _ in world.query('position', 'velocity')) == sorted([a, c])
+        assert world.get(b, 'velocity') is None
+
+    def test_queries_are_cached_and_see_new_archetypes(self):
+        world = World()
+        query = world.query('expires')
+        assert world.query('expires') is query
+        assert len(query) == 0
+        entity = world.spawn(expires=3.0, pickup='hp')
+        assert list(query) == [(entity, 3.0)]
+
+    def test_despawn_keeps_other_rows_addressable(self):
+        world = World()
+        entities = [world.spawn(value=i) for i in range(5)]
+        world.despawn(entities[1])
+        world.despawn(entities[1]) # Unknown entities are ignored / *Les entités inconnues sont ignorées*
+        assert entities[1] not in world
+        assert [world.get(entity, 'value') for entity in entities if entity in world] == [0, 2, 3, 4]
+
+    def test_adding_and_removing_components_moves_the_entity(self):
+        world = World()
+        entity = world.spawn(position=[0, 0])
+        other = world.spawn(position=[1, 1])
+        world.add_component(entity, 'velocity', (2, 0))
+        assert world.has(entity, 'velocity')
+        assert len(world.query('position', 'velocity')) == 1
+        assert world.get(other, 'position') == [1, 1]
+        world.remove_component(entity, 'velocity')
+        assert world.components(entity) == {'position': [0, 0]}
+        assert len(world.query('position', 'velocity')) == 0
+
+    def test_despawn_hooks_and_clear(self):
+        world = World()
+        despawned = []
+        world.despawn_hooks.append(lambda entity, components: despawned.append(components['value']))
+        for i in range(3):
+            world.spawn(value=i)
+        world.clear()
+        assert sorted(despawned) == [0, 1, 2]
+        assert len(world) == 0
+
+
+class TestSystems:
+    def test_movement_keeps_sub_pixel_positions(self):
+        world = World()
+        body = pygame.Rect(0, 0, 4, 4)
+        world.spawn(position=[0.0, 0.0], velocity=(0.5, 0.25), body=body)
+        movement = MovementSystem(world)
+        for _ in range(4):
+            movement.run(0.0)
+        assert body.topleft == (2, 1)
+
+    def test_lifetime_despawns_expired_entities(self):
+        world = World()
+        short = world.spawn(expires=1.0)
+        long = world.spawn(expires=5.0)
+        lifetime = LifetimeSystem(world)
+        lifetime.run(1.0)
+        assert short not in world and long in world
+        assert lifetime.expired_count == 1
+
+    def test_collision_and_pickup(self):
+        world = World()
+        collision_world = CollisionWorld((1000, 1000), 100)
+        taken = []
+        pickups = PickupSystem(world, collision_world, 'items', lambda facade, kind: taken.append(kind) or kind == 'hp')
+        collision = CollisionSystem(world, collision_world)
+        hp = _Facade(pygame.Rect(10, 10, 8, 8))
+        garlic = _Facade(pygame.Rect(12, 12, 8, 8))
+        for facade, kind in ((hp, 'hp'), (garlic, 'garlic')):
+            facade.entity = world.spawn(facade=facade, body=facade.rect, collider='items', pickup=kind)
+        collision.run(0.0)
+        assert len(collision_world.layer('items')) == 2
+
+        pickups.run(pygame.Rect(0, 0, 30, 30))
+        assert sorted(taken) == ['garlic', 'hp']
+        assert hp.entity not in world # Accepted pickups are despawned / *Les objets acceptés sont supprimés*
+        assert garlic.entity in world
+        assert hp not in collision_world.layer('items')
+        assert pickups.collected_count == 1
+
+
+class TestGameStatePipeline:
+    def test_items_are_entities(self, mock_asset_manager):
+        gs = GameState(mock_asset_manager, cli_mode=True)
+        item = gs.add_collectible(1000, 1000, {'size_hint': (16, 16)}, 'garlic')
+        assert gs.world.get(item.entity, 'facade') is item
+        assert gs.world.get(item.entity, 'pickup') == 'garlic'
+        gs.reset()
+        assert len(gs.world) == 0
+        assert item.entity is None
+
+    def test_collected_item_is_despawned(self, mock_asset_manager):
+        gs = GameState(mock_asset_manager, cli_mode=True)
+        gs.player.rect = pygame.Rect(200, 200, 32, 32)
+        gs.vampire.active = False
+        item = gs.add_collectible(216, 216, {'size_hint': (16, 16)}, 'garlic')
+        entity = item.entity
+        gs.update(1.0)
+        assert gs.player.garlic_count == 1
+        assert entity not in gs.world
+        assert item not in gs.items
@@ -0,0 +1,116 @@
+import pytest
+import pygame
+from unittest.mock import patch
+
+from entity_pool import EntityPool
+from game_clock import GameClock, VIRTUAL
+from game_entities import Bullet, Explosion, Collectible
+from game_state import GameState
+import config
+from .test_utils import mock_asset_manager, mock_pygame_init_and_display, real_surface_factory, initialized_pygame
+
+
+class TestEntityPool:
+    def test_acquire_reuses_released_entities(self, real_surface_factory):
+        pool = EntityPool(Bullet)
+        image = real_surface_factory(10, 10)
+        first = pool.acquire(0, 0, 10, 0, image)
+        assert (pool.hits, pool.misses) == (0, 1)
+        pool.release(first)
+        assert not first.active
+        second = pool.acquire(50, 60, 50, 100, image)
+        assert second is first
+        assert second.active
+        assert second.rect.topleft == (50, 60)
+        assert second.velocity == pytest.approx((0.0, config.BULLET_SPEED))
+        assert (pool.hits, pool.misses) == (1, 1)
+        assert pool.hit_rate == pytest.approx(0.5)
+
+    def test_double_release_is_ignored(self, real_surface_factory):
+        pool = EntityPool(Explosion)
+        explosion = pool.acquire(0, 0, real_surface_factory(20, 20), clock=GameClock(VIRTUAL))
+        pool.release(explosion)
+        pool.release(explosion)
+        assert pool.free_count == 1
+        assert pool.acquire(0, 0, None) is explosion
+        assert pool.acquire(0, 0, None) is not explosion
+
+    def test_prewarm(self):
+        pool = EntityPool(Explosion)
+        pool.prewarm(4, 0, 0, None, clock=GameClock(VIRTUAL))
+        assert pool.stats() == {'hits': 0, 'misses': 0, 'releases': 0, 'free': 4}
+        for _ in range(4):
+            pool.acquire(10, 10, None)
+        assert (pool.hits, pool.misses) == (4, 0)
+
+
+class TestEntityReset:
+    def test_explosion_reset_restarts_the_animation(self, real_surface_factory):
+        clock = GameClock(VIRTUAL, start_time=1.0)
+        explosion = Explosion(10, 10, real_surface_factory(20, 20), clock=clock)
+        explosion.flash(1.1)
+        clock.advance(4.0)
+        explosion.reset(100, 100, explosion.image, clock=clock)
+        assert explosion.flash_count == 0
+        assert explosion.start_time == 5.0
+        assert explosion.rect.center == (100, 100)
+
+    def test_collectible_reset_scales_only_when_the_source_changes(self, real_surface_factory):
+        hp_image = real_surface_factory(16, 16)
+        garlic_image = real_surface_factory(20, 20)
+        item = Collectible(50, 50, hp_image, 'hp', 0.5)
+        scaled = item.image
+        with patch('pygame.transform.scale', wraps=pygame.transform.scale) as mock_scale:
+            item.reset(80, 90, hp_image, 'hp', 0.5)
+            mock_scale.assert_not_called()
+            assert item.image is scaled
+            assert item.rect.center == (80, 90)
+            item.reset(10, 10, garlic_image, 'garlic', 0.5)
+            mock_scale.assert_called_once()
+        assert item.item_type == 'garlic'
+        assert item.rect.size == (10, 10)
+        assert item.rect.center == (10, 10)
+
+
+class TestGameStatePools:
+    def test_pools_are_prewarmed(self, mock_asset_manager):
+        gs = GameState(mock_asset_manager)
+        stats = gs.pool_stats()
+        assert stats['bullets']['free'] == config.BULLET_POOL_SIZE
+        assert stats['explosions']['free'] == config.EXPLOSION_POOL_SIZE
+        assert stats['collectibles']['free'] == config.COLLECTIBLE_POOL_SIZE
+
+    def test_removed_bullets_return_to_the_pool(self, mock_asset_manager):
+        gs = GameState(mock_asset_manager)
+        for _ in range(3):
+            gs.add_bullet(-500, -500, -600, -500, mock_asset_manager.images['bullet'])
+        assert gs.bullet_pool.hits == 3
+        gs.update(1.0)
+        assert len(gs.bullets) == 0
+        assert gs.bullet_pool.free_count == config.BULLET_POOL_SIZE
+
+    def test_reset_returns_entities_to_the_pools(self, mock_asset_manager):
+        gs = GameState(mock_asset_manager, cli_mode=True)
+        gs.add_bullet(100, 100, 200, 100, mock_asset_manager.images['bullet'])
+        gs.add_explosion(100, 100, mock_asset_manager.images['explosion'])
+        gs.add_collectible(300, 300, mock_asset_manager.images['hp'], 'hp')
+        explosions, items = gs.explosions, gs.items
+        gs.reset()
+        assert gs.explosions is explosions and gs.explosions == []
+        assert gs.items is items and gs.items == []
+        for pool, size in ((gs.bullet_pool, config.BULLET_POOL_SIZE),
+                           (gs.explosion_pool, config.EXPLOSION_POOL_SIZE),
+                           (gs.collectible_pool, config.COLLECTIBLE_POOL_SIZE)):
+            assert pool.free_count == size
+            assert pool.misses == 0
+
+    def test_collected_item_returns_to_the_pool(self, mock_asset_manager):
+        gs = GameState(mock_asset_manager, cli_mode=True)
+        gs.player.health = config.MAX_HEALTH - 1
+        gs.player.rect = pygame.Rect(200, 200, 32, 32)
+        item = gs.add_collectible(gs.player.rect.centerx, gs.player.rect.centery, {'size_hint': (16, 16)}, 'hp')
+        gs.vampire.active = False
+        gs.update(1.0)
+        assert gs.player.health == config.MAX_HEALTH
+        assert item not in gs.items
+        assert gs.collectible_pool.free_count == config.COLLECTIBLE_POOL_SIZE
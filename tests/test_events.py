@@ -0,0 +1,94 @@
+import pytest
+import pygame
+from unittest.mock import MagicMock
+
+import config
+from events import (EventBus, KillEvent, PickupEvent, DamageEvent, ShotEvent,
+                    AudioListener, HudListener, TelemetryListener)
+from game_state import GameState
+from .test_utils import mock_asset_manager, mock_pygame_init_and_display, real_surface_factory, initialized_pygame
+
+
+class TestEventBus:
+    def test_events_are_delivered_in_batches_by_type(self):
+        bus = EventBus()
+        kills, shots = [], []
+        bus.subscribe(KillEvent, kills.append)
+        bus.subscribe(ShotEvent, shots.append)
+        bus.emit(KillEvent('carrot', 1, 1))
+        bus.emit(ShotEvent('bullet', 0, 0))
+        bus.emit(KillEvent('carrot', 2, 2))
+        assert kills == [] # Nothing is delivered before dispatch / *Rien n'est remis avant la distribution*
+        assert bus.dispatch() == 3
+        assert len(kills) == 1 and [event.x for event in kills[0]] == [1, 2]
+        assert len(shots) == 1 and shots[0][0].weapon == 'bullet'
+        assert len(bus) == 0
+
+    def test_handlers_without_events_are_not_called(self):
+        bus = EventBus()
+        handler = MagicMock()
+        bus.subscribe(DamageEvent, handler)
+        assert bus.dispatch() == 0
+        bus.emit(PickupEvent('hp', 3))
+        bus.dispatch()
+        handler.assert_not_called()
+        assert (bus.emitted_count, bus.dispatched_count) == (1, 0)
+
+    def test_events_emitted_by_handlers_wait_for_the_next_dispatch(self):
+        bus = EventBus()
+        damage = []
+        bus.subscribe(KillEvent, lambda events: bus.emit(DamageEvent(1, 2)))
+        bus.subscribe(DamageEvent, damage.append)
+        bus.emit(KillEvent('vampire', 0, 0, count=1))
+        bus.dispatch()
+        assert damage == []
+        bus.dispatch()
+        assert len(damage) == 1
+
+
+class TestListeners:
+    def test_audio_plays_each_sound_once_per_batch(self):
+        bus = EventBus()
+        sounds = {'explosion': MagicMock(), 'hurt': MagicMock()}
+        AudioListener(sounds).attach(bus)
+        for i in range(5):
+            bus.emit(KillEvent('carrot', i, i))
+        bus.emit(DamageEvent(1, 0)) # Fatal hit: no hurt sound / *Coup fatal : pas de son de blessure*
+        bus.dispatch()
+        sounds['explosion'].play.assert_called_once()
+        sounds['hurt'].play.assert_not_called()
+
+    def test_hud_and_telemetry(self):
+        bus = EventBus()
+        hud = HudListener().attach(bus)
+        telemetry = TelemetryListener().attach(bus)
+        assert hud.consume() and not hud.consume()
+        bus.emit(ShotEvent('bullet', 0, 0))
+        bus.dispatch()
+        assert not hud.consume() # Bullets do not change the HUD / *Les projectiles ne changent pas le HUD*
+        bus.emit(ShotEvent('garlic', 0, 0))
+        bus.emit(DamageEvent(2, 1))
+        bus.emit(KillEvent('carrot', 0, 0))
+        bus.dispatch()
+        assert hud.consume()
+        assert telemetry.counts == {'shot:bullet': 1, 'shot:garlic': 1, 'damage': 2, 'kill:carrot': 1}
+
+
+class TestGameStateEvents:
+    def test_vampire_contact_is_reported_at_the_end_of_the_tick(self, mock_asset_manager):
+        gs = GameState(mock_asset_manager)
+        gs.player.rect = pygame.Rect(200, 200, 32, 32)
+        gs.vampire.rect = pygame.Rect(200, 200, 32, 32)
+        gs.vampire.active = True
+        gs.update(1.0)
+        assert gs.player.health == config.START_HEALTH - 1
+        mock_asset_manager.sounds['hurt'].play.assert_called_once() # Only sound of the tick / *Seul son du tick*
+        assert gs.telemetry.counts['damage'] == 1
+        assert len(gs.events) == 0
+
+    def test_cli_mode_has_no_audio_listener(self, mock_asset_manager):
+        gs = GameState(mock_asset_manager, cli_mode=True)
+        gs.kill_vampire(1.0)
+        gs.update(1.0)
+        mock_asset_manager.sounds['vampire_death'].play.assert_not_called()
+        assert gs.telemetry.counts['kill:vampire'] == 1
@@ -0,0 +1,160 @@
+import heapq
+import math
+
+import pytest
+import numpy as np
+import pygame
+
+import config
+from flow_field import FlowField
+from game_state import GameState
+from game_entities import Player, Vampire
+from .test_utils import mock_asset_manager, mock_pygame_init_and_display, real_surface_factory, initialized_pygame
+
+WORLD = (640, 640)  # 10 x 10 cells of 64 px / *10 x 10 cellules de 64 px*
+
+
+def _walk(field, cell, limit=100):
+    # Follows the field cell by cell; returns the visited cells / *Suit le champ de cellule en cellule ; retourne les cellules visitées*
+    path = [cell]
+    while cell != field.target_cell and len(path) < limit:
+        col, row = cell
+        cell = (col + int(round(field.dir_x[row, col])), row + int(round(field.dir_y[row, col])))
+        path.append(cell)
+    return path
+
+
+def _full_dijkstra(field, cell):
+    # Reference costs: Dijkstra over every cell / *Coûts de référence : Dijkstra sur toutes les cellules*
+    cost = [math.inf] * (field.rows * field.cols)
+    target = cell[1] * field.cols + cell[0]
+    cost[target] = 0.0
+    heap = [(0.0, target)]
+    while heap:
+        current, index = heapq.heappop(heap)
+        if current > cost[index]:
+            continue
+        for neighbour, step in field._adjacency[index]:
+            if current + step < cost[neighbour]:
+                cost[neighbour] = current + step
+                heapq.heappush(heap, (current + step, neighbour))
+    return np.array(cost).reshape(field.rows, field.cols)
+
+
+class TestFlowField:
+    def test_rebuilds_only_when_the_target_changes_cell(self):
+        field = FlowField(WORLD, 64)
+        assert field.set_target(100, 100)
+        assert not field.set_target(120, 90)
+        assert field.set_target(200, 100)
+        assert field.rebuild_count == 2
+
+    def test_open_ground_is_direct(self):
+        field = FlowField(WORLD, 64)
+        field.set_target(300, 300)
+        assert field.direction_at(10, 600) is None
+        assert field.direct.all()
+
+    def test_routes_around_a_wall(self):
+        # Wall on column 5, open only at the bottom row / *Mur sur la colonne 5, ouvert seulement sur la dernière ligne*
+        field = FlowField(WORLD, 64, obstacles=[pygame.Rect(320, 0, 64, 576)])
+        field.set_target(100, 100) # Cell (1, 1)
+        assert field.direction_at(600, 100) is not None # Wall in the way / *Mur sur le chemin*
+        assert field.direction_at(100, 500) is None # Same side as the target / *Même côté que la cible*
+        path = _walk(field, (8, 1))
+        assert path[-1] == (1, 1)
+        assert (5, 9) in path # Through the gap / *Par l'ouverture*
+        assert not any(field.blocked[row, col] for col, row in path)
+        assert field.cost[1, 8] > 7 # Longer than the straight line / *Plus long que la ligne droite*
+
+    def test_unreachable_target_falls_back_to_direct(self):
+        field = FlowField(WORLD, 64)
+        for rect in (pygame.Rect(0, 128, 192, 64), pygame.Rect(128, 0, 64, 192)): # Box around cell (0, 0) / *Boîte autour de la cellule (0, 0)*
+            field.add_obstacle(rect)
+        field.set_target(10, 10)
+        assert field.direction_at(600, 600) is None
+
+    def test_shadow_rebuild_matches_a_full_dijkstra(self):
+        obstacles = [pygame.Rect(320, 0, 64, 576), pygame.Rect(64, 384, 192, 64), pygame.Rect(448, 192, 128, 64)]
+        field = FlowField(WORLD, 64, obstacles=obstacles, rebuild_budget=0)
+        for target in ((100, 100), (600, 600), (200, 600), (450, 20)):
+            field.set_target(*target)
+            assert not field.building
+            assert 0 < field.shadow_cells < field.rows * field.cols
+            np.testing.assert_allclose(field.cost, _full_dijkstra(field, field.target_cell))
+            # Each step of a shadow cell walks down the cost / *Chaque pas d'une cellule d'ombre fait descendre le coût*
+            for row, col in zip(*np.nonzero(~field.direct)):
+                step_x, step_y = int(round(field.dir_x[row, col])), int(round(field.dir_y[row, col]))
+                assert field.cost[row + step_y, col + step_x] == pytest.approx(field.cost[row, col] - math.hypot(step_x, step_y))
+
+    def test_budgeted_rebuild_keeps_the_old_field_until_complete(self):
+        obstacles = [pygame.Rect(320, 0, 64, 576)]
+        reference = FlowField(WORLD, 64, obstacles=obstacles, rebuild_budget=0)
+        reference.set_target(600, 100)
+        field = FlowField(WORLD, 64, obstacles=obstacles, rebuild_budget=5)
+        field.set_target(100, 100)
+        while field.building:
+            assert not field.set_target(100, 100)
+        old_cost = field.cost
+        assert field.set_target(600, 100)
+        calls = 1
+        while field.building:
+            assert field.cost is old_cost # Still the field towards (1, 1) / *Toujours le champ vers (1, 1)*
+            field.set_target(600, 100)
+            calls += 1
+        assert calls > 2
+        np.testing.assert_array_equal(field.cost, reference.cost)
+        np.testing.assert_array_equal(field.direct, reference.direct)
+
+    def test_new_target_replaces_the_rebuild_in_progress(self):
+        field = FlowField(WORLD, 64, obstacles=[pygame.Rect(320, 0, 64, 576)], rebuild_budget=5)
+        field.set_target(600, 100)
+        assert field.building
+        field.set_target(100, 100)
+        while field.building:
+            field.set_target(100, 100)
+        assert field.cost[1, 1] == 0.0
+        assert _walk(field, (8, 1))[-1] == (1, 1)
+
+    def test_vectorized_sampling_matches(self):
+        field = FlowField(WORLD, 64, obstacles=[pygame.Rect(320, 0, 64, 576)])
+        field.set_target(100, 100)
+        xs = np.array([600, 100, 450])
+        ys = np.array([100, 500, 300])
+        dir_x, dir_y, direct = field.directions_at(xs, ys)
+        for i in range(3):
+            single = field.direction_at(xs[i], ys[i])
+            assert direct[i] == (single is None)
+            if single is not None:
+                assert (dir_x[i], dir_y[i]) == single
+
+
+class TestVampireFlowField:
+    def test_vampire_walks_around_the_wall(self, mock_asset_manager, real_surface_factory):
+        field = FlowField(WORLD, 64, obstacles=[pygame.Rect(320, 0, 64, 576)])
+        player = Player(80, 80, real_surface_factory(32, 32), mock_asset_manager)
+        vampire = Vampire(580, 80, real_surface_factory(32, 32))
+        vampire.active = True
+        vampire.speed = 8
+        for _ in range(400):
+            field.set_target(*player.rect.center)
+            vampire.update(player, WORLD, 0.0, field)
+            assert not field.blocked[field.cell_of(*vampire.rect.center)[::-1]]
+            if vampire.rect.colliderect(player.rect):
+                break
+        assert vampire.rect.colliderect(player.rect)
+
+
+class TestGameStateFlowField:
+    def test_configured_obstacles_route_the_horde(self, mock_asset_manager, monkeypatch):
+        monkeypatch.setattr(config, 'FLOW_FIELD_OBSTACLES', [(1000, 1000, 500, 2000)])
+        gs = GameState(mock_asset_manager)
+        field = gs.flow_field
+        assert field.blocked[field.cell_of(1200, 2000)[::-1]]
+        gs.player.rect.center = (800, 2000)
+        gs._update_flow_field(0)
+        while field.building:
+            gs._update_flow_field(0)
+        assert field.target_cell == field.cell_of(800, 2000)
+        assert field.direction_at(1700, 2000) is not None # Behind the wall / *Derrière le mur*
+        assert field.direction_at(400, 2000) is None
@@ -0,0 +1,105 @@
+import pytest
+from unittest.mock import patch
+
+from game_clock import GameClock, REAL, SCALED, PAUSED, VIRTUAL
+from game_entities import Explosion, Player
+from game_state import GameState
+import config
+from .test_utils import mock_asset_manager, mock_pygame_init_and_display, real_surface_factory, initialized_pygame
+
+
+class TestGameClock:
+    def test_real_mode_follows_wall_clock(self):
+        clock = GameClock()
+        with patch('time.time', return_value=123.456):
+            assert clock.now() == 123.456
+
+    def test_pause_freezes_and_resume_does_not_jump(self):
+        clock = GameClock()
+        with patch('time.time', return_value=100.0):
+            clock.pause()
+        assert clock.paused
+        with patch('time.time', return_value=130.0):
+            assert clock.now() == 100.0
+            clock.resume()
+            assert clock.mode == REAL
+            assert clock.now() == pytest.approx(100.0)
+        with patch('time.time', return_value=131.0):
+            assert clock.now() == pytest.approx(101.0)
+
+    def test_scaled_mode(self):
+        with patch('time.time', return_value=50.0):
+            clock = GameClock()
+            clock.set_scale(4.0)
+        assert clock.mode == SCALED
+        with patch('time.time', return_value=52.0):
+            assert clock.now() == pytest.approx(58.0)
+            clock.pause()
+            clock.resume()
+            assert clock.mode == SCALED
+        with patch('time.time', return_value=53.0):
+            assert clock.now() == pytest.approx(62.0)
+
+    def test_virtual_mode_only_moves_on_advance(self):
+        clock = GameClock(VIRTUAL, start_time=10.0)
+        with patch('time.time', side_effect=AssertionError("wall clock read")):
+            assert clock.now() == 10.0
+            assert clock.advance(0.5) == 10.5
+            assert clock.now() == 10.5
+
+    def test_invalid_uses(self):
+        with pytest.raises(ValueError):
+            GameClock('turbo')
+        with pytest.raises(RuntimeError):
+            GameClock().advance(1.0)
+        with pytest.raises(ValueError):
+            GameClock(VIRTUAL).advance(-1.0)
+
+    def test_switch_to_virtual_keeps_time(self):
+        clock = GameClock()
+        with patch('time.time', return_value=77.0):
+            clock.set_mode(VIRTUAL)
+        assert clock.now() == 77.0
+        assert clock.mode == VIRTUAL
+        clock.set_mode(PAUSED)
+        assert clock.now() == 77.0
+
+
+class TestClockInjection:
+    def test_player_invincibility_uses_injected_clock(self, real_surface_factory, mock_asset_manager):
+        clock = GameClock(VIRTUAL, start_time=5.0)
+        player = Player(0, 0, real_surface_factory(32, 32), mock_asset_manager, clock=clock)
+        player.take_damage()
+        assert player.last_hit_time == 5.0
+        clock.advance(config.PLAYER_INVINCIBILITY_DURATION - 0.01)
+        player.update_invincibility()
+        assert player.invincible
+        clock.advance(0.01)
+        player.update_invincibility()
+        assert not player.invincible
+
+    def test_explosion_uses_injected_clock(self, real_surface_factory):
+        explosion = Explosion(10, 10, real_surface_factory(20, 20), clock=GameClock(VIRTUAL, start_time=42.0))
+        assert explosion.start_time == 42.0
+
+    def test_game_state_shares_its_clock(self, mock_asset_manager):
+        clock = GameClock(VIRTUAL, start_time=3.0)
+        gs = GameState(mock_asset_manager, clock=clock)
+        assert gs.player.clock is clock
+        gs.add_explosion(10, 10, mock_asset_manager.images['explosion'])
+        assert gs.explosions[0].start_time == 3.0
+
+    def test_pausing_the_game_pauses_the_clock(self, mock_asset_manager):
+        gs = GameState(mock_asset_manager)
+        gs.pause_game()
+        assert gs.clock.paused
+        gs.resume_game()
+        assert not gs.clock.paused
+
+    def test_simulate_runs_without_the_wall_clock(self, mock_asset_manager):
+        gs = GameState(mock_asset_manager, clock=GameClock(VIRTUAL))
+        gs.player.rect.topleft = (2000, 2000)
+        with patch('time.time', side_effect=AssertionError("wall clock read")):
+            ticks = gs.simulate(60.0, tick_rate=50)
+        assert ticks == 3000
+        assert gs.clock.now() == pytest.approx(60.0)
@@ -3,6 +3,7 @@ from unittest.mock import MagicMock, patch
 import pygame
 import math
 
+from asset_manager import rotation_atlas
 from game_entities import Bullet
 from config import BULLET_SPEED
 from utilities import get_direction_vector # Bullet uses this
@@ -72,15 +73,26 @@ class TestBulletUpdate:
         assert bullet_instance.rect.y == pytest.approx(initial_y + 2 * vel_y)
 
 class TestBulletRotatedImage:
-    @patch('pygame.transform.rotate')
-    def test_rotated_image_property_calls_transform_rotate(self, mock_rotate, bullet_instance, bullet_image):
-        # Setup: bullet_instance has angle 0 by default from fixture
-        # Let's change angle for a more specific test
-        bullet_instance.angle = -30.0
-
-        # Access the property
-        rotated_img = bullet_instance.rotated_image
-
-        # Check pygame.transform.rotate was called correctly
-        mock_rotate.assert_called_once_with(bullet_image, -30.0)
-        assert rotated_img is mock_rotate.return_value # Ensure the property returns what rotate returns
+    def test_rotated_image_comes_from_the_atlas(self, bullet_image):
+        bullet = Bullet(0, 0, 10, 10, bullet_image) # -45 degrees / *-45 degrés*
+        surface, offset = rotation_atlas.frame(bullet_image, -45)
+        assert bullet.rotated_image is surface
+        assert bullet.rotated_frame == (surface, offset)
+        # The rotated frame stays centered on the bullet / *L'image tournée reste centrée sur le projectile*
+        assert (offset[0] + surface.get_width() / 2, offset[1] + surface.get_height() / 2) == pytest.approx((5, 5), abs=0.5)
+
+    def test_frame_is_looked_up_once_per_shot(self, bullet_image):
+        rotation_atlas.frames(bullet_image)
+        bullet = Bullet(0, 0, 10, 0, bullet_image)
+        with patch('pygame.transform.rotate') as mock_rotate, \
+             patch.object(rotation_atlas, 'frame', wraps=rotation_atlas.frame) as mock_frame:
+            for _ in range(3):
+                bullet.rotated_image
+            bullet.reset(0, 0, 0, 10, bullet_image) # Re-aimed by the pool / *Réorienté par la réserve*
+            assert bullet.rotated_image is rotation_atlas.frame(bullet_image, -90)[0]
+        mock_rotate.assert_not_called()
+        assert mock_frame.call_count == 3 # Once per shot, plus the check above / *Une fois par tir, plus la vérification ci-dessus*
+
+    def test_no_frame_in_cli_mode(self):
+        bullet = Bullet(0, 0, 10, 0, {'size_hint': (10, 10)}, cli_mode=True)
+        assert bullet.rotated_frame is None and bullet.rotated_image is None
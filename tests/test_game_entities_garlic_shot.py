@@ -3,6 +3,7 @@ from unittest.mock import MagicMock, patch
 import pygame
 import math
 
+from asset_manager import rotation_atlas
 from game_entities import GarlicShot
 from config import GARLIC_SHOT_SPEED, GARLIC_SHOT_MAX_TRAVEL
 from utilities import get_direction_vector # Used by GarlicShot
@@ -70,6 +71,24 @@ class TestGarlicShotUpdate:
         assert garlic_shot_instance.traveled >= GARLIC_SHOT_MAX_TRAVEL
         assert garlic_shot_instance.active is False
 
+    def test_advance_keeps_the_tick_reaching_max_travel_in_flight(self, garlic_shot_image):
+        # With a max travel that is a multiple of the speed, update() stops on the exact last tick;
+        # advance() still reports that tick in flight, so the game tests it for hits, and expires the next one
+        # *Avec une distance max multiple de la vitesse, update() s'arrête au dernier tick exact ; advance()*
+        # *signale encore ce tick en vol, le jeu le teste donc contre les cibles, et expire au suivant*
+        last_tick = GARLIC_SHOT_MAX_TRAVEL // GARLIC_SHOT_SPEED
+        assert last_tick * GARLIC_SHOT_SPEED == GARLIC_SHOT_MAX_TRAVEL
+        per_object = GarlicShot(50, 50, 150, 50, garlic_shot_image)
+        ecs = GarlicShot(50, 50, 150, 50, garlic_shot_image)
+        for tick in range(1, last_tick):
+            per_object.update()
+            assert per_object.active and ecs.advance(), tick
+        per_object.update()
+        assert not per_object.active
+        assert ecs.advance() # The last tick / *Le dernier tick*
+        assert per_object.traveled == ecs.traveled == GARLIC_SHOT_MAX_TRAVEL
+        assert not ecs.advance()
+
     def test_update_does_not_move_if_inactive(self, garlic_shot_instance):
         garlic_shot_instance.active = False
         initial_pos = garlic_shot_instance.rect.copy()
@@ -81,3 +100,33 @@ class TestGarlicShotUpdate:
         assert garlic_shot_instance.rect.topleft == initial_pos.topleft
         assert garlic_shot_instance.traveled == initial_traveled
         assert garlic_shot_instance.rotation_angle == initial_angle
+
+
+class TestGarlicShotRotationFrames:
+    def test_shots_share_the_rotation_frames(self, garlic_shot_image):
+        first = GarlicShot(0, 0, 10, 0, garlic_shot_image)
+        second = GarlicShot(50, 50, 0, 10, garlic_shot_image)
+        assert rotation_atlas.frames(garlic_shot_image) is rotation_atlas.frames(garlic_shot_image)
+        first.rotation_angle = second.rotation_angle = 90
+        assert first.rotated_image is second.rotated_image
+
+    def test_rotated_image_follows_the_angle(self, garlic_shot_instance):
+        frames = rotation_atlas.frames(garlic_shot_instance.original_image)
+        assert garlic_shot_instance.rotated_image is frames[0][0]
+        garlic_shot_instance.rotation_angle = 45
+        assert garlic_shot_instance.rotated_image is frames[45 // rotation_atlas.step][0]
+
+    def test_no_frames_in_cli_mode(self):
+        shot = GarlicShot(0, 0, 10, 0, {'size_hint': (15, 15)}, cli_mode=True)
+        assert shot.rotated_image is None
+
+
+class TestGarlicShotReset:
+    def test_reset_reaims_a_spent_shot(self, garlic_shot_instance, garlic_shot_image):
+        garlic_shot_instance.traveled = GARLIC_SHOT_MAX_TRAVEL
+        garlic_shot_instance.active = False
+        garlic_shot_instance.reset(5, 6, 5, 100, garlic_shot_image)
+        assert garlic_shot_instance.active
+        assert garlic_shot_instance.rect.topleft == (5, 6)
+        assert garlic_shot_instance.traveled == 0
+        assert garlic_shot_instance.direction.y == pytest.approx(1.0)
@@ -6,7 +6,8 @@ import time # Import time for patching
 # Import fixtures from the common utility file
 from .test_utils import mock_asset_manager, mock_pygame_init_and_display, real_surface_factory, initialized_pygame
 
-from config import START_HEALTH, MAX_HEALTH, PLAYER_INVINCIBILITY_DURATION, MAX_GARLIC, PLAYER_SPEED
+from config import START_HEALTH, MAX_HEALTH, PLAYER_INVINCIBILITY_DURATION, MAX_GARLIC, PLAYER_SPEED, WEAPON_FIRE_INTERVALS
+from events import EventBus, DamageEvent
 from game_entities import Player
 
 # The mock_pygame_init_and_display fixture is already autouse=True in test_utils.py
@@ -52,7 +53,18 @@ class TestPlayer:
         assert player_instance.invincible
         assert player_instance.last_hit_time == 123.456
         mock_asset_manager.sounds['hurt'].play.assert_called_once()
-        assert player_instance.health_changed
+
+    def test_take_damage_emits_a_damage_event(self, player_instance, mock_asset_manager):
+        # The HUD listener refreshes the health display from this event
+        # *L'écouteur du HUD rafraîchit l'affichage de la santé à partir de cet événement*
+        bus = EventBus()
+        damage = []
+        bus.subscribe(DamageEvent, damage.extend)
+        player_instance.events = bus
+        player_instance.take_damage()
+        bus.dispatch()
+        assert [(event.amount, event.health) for event in damage] == [(1, START_HEALTH - 1)]
+        mock_asset_manager.sounds['hurt'].play.assert_not_called() # Played by the sound listener / *Joué par l'écouteur de sons*
 
     def test_take_damage_when_invincible(self, player_instance, mock_asset_manager):
         player_instance.invincible = True
@@ -148,7 +160,7 @@ class TestPlayer:
         assert player_instance.rect.x == world_size[0] - player_instance.rect.width
         assert player_instance.rect.y == world_size[1] - player_instance.rect.height
 
-    def test_draw_ui_calls(self, player_instance, mocker):
+    def test_draw_ui_calls(self, player_instance, real_surface_factory):
         mock_screen = MagicMock(spec=pygame.Surface)
         mock_hp_image = MagicMock(spec=pygame.Surface)
         mock_garlic_image = MagicMock(spec=pygame.Surface)
@@ -156,11 +168,37 @@ class TestPlayer:
         mock_garlic_image.get_width = MagicMock(return_value=30)
         mock_carrot_juice_icon = MagicMock(spec=pygame.Surface)
         player_instance.asset_manager.images['carrot_juice'] = mock_carrot_juice_icon
-        mock_scaled_icon = MagicMock(spec=pygame.Surface)
-        mock_scaled_icon.get_width = MagicMock(return_value=16)
-        mocker.patch('pygame.transform.scale', return_value=mock_scaled_icon)
+        for digit in range(10): # The digit strip is packed from real glyphs / *La bande de chiffres est composée de vrais glyphes*
+            player_instance.asset_manager.images[f'digit_{digit}'] = real_surface_factory(10, 15)
         player_instance.health = 2
         player_instance.garlic_count = 1
-        player_instance.carrot_juice_count = 5
+        player_instance.carrot_juice_count = 15
         player_instance.draw_ui(mock_screen, mock_hp_image, mock_garlic_image, MAX_GARLIC)
-        assert mock_screen.blit.call_count >= 5
+        assert mock_screen.blit.call_count >= 4 # Health, garlic and juice icons / *Icônes de santé, d'ail et de jus*
+        mock_screen.blits.assert_called_once() # Both juice digits in one call / *Les deux chiffres du jus en un appel*
+        assert len(mock_screen.blits.call_args[0][0]) == 2
+
+    def test_ready_to_fire_respects_the_weapon_interval(self, player_instance):
+        interval = WEAPON_FIRE_INTERVALS['bullet']
+        assert player_instance.ready_to_fire('bullet', 10.0)
+        assert not player_instance.ready_to_fire('bullet', 10.0 + interval / 2)
+        assert player_instance.ready_to_fire('bullet', 10.0 + interval)
+        assert player_instance.ready_to_fire('garlic', 10.0 + interval) # Weapons cool down separately / *Les armes refroidissent séparément*
+
+    def test_ready_to_fire_after_reset_or_a_clock_going_back(self, player_instance):
+        assert player_instance.ready_to_fire('bullet', 10.0)
+        assert player_instance.ready_to_fire('bullet', 2.0) # e.g. a restarted clock / *par ex. une horloge redémarrée*
+        player_instance.reset()
+        assert player_instance.last_fired == {}
+        assert player_instance.ready_to_fire('bullet', 2.0)
+
+    def test_flipped_image_is_shared(self, player_instance, real_surface_factory):
+        world_size = (1000, 1000)
+        player_instance.original_image = player_instance.image = real_surface_factory(32, 32)
+        player_instance.move(-1, 0, world_size)
+        flipped = player_instance.image
+        player_instance.move(1, 0, world_size)
+        with patch('pygame.transform.flip') as mock_flip:
+            player_instance.move(-1, 0, world_size)
+        mock_flip.assert_not_called()
+        assert player_instance.image is flipped
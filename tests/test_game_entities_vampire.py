@@ -110,7 +110,7 @@ class TestVampireUpdate:
 
         # Time is up for respawn
         mock_current_time.return_value = vampire.respawn_timer + VAMPIRE_RESPAWN_TIME + 0.1
-        with patch.object(vampire, 'respawn') as mock_vamp_respawn:
+        with patch.object(Vampire, 'respawn') as mock_vamp_respawn:
             # Patching random.randint as it's called by Vampire.update->respawn if not given x,y
             # The actual Vampire.update calls self.respawn(random.randint(...), random.randint(...))
             with patch('random.randint', side_effect=[50,60]) as mock_rand_int_for_respawn:
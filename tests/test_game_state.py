@@ -5,7 +5,7 @@ import random
 from game_state import GameState
 from game_entities import Player, Vampire, Carrot, Bullet, GarlicShot, Explosion, Collectible
 import config
-from .test_utils import mock_asset_manager, mock_pygame_init_and_display, real_surface_factory, initialized_pygame
+from .test_utils import mock_asset_manager, mock_pygame_init_and_display, real_surface_factory, initialized_pygame, virtual_state_factory
 
 import pygame
 
@@ -14,20 +14,10 @@ def game_state_instance(mock_asset_manager):
     gs = GameState(mock_asset_manager)
     return gs
 
-def _create_test_garlic_shot(x, y, image, dx=1, dy=0):
-    """Helper function to create a garlic_shot dictionary for testing."""
-    shot = {
-        "active": True,
-        "x": x,
-        "y": y,
-        "dx": dx,
-        "dy": dy,
-        "rotation_angle": 0,
-        "image": image,
-        "rect": pygame.Rect(0, 0, config.GARLIC_WIDTH, config.GARLIC_HEIGHT),
-    }
-    shot["rect"].center = (x, y)
-    return shot
+def _create_test_garlic_shot(gs, x, y, current_time, dx=1, dy=0):
+    """Helper function to spawn a garlic shot centered on (x, y) for testing."""
+    image = {'size_hint': (config.GARLIC_WIDTH, config.GARLIC_HEIGHT)}
+    return gs.add_garlic_shot(x - config.GARLIC_WIDTH // 2, y - config.GARLIC_HEIGHT // 2, x + dx, y + dy, image, current_time)
 
 class TestGameStateInitialization:
     def test_initial_values(self, game_state_instance):
@@ -39,9 +29,6 @@ class TestGameStateInitialization:
         assert not gs.started
         assert gs.asset_manager is not None
         assert isinstance(gs.player, Player)
-        assert gs.garlic_shot is None
-        assert gs.garlic_shot_start_time == 0
-        assert gs.garlic_shot_travel == 0
         assert isinstance(gs.vampire, Vampire)
         assert gs.vampire.active
         assert gs.bullets == []
@@ -170,9 +157,11 @@ class TestGameStateReset:
 
     def test_reset_clears_garlic_shot_state(self, game_state_instance):
         gs = game_state_instance
-        gs.garlic_shot = {"active": True, "x": 100, "y": 100, "dx":1,"dy":0, "rotation_angle":0}
+        shot = _create_test_garlic_shot(gs, 100, 100, 0.0)
         gs.reset()
-        assert gs.garlic_shot is None
+        assert gs.garlic_shots == []
+        assert shot.entity is None
+        assert gs.garlic_shot_pool.free_count == config.GARLIC_SHOT_POOL_SIZE
 
 class TestGameStateEntityManagement:
     def test_add_bullet(self, game_state_instance, mock_asset_manager):
@@ -193,6 +182,30 @@ class TestGameStateEntityManagement:
         assert new_shot.rect.centerx == 50 + garlic_image.get_width() // 2
         assert new_shot.rect.centery == 60 + garlic_image.get_height() // 2
 
+    def test_throw_garlic_allows_several_shots_in_flight(self, game_state_instance, mock_asset_manager):
+        gs = game_state_instance
+        gs.player.garlic_count = 2
+        first = gs.throw_garlic(1000, 200, mock_asset_manager.images['garlic'], 0.0)
+        second = gs.throw_garlic(200, 1000, mock_asset_manager.images['garlic'], config.WEAPON_FIRE_INTERVALS['garlic'])
+        assert gs.garlic_shots == [first, second]
+        assert first.rect.center == gs.player.rect.center
+        assert gs.player.garlic_count == 0
+        assert gs.throw_garlic(0, 0, mock_asset_manager.images['garlic'], 0.0) is None
+
+    def test_garlic_shots_move_and_return_to_the_pool(self, game_state_instance, mock_asset_manager):
+        gs = game_state_instance
+        gs.player.garlic_count = 1
+        shot = gs.throw_garlic(gs.player.rect.centerx + 1000, gs.player.rect.centery, mock_asset_manager.images['garlic'], 0.0)
+        start_x = shot.rect.x
+        gs.vampires.clear() # Nothing to hit / *Rien à toucher*
+        for _ in range(3):
+            gs.movement_system.run(0.0)
+            gs._step_garlic_shots(0.0)
+        assert shot.rect.x == start_x + 3 * config.GARLIC_SHOT_SPEED
+        gs.world.despawn(shot.entity)
+        assert gs.garlic_shots == []
+        assert gs.garlic_shot_pool.stats()['releases'] == 1
+
     @patch('random.randint')
     def test_create_carrot(self, mock_randint, game_state_instance, mock_asset_manager):
         gs = game_state_instance
@@ -234,10 +247,13 @@ class TestGameStateUpdate:
             assert carrot_far.rect.topleft != initial_carrot_pos_far
             assert carrot_close.rect.x > initial_carrot_pos_close_x
 
-            gs.carrots[0].active = False
-            gs.carrots[0].respawn_timer = mock_time.return_value
-            with patch.object(gs.carrots[0], 'respawn') as mock_carrot_respawn:
-                mock_time.return_value += config.CARROT_RESPAWN_DELAY + 0.1
+            gs.kill_carrot(gs.carrots[0], mock_time.return_value)
+            assert not gs.carrots[0].active
+            with patch.object(Carrot, 'respawn') as mock_carrot_respawn:
+                mock_time.return_value += config.CARROT_RESPAWN_DELAY - 0.1
+                gs.update(mock_time.return_value)
+                mock_carrot_respawn.assert_not_called()
+                mock_time.return_value += 0.2
                 gs.update(mock_time.return_value)
                 mock_carrot_respawn.assert_called_once()
 
@@ -252,32 +268,36 @@ class TestGameStateUpdate:
         gs.add_bullet(100, 100, 200, 200, mock_asset_manager.images['bullet'])
         bullet = gs.bullets[0]
 
-        bullet.rect = MagicMock(spec=pygame.Rect)
-        bullet.rect.colliderect.return_value = True
-        bullet.rect.centerx = carrot.rect.centerx
-        bullet.rect.centery = carrot.rect.centery
-        bullet.rect.right = bullet.rect.centerx + 5
-        bullet.rect.left = bullet.rect.centerx - 5
-        bullet.rect.bottom = bullet.rect.centery + 5
-        bullet.rect.top = bullet.rect.centery - 5
-
         gs.update(current_time)
-        bullet.rect.colliderect.assert_called_once_with(carrot.rect)
         assert not carrot.active
+        assert bullet not in gs.bullets
+        assert len(gs.explosions) == 1
 
     def test_update_removes_off_screen_bullets(self, game_state_instance, mock_asset_manager):
         gs = game_state_instance
         bullet_image = mock_asset_manager.images['bullet']
         gs.add_bullet(config.WORLD_SIZE[0]/2, config.WORLD_SIZE[1]/2, config.WORLD_SIZE[0]/2 + 100, config.WORLD_SIZE[1]/2, bullet_image)
-        gs.add_bullet(-200, config.WORLD_SIZE[1]/2, -300, config.WORLD_SIZE[1]/2, bullet_image)
+        gs.add_bullet(config.WORLD_SIZE[0]/2, config.WORLD_SIZE[1]/2 + 50, config.WORLD_SIZE[0]/2 - 100, config.WORLD_SIZE[1]/2 + 50, bullet_image)
 
         initial_center_x_on_screen = gs.bullets[0].rect.centerx
-        gs.bullets[1].rect.right = -1
+        gs.bullets[1].rect.right = -1 # Written through to the bullet store / *Réécrit dans le stockage des projectiles*
 
         gs.update(1.0)
         assert len(gs.bullets) == 1
         assert gs.bullets[0].rect.centerx == initial_center_x_on_screen + config.BULLET_SPEED
 
+    def test_bullets_is_a_copy_and_can_be_assigned_itself(self, game_state_instance, mock_asset_manager):
+        gs = game_state_instance
+        bullet_image = mock_asset_manager.images['bullet']
+        first = gs.add_bullet(100, 100, 200, 100, bullet_image)
+        second = gs.add_bullet(300, 100, 400, 100, bullet_image)
+        gs.bullets.append(first) # Changes the copy only / *Ne modifie que la copie*
+        assert len(gs.bullet_store) == 2
+        gs.bullets = gs.bullets
+        assert [bullet.rect.x for bullet in gs.bullets] == [100, 300]
+        assert first._store is gs.bullet_store and second._store is gs.bullet_store
+        assert gs.bullet_pool.releases == 0 # Nothing given back to the pool / *Rien n'est rendu à la réserve*
+
     @patch('time.time')
     def test_update_garlic_shot_vampire_collision(self, mock_time, game_state_instance, mock_asset_manager):
         gs = game_state_instance
@@ -286,14 +306,12 @@ class TestGameStateUpdate:
         mock_time.return_value = current_time
         vampire.rect = pygame.Rect(200, 200, 40, 40)
         vampire.active = True
-        gs.garlic_shot = _create_test_garlic_shot(x=200, y=200, image=MagicMock())
-        gs.garlic_shot_start_time = current_time - 0.1
-        gs.garlic_shot_travel = 0
+        _create_test_garlic_shot(gs, x=200, y=200, current_time=current_time - 0.1)
 
         gs.update(current_time)
 
         assert vampire.death_effect_active
-        assert gs.garlic_shot is None
+        assert gs.garlic_shots == []
 
     @patch('time.time')
     def test_update_player_vampire_collision(self, mock_time, game_state_instance):
@@ -315,7 +333,7 @@ class TestGameStateUpdate:
 
         vampire.rect = pygame.Rect(110, 110, 40, 40)
         vampire.active = True
-        with patch.object(player, 'take_damage') as mock_take_damage:
+        with patch.object(Player, 'take_damage') as mock_take_damage:
             gs.update(current_time)
             mock_take_damage.assert_called_once()
         player.rect.colliderect.assert_called_once_with(vampire.rect)
@@ -327,11 +345,7 @@ class TestGameStateUpdate:
         current_time_initial = 400.0
         mock_time.return_value = current_time_initial
 
-        vampire.active = False
-        vampire.death_effect_active = True
-        vampire.death_effect_start_time = current_time_initial
-        vampire.respawn_timer = current_time_initial
-        gs.last_vampire_death_pos = (250, 250)
+        vampire.rect.center = (250, 250)
         initial_item_count = len(gs.items)
 
         real_juice_image = real_surface_factory(20, 20)
@@ -339,6 +353,9 @@ class TestGameStateUpdate:
         try:
             mock_asset_manager.images['carrot_juice'] = real_juice_image
 
+            gs.kill_vampire(current_time_initial)
+            assert not vampire.active
+            assert gs.last_vampire_death_pos == (250, 250)
             assert vampire.death_effect_active is True, "Pre-update: death effect should be active"
             gs.update(current_time_initial)
             assert vampire.death_effect_active is True, "Post-update (elapsed 0): death effect should still be active"
@@ -363,14 +380,15 @@ class TestGameStateUpdate:
         original_hp_image_mock = mock_asset_manager.images['hp']
         mock_asset_manager.images['hp'] = real_hp_image
 
-        mock_explosion = MagicMock(spec=Explosion)
-        mock_explosion.rect = pygame.Rect(300,300,5,5)
-        mock_explosion.update = MagicMock(return_value=True)
-        gs.explosions.append(mock_explosion)
+        explosion = gs.add_explosion(300, 300, real_surface_factory(5, 5))
         initial_item_count = len(gs.items)
         mock_random_random.return_value = config.ITEM_DROP_GARLIC_CHANCE + 0.1 # HP
         gs.update(current_time)
+        assert len(gs.items) == initial_item_count
 
+        gs.update(current_time + explosion.flash_interval * explosion.max_flashes + 0.01)
+        assert not explosion.active
+        assert explosion not in gs.explosions
         assert len(gs.items) == initial_item_count + 1
         dropped_item = gs.items[-1]
         expected_scaled_width = int(real_hp_image.get_width() * config.ITEM_SCALE)
@@ -384,6 +402,10 @@ class TestGameStateUpdate:
         gs = game_state_instance
         player = gs.player
         player.rect = MagicMock(spec=pygame.Rect)
+        player.rect.x = 134
+        player.rect.y = 134
+        player.rect.width = 32
+        player.rect.height = 32
         player.rect.centerx = 150
         player.rect.centery = 150
         player.rect.colliderect.return_value = True
@@ -398,7 +420,7 @@ class TestGameStateUpdate:
         assert player.health < config.MAX_HEALTH
         initial_health = player.health
 
-        with patch.object(player, 'take_damage', wraps=player.take_damage) as mock_take_damage: # wraps to still execute original
+        with patch.object(Player, 'take_damage', autospec=True, side_effect=Player.take_damage) as mock_take_damage: # side_effect to still execute original
             gs.update(600.0)
             mock_take_damage.assert_not_called() # Should not be called if vampire is inactive and respawn timer is set
 
@@ -435,18 +457,37 @@ class TestGameStateUpdate:
         gs = game_state_instance
         current_time = 200.0
         mock_time.return_value = current_time
-        gs.garlic_shot = _create_test_garlic_shot(x=10, y=10, image=mock_asset_manager.images['garlic'])
+        shot = _create_test_garlic_shot(gs, x=10, y=10, current_time=current_time)
         # Set travel distance to be just under the limit
-        gs.garlic_shot_travel = config.GARLIC_SHOT_MAX_TRAVEL - (config.GARLIC_SHOT_SPEED / 2)
-        gs.garlic_shot_start_time = current_time
+        shot.traveled = config.GARLIC_SHOT_MAX_TRAVEL - (config.GARLIC_SHOT_SPEED / 2)
 
         # First update: shot is still active, travel distance is updated inside this call.
         gs.update(current_time)
-        assert gs.garlic_shot["active"]
+        assert shot.active and shot in gs.garlic_shots
 
-        # Second update: shot should expire due to the travel distance check at the start of the update.
+        # Second update: shot should expire as it goes past its maximum travel.
         gs.update(current_time) # Time doesn't need to advance for this check
-        assert gs.garlic_shot is None
+        assert gs.garlic_shots == []
+
+    def test_garlic_shot_hits_on_the_tick_it_reaches_max_travel(self, game_state_instance):
+        gs = game_state_instance
+        vampire = gs.vampire
+        current_time = 200.0
+        shot = _create_test_garlic_shot(gs, x=1000, y=1000, current_time=current_time)
+        shot.traveled = config.GARLIC_SHOT_MAX_TRAVEL - config.GARLIC_SHOT_SPEED # One move left / *Un déplacement restant*
+        x, y = gs.world.get(shot.entity, 'position')
+        step_x, step_y = shot.velocity
+        last_rect = pygame.Rect(int(x + step_x), int(y + step_y), shot.rect.width, shot.rect.height)
+        # The vampire only overlaps the shot's final position / *Le vampire ne chevauche que la position finale du tir*
+        vampire.rect = pygame.Rect(last_rect.right - 1, last_rect.top, 40, 40)
+        vampire.speed = 0 # Keeps still while the shot moves / *Reste immobile pendant que le tir bouge*
+        vampire.active = True
+        assert not vampire.rect.colliderect(shot.rect)
+
+        gs.update(current_time)
+
+        assert vampire.death_effect_active
+        assert gs.garlic_shots == []
 
     @patch('time.time')
     def test_update_garlic_shot_expiration_by_duration(self, mock_time, game_state_instance, mock_asset_manager):
@@ -454,18 +495,167 @@ class TestGameStateUpdate:
         gs = game_state_instance
         current_time = 200.0
         mock_time.return_value = current_time
-        gs.garlic_shot = _create_test_garlic_shot(x=10, y=10, image=mock_asset_manager.images['garlic'])
-        gs.garlic_shot_travel = 0
-        gs.garlic_shot_start_time = current_time
+        shot = _create_test_garlic_shot(gs, x=10, y=10, current_time=current_time)
 
-        # Update at a time just at the expiration moment
+        # Update at a time just before the expiration moment
+        time_before_expiry = current_time + config.GARLIC_SHOT_DURATION - 0.1
+        mock_time.return_value = time_before_expiry
+        gs.update(time_before_expiry)
+        assert shot in gs.garlic_shots
+
+        # Update at the expiration moment
         time_at_expiry = current_time + config.GARLIC_SHOT_DURATION
         mock_time.return_value = time_at_expiry
         gs.update(time_at_expiry)
-        assert gs.garlic_shot["active"]
+        assert gs.garlic_shots == []
+
+
+class TestGameStateBoundedLifetimes:
+    @pytest.fixture
+    def virtual_state(self, virtual_state_factory):
+        gs = virtual_state_factory()
+        for carrot in gs.carrots: # Nothing for the bullets to hit / *Rien à toucher pour les projectiles*
+            carrot.active = False
+        gs.vampire.active = False
+        gs.vampires.sync()
+        return gs
+
+    def test_bullets_are_removed_past_their_range(self, virtual_state, monkeypatch):
+        gs = virtual_state
+        monkeypatch.setattr(config, 'BULLET_MAX_RANGE', 100)
+        gs.player.rect.center = (2000, 2000)
+        gs.add_bullet(2000, 2000, 2100, 2000, {'size_hint': (8, 8)}, current_time=0.0)
+        ticks = 100 // config.BULLET_SPEED
+        for tick in range(ticks):
+            gs.update(tick * 0.02)
+        assert len(gs.bullet_store) == 1
+        gs.update(ticks * 0.02)
+        assert len(gs.bullet_store) == 0
+        assert gs.gauges()['bullets_spent'] == 1
+
+    def test_bullets_are_removed_after_their_ttl(self, virtual_state, monkeypatch):
+        gs = virtual_state
+        monkeypatch.setattr(config, 'BULLET_MAX_RANGE', 0)
+        gs.add_bullet(2000, 2000, 2100, 2000, {'size_hint': (8, 8)}, current_time=10.0)
+        gs.update(10.0 + config.BULLET_TTL - 0.01)
+        assert len(gs.bullet_store) == 1
+        gs.update(10.0 + config.BULLET_TTL)
+        assert len(gs.bullet_store) == 0
+
+    def test_uncollected_items_expire(self, virtual_state):
+        gs = virtual_state
+        item = gs.add_collectible(3000, 3000, {'size_hint': (32, 32)}, 'hp', current_time=5.0)
+        gs.update(5.0 + config.ITEM_LIFETIME - 0.01)
+        assert item in gs.items
+        gs.update(5.0 + config.ITEM_LIFETIME)
+        assert gs.items == []
+        assert item.entity is None
+
+    def test_nearby_drops_of_the_same_type_merge(self, virtual_state):
+        gs = virtual_state
+        image = {'size_hint': (32, 32)}
+        first = gs.add_collectible(3000, 3000, image, 'garlic', current_time=0.0)
+        assert gs.add_collectible(3000 + config.ITEM_MERGE_RADIUS - 1, 3000, image, 'garlic', current_time=20.0) is first
+        assert gs.add_collectible(3010, 3000, image, 'hp', current_time=20.0) is not first
+        assert gs.add_collectible(3000 + config.ITEM_MERGE_RADIUS + 1, 3000, image, 'garlic', current_time=20.0) is not first
+        assert first.quantity == 2
+        assert len(gs.items) == 3
+        assert gs.gauges()['items_merged'] == 1
+        gs.update(config.ITEM_LIFETIME) # The merge refreshed the expiry / *La fusion a repoussé l'expiration*
+        assert first in gs.items
+
+    def test_merged_item_is_picked_up_unit_by_unit(self, virtual_state):
+        gs = virtual_state
+        image = {'size_hint': (32, 32)}
+        x, y = gs.player.rect.center
+        item = gs.add_collectible(x, y, image, 'garlic', current_time=0.0)
+        for _ in range(3):
+            gs.add_collectible(x, y, image, 'garlic', current_time=0.0)
+        gs.player.garlic_count = config.MAX_GARLIC - 2
+        gs.update(1.0)
+        assert gs.player.garlic_count == config.MAX_GARLIC
+        assert item in gs.items and item.quantity == 2 # Full stock: the rest stays / *Stock plein : le reste reste au sol*
+        gs.player.garlic_count = 0
+        gs.update(1.02)
+        assert gs.player.garlic_count == 2
+        assert item not in gs.items
+
+    def test_gauges_stay_flat_over_a_long_session(self, virtual_state):
+        gs = virtual_state
+        image = {'size_hint': (8, 8)}
+        peak = {}
+        for tick in range(50 * 120): # Two game minutes of constant fire and drops / *Deux minutes de jeu de tirs et chutes constants*
+            now = tick * 0.02
+            if tick % 5 == 0:
+                gs.add_bullet(2000, 2000, 2000 + (tick % 7) - 3, 1000, image, current_time=now)
+            if tick % 25 == 0:
+                gs.add_collectible(500 + (tick * 37) % 3000, 500 + (tick * 53) % 3000, image, 'hp', current_time=now)
+            gs.update(now)
+            if tick >= 50 * 60:
+                for name, value in gs.gauges().items():
+                    peak[name] = max(peak.get(name, 0), value)
+        assert peak['bullets'] <= 10 * config.BULLET_TTL
+        assert peak['items'] <= 2 * config.ITEM_LIFETIME
+
+
+class TestGameStateBudgets:
+    @pytest.fixture
+    def virtual_state(self, virtual_state_factory):
+        return virtual_state_factory()
+
+    def test_fire_bullet_is_governed(self, virtual_state):
+        gs = virtual_state
+        image = {'size_hint': (8, 8)}
+        interval = config.WEAPON_FIRE_INTERVALS['bullet']
+        assert gs.fire_bullet(0, 0, image, current_time=1.0) is not None
+        assert gs.fire_bullet(0, 0, image, current_time=1.0 + interval / 2) is None
+        assert gs.fire_bullet(0, 0, image, current_time=1.0 + interval) is not None
+        assert len(gs.bullet_store) == 2
+        assert gs.drop_stats() == {'governor:bullet': 1}
+
+    def test_governed_garlic_throw_keeps_the_garlic(self, virtual_state):
+        gs = virtual_state
+        gs.player.garlic_count = 2
+        image = {'size_hint': (16, 16)}
+        assert gs.throw_garlic(0, 0, image, current_time=1.0) is not None
+        assert gs.throw_garlic(0, 0, image, current_time=1.01) is None
+        assert gs.player.garlic_count == 1
+        assert gs.drop_stats()['governor:garlic'] == 1
+
+    def test_bullet_budget_drops_the_farthest_bullet(self, virtual_state, monkeypatch):
+        gs = virtual_state
+        monkeypatch.setattr(config, 'BULLET_BUDGET', 3)
+        image = {'size_hint': (8, 8)}
+        px, py = gs.player.rect.center
+        gs.add_bullet(px, py, px + 100, py, image, current_time=0.0)
+        gs.add_bullet(px + 1000, py, px + 1100, py, image, current_time=0.0)
+        gs.add_bullet(px + 200, py, px + 300, py, image, current_time=0.0)
+        gs.add_bullet(px, py, px - 100, py, image, current_time=0.0)
+        # The far bullet went back to the pool and came out again as the newest one
+        # *Le projectile éloigné est retourné à la réserve et en est ressorti comme le plus récent*
+        assert sorted(gs.bullet_store.positions()[0].tolist()) == [px, px, px + 200]
+        assert gs.drop_stats() == {'budget:bullets': 1}
+
+    def test_item_budget_drops_the_oldest_item(self, virtual_state, monkeypatch):
+        gs = virtual_state
+        monkeypatch.setattr(config, 'ITEM_BUDGET', 2)
+        image = {'size_hint': (32, 32)}
+        for x in (500, 1500, 2500):
+            gs.add_collectible(x, 500, image, 'hp', current_time=0.0)
+        assert [item.rect.centerx for item in gs.items] == [1500, 2500]
+        assert len(gs.world.query('pickup')) == 2
+        assert gs.drop_stats() == {'budget:items': 1}
+
+    def test_explosion_budget_drops_the_oldest_without_loot(self, virtual_state, monkeypatch):
+        gs = virtual_state
+        monkeypatch.setattr(config, 'EXPLOSION_BUDGET', 2)
+        image = {'size_hint': (32, 32)}
+        for x in (500, 1500, 2500):
+            gs.add_explosion(x, 500, image)
+        assert [explosion.rect.centerx for explosion in gs.explosions] == [1500, 2500]
+        assert len(gs.scheduler) == 2 # Its flash timer was cancelled / *Son minuteur de flash a été annulé*
+        gs.clock.advance(10.0)
+        gs.update(gs.clock.now())
+        assert len(gs.items) == 2 # Only the kept explosions dropped loot / *Seules les explosions gardées ont laissé du butin*
+        assert gs.drop_stats() == {'budget:explosions': 1}
 
-        # Update at a time just after expiration
-        time_after_expiry = current_time + config.GARLIC_SHOT_DURATION + 0.1
-        mock_time.return_value = time_after_expiry
-        gs.update(time_after_expiry)
-        assert gs.garlic_shot is None
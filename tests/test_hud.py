@@ -0,0 +1,69 @@
+import pytest
+import pygame
+from unittest.mock import MagicMock
+
+from events import EventBus, HudListener, PickupEvent
+from hud import DigitStrip, HudLayer
+from .test_utils import mock_asset_manager, mock_pygame_init_and_display, real_surface_factory, initialized_pygame
+
+
+def _glyphs():
+    # Each digit glyph is filled with its own red level / *Chaque glyphe de chiffre est rempli de son propre niveau de rouge*
+    glyphs = []
+    for digit in range(10):
+        surface = pygame.Surface((10, 16), pygame.SRCALPHA)
+        surface.fill((digit * 20, 0, 0, 255))
+        glyphs.append(surface)
+    return glyphs
+
+
+class _Player:
+    def __init__(self):
+        self.asset_manager = MagicMock()
+        self.asset_manager.images = {f'digit_{digit}': glyph for digit, glyph in enumerate(_glyphs())}
+        self.draw_ui = MagicMock(side_effect=lambda surface, *args, **kwargs: surface.fill((255, 255, 255, 255), (0, 0, 4, 4)))
+
+
+class TestDigitStrip:
+    def test_glyphs_are_scaled_once_and_drawn_side_by_side(self):
+        strip = DigitStrip(_glyphs(), 0.5)
+        assert strip.glyph_size == (5, 8)
+        assert strip.width('907', 2) == 3 * 5 + 2 * 2
+        target = pygame.Surface((40, 20), pygame.SRCALPHA)
+        strip.draw(target, '907', 3, 4, 2)
+        assert target.get_at((5, 7)) == (180, 0, 0, 255)
+        assert target.get_at((12, 7)) == (0, 0, 0, 255)
+        assert target.get_at((19, 7)) == (140, 0, 0, 255)
+        assert target.get_at((5, 13)).a == 0 # Below the glyphs / *Sous les glyphes*
+
+    def test_missing_digit_gives_no_strip(self):
+        images = {f'digit_{digit}': glyph for digit, glyph in enumerate(_glyphs())}
+        assert DigitStrip.from_images(images) is not None
+        del images['digit_4']
+        assert DigitStrip.from_images(images) is None
+
+
+class TestHudLayer:
+    def test_composed_only_when_the_listener_is_flagged(self):
+        hud, player, screen = HudLayer(), _Player(), pygame.Surface((64, 48))
+        bus = EventBus()
+        listener = HudListener().attach(bus)
+        assert hud.draw(screen, listener, player, None, None, 3) # First frame / *Première frame*
+        assert not hud.draw(screen, listener, player, None, None, 3)
+        assert player.draw_ui.call_count == 1
+        bus.emit(PickupEvent('carrot_juice', 1))
+        bus.dispatch()
+        assert hud.draw(screen, listener, player, None, None, 3)
+        assert not listener.dirty # Consumed by the layer / *Consommé par la couche*
+        assert hud.renders == 2
+        assert player.draw_ui.call_args.kwargs['digits'] is hud.digits
+
+    def test_layer_is_blitted_every_frame_and_follows_the_screen_size(self):
+        hud, player, listener = HudLayer(), _Player(), HudListener()
+        hud.draw(pygame.Surface((64, 48)), listener, player, None, None, 3)
+        screen = pygame.Surface((64, 48))
+        assert not hud.draw(screen, listener, player, None, None, 3)
+        assert screen.get_at((1, 1))[:3] == (255, 255, 255)
+        assert screen.get_at((10, 10))[:3] == (0, 0, 0) # Transparent elsewhere / *Transparent ailleurs*
+        assert hud.draw(pygame.Surface((80, 60)), listener, player, None, None, 3)
+        assert hud.surface.get_size() == (80, 60)
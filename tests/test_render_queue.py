@@ -0,0 +1,62 @@
+import pytest
+import pygame
+from unittest.mock import MagicMock
+
+from game_entities import Carrot
+from render_queue import RenderQueue
+from .test_utils import mock_asset_manager, mock_pygame_init_and_display, real_surface_factory, initialized_pygame
+
+
+def _square(color, size=10):
+    surface = pygame.Surface((size, size))
+    surface.fill(color)
+    return surface
+
+
+class TestRenderQueue:
+    def test_layers_are_drawn_bottom_to_top_whatever_the_push_order(self):
+        queue = RenderQueue(('ground', 'sky'))
+        screen = pygame.Surface((30, 30))
+        queue.push(_square((0, 0, 255)), (5, 5), 'sky')
+        queue.push(_square((255, 0, 0)), (0, 0), 'ground')
+        queue.push(_square((0, 255, 0)), (5, 5), 'ground')
+        assert queue.submit(screen) == 3
+        assert screen.get_at((7, 7))[:3] == (0, 0, 255)
+        assert screen.get_at((2, 2))[:3] == (255, 0, 0)
+        assert len(queue) == 0 # Emptied for the next frame / *Vidée pour la frame suivante*
+
+    def test_one_blits_call_per_non_empty_layer_and_stats(self):
+        queue = RenderQueue(('a', 'b', 'c'))
+        sprite = _square((255, 255, 255), 2)
+        for i in range(500):
+            queue.push(sprite, (i % 50, i // 50), 'a')
+        queue.push(sprite, (0, 0), 'c')
+        screen = MagicMock(spec=pygame.Surface)
+        queue.submit(screen)
+        assert screen.blits.call_count == 2
+        screen.blit.assert_not_called()
+        stats = queue.stats()
+        assert (stats['blits'], stats['blit_calls']) == (501, 2)
+        assert stats['blits:a'] == 500 and 'blits:b' not in stats
+        assert stats['submit_ms'] >= 0
+
+    def test_layer_stands_in_for_the_screen_in_entity_draws(self, real_surface_factory):
+        image = real_surface_factory(20, 20, fill_color=(200, 100, 0))
+        carrot = Carrot(30, 40, image)
+        direct, queued = pygame.Surface((100, 100)), pygame.Surface((100, 100))
+        carrot.draw(direct, [10, 20])
+        queue = RenderQueue()
+        carrot.draw(queue.layer('carrots'), [10, 20])
+        queue.layer('carrots').blit(image, (60, 60), pygame.Rect(0, 0, 5, 5)) # Area entries are kept / *Les entrées avec zone sont gardées*
+        queue.submit(queued)
+        assert queued.get_at((62, 62))[:3] == (200, 100, 0) and queued.get_at((66, 66))[:3] == (0, 0, 0)
+        queued.fill((0, 0, 0), pygame.Rect(60, 60, 5, 5))
+        assert pygame.image.tobytes(queued, 'RGB') == pygame.image.tobytes(direct, 'RGB')
+
+    def test_clear_drops_the_entries(self):
+        queue = RenderQueue()
+        queue.push(_square((255, 0, 0)), (0, 0), 'items')
+        queue.clear()
+        screen = pygame.Surface((10, 10))
+        assert queue.submit(screen) == 0
+        assert screen.get_at((5, 5))[:3] == (0, 0, 0)
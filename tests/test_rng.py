@@ -0,0 +1,72 @@
+import random
+
+import numpy as np
+import pytest
+
+import config
+from rng import RngRegistry
+from .test_utils import mock_asset_manager, mock_pygame_init_and_display, real_surface_factory, initialized_pygame, virtual_state_factory
+
+
+def _snapshot(gs):
+    return ([c.rect.topleft for c in gs.carrots], [v.rect.topleft for v in gs.vampires],
+            [(i.item_type, i.rect.topleft) for i in gs.items])
+
+
+class TestRngRegistry:
+    def test_unseeded_streams_are_the_random_module(self):
+        rng = RngRegistry()
+        assert rng.stream('spawn') is random
+        assert isinstance(rng.bulk('ai'), np.random.Generator)
+
+    def test_seeded_streams_replay(self):
+        first, second = RngRegistry(42), RngRegistry(42)
+        assert [first.stream('spawn').randint(0, 1000) for _ in range(5)] == \
+               [second.stream('spawn').randint(0, 1000) for _ in range(5)]
+        assert np.array_equal(first.bulk('ai').uniform(size=100), second.bulk('ai').uniform(size=100))
+
+    def test_streams_are_independent(self):
+        rng = RngRegistry(42)
+        reference = RngRegistry(42).stream('loot').random()
+        for _ in range(100): # Heavy use of another stream / *Usage intensif d'un autre flux*
+            rng.stream('spawn').random()
+        assert rng.stream('loot').random() == reference
+        assert rng.stream('spawn') is rng.stream('spawn')
+        assert rng.stream('spawn').random() != rng.stream('ai').random()
+
+    def test_different_seeds_differ(self):
+        assert RngRegistry(1).stream('spawn').random() != RngRegistry(2).stream('spawn').random()
+
+    def test_negative_seeds_are_accepted(self):
+        first = RngRegistry(-1).stream('spawn').random()
+        assert first == RngRegistry(-1).stream('spawn').random()
+        assert first != RngRegistry(1).stream('spawn').random()
+        assert isinstance(RngRegistry(-1).bulk('ai'), np.random.Generator)
+
+
+class TestSeededGameState:
+    def _run(self, virtual_state_factory, seed, ticks=300):
+        gs = virtual_state_factory(seed=seed)
+        clock = gs.clock
+        for tick in range(ticks):
+            clock.advance(1.0 / config.SIMULATION_TICK_RATE)
+            if tick % 20 == 0: # Kill a carrot now and then, so respawns and loot rolls happen / *Tuer une carotte de temps en temps, pour les réapparitions et le butin*
+                carrot = next((c for c in gs.carrots if c.active), None)
+                if carrot is None:
+                    continue
+                gs.add_explosion(carrot.rect.centerx, carrot.rect.centery, gs.asset_manager.images['explosion'])
+                gs.kill_carrot(carrot, clock.now())
+            gs.update()
+        return _snapshot(gs)
+
+    def test_same_seed_replays_the_session(self, virtual_state_factory):
+        assert self._run(virtual_state_factory, 7) == self._run(virtual_state_factory, 7)
+
+    def test_other_seed_changes_the_session(self, virtual_state_factory):
+        assert self._run(virtual_state_factory, 7, ticks=1) != self._run(virtual_state_factory, 8, ticks=1)
+
+    def test_seeded_session_ignores_the_global_random_state(self, virtual_state_factory):
+        random.seed(1)
+        first = self._run(virtual_state_factory, 7, ticks=50)
+        random.seed(2)
+        assert self._run(virtual_state_factory, 7, ticks=50) == first
@@ -0,0 +1,104 @@
+import pytest
+from unittest.mock import patch
+
+from scheduler import Scheduler
+from game_clock import GameClock, VIRTUAL
+from game_state import GameState
+import config
+from .test_utils import mock_asset_manager, mock_pygame_init_and_display, real_surface_factory, initialized_pygame
+
+
+class TestScheduler:
+    def test_runs_due_timers_in_time_then_schedule_order(self):
+        scheduler = Scheduler()
+        fired = []
+        scheduler.schedule(2.0, fired.append, 'c')
+        scheduler.schedule(1.0, fired.append, 'a')
+        scheduler.schedule(1.0, fired.append, 'b')
+        scheduler.schedule(5.0, fired.append, 'late')
+
+        assert scheduler.advance(0.5) == 0
+        assert scheduler.advance(2.0) == 3
+        assert fired == ['a', 'b', 'c']
+        assert len(scheduler) == 1
+        assert scheduler.next_due() == 5.0
+
+    def test_cancelled_timer_never_fires(self):
+        scheduler = Scheduler()
+        fired = []
+        timer = scheduler.schedule(1.0, fired.append, 'x')
+        scheduler.cancel(timer)
+        scheduler.cancel(timer) # Cancelling twice is harmless / *Annuler deux fois est sans effet*
+        assert len(scheduler) == 0
+        assert scheduler.advance(10.0) == 0
+        assert fired == []
+        assert scheduler.next_due() is None
+
+    def test_callback_can_schedule_an_already_due_timer(self):
+        scheduler = Scheduler()
+        fired = []
+        scheduler.schedule(1.0, lambda: scheduler.schedule(1.5, fired.append, 'chained'))
+        assert scheduler.advance(2.0) == 2
+        assert fired == ['chained']
+
+    def test_idle_timers_are_not_touched(self):
+        scheduler = Scheduler()
+        for i in range(10000):
+            scheduler.schedule(1000.0 + i, lambda: None)
+        scheduler.advance(1.0)
+        assert scheduler.last_advance_touched == 0
+        assert len(scheduler) == 10000
+
+    def test_clear(self):
+        scheduler = Scheduler()
+        fired = []
+        timer = scheduler.schedule(1.0, fired.append, 'x')
+        scheduler.clear()
+        scheduler.cancel(timer)
+        assert len(scheduler) == 0
+        scheduler.advance(2.0)
+        assert fired == []
+
+
+class TestGameStateScheduling:
+    def test_killed_carrot_respawns_after_delay(self, mock_asset_manager):
+        gs = GameState(mock_asset_manager, clock=GameClock(VIRTUAL))
+        carrot = gs.carrots[0]
+        gs.kill_carrot(carrot, 10.0)
+        with patch.object(type(carrot), 'respawn') as mock_respawn:
+            gs.update(10.0 + config.CARROT_RESPAWN_DELAY - 0.01)
+            mock_respawn.assert_not_called()
+            gs.update(10.0 + config.CARROT_RESPAWN_DELAY)
+            mock_respawn.assert_called_once()
+
+    def test_scheduled_invincibility_expiry(self, mock_asset_manager):
+        clock = GameClock(VIRTUAL, start_time=20.0)
+        gs = GameState(mock_asset_manager, clock=clock)
+        gs.player.rect.topleft = (3000, 3000)
+        gs.vampire.active = False
+        gs.player.take_damage()
+        assert gs.player.invincible
+        gs.update(clock.advance(config.PLAYER_INVINCIBILITY_DURATION - 0.01))
+        assert gs.player.invincible
+        gs.update(clock.advance(0.01))
+        assert not gs.player.invincible
+
+    def test_vampire_waits_for_death_effect_then_respawns(self, mock_asset_manager):
+        gs = GameState(mock_asset_manager, cli_mode=True, clock=GameClock(VIRTUAL))
+        gs.player.rect.topleft = (3000, 3000)
+        gs.kill_vampire(100.0)
+        assert gs.vampire_killed_count == 1
+        gs.update(100.0 + config.VAMPIRE_DEATH_DURATION)
+        assert not gs.vampire.death_effect_active
+        assert [item.item_type for item in gs.items] == ['carrot_juice']
+        assert not gs.vampire.active
+        gs.update(100.0 + max(config.VAMPIRE_RESPAWN_TIME, config.VAMPIRE_DEATH_DURATION))
+        assert gs.vampire.active
+
+    def test_reset_drops_pending_events(self, mock_asset_manager):
+        gs = GameState(mock_asset_manager, clock=GameClock(VIRTUAL))
+        gs.kill_carrot(gs.carrots[0], 1.0)
+        gs.add_explosion(10, 10, mock_asset_manager.images['explosion'])
+        assert len(gs.scheduler) == 2
+        gs.reset()
+        assert len(gs.scheduler) == 0
@@ -0,0 +1,99 @@
+import pytest
+import numpy as np
+import pygame
+
+import config
+from carrot_population import CarrotPopulation
+from config import WORLD_SIZE
+from game_entities import Carrot
+from simulation_lod import LodTier, SimulationLod
+from .test_utils import mock_pygame_init_and_display, real_surface_factory, initialized_pygame
+
+
+def _lod():
+    return SimulationLod([LodTier('near', 100, 1), LodTier('mid', 500, 2), LodTier('far', float('inf'), 4)])
+
+
+class TestSimulationLod:
+    def test_slots_are_sorted_into_tiers(self):
+        lod = _lod()
+        slots = np.arange(3)
+        dist_sq = np.array([50.0, 300.0, 900.0]) ** 2
+        due, ticks = lod.schedule(slots, dist_sq)
+        assert [tier.population for tier in lod.tiers] == [1, 1, 1]
+        assert 0 in due.tolist()
+        assert dict(zip(due.tolist(), np.broadcast_to(ticks, due.shape).tolist()))[0] == 1
+
+    def test_far_updates_are_staggered_over_the_interval(self):
+        lod = _lod()
+        slots = np.arange(40)
+        dist_sq = np.full(40, 1000.0 ** 2)
+        seen = []
+        for _ in range(4):
+            due, ticks = lod.schedule(slots, dist_sq)
+            assert ticks == 4 # Far slots move by the whole interval / *Les cases lointaines avancent de tout l'intervalle*
+            seen.append(due.tolist())
+        # Each tick updates a quarter of them, and each slot once per interval
+        # *Chaque tick en met à jour un quart, et chaque case une fois par intervalle*
+        assert [len(due) for due in seen] == [10, 10, 10, 10]
+        assert sorted(sum(seen, [])) == list(range(40))
+
+    def test_stats(self):
+        lod = _lod()
+        due, ticks = lod.schedule(np.arange(3), np.array([0.0, 1e9, 1e9]))
+        lod.charge(3e-6)
+        stats = lod.stats()
+        assert (stats['near']['population'], stats['near']['updated']) == (1, 1)
+        assert stats['far']['population'] == 2
+        assert stats['mid']['population'] == 0
+        updated = stats['far']['updated']
+        # The cost is split by number of enemies updated / *Le coût est réparti selon le nombre d'ennemis mis à jour*
+        assert stats['near']['us_per_tick'] == pytest.approx(3.0 / (1 + updated), abs=0.1)
+        lod.reset_stats()
+        assert lod.ticks == 0
+
+
+class TestCarrotPopulationLod:
+    def test_near_carrots_match_the_full_update(self, real_surface_factory):
+        image = real_surface_factory(20, 20)
+        positions = [(2000 + dx, 2000) for dx in (-150, -60, 40, 120)]
+        full = [Carrot(x, y, image) for x, y in positions]
+        tiered = [Carrot(x, y, image) for x, y in positions]
+        for a, b in zip(full, tiered):
+            b.direction = pygame.math.Vector2(a.direction)
+        reference = CarrotPopulation(rng=np.random.default_rng(7))
+        reference.bind(full)
+        population = CarrotPopulation(rng=np.random.default_rng(7), lod=SimulationLod.from_config())
+        population.bind(tiered)
+        player_rect = pygame.Rect(2000, 2000, 32, 32)
+        for _ in range(30):
+            reference.step(player_rect, WORLD_SIZE)
+            population.step(player_rect, WORLD_SIZE)
+        assert [carrot.rect.topleft for carrot in tiered] == [carrot.rect.topleft for carrot in full]
+
+    def test_far_carrots_move_by_their_interval(self, real_surface_factory):
+        carrot = Carrot(3800, 3800, real_surface_factory(20, 20))
+        carrot.direction = pygame.math.Vector2(-1, 0)
+        lod = SimulationLod.from_config()
+        lod.min_population = 0 # Tier even a single carrot / *Classer même une seule carotte*
+        population = CarrotPopulation(rng=np.random.default_rng(0), lod=lod)
+        population.bind([carrot])
+        player_rect = pygame.Rect(0, 0, 32, 32)
+        moves = []
+        for _ in range(config.LOD_FAR_INTERVAL):
+            before = carrot.rect.topleft
+            population.step(player_rect, WORLD_SIZE)
+            if carrot.rect.topleft != before:
+                moves.append(carrot.rect.topleft)
+        assert len(moves) == 1
+        distance = pygame.math.Vector2(moves[0]).distance_to((3800, 3800))
+        assert distance == pytest.approx(config.CARROT_SPEED * config.LOD_FAR_INTERVAL, abs=1.5)
+
+    def test_small_populations_update_every_tick(self, real_surface_factory):
+        carrot = Carrot(3800, 3800, real_surface_factory(20, 20))
+        population = CarrotPopulation(rng=np.random.default_rng(0), lod=SimulationLod.from_config())
+        population.bind([carrot])
+        before = carrot.rect.topleft
+        population.step(pygame.Rect(0, 0, 32, 32), WORLD_SIZE)
+        assert carrot.rect.topleft != before
+        assert population.lod.tick == 0
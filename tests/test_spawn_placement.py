@@ -0,0 +1,115 @@
+import math
+
+import numpy as np
+import pytest
+
+import config
+from game_state import GameState
+from spawn_placement import SpawnPlacer, SpawnRegion
+from .test_utils import mock_asset_manager, mock_pygame_init_and_display, real_surface_factory, initialized_pygame
+
+WORLD = (2000, 2000)
+ITEM = (32, 32)
+CENTER = (1000, 1000)
+
+
+def _assert_valid(positions, radius, center=CENTER, world=WORLD, item=ITEM):
+    for x, y in positions:
+        assert 0 <= x <= world[0] - item[0] and 0 <= y <= world[1] - item[1]
+        assert (x - center[0]) ** 2 + (y - center[1]) ** 2 > radius ** 2
+
+
+class TestSpawnRegion:
+    def test_samples_are_in_bounds_and_outside_the_safe_disk(self):
+        region = SpawnRegion(WORLD, ITEM, CENTER, 600)
+        xs, ys = region.sample(np.random.default_rng(1), 5000)
+        assert xs.size == ys.size == 5000
+        _assert_valid(zip(xs.tolist(), ys.tolist()), 600)
+
+    def test_covers_the_whole_valid_area(self):
+        region = SpawnRegion(WORLD, ITEM, None)
+        xs, ys = region.sample(np.random.default_rng(2), 4000)
+        assert xs.min() < 100 and xs.max() > WORLD[0] - ITEM[0] - 100
+        assert ys.min() < 100 and ys.max() > WORLD[1] - ITEM[1] - 100
+
+    def test_impossible_radius_falls_back_to_the_farthest_corner(self):
+        region = SpawnRegion(WORLD, ITEM, (100, 100), 10000)
+        assert region.empty
+        xs, ys = region.sample(np.random.default_rng(3), 3)
+        assert list(zip(xs.tolist(), ys.tolist())) == [(WORLD[0] - ITEM[0], WORLD[1] - ITEM[1])] * 3
+
+
+class TestSpawnPlacer:
+    def test_small_requests_use_the_scalar_stream(self):
+        calls = []
+
+        class Recorder:
+            def randint(self, low, high):
+                calls.append((low, high))
+                return high # Far corner, always valid / *Coin éloigné, toujours valide*
+
+        placer = SpawnPlacer(WORLD, 600, rng=Recorder())
+        assert placer.place(ITEM, CENTER, 3) == [(1968, 1968)] * 3
+        assert len(calls) == 6
+        assert placer.region_builds == 0
+
+    def test_scalar_path_is_bounded(self):
+        class Stuck:
+            def randint(self, low, high):
+                return CENTER[0] # Always inside the safe disk / *Toujours dans le disque de sécurité*
+
+        placer = SpawnPlacer(WORLD, 600, rng=Stuck(), bulk_rng=np.random.default_rng(4))
+        _assert_valid(placer.place(ITEM, CENTER, 2), 600)
+        assert placer.region_builds == 1
+
+    def test_waves_use_the_cached_region(self):
+        placer = SpawnPlacer(WORLD, 600, bulk_rng=np.random.default_rng(5))
+        positions = placer.place(ITEM, CENTER, config.SPAWN_BULK_THRESHOLD * 10)
+        _assert_valid(positions, 600)
+        placer.place(ITEM, CENTER, config.SPAWN_BULK_THRESHOLD)
+        assert placer.region_builds == 1
+        placer.place(ITEM, (200, 200), config.SPAWN_BULK_THRESHOLD)
+        assert placer.region_builds == 2
+
+    def test_min_spacing_is_respected(self):
+        placer = SpawnPlacer(WORLD, 600, bulk_rng=np.random.default_rng(6))
+        positions = placer.place(ITEM, CENTER, 300, min_spacing=40)
+        assert len(positions) == 300
+        _assert_valid(positions, 600)
+        points = np.array(positions, dtype=np.float64)
+        gaps = np.hypot(points[:, None, 0] - points[None, :, 0], points[:, None, 1] - points[None, :, 1])
+        np.fill_diagonal(gaps, math.inf)
+        assert gaps.min() >= 40
+
+    def test_overfull_spacing_still_returns_every_position(self):
+        placer = SpawnPlacer((200, 200), 0, bulk_rng=np.random.default_rng(7))
+        positions = placer.place(ITEM, None, 50, min_spacing=100)
+        assert len(positions) == 50
+        _assert_valid(positions, -1, center=(0, 0), world=(200, 200))
+
+    def test_seeded_waves_replay(self):
+        first = SpawnPlacer(WORLD, 600, bulk_rng=np.random.default_rng(8)).place(ITEM, CENTER, 500)
+        second = SpawnPlacer(WORLD, 600, bulk_rng=np.random.default_rng(8)).place(ITEM, CENTER, 500)
+        assert first == second
+
+
+class TestGameStateSpawnWaves:
+    def test_large_wave_is_drawn_in_a_few_batches_away_from_the_player(self, mock_asset_manager, monkeypatch):
+        # Work is counted in batched draws rather than timed; see benchmarks/bench_spawn_placement.py
+        # *Le travail est compté en tirages groupés plutôt que chronométré ; voir benchmarks/bench_spawn_placement.py*
+        mock_asset_manager.images['carrot'] = {'size_hint': (32, 32)}
+        gs = GameState(mock_asset_manager, cli_mode=True, seed=3)
+        draws = []
+        draw = SpawnRegion._draw
+        monkeypatch.setattr(SpawnRegion, '_draw', lambda region, rng, count, cdf: draws.append(count) or draw(region, rng, count, cdf))
+        scalar_draws = []
+        monkeypatch.setattr(gs.spawn_placer.rng, 'randint', lambda *args: scalar_draws.append(args))
+        before = len(gs.carrots)
+        carrots = gs.spawn_carrots(5000)
+        assert len(gs.carrots) == before + 5000
+        assert 0 < len(draws) <= 2 and sum(draws) < 2 * 5000
+        assert scalar_draws == [] # No per-carrot rejection loop / *Pas de boucle de rejet par carotte*
+        assert gs.spawn_placer.region_builds == 1
+        radius = math.sqrt(gs.carrot_spawn_safe_radius_sq)
+        _assert_valid([c.rect.topleft for c in carrots], radius, center=gs.player.rect.center,
+                      world=gs.world_size, item=(32, 32))
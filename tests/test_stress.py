@@ -0,0 +1,96 @@
+import pytest
+
+import config
+from events import ShotEvent
+from stress import StressDriver, StressMonitor, StressProfile
+from .test_utils import mock_asset_manager, mock_pygame_init_and_display, real_surface_factory, initialized_pygame, virtual_state_factory
+
+TICK = 1.0 / config.SIMULATION_TICK_RATE
+
+
+@pytest.fixture
+def stress_state(virtual_state_factory):
+    gs = virtual_state_factory(seed=5)
+    return gs, gs.clock
+
+
+def _run(gs, clock, driver, seconds):
+    for _ in range(round(seconds / TICK)):
+        clock.advance(TICK)
+        driver.step(clock.now())
+        gs.update(clock.now())
+
+
+class TestStressProfile:
+    def test_rejects_negative_values(self):
+        with pytest.raises(ValueError):
+            StressProfile(carrots=-1)
+        with pytest.raises(ValueError):
+            StressProfile(wave_interval=0)
+
+
+class TestStressDriver:
+    def test_populate_reaches_the_profile_counts(self, stress_state):
+        gs, _ = stress_state
+        StressDriver(StressProfile(carrots=300, vampires=7), gs, {'size_hint': (8, 8)}, {'size_hint': (32, 32)}).populate()
+        assert len(gs.carrots) == 300
+        assert len(gs.vampires) == 7
+
+    def test_fires_and_explodes_at_the_profile_rates(self, stress_state):
+        gs, clock = stress_state
+        shots = []
+        gs.events.subscribe(ShotEvent, shots.extend)
+        explosions = []
+        add_explosion = gs.add_explosion
+        gs.add_explosion = lambda *args: explosions.append(add_explosion(*args))
+        driver = StressDriver(StressProfile(carrots=0, vampires=0, fire_rate=20, explosion_rate=12),
+                              gs, {'size_hint': (8, 8)}, {'size_hint': (32, 32)})
+        driver.populate()
+        _run(gs, clock, driver, 2.0)
+        assert 38 <= len(shots) <= 40
+        assert 22 <= len(explosions) <= 24
+
+    def test_waves_add_carrots_on_cadence(self, stress_state):
+        gs, clock = stress_state
+        driver = StressDriver(StressProfile(carrots=10, vampires=0, fire_rate=0, explosion_rate=0, wave_size=50, wave_interval=1),
+                              gs, {'size_hint': (8, 8)}, {'size_hint': (32, 32)})
+        driver.populate()
+        _run(gs, clock, driver, 2.5)
+        assert len(gs.carrots) == 110
+
+    def test_player_survives_and_the_run_ends_after_its_duration(self, stress_state):
+        gs, clock = stress_state
+        driver = StressDriver(StressProfile(carrots=200, vampires=4, duration=3), gs,
+                              {'size_hint': (8, 8)}, {'size_hint': (32, 32)})
+        driver.populate()
+        gs.player.take_damage()
+        _run(gs, clock, driver, 2.0)
+        assert gs.player.health > 0
+        assert not driver.finished(clock.now())
+        _run(gs, clock, driver, 1.1)
+        assert driver.finished(clock.now())
+
+
+class TestStressMonitor:
+    def test_summarizes_once_per_window(self, stress_state):
+        gs, _ = stress_state
+        monitor = StressMonitor(window=1.0)
+        assert monitor.poll(10.0, gs) is None
+        monitor.record_frame(0.020)
+        monitor.record_tick(0.004)
+        monitor.record_tick(0.006)
+        assert monitor.poll(10.5, gs) is None
+        summary = monitor.poll(11.0, gs)
+        assert summary['frames'] == 1 and summary['ticks'] == 2
+        assert summary['frame_ms'] == pytest.approx(20.0)
+        assert summary['tick_ms'] == pytest.approx(5.0)
+        assert summary['tick_max_ms'] == pytest.approx(6.0)
+        assert summary['entities'] == gs.gauges()
+        assert monitor.poll(11.5, gs) is None # A new window started / *Une nouvelle fenêtre a commencé*
+
+    def test_forced_poll_reports_a_partial_window(self, stress_state):
+        gs, _ = stress_state
+        monitor = StressMonitor()
+        monitor.poll(0.0, gs)
+        monitor.record_tick(0.002)
+        assert monitor.poll(0.3, gs, force=True)['ticks'] == 1
@@ -0,0 +1,62 @@
+import pytest
+
+from timestep import FixedTimestep, RateMeter
+
+
+class TestFixedTimestep:
+    def test_first_call_runs_no_tick(self):
+        timestep = FixedTimestep(tick_rate=50, max_catch_up_ticks=5)
+        assert timestep.ticks(100.0) == []
+
+    def test_tick_count_follows_elapsed_time_not_frames(self):
+        timestep = FixedTimestep(tick_rate=50, max_catch_up_ticks=5)
+        timestep.ticks(0.0)
+        # 100 fast frames of 5 ms, then 20 slow frames of 50 ms: one second each way
+        # *100 frames rapides de 5 ms, puis 20 frames lentes de 50 ms : une seconde dans chaque cas*
+        fast = sum(len(timestep.ticks(i * 0.005)) for i in range(1, 201))
+        slow = sum(len(timestep.ticks(1.0 + i * 0.05)) for i in range(1, 21))
+        assert fast == pytest.approx(50, abs=1)
+        assert slow == pytest.approx(50, abs=1)
+        assert timestep.dropped_ticks == 0
+
+    def test_tick_timestamps_are_spaced_by_dt_and_end_before_now(self):
+        timestep = FixedTimestep(tick_rate=50, max_catch_up_ticks=5)
+        timestep.ticks(10.0)
+        times = timestep.ticks(10.07)
+        assert len(times) == 3
+        assert times[1] - times[0] == pytest.approx(0.02)
+        assert times[2] - times[1] == pytest.approx(0.02)
+        assert times[-1] == pytest.approx(10.07 - timestep.accumulator)
+        assert timestep.accumulator == pytest.approx(0.5 * timestep.dt) # Half a tick left over / *Un demi-tick restant*
+
+    def test_catch_up_is_clamped(self):
+        timestep = FixedTimestep(tick_rate=50, max_catch_up_ticks=5)
+        timestep.ticks(0.0)
+        times = timestep.ticks(2.0) # A 2 second stall / *Un blocage de 2 secondes*
+        assert len(times) == 5
+        assert timestep.dropped_ticks == 95
+        assert timestep.accumulator < timestep.dt
+        assert times[-1] == pytest.approx(2.0, abs=timestep.dt)
+        assert len(timestep.ticks(2.02)) == 1
+
+    def test_reset_forgets_elapsed_time(self):
+        timestep = FixedTimestep(tick_rate=50, max_catch_up_ticks=5)
+        timestep.ticks(0.0)
+        timestep.reset()
+        assert timestep.ticks(30.0) == []
+        assert timestep.dropped_ticks == 0
+
+
+class TestRateMeter:
+    def test_reports_rate_once_per_window(self):
+        meter = RateMeter(window=1.0)
+        published = [meter.record(i * 0.1) for i in range(11)]
+        assert published == [False] * 10 + [True]
+        assert meter.rate == pytest.approx(11.0)
+
+    def test_counts_batches(self):
+        meter = RateMeter(window=1.0)
+        meter.record(0.0, 0)
+        meter.record(0.5, 25)
+        assert meter.record(1.0, 25)
+        assert meter.rate == pytest.approx(50.0)
@@ -102,6 +102,22 @@ def real_surface_factory(initialized_pygame):
         return surface
     return _create_surface
 
+@pytest.fixture
+def virtual_state_factory(mock_asset_manager):
+    """
+    A factory of CLI-mode GameStates on a virtual clock (gs.clock), driven by the test.
+    Assets are size metadata instead of mock surfaces, as AssetManager gives in CLI mode.
+    *Une fabrique de GameState en mode CLI sur une horloge virtuelle (gs.clock), pilotée par le test.*
+    *Les ressources sont des métadonnées de taille au lieu de surfaces simulées, comme AssetManager en mode CLI.*
+    """
+    from game_clock import GameClock, VIRTUAL
+    from game_state import GameState
+    for name in ('rabbit', 'carrot', 'vampire', 'explosion', 'hp', 'garlic', 'carrot_juice', 'bullet'):
+        mock_asset_manager.images[name] = {'size_hint': (32, 32)}
+    def _create_state(seed=None):
+        return GameState(mock_asset_manager, cli_mode=True, clock=GameClock(VIRTUAL), seed=seed)
+    return _create_state
+
 # It might be beneficial to also have fixtures for creating specific game entity instances
 # For example:
 # from game_entities import Player # Assuming top-level import works after project structure adjustment
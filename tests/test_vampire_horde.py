@@ -0,0 +1,161 @@
+import pytest
+import pygame
+
+import config
+from collision import CollisionWorld
+from flow_field import FlowField
+from game_entities import Player, Vampire
+from game_state import GameState
+from vampire_horde import VampireHorde
+from .test_utils import mock_asset_manager, mock_pygame_init_and_display, real_surface_factory, initialized_pygame
+
+WORLD = (2000, 2000)
+
+
+def _vampire(x, y, surface):
+    vampire = Vampire(x, y, surface)
+    vampire.active = True
+    return vampire
+
+
+class TestVampireHordeStep:
+    def test_batched_step_matches_vampire_update(self, mock_asset_manager, real_surface_factory):
+        surface = real_surface_factory(32, 32)
+        player = Player(1000, 1000, surface, mock_asset_manager)
+        positions = [(0, 0), (1980, 10), (990, 995), (1500, 1700), (3, 1999), (1000, 1000)]
+        horde = VampireHorde()
+        singles = []
+        for x, y in positions:
+            horde.add(_vampire(x, y, surface))
+            singles.append(_vampire(x, y, surface))
+        for _ in range(30):
+            horde.step(player.rect, WORLD)
+            for vampire in singles:
+                vampire.update(player, WORLD, 0.0)
+            assert [tuple(v.rect) for v in horde] == [tuple(v.rect) for v in singles]
+
+    def test_batched_step_follows_the_flow_field(self, mock_asset_manager, real_surface_factory):
+        world = (640, 640)
+        field = FlowField(world, 64, obstacles=[pygame.Rect(320, 0, 64, 576)])
+        surface = real_surface_factory(32, 32)
+        player = Player(80, 80, surface, mock_asset_manager)
+        field.set_target(*player.rect.center)
+        horde = VampireHorde()
+        single = _vampire(580, 80, surface)
+        horde.add(_vampire(580, 80, surface))
+        for _ in range(20):
+            horde.step(player.rect, world, field)
+            single.update(player, world, 0.0, field)
+            assert tuple(horde[0].rect) == tuple(single.rect)
+
+    def test_inactive_vampires_stay_put_and_leave_the_layer(self, real_surface_factory):
+        world = CollisionWorld(WORLD, 64)
+        horde = VampireHorde(world.layer('vampires'))
+        moving = horde.add(_vampire(100, 100, real_surface_factory(32, 32)))
+        resting = horde.add(_vampire(300, 300, real_surface_factory(32, 32)))
+        resting.active = False
+        horde.sync()
+        horde.step(pygame.Rect(500, 500, 32, 32), WORLD)
+        assert resting.rect.topleft == (300, 300)
+        assert moving.rect.topleft != (100, 100)
+        assert world.query('vampires', pygame.Rect(300, 300, 32, 32)) == []
+        assert world.query('vampires', moving.rect) == [moving]
+
+
+class TestGameStateHorde:
+    @pytest.fixture
+    def crowded_state(self, mock_asset_manager, real_surface_factory):
+        mock_asset_manager.images['vampire'] = real_surface_factory(32, 32)
+        mock_asset_manager.images['carrot_juice'] = real_surface_factory(20, 20)
+        gs = GameState(mock_asset_manager)
+        for i in range(9):
+            gs.add_vampire(200 + i * 150, 1500)
+        return gs
+
+    def test_garlic_hit_kills_only_the_vampire_it_touches(self, crowded_state):
+        gs = crowded_state
+        target = gs.vampires[5]
+        gs.kill_vampire(10.0, gs.collision_world.first_hit('vampires', target.rect.copy()))
+        assert not target.active
+        assert all(v.active for v in gs.vampires if v is not target)
+        assert gs.vampire_killed_count == 1
+        assert gs.last_vampire_death_pos == target.rect.center
+
+    def test_each_kill_drops_juice_where_that_vampire_died(self, crowded_state):
+        gs = crowded_state
+        first, second = gs.vampires[2], gs.vampires[7]
+        gs.kill_vampire(10.0, first)
+        gs.kill_vampire(10.2, second)
+        gs.scheduler.advance(10.0 + config.VAMPIRE_DEATH_DURATION)
+        juice = [item for item in gs.items if item.item_type == 'carrot_juice']
+        assert [item.rect.center for item in juice] == [first.death_position]
+        gs.scheduler.advance(10.2 + config.VAMPIRE_DEATH_DURATION)
+        juice = [item for item in gs.items if item.item_type == 'carrot_juice']
+        assert [item.rect.center for item in juice] == [first.death_position, second.death_position]
+        assert gs.vampire_killed_count == 2
+        assert gs.last_vampire_death_pos == second.death_position
+
+    def test_each_vampire_respawns_on_its_own_timer(self, crowded_state):
+        gs = crowded_state
+        first, second = gs.vampires[1], gs.vampires[4]
+        gs.kill_vampire(10.0, first)
+        gs.kill_vampire(12.0, second)
+        gs.scheduler.advance(10.0 + config.VAMPIRE_RESPAWN_TIME)
+        assert first.active and not second.active
+        assert first in gs.collision_world.query('vampires', first.rect)
+        gs.scheduler.advance(12.0 + config.VAMPIRE_RESPAWN_TIME)
+        assert second.active
+
+    def test_player_contact_is_checked_against_every_vampire(self, crowded_state):
+        gs = crowded_state
+        toucher = gs.vampires[3]
+        toucher.rect.center = gs.player.rect.center
+        gs.vampires.sync(toucher)
+        health = gs.player.health
+        gs._check_vampire_contact(10.0)
+        assert gs.player.health == health - 1
+        assert not toucher.active
+        assert sum(v.active for v in gs.vampires) == len(gs.vampires) - 1
+
+    def test_reset_respawns_the_whole_horde(self, crowded_state):
+        gs = crowded_state
+        for vampire in list(gs.vampires)[:4]:
+            gs.kill_vampire(10.0, vampire)
+        gs.reset()
+        assert all(v.active and not v.death_effect_active for v in gs.vampires)
+        assert gs.vampire_killed_count == 0
+        assert gs.last_vampire_death_pos == (0, 0)
+
+    def test_reset_drops_the_vampires_added_during_the_game(self, crowded_state):
+        gs = crowded_state
+        extras = list(gs.vampires)[config.VAMPIRE_COUNT:]
+        gs.reset()
+        assert extras and len(gs.vampires) == config.VAMPIRE_COUNT
+        layer = gs.collision_world.layer('vampires')
+        assert not any(vampire in layer for vampire in extras)
+        assert all(vampire in layer for vampire in gs.vampires)
+
+
+class TestHordeBatching:
+    def test_fifty_vampires_step_in_one_batched_pass(self, mock_asset_manager, real_surface_factory, monkeypatch):
+        # Work is counted rather than timed; see benchmarks/bench_vampire_horde.py
+        # *Le travail est compté plutôt que chronométré ; voir benchmarks/bench_vampire_horde.py*
+        surface = real_surface_factory(32, 32)
+        player = Player(2000, 2000, surface, mock_asset_manager)
+        world = CollisionWorld()
+        horde = VampireHorde(world.layer('vampires'))
+        for i in range(50):
+            horde.add(_vampire((i * 397) % 3900, (i * 211) % 3900, surface))
+        field = FlowField(config.WORLD_SIZE, obstacles=[pygame.Rect(1000, 1000, 256, 256)])
+        field.set_target(*player.rect.center)
+        while field.building:
+            field.set_target(*player.rect.center)
+        samples, updates = [], []
+        directions_at, update = field.directions_at, horde.collision_layer.update
+        monkeypatch.setattr(field, 'directions_at', lambda xs, ys: samples.append(len(xs)) or directions_at(xs, ys))
+        monkeypatch.setattr(horde.collision_layer, 'update', lambda entity: updates.append(entity) or update(entity))
+        monkeypatch.setattr(Vampire, 'update', lambda *args, **kwargs: pytest.fail("per-vampire update"))
+        for _ in range(10):
+            horde.step(player.rect, config.WORLD_SIZE, field)
+        assert samples == [50] * 10 # One field lookup per tick for the whole horde / *Une lecture du champ par tick pour toute la horde*
+        assert 0 < len(updates) <= 50 * 10 # Only the vampires that moved / *Seulement les vampires qui ont bougé*
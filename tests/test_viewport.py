@@ -0,0 +1,69 @@
+import pytest
+import pygame
+
+from bullet_store import BulletStore
+from collision import SpatialHash
+from game_entities import Bullet
+from stress import StressMonitor
+from viewport import Viewport
+from .test_utils import mock_asset_manager, mock_pygame_init_and_display, real_surface_factory, initialized_pygame
+
+
+class _Box:
+    def __init__(self, x, y, w=20, h=20):
+        self.rect = pygame.Rect(x, y, w, h)
+
+
+class TestViewport:
+    def test_follows_scroll_and_screen_size(self):
+        viewport = Viewport((800, 600), margin=10)
+        viewport.update([300, 200])
+        assert viewport.rect == pygame.Rect(300, 200, 800, 600)
+        assert viewport.cull_rect == pygame.Rect(290, 190, 820, 620)
+        viewport.update([0, 0], (1024, 768))
+        assert viewport.cull_rect == pygame.Rect(-10, -10, 1044, 788)
+
+    def test_visible_keeps_list_order_and_counts(self):
+        viewport = Viewport((800, 600), margin=0)
+        viewport.update([1000, 1000])
+        inside = [_Box(1100, 1100), _Box(990, 990)] # The second one only overlaps the corner / *Le second ne chevauche que le coin*
+        entities = [inside[0], _Box(0, 0), inside[1], _Box(1900, 1000)]
+        assert viewport.visible('vampires', entities) == inside
+        assert viewport.stats() == {'drawn': 2, 'culled': 2, 'drawn:vampires': 2, 'culled:vampires': 2}
+
+    def test_visible_in_only_reads_the_cells_under_the_screen(self):
+        viewport = Viewport((800, 600), margin=32)
+        viewport.update([1000, 1000])
+        layer = SpatialHash((4000, 4000), 128)
+        boxes = [_Box(x, y) for x in range(0, 4000, 100) for y in range(0, 4000, 100)]
+        for box in boxes:
+            layer.update(box)
+        visible = viewport.visible_in('carrots', layer, len(layer))
+        expected = [box for box in boxes if viewport.cull_rect.colliderect(box.rect)]
+        assert sorted(map(id, visible)) == sorted(map(id, expected))
+        assert viewport.drawn['carrots'] == len(expected)
+        assert viewport.culled['carrots'] == len(boxes) - len(expected)
+
+    def test_visible_slots_tests_the_bullet_arrays(self, real_surface_factory):
+        image = real_surface_factory(10, 10)
+        store = BulletStore()
+        for x in (50, 500, 895, 2000):
+            store.add(Bullet(x, 100, x + 100, 100, image))
+        viewport = Viewport((800, 600), margin=0)
+        viewport.update([100, 0])
+        assert viewport.visible_slots('bullets', store) == [1, 2]
+        assert viewport.stats()['culled:bullets'] == 2
+        viewport.update([100, 0]) # A new frame resets the counters / *Une nouvelle frame remet les compteurs à zéro*
+        assert viewport.stats() == {'drawn': 0, 'culled': 0}
+
+    def test_stress_summary_reports_the_latest_draw_counts(self, mock_asset_manager):
+        from game_state import GameState
+        gs = GameState(mock_asset_manager, cli_mode=True)
+        viewport = Viewport((800, 600))
+        viewport.update([0, 0])
+        viewport.visible('explosions', [_Box(10, 10), _Box(3000, 3000)])
+        monitor = StressMonitor()
+        monitor.poll(0.0, gs)
+        monitor.record_frame(0.01, viewport.stats())
+        summary = monitor.poll(1.0, gs)
+        assert summary['render']['drawn'] == 1 and summary['render']['culled'] == 1
@@ -0,0 +1,101 @@
+# timestep.py
+# This file defines the fixed-timestep helpers used by the GUI game loop.
+# FixedTimestep accumulates the real time elapsed between rendered frames and tells the
+# loop how many simulation ticks of a constant length to run, so game speed no longer
+# depends on the frame rate. A catch-up clamp drops excess time after a long stall instead
+# of running an ever-growing number of ticks (the "spiral of death").
+# RateMeter counts events per second, to report ticks-per-second and render FPS separately.
+#
+# *Ce fichier définit les utilitaires de pas de temps fixe utilisés par la boucle de jeu GUI.*
+# *FixedTimestep accumule le temps réel écoulé entre les frames affichées et indique à la boucle*
+# *combien de ticks de simulation de durée constante exécuter, afin que la vitesse du jeu ne dépende*
+# *plus du nombre d'images par seconde. Une limite de rattrapage abandonne le temps en trop après un*
+# *long blocage au lieu d'exécuter un nombre croissant de ticks (la "spirale de la mort").*
+# *RateMeter compte des événements par seconde, pour rapporter séparément les ticks par seconde et les FPS d'affichage.*
+
+import config
+
+
+class RateMeter:
+    """
+    Counts events and publishes their rate once per measurement window.
+    *Compte des événements et publie leur fréquence une fois par fenêtre de mesure.*
+    """
+    def __init__(self, window=1.0):
+        """
+        Args:
+            window (float): Length of a measurement window, in seconds. / *Durée d'une fenêtre de mesure, en secondes.*
+        """
+        self.window = window
+        self.rate = 0.0  # Events per second over the last complete window / *Événements par seconde sur la dernière fenêtre complète*
+        self._count = 0
+        self._window_start = None
+
+    def record(self, now, count=1):
+        """
+        Records events at time `now`.
+        Returns:
+            bool: True when a window just completed and `rate` was updated. / *True quand une fenêtre vient de se terminer et que `rate` a été mis à jour.*
+        """
+        if self._window_start is None:
+            self._window_start = now
+        self._count += count
+        elapsed = now - self._window_start
+        if elapsed >= self.window:
+            self.rate = self._count / elapsed
+            self._count = 0
+            self._window_start = now
+            return True
+        return False
+
+
+class FixedTimestep:
+    """
+    Accumulator turning variable frame times into a whole number of fixed-length ticks.
+    *Accumulateur transformant des durées de frame variables en un nombre entier de ticks de durée fixe.*
+    """
+    def __init__(self, tick_rate=config.SIMULATION_TICK_RATE, max_catch_up_ticks=config.MAX_CATCH_UP_TICKS):
+        """
+        Args:
+            tick_rate (int): Simulation ticks per second. / *Ticks de simulation par seconde.*
+            max_catch_up_ticks (int): Most ticks run for a single frame; older time is dropped.
+                                      *Nombre maximal de ticks exécutés pour une frame ; le temps plus ancien est abandonné.*
+        """
+        self.tick_rate = tick_rate
+        self.dt = 1.0 / tick_rate
+        self.max_catch_up_ticks = max_catch_up_ticks
+        self.accumulator = 0.0
+        self.tick_count = 0  # Ticks run since creation / *Ticks exécutés depuis la création*
+        self.dropped_ticks = 0  # Ticks skipped by the catch-up clamp / *Ticks sautés par la limite de rattrapage*
+        self._last_time = None
+
+    def ticks(self, now):
+        """
+        Adds the time elapsed since the previous call and returns one timestamp per tick to run.
+        Tick timestamps are spaced by `dt` and end just before `now`, so time-based game logic
+        keeps seeing (almost) real time even when ticks were dropped.
+        Args:
+            now (float): Current time, in seconds. / *Temps actuel, en secondes.*
+        Returns:
+            list[float]: Timestamps of the ticks to run, oldest first. / *Horodatages des ticks à exécuter, du plus ancien au plus récent.*
+
+        *Ajoute le temps écoulé depuis l'appel précédent et retourne un horodatage par tick à exécuter.*
+        *Les horodatages sont espacés de `dt` et se terminent juste avant `now`, pour que la logique*
+        *temporelle du jeu voie (presque) le temps réel même quand des ticks ont été abandonnés.*
+        """
+        if self._last_time is not None:
+            self.accumulator += max(0.0, now - self._last_time)
+        self._last_time = now
+        count = int(self.accumulator / self.dt + 1e-9) # Tolerate float rounding / *Tolérer les arrondis flottants*
+        if count > self.max_catch_up_ticks:
+            self.dropped_ticks += count - self.max_catch_up_ticks
+            self.accumulator -= (count - self.max_catch_up_ticks) * self.dt
+            count = self.max_catch_up_ticks
+        self.accumulator -= count * self.dt
+        self.tick_count += count
+        return [now - self.accumulator - remaining * self.dt for remaining in range(count - 1, -1, -1)]
+
+    def reset(self):
+        """Forgets the accumulated time, e.g. after a pause. / *Oublie le temps accumulé, par ex. après une pause.*"""
+        self.accumulator = 0.0
+        self._last_time = None
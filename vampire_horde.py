@@ -0,0 +1,142 @@
+# vampire_horde.py
+# This file defines the VampireHorde class, the collection of all the vampires of a game.
+# Every active vampire is moved in one batched NumPy pass per tick, with the same rules as
+# Vampire.update(): straight at the player, or along the flow field where an obstacle is in
+# the way, then clamped to the world. The 'vampires' collision layer is kept in sync, so
+# garlic hits and player contacts are resolved with one broadphase query for the whole
+# horde. The Vampire objects keep their own rect and state, for rendering and tests.
+#
+# *Ce fichier définit la classe VampireHorde, la collection de tous les vampires d'une partie.*
+# *Chaque vampire actif est déplacé en une seule passe NumPy groupée par tick, avec les mêmes règles*
+# *que Vampire.update() : droit sur le joueur, ou le long du champ de flux là où un obstacle gêne,*
+# *puis limité au monde. La couche de collision 'vampires' est maintenue à jour, de sorte que les*
+# *coups d'ail et les contacts avec le joueur sont résolus par une seule requête de phase large pour*
+# *toute la horde. Les objets Vampire gardent leur propre rect et état, pour l'affichage et les tests.*
+
+import numpy as np
+
+
+class VampireHorde:
+    """
+    List of Vampire objects with batched movement and kill bookkeeping.
+    *Liste d'objets Vampire avec déplacement groupé et comptabilité des victimes.*
+    """
+    def __init__(self, collision_layer=None):
+        """
+        Initializes an empty horde.
+        Args:
+            collision_layer (SpatialHash, optional): Broadphase layer kept in sync with the active vampires.
+                                                     *Couche de phase large maintenue à jour avec les vampires actifs.*
+        """
+        self.collision_layer = collision_layer
+        self.vampires = []
+        self.killed_count = 0  # Vampires killed this game / *Vampires tués pendant la partie*
+        self.last_death_pos = (0, 0)  # Where the latest one died / *Où le dernier est mort*
+
+    def __len__(self):
+        return len(self.vampires)
+
+    def __iter__(self):
+        return iter(self.vampires)
+
+    def __getitem__(self, index):
+        return self.vampires[index]
+
+    def add(self, vampire):
+        self.vampires.append(vampire)
+        self.sync(vampire)
+        return vampire
+
+    def trim(self, count):
+        """
+        Drops the vampires past the first `count`, e.g. those added by waves, and takes them out of the collision layer.
+        *Retire les vampires au-delà des `count` premiers, par ex. ceux ajoutés par les vagues, et les sort de la couche de collision.*
+        """
+        if self.collision_layer is not None:
+            for vampire in self.vampires[count:]:
+                self.collision_layer.remove(vampire)
+        del self.vampires[count:]
+
+    def clear(self):
+        for vampire in self.vampires:
+            if self.collision_layer is not None:
+                self.collision_layer.remove(vampire)
+        self.vampires.clear()
+        self.killed_count = 0
+        self.last_death_pos = (0, 0)
+
+    def active(self):
+        return [vampire for vampire in self.vampires if vampire.active]
+
+    def record_death(self, vampire):
+        """
+        Counts a kill and remembers where the vampire died. Returns the new kill count.
+        *Compte une victime et retient où le vampire est mort. Retourne le nouveau nombre de victimes.*
+        """
+        self.killed_count += 1
+        vampire.death_position = vampire.rect.center
+        self.last_death_pos = vampire.death_position
+        return self.killed_count
+
+    def sync(self, vampire=None):
+        """
+        Keeps the collision layer in line with the vampires' positions and active states (one vampire, or all).
+        *Maintient la couche de collision en accord avec les positions et états actifs des vampires (un seul, ou tous).*
+        """
+        layer = self.collision_layer
+        if layer is None:
+            return
+        for each in (self.vampires if vampire is None else (vampire,)):
+            if each.active:
+                layer.update(each)
+            else:
+                layer.remove(each)
+
+    def step(self, player_rect, world_bounds, flow_field=None):
+        """
+        Moves every active vampire in one batched pass, with the same rules as Vampire.update().
+        Args:
+            player_rect (pygame.Rect): The player's current rectangle. / *Rectangle actuel du joueur.*
+            world_bounds (tuple[int, int]): Boundaries of the game world. / *Limites du monde du jeu.*
+            flow_field (FlowField, optional): Field pointed at the player. / *Champ orienté vers le joueur.*
+
+        *Déplace tous les vampires actifs en une seule passe groupée, avec les mêmes règles que Vampire.update().*
+        """
+        active = self.active()
+        if not active:
+            return
+        rects = [vampire.rect for vampire in active]
+        boxes = np.array([tuple(rect) for rect in rects], dtype=np.float64)
+        x, y, width, height = boxes[:, 0], boxes[:, 1], boxes[:, 2], boxes[:, 3]
+        speed = np.array([vampire.speed for vampire in active], dtype=np.float64)
+
+        # Straight at the player's center, like utilities.calculate_movement_towards()
+        # *Droit sur le centre du joueur, comme utilities.calculate_movement_towards()*
+        center_x = x + width // 2
+        center_y = y + height // 2
+        to_player_x = player_rect.centerx - center_x
+        to_player_y = player_rect.centery - center_y
+        dist = np.hypot(to_player_x, to_player_y)
+        safe_dist = np.where(dist > 0, dist, 1.0)
+        move_x = np.where(dist > 0, to_player_x / safe_dist * speed, 0.0)
+        move_y = np.where(dist > 0, to_player_y / safe_dist * speed, 0.0)
+
+        if flow_field is not None: # Follow the field where the straight line is blocked / *Suivre le champ là où la ligne droite est bloquée*
+            field_x, field_y, direct = flow_field.directions_at(center_x, center_y)
+            if not direct.all():
+                move_x = np.where(direct, move_x, field_x * speed)
+                move_y = np.where(direct, move_y, field_y * speed)
+
+        # Truncated like pygame.Rect assignments, then clamped to the world
+        # *Tronqués comme les affectations de pygame.Rect, puis limités au monde*
+        max_x = world_bounds[0] - width
+        max_y = world_bounds[1] - height
+        new_x = np.clip(np.trunc(np.clip(x + move_x, 0, max_x)), 0, max_x)
+        new_y = np.clip(np.trunc(np.clip(y + move_y, 0, max_y)), 0, max_y)
+
+        moved = np.flatnonzero((new_x != x) | (new_y != y))
+        layer = self.collision_layer
+        for index, rect_x, rect_y in zip(moved.tolist(), new_x[moved].tolist(), new_y[moved].tolist()):
+            rects[index].topleft = (rect_x, rect_y)
+            if layer is not None:
+                layer.update(active[index])
@@ -0,0 +1,115 @@
+# viewport.py
+# This file defines the Viewport, the part of the world shown on screen, used to cull world-space
+# draws. It is rebuilt every frame from the camera scroll and the screen size. Only the
+# entities overlapping it (plus a small margin for sprites drawn slightly past their rect,
+# like the spinning garlic) are handed to the draw calls:
+# - layers kept in a SpatialHash (carrots, items) are read through the grid, so only the
+#   cells under the screen are visited, whatever the population;
+# - bullets are tested in one NumPy pass over the BulletStore arrays;
+# - short lists (vampires, garlic shots, explosions) are tested rect by rect.
+# The drawn and culled counts of each kind are kept for the frame, to measure the savings.
+#
+# *Ce fichier définit le Viewport, la partie du monde affichée à l'écran, utilisée pour écarter les*
+# *dessins dans l'espace du monde. Il est reconstruit à chaque frame à partir du défilement de la*
+# *caméra et de la taille de l'écran. Seules les entités qui le chevauchent (plus une petite marge pour*
+# *les sprites dessinés un peu au-delà de leur rect, comme l'ail qui tourne) sont passées aux dessins :*
+# *- les couches gardées dans un SpatialHash (carottes, objets) sont lues à travers la grille, seules*
+# *  les cellules sous l'écran sont donc visitées, quelle que soit la population ;*
+# *- les projectiles sont testés en une passe NumPy sur les tableaux du BulletStore ;*
+# *- les listes courtes (vampires, tirs d'ail, explosions) sont testées rect par rect.*
+# *Le nombre d'entités dessinées et écartées de chaque type est gardé pour la frame, pour mesurer le gain.*
+
+import numpy as np
+import pygame
+
+import config
+
+
+class Viewport:
+    """
+    World-space rectangle shown on screen, with per-frame drawn/culled counters.
+    *Rectangle de l'espace du monde affiché à l'écran, avec des compteurs par frame d'entités dessinées/écartées.*
+    """
+    def __init__(self, screen_size, margin=config.VIEWPORT_CULL_MARGIN):
+        """
+        Args:
+            screen_size (tuple[int, int]): The (width, height) of the screen. / *La (largeur, hauteur) de l'écran.*
+            margin (int): Extra pixels kept around the screen on each side. / *Pixels en plus gardés autour de l'écran de chaque côté.*
+        """
+        self.margin = margin
+        self.rect = pygame.Rect(0, 0, *screen_size)  # Area on screen / *Zone à l'écran*
+        self.cull_rect = self.rect.inflate(2 * margin, 2 * margin)  # Area kept for drawing / *Zone gardée pour le dessin*
+        self.drawn = {}  # Kind -> entities drawn this frame / *Type -> entités dessinées pendant la frame*
+        self.culled = {}  # Kind -> entities skipped this frame / *Type -> entités écartées pendant la frame*
+
+    def update(self, scroll, screen_size=None):
+        """
+        Moves the viewport to the camera scroll (and new screen size, if given) and starts a new frame of counting.
+        *Déplace le viewport au défilement de la caméra (et à la nouvelle taille d'écran, si donnée) et commence une nouvelle frame de comptage.*
+        """
+        if screen_size is not None and screen_size != self.rect.size:
+            self.rect.size = screen_size
+            self.cull_rect.size = (screen_size[0] + 2 * self.margin, screen_size[1] + 2 * self.margin)
+        self.rect.topleft = (int(scroll[0]), int(scroll[1]))
+        self.cull_rect.topleft = (self.rect.x - self.margin, self.rect.y - self.margin)
+        self.drawn.clear()
+        self.culled.clear()
+
+    def _count(self, kind, drawn, total):
+        self.drawn[kind] = self.drawn.get(kind, 0) + drawn
+        self.culled[kind] = self.culled.get(kind, 0) + total - drawn
+
+    def visible(self, kind, entities):
+        """
+        Returns the entities of a list whose rect overlaps the viewport, in list order.
+        *Retourne les entités d'une liste dont le rect chevauche le viewport, dans l'ordre de la liste.*
+        """
+        colliderect = self.cull_rect.colliderect
+        found = [entity for entity in entities if colliderect(entity.rect)]
+        self._count(kind, len(found), len(entities))
+        return found
+
+    def visible_in(self, kind, spatial_hash, total):
+        """
+        Returns the entities of a SpatialHash layer whose rect overlaps the viewport.
+        Args:
+            kind (str): Counter name, e.g. 'carrots'. / *Nom du compteur, par ex. 'carrots'.*
+            spatial_hash (SpatialHash): The layer holding every drawable entity of the kind.
+                                        *La couche contenant toutes les entités affichables du type.*
+            total (int): Entities of the kind, to count the culled ones. / *Entités du type, pour compter celles écartées.*
+        Returns:
+            list: The visible entities, in the grid's deterministic order. / *Les entités visibles, dans l'ordre déterministe de la grille.*
+        """
+        colliderect = self.cull_rect.colliderect
+        found = [entity for entity in spatial_hash.candidates(self.cull_rect) if colliderect(entity.rect)]
+        self._count(kind, len(found), total)
+        return found
+
+    def visible_slots(self, kind, bullet_store):
+        """
+        Returns the slots of the BulletStore bullets overlapping the viewport, in slot order.
+        *Retourne les cases des projectiles du BulletStore qui chevauchent le viewport, dans l'ordre des cases.*
+        """
+        count = len(bullet_store)
+        if count == 0:
+            self._count(kind, 0, 0)
+            return []
+        area = self.cull_rect
+        xs, ys = bullet_store.positions()
+        inside = ((xs + bullet_store.width[:count] > area.left) & (xs < area.right)
+                  & (ys + bullet_store.height[:count] > area.top) & (ys < area.bottom))
+        slots = np.flatnonzero(inside).tolist()
+        self._count(kind, len(slots), count)
+        return slots
+
+    def stats(self):
+        """
+        Returns the drawn and culled counts of the current frame, by kind and in total.
+        *Retourne le nombre d'entités dessinées et écartées de la frame en cours, par type et au total.*
+        """
+        return {
+            'drawn': sum(self.drawn.values()),
+            'culled': sum(self.culled.values()),
+            **{f"drawn:{kind}": count for kind, count in self.drawn.items()},
+            **{f"culled:{kind}": count for kind, count in self.culled.items()},
+        }